@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+calculate_lifecycle_metrics 성능 비교 벤치마크
+
+기존(전체 DataFrame을 여러 번 훑는) 구현과 메트릭 등록부 기반 구현의
+실행 시간을 비교하고, 두 결과가 같은지 확인한다.
+
+사용 예시:
+  python benchmarks/bench_lifecycle_metrics.py --sizes 10000 100000 1000000
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.analyzers.lifecycle_analyzer import LifecycleAnalyzer
+
+
+def make_posts(n_posts, seed=0):
+    """벤치마크용 가상 게시물 데이터"""
+    rng = np.random.default_rng(seed)
+    days = rng.normal(200, 60, n_posts).clip(0, 729).astype(int)
+    date = pd.Timestamp('2023-01-01') + pd.to_timedelta(days, unit='D')
+    score = (rng.pareto(1.5, n_posts) * 10).astype(int)
+    num_comments = (rng.pareto(2, n_posts) * 3).astype(int)
+    return pd.DataFrame({
+        'id': np.arange(n_posts),
+        'date': date,
+        'author': rng.integers(0, max(n_posts // 3, 1), n_posts).astype(str),
+        'subreddit': rng.zipf(1.6, n_posts) % 500,
+        'score': score,
+        'num_comments': num_comments,
+        'engagement_score': score + num_comments * 2
+    })
+
+
+def legacy_lifecycle_metrics(df, daily_metrics):
+    """기존 구현 (비교 기준)"""
+    metrics = {}
+    metrics['total_posts'] = len(df)
+    metrics['unique_authors'] = df['author'].nunique()
+    metrics['date_range'] = f"{df['date'].min()} to {df['date'].max()}"
+    metrics['duration_days'] = (df['date'].max() - df['date'].min()).days
+    metrics['avg_score'] = df['score'].mean()
+    metrics['avg_comments'] = df['num_comments'].mean()
+    metrics['total_engagement'] = df['engagement_score'].sum()
+    metrics['posts_per_author'] = metrics['total_posts'] / metrics['unique_authors']
+    metrics['subreddit_count'] = df['subreddit'].nunique()
+    peak_date_idx = daily_metrics['post_count'].idxmax()
+    peak_date = daily_metrics.loc[peak_date_idx, 'date']
+    metrics['peak_date'] = peak_date
+    metrics['days_to_peak'] = (peak_date - df['date'].min()).days
+    if metrics['days_to_peak'] > 0:
+        growth_phase = df[df['date'] < peak_date]
+        decline_phase = df[df['date'] >= peak_date]
+        metrics['growth_phase_posts'] = len(growth_phase)
+        metrics['decline_phase_posts'] = len(decline_phase)
+        metrics['growth_decline_ratio'] = metrics['growth_phase_posts'] / max(metrics['decline_phase_posts'], 1)
+    active_days = daily_metrics[daily_metrics['post_count'] > 0]
+    metrics['active_days_ratio'] = len(active_days) / len(daily_metrics)
+    top_10_pct = int(len(df) * 0.1)
+    top_posts_engagement = df.nlargest(top_10_pct, 'engagement_score')['engagement_score'].sum()
+    metrics['viral_concentration'] = top_posts_engagement / df['engagement_score'].sum()
+    return metrics
+
+
+def best_of(func, repeat):
+    """repeat회 실행 중 최소 시간 (초)"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = func()
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='lifecycle 메트릭 계산 벤치마크')
+    parser.add_argument('--sizes', nargs='+', type=int, default=[10000, 100000, 1000000],
+                        help='게시물 수 목록')
+    parser.add_argument('--repeat', type=int, default=5, help='반복 횟수 (최소값 사용)')
+    args = parser.parse_args()
+
+    analyzer = LifecycleAnalyzer()
+
+    print(f"{'posts':>10} {'legacy(ms)':>12} {'registry(ms)':>13} {'speedup':>8}  match")
+    for n_posts in args.sizes:
+        df = make_posts(n_posts)
+        with contextlib.redirect_stdout(io.StringIO()):
+            daily_metrics, _ = analyzer.identify_lifecycle_phases(df)
+
+        legacy_time, expected = best_of(lambda: legacy_lifecycle_metrics(df, daily_metrics), args.repeat)
+        new_time, actual = best_of(lambda: analyzer.calculate_lifecycle_metrics(df, daily_metrics), args.repeat)
+
+        match = list(expected) == list(actual) and all(
+            np.isclose(expected[key], actual[key]) if isinstance(expected[key], float) else expected[key] == actual[key]
+            for key in expected
+        )
+        print(f"{n_posts:>10,} {legacy_time * 1000:>12.2f} {new_time * 1000:>13.2f} "
+              f"{legacy_time / new_time:>7.2f}x  {'OK' if match else 'MISMATCH'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+CLI 시작 시간 벤치마크
+
+main.py, run_pipeline.py와 각 모듈 CLI를 새 인터프리터에서 import만 해서
+(`python -X importtime -c "import 모듈"`) 시작 비용을 측정한다. 스케줄러가 스크립트를
+하루 수백 번 실행하므로, 실행하지 않는 단계의 무거운 라이브러리(matplotlib, scipy,
+sklearn, numba, API 클라이언트)가 import 시점에 로드되는지도 함께 표시한다.
+
+사용 예시:
+  python benchmarks/bench_startup.py
+  python benchmarks/bench_startup.py --targets main run_pipeline --repeat 10
+"""
+
+import argparse
+import glob
+import os
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 시작 시점에 로드되면 표시할 무거운 최상위 패키지
+HEAVY_PACKAGES = ['matplotlib', 'seaborn', 'scipy', 'sklearn', 'numba',
+                  'praw', 'tweepy', 'instaloader', 'dash', 'plotly']
+
+
+def find_targets():
+    """측정 대상 모듈 이름 (main, run_pipeline, `__main__` 블록이 있는 src 모듈)"""
+    targets = ['main', 'run_pipeline']
+    for filepath in sorted(glob.glob(os.path.join(PROJECT_ROOT, 'src', '**', '*.py'), recursive=True)):
+        with open(filepath, 'r', encoding='utf-8') as f:
+            if '__name__ == "__main__"' not in f.read():
+                continue
+        relative = os.path.relpath(filepath, PROJECT_ROOT)
+        targets.append(relative[:-3].replace(os.sep, '.'))
+    return targets
+
+
+def parse_importtime(stderr):
+    """-X importtime 출력 -> [(import 깊이, 모듈 이름, 누적 마이크로초)]"""
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line.split('|')
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        entries.append((depth, name.strip(), int(cumulative)))
+    return entries
+
+
+def interpreter_modules():
+    """빈 인터프리터 시작 시 import되는 모듈 (측정에서 제외)"""
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'pass'],
+                            cwd=PROJECT_ROOT, capture_output=True, text=True)
+    return {name for _, name, _ in parse_importtime(result.stderr)}
+
+
+def measure(target, repeat, baseline):
+    """모듈 하나의 시작 시간 측정
+
+    Args:
+        target: import할 모듈 이름
+        repeat: 반복 횟수 (벽시계 시간은 중앙값)
+        baseline: 인터프리터 시작 모듈 이름 집합
+
+    Returns:
+        {'target', 'wall_ms', 'import_ms', 'heavy', 'slowest', 'error'}
+    """
+    command = [sys.executable, '-X', 'importtime', '-c', f'import {target}']
+    wall = []
+    result = None
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        result = subprocess.run(command, cwd=PROJECT_ROOT, capture_output=True, text=True)
+        wall.append(time.perf_counter() - start_time)
+        if result.returncode != 0:
+            break
+
+    entries = [entry for entry in parse_importtime(result.stderr) if entry[1] not in baseline]
+    # 대상 모듈의 누적 시간과 대상이 직접 import한 모듈 중 가장 느린 것
+    import_us = sum(cumulative for depth, name, cumulative in entries if depth == 0)
+    children = [(name, cumulative) for depth, name, cumulative in entries if depth == 1]
+    loaded = {name.split('.')[0] for _, name, _ in entries}
+
+    error = None
+    if result.returncode != 0:
+        lines = [line for line in result.stderr.splitlines() if not line.startswith('import time:')]
+        error = lines[-1] if lines else f'returncode {result.returncode}'
+
+    return {
+        'target': target,
+        'wall_ms': float(np.median(wall)) * 1000,
+        'import_ms': import_us / 1000,
+        'heavy': [package for package in HEAVY_PACKAGES if package in loaded],
+        'slowest': sorted(children, key=lambda item: -item[1])[:3],
+        'error': error
+    }
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description='CLI 시작(import) 시간 벤치마크')
+    parser.add_argument('--targets', nargs='+', help='측정할 모듈 (예: main src.analyzers.lifecycle_analyzer)')
+    parser.add_argument('--repeat', type=int, default=5, help='모듈별 반복 횟수 (벽시계 시간은 중앙값)')
+
+    args = parser.parse_args()
+
+    targets = args.targets or find_targets()
+    print(f"=== Startup Benchmark ({len(targets)} targets, repeat {args.repeat}) ===")
+    print(f"{'target':<40} {'wall ms':>9} {'import ms':>10}  heavy imports")
+
+    baseline = interpreter_modules()
+    results = [measure(target, args.repeat, baseline) for target in targets]
+    for row in results:
+        heavy = ', '.join(row['heavy']) or '-'
+        print(f"{row['target']:<40} {row['wall_ms']:>9.1f} {row['import_ms']:>10.1f}  {heavy}")
+        if row['error']:
+            print(f"{'':<40} ✗ {row['error']}")
+        else:
+            slowest = ', '.join(f"{name} {cumulative / 1000:.0f}ms" for name, cumulative in row['slowest'])
+            print(f"{'':<40}   가장 느린 import: {slowest}")
+
+    total = sum(row['wall_ms'] for row in results)
+    print(f"\n전체 {total:.0f}ms (모듈당 평균 {total / len(results):.0f}ms)")
+
+# 실행 코드
+if __name__ == "__main__":
+    main()
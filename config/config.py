@@ -1,7 +1,5 @@
 import os,platform
 from datetime import datetime
-import matplotlib.pyplot as plt
-import matplotlib.font_manager as fm
 
 # 프로젝트 루트 경로
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -10,6 +8,9 @@ PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 DATA_DIR = os.path.join(PROJECT_ROOT, 'data')
 RAW_DATA_DIR = os.path.join(DATA_DIR, 'raw')
 PROCESSED_DATA_DIR = os.path.join(DATA_DIR, 'processed')
+CACHE_DIR = os.path.join(DATA_DIR, 'cache')
+TRACKER_DIR = os.path.join(DATA_DIR, 'trackers')
+MODELS_DIR = os.path.join(DATA_DIR, 'models')
 
 # 결과 경로
 RESULTS_DIR = os.path.join(PROJECT_ROOT, 'results')
@@ -24,21 +25,50 @@ TARGET_MEMES = [
     # 추가 밈들...
 ]
 
+# 그림 렌더 프로파일 (저장 형식, 해상도, 여백 자르기, web은 팔레트 PNG 색 수)
+# - draft: 빠른 검토/CI 산출물용 저해상도
+# - web: 화면 크기 압축 PNG
+# - publication: 기존 출력과 같은 300dpi PNG, -svg/-pdf는 벡터 출력
+RENDER_PROFILES = {
+    "draft": {"format": "png", "dpi": 72, "bbox_inches": None},
+    "web": {"format": "png", "dpi": 100, "bbox_inches": "tight", "colors": 256},
+    "publication": {"format": "png", "dpi": 300, "bbox_inches": "tight"},
+    "publication-svg": {"format": "svg", "dpi": 300, "bbox_inches": "tight"},
+    "publication-pdf": {"format": "pdf", "dpi": 300, "bbox_inches": "tight"},
+}
+DEFAULT_RENDER_PROFILE = "publication"
+
+# 운영체제별 한글 글꼴 후보 (설치된 글꼴 이름으로 조회)
+FONT_CANDIDATES = {
+    "Darwin": ["AppleGothic", "Apple SD Gothic Neo"],
+    "Windows": ["Malgun Gothic"],
+    "Linux": ["NanumGothic", "Noto Sans CJK KR", "Noto Sans KR"],
+}
+
+_global_font = None
+
 def set_global_font():
-    system = platform.system()
-    if system == "Darwin":  # macOS
-        font_path = "/System/Library/Fonts/AppleSDGothicNeo.ttc"
-    elif system == "Windows":
-        font_path = "C:/Windows/Fonts/malgun.ttf"
-    else:
-        font_path = "/usr/share/fonts/truetype/nanum/NanumGothic.ttf"  # 예시
-    font_prop = fm.FontProperties(fname=font_path)
-    plt.rcParams['font.family'] = font_prop.get_name()
-    
-    return font_prop.get_name()
-
-# 실제로 한 번 설정 적용,
-DEFAULT_FONT = set_global_font()
+    """matplotlib 전역 글꼴을 한글 글꼴로 설정하고 글꼴 이름 반환
+
+    import 시점에는 matplotlib을 불러오지 않도록 그림을 그리기 직전에 호출한다.
+    설치된 후보 글꼴이 없으면 기본 글꼴을 유지한다.
+    """
+    global _global_font
+    import matplotlib
+    import matplotlib.font_manager as fm
+
+    if _global_font is None:
+        installed = {font.name for font in fm.fontManager.ttflist}
+        candidates = [name for name in FONT_CANDIDATES.get(platform.system(), []) if name in installed]
+        _global_font = candidates[0] if candidates else matplotlib.rcParams['font.family'][0]
+    matplotlib.rcParams['font.family'] = _global_font
+    return _global_font
+
+def __getattr__(name):
+    # 기존 코드 호환: DEFAULT_FONT는 처음 참조될 때 글꼴을 설정
+    if name == 'DEFAULT_FONT':
+        return set_global_font()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # 데이터 수집 기간
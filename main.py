@@ -8,9 +8,7 @@ import sys
 import time
 from datetime import datetime
 
-from src.collectors.twitter_collector import TwitterCollector
-from src.collectors.reddit_collector import RedditCollector
-from src.collectors.instagram_collector import InstagramCollector
+# 수집기는 API 클라이언트(tweepy, praw, instaloader) 로딩 비용이 커서 해당 플랫폼을 수집할 때 import
 from src.utils import create_directories, sanitize_filename
 from config.config import TARGET_MEMES
 
@@ -18,6 +16,7 @@ def collect_twitter_data(meme_name):
     """Twitter에서 밈 데이터 수집"""
     print(f"\n=== Twitter에서 '{meme_name}' 데이터 수집 시작 ===")
     try:
+        from src.collectors.twitter_collector import TwitterCollector
         collector = TwitterCollector()
         
         # 해시태그 변형 생성
@@ -36,6 +35,7 @@ def collect_reddit_data(meme_name):
     """Reddit에서 밈 데이터 수집"""
     print(f"\n=== Reddit에서 '{meme_name}' 데이터 수집 시작 ===")
     try:
+        from src.collectors.reddit_collector import RedditCollector
         collector = RedditCollector()
         
         # 주요 밈 서브레딧
@@ -54,6 +54,7 @@ def collect_instagram_data(meme_name):
     """Instagram에서 밈 데이터 수집"""
     print(f"\n=== Instagram에서 '{meme_name}' 데이터 수집 시작 ===")
     try:
+        from src.collectors.instagram_collector import InstagramCollector
         collector = InstagramCollector()
         posts = collector.collect_meme_data(meme_name)
         print(f"✓ {len(posts)}개의 Instagram 게시물 수집 완료")
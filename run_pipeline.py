@@ -8,19 +8,17 @@ import sys
 import time
 import glob
 import os
-import pandas as pd
 from datetime import datetime
 
 # 프로젝트 루트 디렉토리를 sys.path에 추가
 project_root = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, project_root)
 
-from src.collectors.reddit_collector import RedditCollector
-from src.preprocessors.data_preprocessor import DataPreprocessor
-from src.visualizers.meme_visualizer import MemeVisualizer
-from src.analyzers.lifecycle_analyzer import LifecycleAnalyzer
-from src.utils import create_directories
-from config.config import RAW_DATA_DIR, PROCESSED_DATA_DIR
+# 단계별 모듈(수집기, 전처리, 시각화, 분석)은 건너뛴 단계의 import 비용을 내지 않도록 각 단계 함수 안에서 import
+from src.utils import create_directories, save_json_file
+from src.pipeline import Pipeline, Stage
+from config.config import (RAW_DATA_DIR, PROCESSED_DATA_DIR, REPORTS_DIR, TARGET_MEMES,
+                           RENDER_PROFILES, DEFAULT_RENDER_PROFILE)
 
 def run_collection(meme_name, platforms=['reddit']):
     """데이터 수집 단계"""
@@ -34,6 +32,7 @@ def run_collection(meme_name, platforms=['reddit']):
     if 'reddit' in platforms:
         try:
             print(f"Reddit에서 '{meme_name}' 데이터 수집 중...")
+            from src.collectors.reddit_collector import RedditCollector
             collector = RedditCollector()
             posts = collector.collect_meme_data(meme_name)
             if posts:
@@ -70,12 +69,17 @@ def run_collection(meme_name, platforms=['reddit']):
     
     return collected_files
 
-def run_preprocessing(meme_name):
-    """데이터 전처리 단계"""
+def run_preprocessing(meme_name, collected_platforms=None):
+    """데이터 전처리 단계 (collected_platforms: 수집 단계에서 수집에 성공한 플랫폼)"""
     print(f"\n{'='*50}")
     print(f"2단계: 데이터 전처리")
     print(f"{'='*50}")
     
+    if collected_platforms is not None and 'reddit' not in collected_platforms:
+        print("✗ Reddit 데이터가 수집되지 않아 전처리를 건너뜁니다.")
+        return None
+    
+    from src.preprocessors.data_preprocessor import DataPreprocessor
     preprocessor = DataPreprocessor()
     
     # 수집된 데이터 파일 찾기 (가장 최근 파일)
@@ -112,14 +116,20 @@ def run_preprocessing(meme_name):
         print(f"✗ 전처리 실패: {e}")
         return None
 
-def run_visualization(processed_filename, meme_name):
-    """시각화 단계"""
+def run_visualization(processed_filename, meme_name, profile=DEFAULT_RENDER_PROFILE, workers=None):
+    """시각화 단계 (실패하면 None, 성공하면 그림 파일 경로 리스트)
+
+    workers: 그림 렌더링 프로세스 수 (파이프라인에서는 동시에 실행되는 CPU 단계 수로 나눈 값)
+    """
     print(f"\n{'='*50}")
     print(f"3단계: 시각화 생성")
     print(f"{'='*50}")
     
     try:
-        visualizer = MemeVisualizer()
+        import pandas as pd
+        from src.preprocessors.rollup_cube import load_rollup
+        from src.visualizers.meme_visualizer import MemeVisualizer
+        visualizer = MemeVisualizer(profile=profile)
         
         # 전처리된 데이터 로드
         filepath = os.path.join(PROCESSED_DATA_DIR, processed_filename)
@@ -129,29 +139,30 @@ def run_visualization(processed_filename, meme_name):
         
         meme_safe_name = meme_name.replace(' ', '_').lower()
         
+        cube = load_rollup(filepath, df, meme_safe_name)
+        
         print("시각화 생성 중...")
         
-        # 각 시각화 생성
-        visualizer.plot_lifecycle_curve(df, meme_safe_name)
-        visualizer.plot_engagement_analysis(df, meme_safe_name)
-        visualizer.plot_subreddit_distribution(df, meme_safe_name)
-        visualizer.plot_lifecycle_phases(df, meme_safe_name)
-        visualizer.create_summary_dashboard(df, meme_safe_name)
+        # 각 시각화를 프로세스 풀에서 병렬 생성
+        figure_paths = visualizer.render_all(df, meme_safe_name, cube=cube, workers=workers)
         
         print("✓ 모든 시각화 완료!")
-        return True
+        return figure_paths
         
     except Exception as e:
         print(f"✗ 시각화 생성 실패: {e}")
-        return False
+        return None
 
 def run_analysis(processed_filename, meme_name):
-    """분석 단계"""
+    """분석 단계 (실패하면 None, 성공하면 보고서 경로)"""
     print(f"\n{'='*50}")
     print(f"4단계: 수명 주기 분석")
     print(f"{'='*50}")
     
     try:
+        import pandas as pd
+        from src.preprocessors.rollup_cube import load_rollup
+        from src.analyzers.lifecycle_analyzer import LifecycleAnalyzer
         analyzer = LifecycleAnalyzer()
         
         # 전처리된 데이터 로드
@@ -165,7 +176,7 @@ def run_analysis(processed_filename, meme_name):
         print("수명 주기 분석 중...")
         
         # 분석 실행
-        daily_metrics, phases = analyzer.identify_lifecycle_phases(df)
+        daily_metrics, phases = analyzer.identify_lifecycle_phases(df, load_rollup(filepath, df, meme_safe_name))
         curve_fit = analyzer.fit_lifecycle_curve(daily_metrics)
         metrics = analyzer.calculate_lifecycle_metrics(df, daily_metrics)
         
@@ -175,11 +186,11 @@ def run_analysis(processed_filename, meme_name):
         )
         
         print(f"✓ 분석 완료! 보고서: {report_path}")
-        return True
+        return report_path
         
     except Exception as e:
         print(f"✗ 분석 실패: {e}")
-        return False
+        return None
 
 def validate_environment():
     """환경 설정 검증"""
@@ -203,6 +214,119 @@ def validate_environment():
     print("✓ 환경 설정 검증 완료")
     return True
 
+# 밈 하나의 파이프라인 단계 (보고서 열 순서)
+STEPS = ['collection', 'preprocessing', 'visualization', 'analysis']
+
+def build_stages(meme_name, args, render_workers=None):
+    """밈 하나의 파이프라인 단계 구성
+
+    수집 → 전처리 → (시각화, 분석). 시각화와 분석은 전처리 결과에만 의존하므로 동시에 실행된다.
+    단계와 산출물 이름에 밈 이름을 붙여 여러 밈의 단계를 하나의 그래프에 넣을 수 있다.
+
+    Returns:
+        (Stage 리스트, {단계: Stage 이름})
+    """
+    meme_safe_name = meme_name.replace(' ', '_').lower()
+    
+    def key(name):
+        return f"{name}:{meme_safe_name}"
+    
+    stages = []
+    preprocessing_inputs = {}
+    
+    # 1. 데이터 수집 (API 호출 위주라 스레드에서 실행, 플랫폼별 동시 수집 수 제한)
+    if not args.skip_collection:
+        stages.append(Stage(key('collection'), run_collection, outputs=[key('collected_platforms')],
+                            params={'meme_name': meme_name, 'platforms': args.platforms},
+                            kind='io', resources=args.platforms))
+        preprocessing_inputs['collected_platforms'] = key('collected_platforms')
+    
+    # 2. 데이터 전처리
+    stages.append(Stage(key('preprocessing'), run_preprocessing, inputs=preprocessing_inputs,
+                        outputs=[key('processed_filename')], params={'meme_name': meme_name}))
+    
+    # 3. 시각화 (실패해도 분석 결과는 유효하므로 필수 단계가 아님)
+    if not args.skip_visualization:
+        stages.append(Stage(key('visualization'), run_visualization,
+                            inputs={'processed_filename': key('processed_filename')}, outputs=[key('figures')],
+                            params={'meme_name': meme_name, 'profile': args.profile, 'workers': render_workers},
+                            required=False))
+    
+    # 4. 분석
+    if not args.skip_analysis:
+        stages.append(Stage(key('analysis'), run_analysis,
+                            inputs={'processed_filename': key('processed_filename')}, outputs=[key('report')],
+                            params={'meme_name': meme_name}))
+    
+    return stages, {step: key(step) for step in STEPS if key(step) in {stage.name for stage in stages}}
+
+def build_run_report(pipeline, run, meme_stages):
+    """밈별 단계 결과를 모은 실행 보고서
+
+    Args:
+        meme_stages: {밈 이름: {단계: Stage 이름}}
+    """
+    records = run['records']
+    artifacts = run['artifacts']
+    failed = set(pipeline.failed_required(run))
+    memes = {}
+    for meme_name, steps in meme_stages.items():
+        meme_safe_name = meme_name.replace(' ', '_').lower()
+        stage_results = {}
+        for step, stage_name in steps.items():
+            record = records[stage_name]
+            seconds = record['end'] - record['start'] if record['start'] is not None else None
+            stage_results[step] = {
+                'status': record['status'],
+                'seconds': round(seconds, 3) if seconds is not None else None,
+                'error': record['error'].splitlines()[0] if record['error'] else None
+            }
+        if any(stage_name in failed for stage_name in steps.values()):
+            status = 'failed'
+        elif any(result['status'] != 'done' for result in stage_results.values()):
+            status = 'partial'
+        else:
+            status = 'success'
+        memes[meme_name] = {
+            'status': status,
+            'stages': stage_results,
+            'processed_file': artifacts.get(f"processed_filename:{meme_safe_name}"),
+            'report': artifacts.get(f"report:{meme_safe_name}"),
+            'figures': artifacts.get(f"figures:{meme_safe_name}", [])
+        }
+    return {
+        'started_at': datetime.fromtimestamp(run['start']).strftime('%Y-%m-%d %H:%M:%S'),
+        'finished_at': datetime.fromtimestamp(run['end']).strftime('%Y-%m-%d %H:%M:%S'),
+        'elapsed_seconds': round(run['end'] - run['start'], 3),
+        'workers': pipeline.workers,
+        'critical_path': pipeline.critical_path(run),
+        'memes': memes
+    }
+
+def print_run_report(report):
+    """실행 보고서 표 출력 (단계별 상태와 소요 시간)"""
+    statuses = [meme['status'] for meme in report['memes'].values()]
+    print(f"\n=== 실행 보고서: 밈 {len(statuses)}개 (성공 {statuses.count('success')}, "
+          f"일부 실패 {statuses.count('partial')}, 실패 {statuses.count('failed')}) ===")
+    name_width = max(len(name) for name in report['memes']) + 2
+    print(f"{'meme':<{name_width}}" + ''.join(f"{step:>16}" for step in STEPS) + f"{'status':>10}")
+    symbols = {'done': '✓', 'failed': '✗', 'skipped': '-'}
+    for meme_name, meme in report['memes'].items():
+        cells = []
+        for step in STEPS:
+            result = meme['stages'].get(step)
+            if result is None:
+                cells.append(f"{'skip':>16}")
+            elif result['seconds'] is None:
+                cells.append(f"{symbols.get(result['status'], '?'):>16}")
+            else:
+                cells.append(f"{symbols.get(result['status'], '?') + ' ' + format(result['seconds'], '.2f') + 's':>16}")
+        print(f"{meme_name:<{name_width}}" + ''.join(cells) + f"{meme['status']:>10}")
+    for meme_name, meme in report['memes'].items():
+        for step, result in meme['stages'].items():
+            if result['status'] == 'failed':
+                print(f"  ✗ {meme_name} / {step}: {result['error']}")
+
 def main():
     """메인 실행 함수"""
     parser = argparse.ArgumentParser(
@@ -213,11 +337,19 @@ def main():
   python run_pipeline.py --meme "chill guy"
   python run_pipeline.py --meme "wojak" --platforms reddit
   python run_pipeline.py --meme "pepe" --skip-collection
+  python run_pipeline.py --meme "pepe" --skip-collection --profile draft
+  python run_pipeline.py --memes "chill guy" "wojak" --skip-collection
+  python run_pipeline.py --all
         """
     )
     
-    parser.add_argument('--meme', type=str, required=True, 
+    targets = parser.add_mutually_exclusive_group(required=True)
+    targets.add_argument('--meme', type=str,
                        help='분석할 밈 이름 (예: "chill guy", "wojak")')
+    targets.add_argument('--memes', nargs='+',
+                       help='여러 밈을 동시에 분석 (밈별 파이프라인을 하나의 워커 풀에서 실행)')
+    targets.add_argument('--all', action='store_true',
+                       help='config의 TARGET_MEMES 전체 분석')
     parser.add_argument('--platforms', nargs='+', default=['reddit'], 
                        choices=['twitter', 'reddit', 'instagram'],
                        help='데이터 수집 플랫폼 (기본값: reddit)')
@@ -227,13 +359,26 @@ def main():
                        help='시각화 단계 건너뛰기')
     parser.add_argument('--skip-analysis', action='store_true',
                        help='분석 단계 건너뛰기')
+    parser.add_argument('--profile', choices=list(RENDER_PROFILES), default=DEFAULT_RENDER_PROFILE,
+                       help='시각화 렌더 프로파일 (draft: 빠른 검토, web: 압축 PNG, publication: 300dpi PNG/SVG/PDF)')
+    parser.add_argument('--workers', type=int, default=None,
+                       help='CPU 단계(전처리/시각화/분석) 동시 실행 프로세스 수 (기본: CPU 코어 수)')
+    parser.add_argument('--collection-concurrency', type=int, default=1,
+                       help='플랫폼별 동시 수집 밈 수 (API 요청 제한, 기본값: 1)')
     
     args = parser.parse_args()
     
+    memes = [args.meme] if args.meme else (args.memes or TARGET_MEMES)
+    # 파일명이 같아지는 밈 이름은 한 번만 실행 (처음 나온 이름 사용)
+    unique_memes = {}
+    for meme in memes:
+        unique_memes.setdefault(meme.replace(' ', '_').lower(), meme)
+    memes = list(unique_memes.values())
+    
     print(f"\n{'='*60}")
     print(f"밈 수명 주기 분석 파이프라인")
     print(f"{'='*60}")
-    print(f"분석 대상: {args.meme}")
+    print(f"분석 대상: {', '.join(memes)}")
     print(f"플랫폼: {', '.join(args.platforms)}")
     print(f"시작 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print(f"{'='*60}")
@@ -245,41 +390,41 @@ def main():
     
     start_time = time.time()
     
+    for flag, step in [('skip_collection', '데이터 수집'), ('skip_visualization', '시각화'), ('skip_analysis', '분석')]:
+        if getattr(args, flag):
+            print(f"\n⏭️  {step} 단계를 건너뜁니다.")
+    
     try:
-        # 1. 데이터 수집
-        if not args.skip_collection:
-            collected = run_collection(args.meme, args.platforms)
-            if not collected:
-                print("\n❌ 데이터 수집에 실패했습니다.")
-                return 1
-            time.sleep(2)
-        else:
-            print("\n⏭️  데이터 수집 단계를 건너뜁니다.")
+        # 동시에 실행될 수 있는 CPU 단계(밈별 시각화/분석 분기)가 CPU 프로세스를 나눠 쓰도록
+        # 그림 렌더링 프로세스 수를 제한 (밈 하나여도 시각화와 분석이 동시에 실행됨)
+        workers = args.workers or os.cpu_count() or 1
+        cpu_branches = max(1, (not args.skip_visualization) + (not args.skip_analysis))
+        concurrent_cpu_stages = min(workers, len(memes) * cpu_branches)
+        render_workers = max(1, workers // concurrent_cpu_stages)
+        stages = []
+        meme_stages = {}
+        for meme_name in memes:
+            meme_stage_list, meme_stages[meme_name] = build_stages(meme_name, args, render_workers)
+            stages.extend(meme_stage_list)
         
-        # 2. 데이터 전처리
-        processed_filename = run_preprocessing(args.meme)
-        if not processed_filename:
-            print("\n❌ 데이터 전처리에 실패했습니다.")
-            return 1
-        time.sleep(1)
+        pipeline = Pipeline(stages, workers=args.workers,
+                            resource_limits={platform: args.collection_concurrency for platform in args.platforms})
+        run = pipeline.run()
+        pipeline.print_timeline(run)
         
-        # 3. 시각화
-        if not args.skip_visualization:
-            success = run_visualization(processed_filename, args.meme)
-            if not success:
-                print("\n⚠️  시각화 생성에 실패했지만 계속 진행합니다.")
-            time.sleep(1)
-        else:
-            print("\n⏭️  시각화 단계를 건너뜁니다.")
+        # 실행 보고서
+        report = build_run_report(pipeline, run, meme_stages)
+        print_run_report(report)
+        report_path = os.path.join(REPORTS_DIR, f"pipeline_run_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+        os.makedirs(REPORTS_DIR, exist_ok=True)
+        save_json_file(report, report_path)
         
-        # 4. 분석
-        if not args.skip_analysis:
-            success = run_analysis(processed_filename, args.meme)
-            if not success:
-                print("\n⚠️  분석에 실패했습니다.")
-                return 1
-        else:
-            print("\n⏭️  분석 단계를 건너뜁니다.")
+        if any(meme['stages'].get('visualization', {}).get('status') == 'failed' for meme in report['memes'].values()):
+            print("\n⚠️  시각화 생성에 실패했지만 계속 진행합니다.")
+        failed = [meme_name for meme_name, meme in report['memes'].items() if meme['status'] == 'failed']
+        if failed:
+            print(f"\n❌ 파이프라인 실패: {', '.join(failed)}")
+            return 1
         
         # 완료 메시지
         elapsed_time = time.time() - start_time
@@ -0,0 +1,230 @@
+import pandas as pd
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+import contextlib
+import io
+import json
+import os
+import sys
+import glob
+import time
+import argparse
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from config.config import PROCESSED_DATA_DIR, REPORTS_DIR
+from src.analyzers import kernels
+from src.analyzers.lifecycle_analyzer import (
+    LifecycleAnalyzer, DAILY_METRIC_COLUMNS, diffusion_metrics, duration_lifecycle_type,
+    extract_meme_name_from_processed_filename
+)
+from src.analyzers.shape_clustering import cluster_daily_metrics
+from src.analyzers.curve_index import load_or_create_index
+
+# 분석에 필요한 컬럼만 로드
+CORPUS_COLUMNS = ['id', 'author', 'subreddit', 'score', 'num_comments', 'engagement_score', 'created_utc', 'date']
+
+
+def find_latest_processed_files(meme_names=None):
+    """밈별 가장 최근 전처리 파일 {밈 이름: 경로}"""
+    latest = {}
+    for filepath in glob.glob(os.path.join(PROCESSED_DATA_DIR, "processed_reddit_*_*.csv")):
+        meme = extract_meme_name_from_processed_filename(os.path.basename(filepath))
+        if meme not in latest or os.path.getctime(filepath) > os.path.getctime(latest[meme]):
+            latest[meme] = filepath
+
+    if meme_names:
+        wanted = {name.replace(' ', '_').lower() for name in meme_names}
+        latest = {meme: path for meme, path in latest.items() if meme in wanted}
+    return latest
+
+
+def load_processed_corpus(files):
+    """전처리 파일들을 meme 컬럼이 있는 하나의 long-format DataFrame으로 로드"""
+    frames = []
+    for meme, filepath in files.items():
+        df = pd.read_csv(filepath, usecols=CORPUS_COLUMNS)
+        df['meme'] = meme
+        frames.append(df)
+
+    corpus = pd.concat(frames, ignore_index=True)
+    corpus['meme'] = corpus['meme'].astype('category')
+    corpus['created_utc'] = pd.to_datetime(corpus['created_utc'])
+    corpus['date'] = pd.to_datetime(corpus['date'])
+    print(f"코퍼스 로드: 밈 {len(files)}개, 게시물 {len(corpus):,}개")
+    return corpus
+
+
+def build_daily_metrics_grouped(corpus):
+    """모든 밈의 daily_metrics를 한 번의 groupby로 계산
+
+    결과는 meme 컬럼이 추가된 것 외에는 build_daily_metrics와 같은 형태이며,
+    이동 평균/성장률/누적합은 밈별 시계열을 2차원 배열로 묶어 kernels로 계산한다.
+    """
+    daily = corpus.groupby(['meme', 'date'], observed=True, sort=True).agg({
+        'id': 'count',
+        'score': ['mean', 'sum'],
+        'num_comments': ['mean', 'sum'],
+        'engagement_score': 'sum'
+    }).reset_index()
+    daily.columns = ['meme'] + DAILY_METRIC_COLUMNS
+
+    # 밈별 시계열을 (밈 x 최대 일수) 배열로 배치 (남는 칸은 NaN)
+    rows = daily['meme'].cat.codes.to_numpy()
+    cols = daily.groupby('meme', observed=True).cumcount().to_numpy()
+    shape = (len(daily['meme'].cat.categories), int(cols.max()) + 1 if len(cols) else 0)
+
+    def to_matrix(column):
+        matrix = np.full(shape, np.nan)
+        matrix[rows, cols] = daily[column].to_numpy(dtype=np.float64)
+        return matrix
+
+    post_matrix = to_matrix('post_count')
+    ma7_posts = kernels.rolling_mean(post_matrix, window=7, min_periods=1)
+
+    daily['cumulative_posts'] = kernels.cumsum(post_matrix)[rows, cols].astype(np.int64)
+    first_dates = daily.groupby('meme', observed=True)['date'].transform('min')
+    daily['days_since_start'] = (daily['date'] - first_dates).dt.days
+    daily['ma7_posts'] = ma7_posts[rows, cols]
+    daily['ma7_engagement'] = kernels.rolling_mean(to_matrix('total_engagement'), window=7, min_periods=1)[rows, cols]
+    daily['growth_rate'] = kernels.pct_change(ma7_posts)[rows, cols]
+    return daily
+
+
+def _fit_curve_worker(item):
+    """프로세스 풀에서 실행되는 밈 하나의 곡선 피팅 (프로세스 안에서는 모델을 순차 피팅)"""
+    meme, daily_metrics = item
+    analyzer = LifecycleAnalyzer()
+    with contextlib.redirect_stdout(io.StringIO()):
+        return meme, analyzer.fit_lifecycle_curve(daily_metrics)
+
+
+class BatchLifecycleAnalyzer:
+    def __init__(self, workers=None, start_date=None, end_date=None, n_clusters=6):
+        """여러 밈 일괄 수명 주기 분석기 초기화
+
+        Args:
+            workers: 곡선 피팅 프로세스 수 (None이면 CPU 수)
+            start_date, end_date: 단계 분할 기간 (None이면 전체 이력)
+            n_clusters: 곡선 형태 군집 수
+        """
+        self.workers = workers
+        self.n_clusters = n_clusters
+        self.analyzer = LifecycleAnalyzer(start_date=start_date, end_date=end_date)
+
+    def fit_curves(self, daily_by_meme):
+        """모든 밈의 곡선 피팅을 프로세스 풀에서 실행"""
+        print(f"\n=== Batch Curve Fitting ({len(daily_by_meme)} memes) ===")
+        items = list(daily_by_meme.items())
+        if self.workers == 1 or len(items) <= 1:
+            return dict(_fit_curve_worker(item) for item in items)
+
+        with ProcessPoolExecutor(max_workers=self.workers, mp_context=kernels.pool_context()) as executor:
+            return dict(executor.map(_fit_curve_worker, items, chunksize=max(1, len(items) // 32)))
+
+    def analyze(self, corpus):
+        """코퍼스 전체 분석 후 밈별 결과 테이블 반환"""
+        start_time = time.time()
+        daily = build_daily_metrics_grouped(corpus)
+        daily_by_meme = {meme: group.drop(columns='meme').reset_index(drop=True)
+                         for meme, group in daily.groupby('meme', observed=True)}
+
+        fits = self.fit_curves(daily_by_meme)
+        # 확산 네트워크는 코퍼스 전체로 한 번만 구성
+        diffusion = diffusion_metrics(corpus)
+
+        rows = []
+        for meme, meme_df in corpus.groupby('meme', observed=True):
+            daily_metrics = daily_by_meme[meme]
+            with contextlib.redirect_stdout(io.StringIO()):
+                phases = self.analyzer._identify_phases(daily_metrics)
+                metrics = self.analyzer.calculate_lifecycle_metrics(meme_df, daily_metrics, diffusion[meme])
+
+            curve = fits.get(meme)
+            rows.append({
+                'meme': meme,
+                'total_posts': metrics['total_posts'],
+                'unique_authors': metrics['unique_authors'],
+                'duration_days': metrics['duration_days'],
+                'peak_date': metrics['peak_date'],
+                'days_to_peak': metrics['days_to_peak'],
+                'avg_score': metrics['avg_score'],
+                'avg_comments': metrics['avg_comments'],
+                'total_engagement': metrics['total_engagement'],
+                'posts_per_author': metrics['posts_per_author'],
+                'subreddit_count': metrics['subreddit_count'],
+                'independent_introductions': metrics['independent_introductions'],
+                'max_cascade_depth': metrics['max_cascade_depth'],
+                'bridge_author_share': metrics['bridge_author_share'],
+                'hub_subreddit': metrics['hub_subreddit'],
+                'growth_decline_ratio': metrics.get('growth_decline_ratio', np.nan),
+                'active_days_ratio': metrics['active_days_ratio'],
+                'viral_concentration': metrics['viral_concentration'],
+                'phase_count': len(phases) if phases else 0,
+                'phase_sequence': ' > '.join(phase['phase'] for phase in phases) if phases else None,
+                'curve_model': curve['model'] if curve else None,
+                'r_squared': curve['r_squared'] if curve else np.nan,
+                'curve_bic': curve['bic'] if curve else np.nan,
+                'peak_day': curve['peak_day'] if curve else np.nan,
+                'spread_days': curve['spread_days'] if curve else np.nan,
+                'curve_parameters': json.dumps(np.asarray(curve['parameters']).tolist()) if curve else None
+            })
+
+        results = pd.DataFrame(rows)
+
+        # 곡선 형태 군집 학습 (모델은 단일 밈 보고서 분류에도 사용됨)
+        assignments = cluster_daily_metrics(daily, n_clusters=self.n_clusters)
+        if assignments is not None:
+            results = results.merge(assignments, on='meme', how='left')
+            results['lifecycle_type'] = results['shape_cluster_name']
+        else:
+            results['lifecycle_type'] = results['duration_days'].map(duration_lifecycle_type)
+
+        print(f"일괄 분석 완료: 밈 {len(results)}개, {time.time() - start_time:.2f}초")
+        return results, daily
+
+
+def run_batch_analysis(meme_names=None, workers=None, start_date=None, end_date=None):
+    """전처리된 모든 밈(또는 지정한 밈) 일괄 분석 후 결과 테이블 저장"""
+    files = find_latest_processed_files(meme_names)
+    if not files:
+        print("전처리된 데이터 파일을 찾을 수 없습니다.")
+        return None
+
+    corpus = load_processed_corpus(files)
+    results, daily = BatchLifecycleAnalyzer(workers=workers, start_date=start_date, end_date=end_date).analyze(corpus)
+    results['source_file'] = results['meme'].map(lambda meme: os.path.basename(files[meme]))
+
+    os.makedirs(REPORTS_DIR, exist_ok=True)
+    output_path = os.path.join(REPORTS_DIR, 'lifecycle_batch_results.csv')
+    results.to_csv(output_path, index=False)
+    print(f"\n결과 테이블 저장: {output_path}")
+
+    # 분석한 밈 곡선을 유사 밈 검색 색인에 반영
+    index = load_or_create_index()
+    for meme, group in daily.groupby('meme', observed=True):
+        index.add_daily_metrics(meme, group)
+    print(f"곡선 색인 갱신: {index.save()} (밈 {len(index)}개)")
+    return output_path
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description='여러 밈 수명 주기 일괄 분석')
+    parser.add_argument('--memes', nargs='+', help='분석할 밈 이름 목록 (미지정 시 전체)')
+    parser.add_argument('--workers', type=int, default=None, help='곡선 피팅 프로세스 수')
+    parser.add_argument('--start-date', type=str, help='단계 분할 시작일 (YYYY-MM-DD)')
+    parser.add_argument('--end-date', type=str, help='단계 분할 종료일 (YYYY-MM-DD)')
+
+    args = parser.parse_args()
+
+    try:
+        run_batch_analysis(args.memes, args.workers, args.start_date, args.end_date)
+    except Exception as e:
+        print(f"❌ 일괄 분석 중 오류 발생: {e}")
+        import traceback
+        traceback.print_exc()
+
+# 실행 코드
+if __name__ == "__main__":
+    main()
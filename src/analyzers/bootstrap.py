@@ -0,0 +1,218 @@
+"""
+수명 주기 지표와 곡선 파라미터의 부트스트랩 신뢰 구간
+
+게시물을 복원 추출한 인덱스 행렬 (재표본 수, 게시물 수)을 한 번에 만들고,
+집중도/성장-하락 비율 등 지표와 일별 게시물 수를 행렬 연산으로 계산한다.
+곡선 파라미터는 재표본별 일별 게시물 수에 원래 선택된 모델을 다시 피팅하며,
+피팅은 프로세스 풀에 나누어 실행한다. 재표본은 SeedSequence로 묶음마다 독립 시드를
+쓰므로 워커 수와 관계없이 같은 결과가 나온다.
+
+재표본 일별 게시물 수는 원래 계열보다 잡음이 커서 재표본 분포가 점추정값에서 한쪽으로 밀리므로
+신뢰 구간은 편향 보정 백분위(BC) 구간으로 계산한다. r_squared는 재표본 피팅 곡선을 원래 계열에
+대해 평가하며, 원래 피팅이 그 계열의 최적이므로 점추정값을 상한으로 하는 단측 구간을 쓴다.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+import os
+from statistics import NormalDist
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.analyzers import kernels
+from src.analyzers.curve_models import MODELS, fit_model
+from src.analyzers.lifecycle_analyzer import curve_fit_data
+
+# 인덱스 행렬 한 묶음의 최대 원소 수 (메모리 상한)
+MAX_CHUNK_ELEMENTS = 10_000_000
+# 보고서에 신뢰 구간을 붙이는 지표
+METRIC_NAMES = ['avg_score', 'avg_comments', 'days_to_peak', 'growth_decline_ratio', 'viral_concentration']
+
+
+def _refit_worker(item):
+    """프로세스 풀에서 실행되는 재표본 곡선 피팅 묶음 (r_squared는 원래 계열 y_observed 기준)"""
+    model_name, x, y_observed, y_matrix, p0 = item
+    model = MODELS[model_name]
+    ss_tot = float(np.sum((y_observed - y_observed.mean()) ** 2))
+    results = np.full((len(y_matrix), model.n_params + 3), np.nan)
+    for i, y in enumerate(y_matrix):
+        fit = fit_model(model_name, x, y, p0=p0, max_nfev=50 * model.n_params)
+        if 'error' not in fit:
+            rss = float(np.sum((y_observed - model.func(x, *fit['parameters'])) ** 2))
+            results[i, :model.n_params] = fit['parameters']
+            results[i, model.n_params:] = 1 - rss / ss_tot if ss_tot > 0 else 0.0, fit['peak_day'], fit['spread_days']
+    return results
+
+
+class LifecycleBootstrap:
+    def __init__(self, n_resamples=1000, confidence=0.95, workers=None, seed=42):
+        """부트스트랩 신뢰 구간 계산기
+
+        Args:
+            n_resamples: 재표본 수
+            confidence: 신뢰 수준
+            workers: 곡선 재피팅 프로세스 수 (None이면 CPU 수, 1이면 현재 프로세스)
+            seed: 재표본 시드
+        """
+        self.n_resamples = n_resamples
+        self.confidence = confidence
+        self.workers = workers
+        self.seed = seed
+
+    def _chunks(self, n_posts):
+        """(묶음 크기, 난수 생성기) 목록 (묶음 크기는 게시물 수로만 정해져 재현 가능)"""
+        chunk_size = max(1, min(self.n_resamples, MAX_CHUNK_ELEMENTS // max(n_posts, 1)))
+        sizes = [min(chunk_size, self.n_resamples - start) for start in range(0, self.n_resamples, chunk_size)]
+        seeds = np.random.SeedSequence(self.seed).spawn(len(sizes))
+        return [(size, np.random.default_rng(seed)) for size, seed in zip(sizes, seeds)]
+
+    def resample(self, df, daily_metrics):
+        """재표본별 지표 배열과 곡선 피팅 구간의 일별 게시물 수 행렬
+
+        Returns:
+            ({지표 이름: (재표본 수,) 배열}, (재표본 수, 피팅 구간 일수) 행렬)
+        """
+        n_posts = len(df)
+        dates = daily_metrics['date'].to_numpy()
+        day_codes = np.searchsorted(dates, df['date'].to_numpy()).astype(np.int64)
+        day_offsets = (daily_metrics['date'] - daily_metrics['date'].min()).dt.days.to_numpy()
+        n_days = len(dates)
+
+        recent_data, _, _ = curve_fit_data(daily_metrics)
+        fit_days = np.searchsorted(dates, recent_data['date'].to_numpy())
+
+        score = df['score'].to_numpy(dtype=np.float64)
+        comments = df['num_comments'].to_numpy(dtype=np.float64)
+        engagement = df['engagement_score'].to_numpy(dtype=np.float64)
+        top_k = int(n_posts * 0.1)
+
+        samples = {name: [] for name in METRIC_NAMES}
+        fit_counts = []
+        for size, rng in self._chunks(n_posts):
+            # 복원 추출 인덱스 행렬 (size, n_posts)
+            indices = rng.integers(0, n_posts, size=(size, n_posts), dtype=np.int64)
+
+            samples['avg_score'].append(score[indices].mean(axis=1))
+            samples['avg_comments'].append(comments[indices].mean(axis=1))
+
+            resampled = engagement[indices]
+            total = resampled.sum(axis=1)
+            if top_k > 0:
+                top = np.partition(resampled, n_posts - top_k, axis=1)[:, n_posts - top_k:].sum(axis=1)
+            else:
+                top = np.zeros(size)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                samples['viral_concentration'].append(top / total)
+            del resampled
+
+            # 재표본별 일별 게시물 수 (행마다 오프셋을 더해 bincount 한 번으로 계산)
+            codes = day_codes[indices] + (np.arange(size) * n_days)[:, np.newaxis]
+            counts = np.bincount(codes.ravel(), minlength=size * n_days).reshape(size, n_days)
+            del codes, indices
+
+            peak = counts.argmax(axis=1)
+            first_day = (counts > 0).argmax(axis=1)
+            growth = np.take_along_axis(np.cumsum(counts, axis=1), peak[:, np.newaxis], axis=1)[:, 0] \
+                - counts[np.arange(size), peak]
+            samples['days_to_peak'].append((day_offsets[peak] - day_offsets[first_day]).astype(np.float64))
+            samples['growth_decline_ratio'].append(growth / np.maximum(n_posts - growth, 1))
+            fit_counts.append(counts[:, fit_days])
+
+        return {name: np.concatenate(values) for name, values in samples.items()}, np.vstack(fit_counts)
+
+    def refit_curves(self, curve_fit, daily_metrics, fit_counts):
+        """재표본 일별 게시물 수에 선택된 모델을 웜 스타트로 다시 피팅
+
+        r_squared는 재표본 피팅 곡선을 원래 일별 게시물 수에 대해 평가한 값이다.
+
+        Returns:
+            {파라미터/r_squared/peak_day/spread_days 이름: (재표본 수,) 배열}
+        """
+        model = MODELS[curve_fit['model']]
+        _, x, y = curve_fit_data(daily_metrics)
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        p0 = np.asarray(curve_fit['parameters'], dtype=np.float64)
+
+        workers = self.workers or os.cpu_count() or 1
+        n_jobs = 1 if workers == 1 else min(len(fit_counts), workers * 4)
+        jobs = [(curve_fit['model'], x, y, part, p0) for part in np.array_split(fit_counts, n_jobs)]
+        if n_jobs == 1:
+            results = [_refit_worker(job) for job in jobs]
+        else:
+            with ProcessPoolExecutor(max_workers=workers, mp_context=kernels.pool_context()) as executor:
+                results = list(executor.map(_refit_worker, jobs))
+        results = np.vstack(results)
+
+        names = [f'param_{name}' for name in model.param_names] + ['r_squared', 'peak_day', 'spread_days']
+        return {name: results[:, i] for i, name in enumerate(names)}
+
+    def interval(self, values, estimate, one_sided=False):
+        """편향 보정 백분위(BC) 신뢰 구간 딕셔너리
+
+        점추정값보다 작은 재표본 비율 p로 z0 = Φ⁻¹(p)를 구해 백분위를 Φ(2·z0 ± z)로 옮긴다.
+        재표본 분포가 점추정값을 중심으로 대칭이면 보통 백분위 구간과 같다.
+
+        Args:
+            values: 재표본 값 배열
+            estimate: 점추정값 (NaN이면 보정 없이 백분위 구간)
+            one_sided: True면 점추정값을 상한으로 하는 단측 구간 (점추정값이 재표본 값의 최댓값일 때)
+        """
+        values = values[np.isfinite(values)]
+        n = len(values)
+        if n == 0:
+            return {'estimate': estimate, 'low': np.nan, 'high': np.nan, 'std': np.nan, 'n': 0}
+
+        normal = NormalDist()
+        if one_sided:
+            low, high = float(np.quantile(values, 1 - self.confidence)), estimate
+        else:
+            z = normal.inv_cdf(1 - (1 - self.confidence) / 2)
+            z0 = 0.0
+            if np.isfinite(estimate):
+                below = (np.count_nonzero(values < estimate) + 0.5 * np.count_nonzero(values == estimate)) / n
+                z0 = normal.inv_cdf(min(max(below, 0.5 / n), 1 - 0.5 / n))
+            low = float(np.quantile(values, normal.cdf(2 * z0 - z)))
+            high = float(np.quantile(values, normal.cdf(2 * z0 + z)))
+        return {
+            'estimate': estimate,
+            'low': low,
+            'high': high,
+            'std': float(values.std(ddof=1)) if n > 1 else 0.0,
+            'n': int(n)
+        }
+
+    def confidence_intervals(self, df, daily_metrics, metrics, curve_fit=None):
+        """지표(와 곡선 파라미터)의 부트스트랩 신뢰 구간
+
+        Args:
+            df: 게시물 DataFrame
+            daily_metrics: identify_lifecycle_phases(df)의 일별 지표
+            metrics: calculate_lifecycle_metrics 결과 (점추정값)
+            curve_fit: fit_lifecycle_curve 결과 (None이면 곡선 구간 생략)
+
+        Returns:
+            {이름: {'estimate', 'low', 'high', 'std', 'n'}}
+        """
+        print(f"\n=== Bootstrap Confidence Intervals ({self.n_resamples} resamples) ===")
+        start_time = time.time()
+
+        samples, fit_counts = self.resample(df, daily_metrics)
+        intervals = {name: self.interval(values, metrics.get(name, np.nan)) for name, values in samples.items()}
+        resample_time = time.time() - start_time
+
+        if curve_fit:
+            model = MODELS[curve_fit['model']]
+            estimates = dict(zip([f'param_{name}' for name in model.param_names], curve_fit['parameters']))
+            estimates.update({key: curve_fit[key] for key in ('r_squared', 'peak_day', 'spread_days')})
+            curve_samples = self.refit_curves(curve_fit, daily_metrics, fit_counts)
+            intervals.update({name: self.interval(values, float(estimates[name]), one_sided=name == 'r_squared')
+                              for name, values in curve_samples.items()})
+
+        print(f"재표본 지표 {resample_time:.2f}초, 전체 {time.time() - start_time:.2f}초")
+        for name, ci in intervals.items():
+            print(f"  {name}: {ci['estimate']:.4g} [{ci['low']:.4g}, {ci['high']:.4g}]")
+        return intervals
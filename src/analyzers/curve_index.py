@@ -0,0 +1,341 @@
+"""
+밈 수명 주기 곡선 최근접 이웃 색인
+
+각 밈의 일별 게시물 곡선을 고정 길이로 리샘플링/정규화한 벡터로 만들어
+KD-트리에 저장한다. 아직 진행 중인 밈의 부분 곡선도 비교할 수 있도록 활동 시작 후
+14/30/60/90/180일 구간(prefix)과 전체 구간을 각각 따로 색인한다.
+"""
+
+import argparse
+import json
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from config.config import MODELS_DIR
+from src.analyzers.shape_clustering import normalize_curve
+
+DEFAULT_INDEX_PATH = os.path.join(MODELS_DIR, 'curve_index.npz')
+DEFAULT_HORIZONS = (14, 30, 60, 90, 180)
+FULL = 'full'
+VECTOR_LENGTH = 32
+# 7일 합계가 이 값 이상이 되는 시점을 활동 시작으로 본다
+MIN_START_POSTS = 5
+
+
+def daily_counts(daily_metrics):
+    """daily_metrics에서 빠진 날짜를 0으로 채운 일별 게시물 수 Series"""
+    return daily_metrics.set_index('date')['post_count'].sort_index().asfreq('D', fill_value=0)
+
+
+def activity_start(values, min_posts=MIN_START_POSTS):
+    """활동 시작 인덱스 (7일 합계가 min_posts에 처음 도달한 구간의 첫 게시일), 없으면 None"""
+    rolling = np.convolve(values, np.ones(7), mode='full')[:len(values)]
+    reached = np.flatnonzero(rolling >= min_posts)
+    if len(reached) == 0:
+        return None
+    first = reached[0]
+    window = values[max(0, first - 6):first + 1]
+    return max(0, first - 6) + int(np.flatnonzero(window > 0)[0])
+
+
+def embed(counts, horizon, length=VECTOR_LENGTH):
+    """곡선 하나를 색인용 벡터로 변환
+
+    Args:
+        counts: daily_counts() 형태의 일별 게시물 수
+        horizon: 활동 시작 후 일수, 또는 'full'(활동 구간 전체)
+
+    Returns:
+        (length,) 벡터, 데이터가 horizon보다 짧으면 None
+    """
+    if horizon == FULL:
+        return normalize_curve(counts, length=length)
+
+    values = counts.to_numpy(dtype=np.float64)
+    start = activity_start(values)
+    if start is None or len(values) - start < horizon:
+        return None
+    segment = values[start:start + horizon]
+    smoothed = pd.Series(segment).rolling(window=7, min_periods=1).mean().to_numpy()
+    resampled = np.interp(np.linspace(0, horizon - 1, length), np.arange(horizon), smoothed)
+    return resampled / resampled.max() if resampled.max() > 0 else None
+
+
+def curve_summary(counts):
+    """이웃 밈의 이후 궤적 참고용 요약 (활동 시작 기준 일수)"""
+    values = counts.to_numpy(dtype=np.float64)
+    start = activity_start(values) or 0
+    peak = int(np.argmax(values))
+    return {
+        'start_date': str(counts.index[start].date()),
+        'total_posts': int(values.sum()),
+        'peak_posts': int(values[peak]),
+        'days_to_peak': int(peak - start),
+        'active_days': int(np.count_nonzero(values[start:]))
+    }
+
+
+class CurveIndex:
+    def __init__(self, horizons=DEFAULT_HORIZONS, length=VECTOR_LENGTH, rebuild_ratio=0.1):
+        """곡선 최근접 이웃 색인
+
+        새로 추가된 벡터는 리스트 버퍼에 쌓아 전수 비교하고, 트리를 다시 만들 때 한 번에
+        행렬로 합친다. 제거하거나 교체한 밈의 트리 행은 지우지 않고 표시(tombstone)만 해 두었다가
+        조회에서 건너뛴다. 버퍼와 표시된 행의 합이 트리 크기의 rebuild_ratio를 넘으면
+        표시된 행을 정리하고 트리를 다시 만든다.
+
+        Args:
+            horizons: prefix 구간 길이 목록 (일)
+            length: 벡터 길이
+            rebuild_ratio: 트리 재구성 기준 버퍼 비율
+        """
+        self.horizons = list(horizons) + [FULL]
+        self.length = length
+        self.rebuild_ratio = rebuild_ratio
+        self.summaries = {}
+        # 트리에 들어간 벡터 행렬과 아직 트리에 반영되지 않은 벡터 목록 (행 번호는 이어짐)
+        self.vectors = {h: np.empty((0, length)) for h in self.horizons}
+        self.buffers = {h: [] for h in self.horizons}
+        self.names = {h: [] for h in self.horizons}
+        self.trees = {h: None for h in self.horizons}
+        self.tree_sizes = {h: 0 for h in self.horizons}
+        self.rows = {h: {} for h in self.horizons}
+        self.removed = {h: 0 for h in self.horizons}
+
+    def __len__(self):
+        return len(self.summaries)
+
+    def __contains__(self, meme):
+        return meme in self.summaries
+
+    # ------------------------------------------------------------------
+    # 추가
+    # ------------------------------------------------------------------
+
+    def _rebuild(self, horizon):
+        """버퍼를 행렬에 합치고 표시된(제거된) 행을 정리한 뒤 트리 재구성"""
+        from scipy.spatial import cKDTree
+
+        if self.buffers[horizon]:
+            self.vectors[horizon] = np.vstack([self.vectors[horizon]] + self.buffers[horizon])
+            self.buffers[horizon] = []
+        if self.removed[horizon]:
+            live = [row for row, name in enumerate(self.names[horizon]) if name is not None]
+            self.vectors[horizon] = self.vectors[horizon][live]
+            self.names[horizon] = [self.names[horizon][row] for row in live]
+            self.removed[horizon] = 0
+        self.rows[horizon] = {name: row for row, name in enumerate(self.names[horizon])}
+        vectors = self.vectors[horizon]
+        self.trees[horizon] = cKDTree(vectors) if len(vectors) else None
+        self.tree_sizes[horizon] = len(vectors)
+
+    def _maybe_rebuild(self, horizon):
+        """버퍼와 표시된 행이 트리 크기의 rebuild_ratio를 넘으면 재구성"""
+        pending = len(self.buffers[horizon]) + self.removed[horizon]
+        if pending > max(1, self.rebuild_ratio * self.tree_sizes[horizon]):
+            self._rebuild(horizon)
+
+    def _discard(self, meme, horizon):
+        """구간 색인에서 밈 행을 제거 표시 (트리는 그대로 두고 조회에서 건너뜀)"""
+        row = self.rows[horizon].pop(meme, None)
+        if row is not None:
+            self.names[horizon][row] = None
+            self.removed[horizon] += 1
+
+    def remove(self, meme):
+        """밈 제거"""
+        if meme not in self.summaries:
+            return
+        del self.summaries[meme]
+        for horizon in self.horizons:
+            self._discard(meme, horizon)
+            self._maybe_rebuild(horizon)
+
+    def add(self, meme, counts):
+        """밈 곡선 추가 (이미 있으면 교체)
+
+        교체할 행이 아직 버퍼에 있으면 그 자리에서 덮어쓰고, 트리에 있으면 제거 표시 후 버퍼에 추가한다.
+
+        Args:
+            counts: daily_counts() 형태의 일별 게시물 수
+        """
+        self.summaries[meme] = curve_summary(counts)
+        for horizon in self.horizons:
+            vector = embed(counts, horizon, self.length)
+            row = self.rows[horizon].get(meme)
+            if vector is not None and row is not None and row >= self.tree_sizes[horizon]:
+                self.buffers[horizon][row - self.tree_sizes[horizon]] = vector
+                continue
+            self._discard(meme, horizon)
+            if vector is not None:
+                self.rows[horizon][meme] = len(self.names[horizon])
+                self.buffers[horizon].append(vector)
+                self.names[horizon].append(meme)
+            self._maybe_rebuild(horizon)
+        return self
+
+    def add_daily_metrics(self, meme, daily_metrics):
+        """build_daily_metrics 결과로 밈 곡선 추가"""
+        return self.add(meme, daily_counts(daily_metrics))
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def choose_horizon(self, counts):
+        """질의 곡선 길이에 맞는 가장 긴 prefix 구간 (부족하면 None)"""
+        values = counts.to_numpy(dtype=np.float64)
+        start = activity_start(values)
+        if start is None:
+            return None
+        available = len(values) - start
+        fitting = [h for h in self.horizons if h != FULL and h <= available]
+        return max(fitting) if fitting else None
+
+    def query_vector(self, vector, horizon, k=5, exclude=()):
+        """벡터와 가장 가까운 k개 밈 [(밈, 거리)]"""
+        names = self.names[horizon]
+        exclude = set(exclude)
+        n_candidates = min(len(self.rows[horizon]), k + len(exclude))
+        if n_candidates == 0:
+            return []
+
+        found = []
+        tree_size = self.tree_sizes[horizon]
+        if self.trees[horizon] is not None:
+            # 제거 표시된 행이 앞을 차지할 수 있으므로 그만큼 더 조회
+            n_tree = min(n_candidates + self.removed[horizon], tree_size)
+            distances, rows = self.trees[horizon].query(vector, k=n_tree)
+            found.extend(zip(np.atleast_1d(rows), np.atleast_1d(distances)))
+        # 트리에 아직 반영되지 않은 버퍼는 전수 비교
+        if self.buffers[horizon]:
+            buffer = np.asarray(self.buffers[horizon])
+            distances = np.sqrt(((buffer - vector) ** 2).sum(axis=1))
+            found.extend(zip(range(tree_size, len(names)), distances))
+
+        found.sort(key=lambda item: item[1])
+        results = [(names[row], float(distance)) for row, distance in found
+                   if names[row] is not None and names[row] not in exclude]
+        return results[:k]
+
+    def query(self, counts, k=5, horizon=None, exclude=()):
+        """부분(또는 전체) 곡선과 비슷한 밈 상위 k개
+
+        Args:
+            counts: daily_counts() 형태의 일별 게시물 수
+            horizon: 비교 구간 (None이면 질의 길이에 맞는 가장 긴 prefix, 'full'이면 전체 곡선)
+            exclude: 결과에서 제외할 밈 이름
+
+        Returns:
+            [{'meme', 'distance', 'horizon', 요약 지표...}] 거리 오름차순
+        """
+        horizon = horizon or self.choose_horizon(counts)
+        if horizon is None:
+            return []
+        vector = embed(counts, horizon, self.length)
+        if vector is None:
+            return []
+        return [dict(meme=meme, distance=distance, horizon=horizon, **self.summaries[meme])
+                for meme, distance in self.query_vector(vector, horizon, k, exclude)]
+
+    def query_daily_metrics(self, daily_metrics, k=5, horizon=None, exclude=()):
+        return self.query(daily_counts(daily_metrics), k, horizon, exclude)
+
+    # ------------------------------------------------------------------
+    # 저장/로드
+    # ------------------------------------------------------------------
+
+    def save(self, filepath=DEFAULT_INDEX_PATH):
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        for h in self.horizons:
+            if self.removed[h] or self.buffers[h]:
+                self._rebuild(h)
+        arrays = {f'vectors_{h}': self.vectors[h] for h in self.horizons}
+        metadata = {
+            'horizons': [h for h in self.horizons if h != FULL],
+            'length': self.length,
+            'rebuild_ratio': self.rebuild_ratio,
+            'names': {str(h): self.names[h] for h in self.horizons},
+            'summaries': self.summaries
+        }
+        np.savez_compressed(filepath, metadata=json.dumps(metadata, ensure_ascii=False), **arrays)
+        return filepath
+
+    @classmethod
+    def load(cls, filepath=DEFAULT_INDEX_PATH):
+        with np.load(filepath) as data:
+            metadata = json.loads(str(data['metadata']))
+            index = cls(metadata['horizons'], metadata['length'], metadata['rebuild_ratio'])
+            for h in index.horizons:
+                index.vectors[h] = data[f'vectors_{h}']
+                index.names[h] = metadata['names'][str(h)]
+                index._rebuild(h)
+        index.summaries = metadata['summaries']
+        return index
+
+
+def load_or_create_index(filepath=DEFAULT_INDEX_PATH):
+    """저장된 색인이 있으면 로드, 없으면 빈 색인 생성"""
+    if os.path.exists(filepath):
+        return CurveIndex.load(filepath)
+    return CurveIndex()
+
+
+def main():
+    """메인 실행 함수"""
+    from src.analyzers.batch_analyzer import (
+        find_latest_processed_files, load_processed_corpus, build_daily_metrics_grouped
+    )
+
+    parser = argparse.ArgumentParser(description='비슷한 수명 주기 곡선의 밈 검색')
+    parser.add_argument('--meme', type=str, help='질의할 밈 이름')
+    parser.add_argument('--k', type=int, default=5, help='반환할 이웃 수')
+    parser.add_argument('--horizon', type=str, help="비교 구간 (일 수 또는 'full', 미지정 시 자동)")
+    parser.add_argument('--rebuild', action='store_true', help='전처리된 모든 밈으로 색인 재구성')
+
+    args = parser.parse_args()
+
+    if args.rebuild:
+        files = find_latest_processed_files()
+        if not files:
+            print("전처리된 데이터 파일을 찾을 수 없습니다.")
+            return
+        daily = build_daily_metrics_grouped(load_processed_corpus(files))
+        index = CurveIndex()
+        for meme, group in daily.groupby('meme', observed=True):
+            index.add_daily_metrics(meme, group)
+        print(f"색인 저장: {index.save()} (밈 {len(index)}개)")
+    else:
+        index = load_or_create_index()
+
+    if not args.meme:
+        return
+
+    meme = args.meme.replace(' ', '_').lower()
+    files = find_latest_processed_files([meme])
+    if not files:
+        print(f"'{args.meme}' 밈의 전처리된 데이터 파일을 찾을 수 없습니다.")
+        return
+    daily = build_daily_metrics_grouped(load_processed_corpus(files))
+
+    horizon = args.horizon
+    if horizon and horizon != FULL:
+        horizon = int(horizon)
+    neighbours = index.query_daily_metrics(daily, k=args.k, horizon=horizon, exclude=[meme])
+
+    print(f"\n=== Memes Like '{args.meme}' ===")
+    if not neighbours:
+        print("비교할 수 있는 밈이 없습니다.")
+    for rank, neighbour in enumerate(neighbours, start=1):
+        print(f"{rank}. {neighbour['meme']} (distance {neighbour['distance']:.3f}, horizon {neighbour['horizon']}) "
+              f"- peak {neighbour['peak_posts']} posts at day {neighbour['days_to_peak']}, "
+              f"{neighbour['total_posts']:,} posts total")
+
+# 실행 코드
+if __name__ == "__main__":
+    main()
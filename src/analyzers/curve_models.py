@@ -0,0 +1,374 @@
+"""
+밈 수명 주기 곡선 모델 모음
+
+각 모델은 함수값, 해석적 야코비안, 데이터 기반 초기값, 파라미터 범위,
+피크 시점/확산 폭 계산을 함께 제공한다. fit_models()는 여러 모델을 차례로
+피팅하고 AIC/BIC로 가장 적합한 모델을 고른다. 병렬화는 밈 단위 프로세스에서 한다.
+"""
+
+import warnings
+
+import numpy as np
+
+# sech² 곡선의 반치폭 = 2 * ln(1 + √2) * 척도
+SECH2_FWHM = 2 * np.log(1 + np.sqrt(2))
+# 가우시안 반치폭 = 2 * sqrt(2 ln 2) * σ
+GAUSSIAN_FWHM = 2 * np.sqrt(2 * np.log(2))
+
+
+class CurveModel:
+    """수명 주기 곡선 모델 정의"""
+
+    def __init__(self, name, param_names, func, jac, initial_guess, bounds, peak, spread):
+        self.name = name
+        self.param_names = param_names
+        self.func = func
+        self.jac = jac
+        self.initial_guess = initial_guess
+        self.bounds = bounds
+        self.peak = peak
+        self.spread = spread
+
+    @property
+    def n_params(self):
+        return len(self.param_names)
+
+
+# ---------------------------------------------------------------------------
+# 초기값 추정 공통 도구
+# ---------------------------------------------------------------------------
+
+def _smooth(y, window=7):
+    window = max(1, min(window, len(y)))
+    kernel = np.ones(window) / window
+    return np.convolve(y, kernel, mode='same')
+
+
+def _peak_shape(x, y):
+    """평활 곡선의 피크 높이, 위치, 반치폭"""
+    smoothed = _smooth(y)
+    peak_idx = int(np.argmax(smoothed))
+    height = max(float(smoothed[peak_idx]), float(np.max(y)) * 0.5, 1e-3)
+    above = np.flatnonzero(smoothed >= smoothed[peak_idx] / 2)
+    fwhm = max(float(x[above[-1]] - x[above[0]]), 1.0) if len(above) else len(x) / 4
+    return height, float(x[peak_idx]), fwhm
+
+
+def _find_components(x, y, k):
+    """상위 k개 피크의 (높이, 위치, σ) 추정 (부족하면 구간을 나눠 보충)"""
+    from scipy.signal import find_peaks, peak_widths
+
+    smoothed = _smooth(y)
+    peaks, properties = find_peaks(smoothed, prominence=max(smoothed.max() * 0.05, 1e-9))
+    components = []
+    if len(peaks):
+        order = np.argsort(properties['prominences'])[::-1][:k]
+        chosen = peaks[order]
+        widths = peak_widths(smoothed, chosen, rel_height=0.5)[0]
+        step = np.median(np.diff(x)) if len(x) > 1 else 1.0
+        for idx, width in zip(chosen, widths):
+            components.append((max(smoothed[idx], 1e-3), float(x[idx]), max(width * step / GAUSSIAN_FWHM, 1.0)))
+
+    # 피크가 부족하면 전체 구간을 균등 분할한 위치로 보충
+    span = x[-1] - x[0] if len(x) > 1 else 1.0
+    for i in range(len(components), k):
+        center = x[0] + span * (i + 1) / (k + 1)
+        idx = int(np.searchsorted(x, center).clip(0, len(x) - 1))
+        components.append((max(smoothed[idx], 1e-3), float(center), max(span / (4 * k), 1.0)))
+    return sorted(components, key=lambda c: c[1])
+
+
+# ---------------------------------------------------------------------------
+# 가우시안
+# ---------------------------------------------------------------------------
+
+def gaussian(x, a, b, c):
+    return a * np.exp(-(x - b) ** 2 / (2 * c ** 2))
+
+
+def gaussian_jac(x, a, b, c):
+    e = np.exp(-(x - b) ** 2 / (2 * c ** 2))
+    return np.column_stack([e, a * e * (x - b) / c ** 2, a * e * (x - b) ** 2 / c ** 3])
+
+
+def gaussian_guess(x, y):
+    height, center, fwhm = _peak_shape(x, y)
+    return [height, center, fwhm / GAUSSIAN_FWHM]
+
+
+def gaussian_bounds(x, y):
+    span = max(x[-1] - x[0], 1.0)
+    return [0, x[0] - span, 0.5], [np.inf, x[-1] + span, 10 * span]
+
+
+# ---------------------------------------------------------------------------
+# 로그 정규 (로그 시간축 가우시안, 오른쪽 꼬리가 긴 밈)
+# ---------------------------------------------------------------------------
+
+def lognormal(x, a, mu, s):
+    log_t = np.log(x + 1.0)
+    return a * np.exp(-(log_t - mu) ** 2 / (2 * s ** 2))
+
+
+def lognormal_jac(x, a, mu, s):
+    log_t = np.log(x + 1.0)
+    e = np.exp(-(log_t - mu) ** 2 / (2 * s ** 2))
+    return np.column_stack([e, a * e * (log_t - mu) / s ** 2, a * e * (log_t - mu) ** 2 / s ** 3])
+
+
+def lognormal_guess(x, y):
+    height, center, fwhm = _peak_shape(x, y)
+    left = max(center - fwhm / 2, 0.0)
+    right = center + fwhm / 2
+    s = max((np.log(right + 1) - np.log(left + 1)) / GAUSSIAN_FWHM, 0.05)
+    return [height, np.log(center + 1), s]
+
+
+def lognormal_bounds(x, y):
+    return [0, 0, 0.01], [np.inf, np.log(2 * x[-1] + 2), 5]
+
+
+def lognormal_peak(a, mu, s):
+    return np.exp(mu) - 1.0
+
+
+def lognormal_spread(a, mu, s):
+    return (np.exp(mu + s) - np.exp(mu - s)) / 2
+
+
+# ---------------------------------------------------------------------------
+# 감마 (피크 높이 a로 정규화, t = x + 1)
+# ---------------------------------------------------------------------------
+
+def gamma_curve(x, a, k, theta):
+    t = x + 1.0
+    return a * np.exp(k * np.log(t / (k * theta)) + k - t / theta)
+
+
+def gamma_jac(x, a, k, theta):
+    t = x + 1.0
+    y = gamma_curve(x, a, k, theta)
+    return np.column_stack([y / a, y * np.log(t / (k * theta)), y * (t / theta ** 2 - k / theta)])
+
+
+def gamma_guess(x, y):
+    height, center, fwhm = _peak_shape(x, y)
+    mode = center + 1.0
+    sd = fwhm / GAUSSIAN_FWHM
+    k = max(mode ** 2 / sd ** 2, 1.0)
+    return [height, k, mode / k]
+
+
+def gamma_bounds(x, y):
+    return [0, 0.5, 0.01], [np.inf, 1e4, 10 * max(x[-1], 1.0)]
+
+
+def gamma_peak(a, k, theta):
+    return k * theta - 1.0
+
+
+def gamma_spread(a, k, theta):
+    return np.sqrt(k) * theta
+
+
+# ---------------------------------------------------------------------------
+# Bass 확산 모델 (일별 신규 채택 수)
+# ---------------------------------------------------------------------------
+
+def bass(x, m, p, q):
+    r = p + q
+    e = np.exp(-r * x)
+    return m * r ** 2 / p * e / (1 + q / p * e) ** 2
+
+
+def bass_jac(x, m, p, q):
+    r = p + q
+    e = np.exp(-r * x)
+    d = 1 + q / p * e
+    f = m * r ** 2 / p * e / d ** 2
+    dd_dp = -(q / p) * e * (1 / p + x)
+    dd_dq = (e / p) * (1 - q * x)
+    return np.column_stack([
+        f / m,
+        f * (2 / r - 1 / p - x - 2 * dd_dp / d),
+        f * (2 / r - x - 2 * dd_dq / d)
+    ])
+
+
+def bass_guess(x, y):
+    _, center, fwhm = _peak_shape(x, y)
+    r = 2 * SECH2_FWHM / max(fwhm, 1.0)
+    # 피크 시점 t* = ln(q/p) / (p+q)
+    ratio = np.exp(min(r * max(center, 0.0), 50))
+    p = r / (1 + ratio)
+    return [max(float(np.sum(y)), 1.0), max(p, 1e-6), r - p]
+
+
+def bass_bounds(x, y):
+    return [0, 1e-8, 1e-8], [np.inf, 5, 5]
+
+
+def bass_peak(m, p, q):
+    return np.log(q / p) / (p + q) if q > p else 0.0
+
+
+def bass_spread(m, p, q):
+    # sech² 형태의 표준편차 (로지스틱 분포 근사)
+    return np.pi / (np.sqrt(3) * (p + q))
+
+
+# ---------------------------------------------------------------------------
+# SIR형 (Kermack-McKendrick 근사해: a sech²((x - b) / c))
+# ---------------------------------------------------------------------------
+
+def sir(x, a, b, c):
+    return a / np.cosh((x - b) / c) ** 2
+
+
+def sir_jac(x, a, b, c):
+    u = (x - b) / c
+    s2 = 1 / np.cosh(u) ** 2
+    t = np.tanh(u)
+    return np.column_stack([s2, 2 * a * s2 * t / c, 2 * a * s2 * t * u / c])
+
+
+def sir_guess(x, y):
+    height, center, fwhm = _peak_shape(x, y)
+    return [height, center, max(fwhm / SECH2_FWHM, 0.5)]
+
+
+def sir_spread(a, b, c):
+    return c * np.pi / (2 * np.sqrt(3))
+
+
+# ---------------------------------------------------------------------------
+# 다중 가우시안 혼합 (여러 번 유행한 밈)
+# ---------------------------------------------------------------------------
+
+def _mixture_model(k):
+    def func(x, *params):
+        y = np.zeros_like(x, dtype=np.float64)
+        for i in range(k):
+            y = y + gaussian(x, *params[3 * i:3 * i + 3])
+        return y
+
+    def jac(x, *params):
+        return np.hstack([gaussian_jac(x, *params[3 * i:3 * i + 3]) for i in range(k)])
+
+    def guess(x, y):
+        return [value for component in _find_components(x, y, k) for value in component]
+
+    def bounds(x, y):
+        lower, upper = gaussian_bounds(x, y)
+        return lower * k, upper * k
+
+    def peak(*params):
+        heights = params[0::3]
+        return params[3 * int(np.argmax(heights)) + 1]
+
+    def spread(*params):
+        heights = params[0::3]
+        return params[3 * int(np.argmax(heights)) + 2]
+
+    names = [f'{name}{i + 1}' for i in range(k) for name in ('a', 'b', 'c')]
+    return CurveModel(f'gaussian_mixture_{k}', names, func, jac, guess, bounds, peak, spread)
+
+
+MODELS = {
+    'gaussian': CurveModel('gaussian', ['a', 'b', 'c'], gaussian, gaussian_jac, gaussian_guess,
+                           gaussian_bounds, lambda a, b, c: b, lambda a, b, c: c),
+    'lognormal': CurveModel('lognormal', ['a', 'mu', 's'], lognormal, lognormal_jac, lognormal_guess,
+                            lognormal_bounds, lognormal_peak, lognormal_spread),
+    'gamma': CurveModel('gamma', ['a', 'k', 'theta'], gamma_curve, gamma_jac, gamma_guess,
+                        gamma_bounds, gamma_peak, gamma_spread),
+    'bass': CurveModel('bass', ['m', 'p', 'q'], bass, bass_jac, bass_guess,
+                       bass_bounds, bass_peak, bass_spread),
+    'sir': CurveModel('sir', ['a', 'b', 'c'], sir, sir_jac, sir_guess,
+                      gaussian_bounds, lambda a, b, c: b, sir_spread),
+    'gaussian_mixture_2': _mixture_model(2),
+    'gaussian_mixture_3': _mixture_model(3),
+}
+
+DEFAULT_MODELS = list(MODELS)
+
+
+def information_criteria(rss, n, k):
+    """잔차 제곱합 기반 AIC, BIC"""
+    rss = max(rss, 1e-12)
+    log_likelihood_term = n * np.log(rss / n)
+    return float(log_likelihood_term + 2 * k), float(log_likelihood_term + k * np.log(n))
+
+
+def fit_model(model_name, x, y, p0=None, max_nfev=None):
+    """모델 하나 피팅
+
+    Args:
+        model_name: MODELS의 키
+        x, y: 시작일로부터의 일수, 일별 게시물 수
+        p0: 초기값 (None이면 데이터에서 추정, 예측 시 이전 파라미터로 웜 스타트)
+        max_nfev: 최대 함수 평가 횟수 (None이면 파라미터당 100회)
+
+    Returns:
+        피팅 결과 딕셔너리, 실패 시 {'model', 'error'}
+    """
+    from scipy.optimize import curve_fit
+
+    model = MODELS[model_name]
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    lower, upper = model.bounds(x, y)
+    if p0 is None:
+        p0 = model.initial_guess(x, y)
+    p0 = np.clip(np.asarray(p0, dtype=np.float64), np.asarray(lower) + 1e-9,
+                 np.where(np.isinf(upper), np.inf, np.asarray(upper) - 1e-9))
+
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            popt, pcov, infodict, _, _ = curve_fit(
+                model.func, x, y, p0=p0, jac=model.jac, bounds=(lower, upper),
+                method='trf', x_scale='jac', full_output=True,
+                max_nfev=max_nfev or 100 * model.n_params
+            )
+    except (RuntimeError, ValueError, np.linalg.LinAlgError) as e:
+        return {'model': model_name, 'error': str(e)}
+
+    y_fit = model.func(x, *popt)
+    rss = float(np.sum((y - y_fit) ** 2))
+    ss_tot = float(np.sum((y - y.mean()) ** 2))
+    aic, bic = information_criteria(rss, len(x), model.n_params)
+    return {
+        'model': model_name,
+        'parameters': popt,
+        'covariance': pcov,
+        'r_squared': 1 - rss / ss_tot if ss_tot > 0 else 0.0,
+        'rss': rss,
+        'aic': aic,
+        'bic': bic,
+        'nfev': int(infodict.get('nfev', 0)),
+        'peak_day': float(model.peak(*popt)),
+        'spread_days': float(model.spread(*popt))
+    }
+
+
+def fit_models(x, y, models=None, criterion='bic'):
+    """여러 모델을 차례로 피팅하고 정보 기준으로 최적 모델 선택
+
+    Args:
+        models: 피팅할 모델 이름 목록 (None이면 전체)
+        criterion: 'aic' 또는 'bic'
+
+    Returns:
+        (최적 결과, 전체 후보 결과 리스트). 모두 실패하면 (None, 후보 리스트)
+    """
+    models = models or DEFAULT_MODELS
+    # 파라미터 수보다 데이터가 적은 모델은 제외
+    models = [name for name in models if MODELS[name].n_params < len(x)]
+
+    # 밈 단위 프로세스 안에서 호출되므로 모델은 스레드로 나누지 않고 차례로 피팅
+    candidates = [fit_model(name, x, y) for name in models]
+
+    successful = [c for c in candidates if 'error' not in c and np.isfinite(c[criterion])]
+    if not successful:
+        return None, candidates
+    return min(successful, key=lambda c: c[criterion]), candidates
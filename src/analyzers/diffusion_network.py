@@ -0,0 +1,311 @@
+"""
+작성자/서브레딧 확산 네트워크
+
+전처리된 게시물로 세 가지 희소 그래프를 만든다. 노드는 (밈, 서브레딧) 쌍이라 여러 밈의
+그래프가 하나의 블록 대각 행렬에 들어가며, 모든 계산은 밈 개수와 관계없이 배열 연산으로 한다.
+
+- 작성자-서브레딧 이분 그래프: (밈, 작성자) x 노드 게시물 수
+- 서브레딧 이동 그래프: 같은 작성자가 연달아 다른 서브레딧에 올린 횟수 (가중 방향 그래프)
+- 최초 전파 그래프: 서브레딧의 첫 게시물 작성자가 직전에 밈을 올린 서브레딧 -> 해당 서브레딧 (숲)
+"""
+
+import argparse
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from config.config import REPORTS_DIR
+
+# 작성자를 알 수 없는 게시물 (전파 경로 추적에서 제외)
+DELETED_AUTHOR = '[deleted]'
+GRAPH_TYPES = ('adoption', 'transitions', 'bipartite')
+
+
+def pointer_jump(parent):
+    """숲의 부모 배열로 (깊이, 루트) 계산 (포인터 점프, 반복 횟수는 log(최대 깊이))"""
+    n = len(parent)
+    has_parent = parent >= 0
+    depth = has_parent.astype(np.int64)
+    root = np.where(has_parent, parent, np.arange(n))
+    while True:
+        next_root = root[root]
+        if np.array_equal(next_root, root):
+            return depth, root
+        depth = depth + depth[root]
+        root = next_root
+
+
+class DiffusionNetwork:
+    def __init__(self, df, meme_name=None):
+        """게시물 DataFrame으로 확산 네트워크 구성
+
+        Args:
+            df: author/subreddit/created_utc 컬럼이 있는 게시물 (meme 컬럼이 있으면 밈별로 분리)
+            meme_name: meme 컬럼이 없을 때 사용할 밈 이름
+        """
+        if 'meme' in df.columns:
+            meme_values = df['meme'].astype('category').cat.remove_unused_categories()
+            self.memes = np.asarray(meme_values.cat.categories, dtype=object)
+            meme_codes = meme_values.cat.codes.to_numpy(dtype=np.int64)
+        else:
+            self.memes = np.array([meme_name or ''], dtype=object)
+            meme_codes = np.zeros(len(df), dtype=np.int64)
+
+        times = pd.to_datetime(df['created_utc']).to_numpy('datetime64[ns]').view(np.int64)
+        sub_codes, self.subreddits = pd.factorize(df['subreddit'], sort=True)
+
+        # 노드 = (밈, 서브레딧)
+        node_codes, node_keys = pd.factorize(meme_codes * len(self.subreddits) + sub_codes, sort=True)
+        self.node_meme = node_keys // len(self.subreddits)
+        self.node_subreddit = node_keys % len(self.subreddits)
+        n_nodes = len(node_keys)
+
+        # 서브레딧별 첫 게시물과 밈 안에서의 채택 순서
+        order = np.lexsort((times, node_codes))
+        first_rows = order[np.flatnonzero(np.r_[True, np.diff(node_codes[order]) != 0])]
+        self.first_post = times[first_rows]
+        adoption = np.lexsort((self.first_post, self.node_meme))
+        meme_start = np.searchsorted(self.node_meme[adoption], self.node_meme[adoption])
+        self.adoption_order = np.empty(n_nodes, dtype=np.int64)
+        self.adoption_order[adoption] = np.arange(n_nodes) - meme_start
+
+        # 작성자 = (밈, 작성자), 삭제된 작성자는 제외
+        authors = df['author'].to_numpy(dtype=object)
+        known = authors != DELETED_AUTHOR
+        author_codes, author_names = pd.factorize(authors)
+        author_keys = np.where(known, meme_codes * max(len(author_names), 1) + author_codes, -1)
+        author_index, author_keys_unique = pd.factorize(author_keys[known], sort=True)
+        self.author_meme = author_keys_unique // max(len(author_names), 1)
+        self.n_posts = np.bincount(node_codes, minlength=n_nodes)
+
+        # 작성자-서브레딧 이분 그래프 (중복 항목은 합산되어 게시물 수가 됨)
+        self.author_subreddit = sparse.csr_matrix(
+            (np.ones(len(author_index), dtype=np.int64), (author_index, node_codes[known])),
+            shape=(len(author_keys_unique), n_nodes))
+
+        # 작성자별 시간순 게시물에서 직전 게시물의 노드
+        rows = np.flatnonzero(known)
+        sequence = rows[np.lexsort((times[rows], author_keys[rows]))]
+        same_author = author_keys[sequence[1:]] == author_keys[sequence[:-1]]
+        previous_node = np.full(len(df), -1, dtype=np.int64)
+        previous_node[sequence[1:][same_author]] = node_codes[sequence[:-1][same_author]]
+
+        # 서브레딧 이동 그래프
+        moved = (previous_node >= 0) & (previous_node != node_codes)
+        self.transitions = sparse.csr_matrix(
+            (np.ones(moved.sum(), dtype=np.int64), (previous_node[moved], node_codes[moved])),
+            shape=(n_nodes, n_nodes))
+
+        # 최초 전파 그래프: 채택 순서가 앞선 노드만 부모로 인정 (동시각 게시물로 인한 순환 방지)
+        parent = previous_node[first_rows]
+        valid = parent >= 0
+        valid[valid] = self.adoption_order[parent[valid]] < self.adoption_order[valid]
+        self.parent = np.where(valid, parent, -1)
+        children = np.flatnonzero(valid)
+        self.adoption = sparse.csr_matrix(
+            (np.ones(len(children), dtype=np.int64), (self.parent[children], children)),
+            shape=(n_nodes, n_nodes))
+
+        self.cascade_depth, self.cascade_root = pointer_jump(self.parent)
+        self._pagerank = None
+
+    @property
+    def n_nodes(self):
+        return len(self.node_meme)
+
+    def _meme_sizes(self):
+        return np.bincount(self.node_meme, minlength=len(self.memes))
+
+    # ------------------------------------------------------------------
+    # 중심성
+    # ------------------------------------------------------------------
+
+    def pagerank(self, damping=0.85, tol=1e-10, max_iter=200):
+        """서브레딧 이동 그래프의 밈별 PageRank (희소 거듭제곱법, 밈마다 합이 1)"""
+        if self._pagerank is not None:
+            return self._pagerank
+
+        sizes = self._meme_sizes()
+        teleport = 1.0 / sizes[self.node_meme]
+        out_weight = np.asarray(self.transitions.sum(axis=1)).ravel().astype(np.float64)
+        dangling = out_weight == 0
+        inverse = np.divide(1.0, out_weight, out=np.zeros_like(out_weight), where=~dangling)
+        transposed = (sparse.diags(inverse) @ self.transitions).T.tocsr()
+
+        rank = teleport.copy()
+        for _ in range(max_iter):
+            # 나가는 간선이 없는 노드의 확률은 같은 밈 안에서 고르게 재분배
+            dangling_mass = np.bincount(self.node_meme, weights=rank * dangling, minlength=len(self.memes))
+            updated = damping * (transposed @ rank) \
+                + (damping * dangling_mass[self.node_meme] + 1 - damping) * teleport
+            converged = np.abs(updated - rank).sum() < tol * len(self.memes)
+            rank = updated
+            if converged:
+                break
+        self._pagerank = rank
+        return rank
+
+    def degree_centrality(self):
+        """이동 그래프의 (들어오는, 나가는) 이웃 수를 밈 내 다른 서브레딧 수로 나눈 값"""
+        linked = (self.transitions > 0).astype(np.int64)
+        in_degree = np.diff(linked.tocsc().indptr)
+        out_degree = np.diff(linked.indptr)
+        others = np.maximum(self._meme_sizes()[self.node_meme] - 1, 1)
+        return in_degree, out_degree, (in_degree + out_degree) / (2 * others)
+
+    # ------------------------------------------------------------------
+    # 결과 테이블
+    # ------------------------------------------------------------------
+
+    def subreddit_table(self):
+        """(밈, 서브레딧)별 채택 순서, 전파 경로, 중심성 테이블"""
+        in_degree, out_degree, degree = self.degree_centrality()
+        unique_authors = np.diff(self.author_subreddit.tocsc().indptr)
+        bridge = np.diff(self.author_subreddit.indptr) > 1
+        bridge_authors = np.diff(self.author_subreddit[bridge].tocsc().indptr)
+        cascade_size = np.bincount(self.cascade_root, minlength=self.n_nodes)
+        has_parent = self.parent >= 0
+
+        table = pd.DataFrame({
+            'meme': self.memes[self.node_meme],
+            'subreddit': np.asarray(self.subreddits)[self.node_subreddit],
+            'first_post': pd.to_datetime(self.first_post),
+            'adoption_order': self.adoption_order,
+            'posts': self.n_posts,
+            'unique_authors': unique_authors,
+            'bridge_authors': bridge_authors,
+            'parent_subreddit': np.where(has_parent, np.asarray(self.subreddits)[
+                self.node_subreddit[np.where(has_parent, self.parent, 0)]], None),
+            'cascade_root': np.asarray(self.subreddits)[self.node_subreddit[self.cascade_root]],
+            'cascade_depth': self.cascade_depth,
+            'cascade_size': np.where(has_parent, 0, cascade_size),
+            'in_degree': in_degree,
+            'out_degree': out_degree,
+            'degree_centrality': degree,
+            'pagerank': self.pagerank()
+        })
+        return table.sort_values(['meme', 'adoption_order'], ignore_index=True)
+
+    def meme_summary(self):
+        """밈별 확산 요약 지표"""
+        n_memes = len(self.memes)
+        sizes = self._meme_sizes()
+        roots = self.parent < 0
+        cascade_size = np.bincount(self.cascade_root, minlength=self.n_nodes)
+
+        # 밈별 최대값은 (밈, 값) 정렬 후 밈마다 마지막 원소
+        def last_by_meme(values):
+            order = np.lexsort((values, self.node_meme))
+            last = np.r_[np.flatnonzero(np.diff(self.node_meme[order])), len(order) - 1]
+            return order[last]
+
+        pagerank = self.pagerank()
+        hubs = last_by_meme(pagerank)
+        largest = last_by_meme(np.where(roots, cascade_size, 0))
+        first = last_by_meme(-self.adoption_order)
+
+        author_subreddits = np.diff(self.author_subreddit.indptr)
+        authors = np.bincount(self.author_meme, minlength=n_memes)
+        bridges = np.bincount(self.author_meme, weights=author_subreddits > 1, minlength=n_memes)
+        edge_rows = np.repeat(np.arange(self.n_nodes), np.diff(self.transitions.indptr))
+
+        subreddit_names = np.asarray(self.subreddits)
+        return pd.DataFrame({
+            'meme': self.memes,
+            'diffusion_subreddits': sizes,
+            'first_subreddit': subreddit_names[self.node_subreddit[first]],
+            'independent_introductions': np.bincount(self.node_meme, weights=roots, minlength=n_memes).astype(np.int64),
+            'max_cascade_depth': np.maximum.reduceat(self.cascade_depth, np.r_[0, np.cumsum(sizes)[:-1]]),
+            'mean_cascade_depth': np.bincount(self.node_meme, weights=self.cascade_depth, minlength=n_memes) / sizes,
+            'largest_cascade_share': cascade_size[largest] / sizes,
+            'bridge_author_share': np.divide(bridges, authors, out=np.zeros(n_memes), where=authors > 0),
+            'transition_edges': np.bincount(self.node_meme[edge_rows], minlength=n_memes),
+            'hub_subreddit': subreddit_names[self.node_subreddit[hubs]],
+            'hub_pagerank': pagerank[hubs]
+        })
+
+    # ------------------------------------------------------------------
+    # 내보내기
+    # ------------------------------------------------------------------
+
+    def to_networkx(self, meme, graph='adoption'):
+        """한 밈의 그래프를 networkx DiGraph/Graph로 변환 (networkx 필요)
+
+        Args:
+            graph: 'adoption'(최초 전파 숲), 'transitions'(서브레딧 이동), 'bipartite'(작성자-서브레딧)
+        """
+        import networkx as nx
+
+        if graph not in GRAPH_TYPES:
+            raise ValueError(f"graph는 {GRAPH_TYPES} 중 하나여야 합니다: {graph}")
+        meme_code = int(np.flatnonzero(self.memes == meme)[0])
+        nodes = np.flatnonzero(self.node_meme == meme_code)
+        labels = {i: name for i, name in enumerate(np.asarray(self.subreddits)[self.node_subreddit[nodes]])}
+
+        if graph == 'bipartite':
+            authors = np.flatnonzero(self.author_meme == meme_code)
+            block = self.author_subreddit[authors][:, nodes]
+            result = nx.Graph()
+            result.add_nodes_from((f"r/{name}" for name in labels.values()), bipartite='subreddit')
+            result.add_nodes_from((f"u/{i}" for i in range(len(authors))), bipartite='author')
+            coo = block.tocoo()
+            result.add_weighted_edges_from(zip((f"u/{i}" for i in coo.row),
+                                               (f"r/{labels[j]}" for j in coo.col), coo.data.tolist()))
+            return result
+
+        matrix = self.adoption if graph == 'adoption' else self.transitions
+        result = nx.from_scipy_sparse_array(matrix[nodes][:, nodes], create_using=nx.DiGraph)
+        nx.set_node_attributes(result, dict(enumerate(self.adoption_order[nodes].tolist())), 'adoption_order')
+        nx.set_node_attributes(result, dict(enumerate(self.cascade_depth[nodes].tolist())), 'cascade_depth')
+        return nx.relabel_nodes(result, labels)
+
+
+def main():
+    """메인 실행 함수"""
+    from src.analyzers.batch_analyzer import find_latest_processed_files, load_processed_corpus
+
+    parser = argparse.ArgumentParser(description='밈 확산 네트워크 분석')
+    parser.add_argument('--memes', nargs='+', help='분석할 밈 이름 목록 (미지정 시 전체)')
+    parser.add_argument('--graphml', choices=GRAPH_TYPES, help='밈별 그래프를 GraphML로 저장 (networkx 필요)')
+
+    args = parser.parse_args()
+
+    files = find_latest_processed_files(args.memes)
+    if not files:
+        print("전처리된 데이터 파일을 찾을 수 없습니다.")
+        return
+
+    try:
+        network = DiffusionNetwork(load_processed_corpus(files))
+        print(f"노드 {network.n_nodes:,}개, 이동 간선 {network.transitions.nnz:,}개, "
+              f"작성자-서브레딧 간선 {network.author_subreddit.nnz:,}개")
+
+        summary = network.meme_summary()
+        print("\n=== Diffusion Summary ===")
+        print(summary.to_string(index=False))
+
+        os.makedirs(REPORTS_DIR, exist_ok=True)
+        network.subreddit_table().to_csv(os.path.join(REPORTS_DIR, 'diffusion_subreddits.csv'), index=False)
+        summary.to_csv(os.path.join(REPORTS_DIR, 'diffusion_summary.csv'), index=False)
+        print(f"\n결과 저장: {REPORTS_DIR}")
+
+        if args.graphml:
+            import networkx as nx
+            for meme in network.memes:
+                path = os.path.join(REPORTS_DIR, f'{meme}_{args.graphml}.graphml')
+                nx.write_graphml(network.to_networkx(meme, args.graphml), path)
+                print(f"그래프 저장: {path}")
+
+    except Exception as e:
+        print(f"❌ 분석 중 오류 발생: {e}")
+        import traceback
+        traceback.print_exc()
+
+# 실행 코드
+if __name__ == "__main__":
+    main()
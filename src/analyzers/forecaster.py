@@ -0,0 +1,306 @@
+"""
+밈 피크/잔여 수명 예측
+
+밈별로 마지막 피팅 결과(모델, 파라미터, 공분산)를 저장해 두고, 새 데이터가 들어오면
+이전 파라미터에서 웜 스타트로 다시 피팅한다. 공분산에서 파라미터를 표본 추출해
+피크 날짜, 피크 높이, 하락 시점, 종료 시점의 예측 구간을 계산한다.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from config.config import MODELS_DIR, REPORTS_DIR
+from src.analyzers import kernels
+from src.analyzers.curve_index import activity_start, daily_counts
+from src.analyzers.curve_models import MODELS, fit_model, fit_models
+
+DEFAULT_STATE_PATH = os.path.join(MODELS_DIR, 'forecast_state.json')
+# 예측에 사용하는 단일 유행 모델 (혼합 모델은 미래 파동을 추정할 근거가 없어 제외)
+FORECAST_MODELS = ['gaussian', 'lognormal', 'gamma', 'bass', 'sir']
+# 피크 대비 이 비율 아래로 내려가면 하락/종료로 본다
+DECLINE_FRACTION = 0.5
+END_FRACTION = 0.05
+
+
+def _first_below(curves, peak_index, threshold):
+    """피크 이후 처음으로 threshold 아래가 되는 격자 인덱스 (없으면 -1)"""
+    after = np.arange(curves.shape[1])[np.newaxis, :] > peak_index[:, np.newaxis]
+    below = (curves < threshold[:, np.newaxis]) & after
+    found = below.any(axis=1)
+    return np.where(found, below.argmax(axis=1), -1)
+
+
+def curve_milestones(model_name, parameters, grid):
+    """파라미터 행렬 (표본 수, 파라미터 수)의 피크/하락/종료 시점 (격자 단위)"""
+    model = MODELS[model_name]
+    # 극단적인 표본 파라미터에서는 오버플로가 날 수 있음 (곡선 값 0/inf로 처리)
+    with np.errstate(over='ignore', invalid='ignore', divide='ignore'):
+        curves = model.func(grid[np.newaxis, :], *[p[:, np.newaxis] for p in parameters.T])
+    curves = np.nan_to_num(curves, nan=0.0)
+    peak_index = curves.argmax(axis=1)
+    peak_height = curves[np.arange(len(curves)), peak_index]
+    decline_index = _first_below(curves, peak_index, peak_height * DECLINE_FRACTION)
+    end_index = _first_below(curves, peak_index, peak_height * END_FRACTION)
+    to_day = lambda index: np.where(index >= 0, grid[np.clip(index, 0, None)], np.nan)
+    return {
+        'peak_day': grid[peak_index],
+        'peak_height': peak_height,
+        'decline_day': to_day(decline_index),
+        'end_day': to_day(end_index)
+    }
+
+
+class LifecycleForecaster:
+    def __init__(self, models=None, n_samples=500, interval=0.9, horizon_days=365,
+                 latency_target=0.05, reselect_days=7, state_path=DEFAULT_STATE_PATH, random_state=42):
+        """피크/잔여 수명 예측기
+
+        Args:
+            models: 모델 선택 후보 (None이면 FORECAST_MODELS)
+            n_samples: 예측 구간 계산용 파라미터 표본 수
+            interval: 예측 구간 포함 확률
+            horizon_days: 마지막 관측일 이후 예측 범위 (일)
+            latency_target: 밈당 목표 처리 시간 (초), 초과 시 표본 수를 줄임
+            reselect_days: 이 일수만큼 데이터가 늘면 전체 모델 재선택
+            state_path: 밈별 피팅 상태 JSON 경로
+        """
+        self.models = models or FORECAST_MODELS
+        self.n_samples = n_samples
+        self.interval = interval
+        self.horizon_days = horizon_days
+        self.latency_target = latency_target
+        self.reselect_days = reselect_days
+        self.state_path = state_path
+        self.random_state = random_state
+        self.state = self.load_state()
+
+    def load_state(self):
+        if self.state_path and os.path.exists(self.state_path):
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        return {}
+
+    def save_state(self):
+        os.makedirs(os.path.dirname(self.state_path), exist_ok=True)
+        with open(self.state_path, 'w', encoding='utf-8') as f:
+            json.dump(self.state, f, ensure_ascii=False)
+        return self.state_path
+
+    # ------------------------------------------------------------------
+    # 피팅
+    # ------------------------------------------------------------------
+
+    def _fit(self, meme, x, y, origin):
+        """저장된 파라미터로 웜 스타트, 실패하거나 재선택 시점이면 전체 모델 선택"""
+        previous = self.state.get(meme)
+        if previous and previous['origin'] == origin and len(x) - previous['selected_at'] < self.reselect_days:
+            n_params = MODELS[previous['model']].n_params
+            result = fit_model(previous['model'], x, y, p0=previous['parameters'], max_nfev=20 * n_params)
+            if 'error' not in result and np.all(np.isfinite(result['parameters'])):
+                return result, 'warm', previous['selected_at']
+
+        best, _ = fit_models(x, y, models=self.models)
+        return best, 'full', len(x)
+
+    def _intervals(self, fit, x, y, grid, rng, n_samples):
+        """공분산 표본으로 이정표별 (하한, 상한)"""
+        model = MODELS[fit['model']]
+        covariance = np.asarray(fit['covariance'], dtype=np.float64)
+        if not np.all(np.isfinite(covariance)):
+            return None
+
+        samples = rng.multivariate_normal(fit['parameters'], covariance, size=n_samples, check_valid='ignore')
+        lower, upper = model.bounds(x, y)
+        samples = np.clip(samples, lower, upper)
+        milestones = curve_milestones(fit['model'], samples, grid)
+        alpha = (1 - self.interval) / 2
+        return {name: (float(np.nanquantile(values, alpha)), float(np.nanquantile(values, 1 - alpha)))
+                if np.any(np.isfinite(values)) else (np.nan, np.nan)
+                for name, values in milestones.items()}
+
+    # ------------------------------------------------------------------
+    # 예측
+    # ------------------------------------------------------------------
+
+    def forecast(self, meme, daily_metrics):
+        """밈 하나의 피크/잔여 수명 예측
+
+        Returns:
+            예측 딕셔너리 (날짜와 예측 구간 포함), 데이터가 부족하거나 피팅에 실패하면 None
+        """
+        start_time = time.perf_counter()
+        counts = daily_counts(daily_metrics)
+        start = activity_start(counts.to_numpy(dtype=np.float64))
+        if start is None or len(counts) - start < 14:
+            return None
+
+        counts = counts.iloc[start:]
+        origin = str(counts.index[0].date())
+        x = np.arange(len(counts), dtype=np.float64)
+        y = counts.to_numpy(dtype=np.float64)
+
+        fit, mode, selected_at = self._fit(meme, x, y, origin)
+        if fit is None:
+            return None
+
+        self.state[meme] = {
+            'model': fit['model'],
+            'parameters': np.asarray(fit['parameters']).tolist(),
+            'origin': origin,
+            'selected_at': selected_at,
+            'fitted_days': len(x)
+        }
+
+        grid = np.arange(0, len(x) + self.horizon_days, dtype=np.float64)
+        point = {name: float(values[0]) for name, values in
+                 curve_milestones(fit['model'], np.asarray(fit['parameters'])[np.newaxis, :], grid).items()}
+
+        # 피팅에 목표 시간의 절반 이상을 썼으면 표본 수를 줄여 전체 시간을 맞춤
+        elapsed = time.perf_counter() - start_time
+        n_samples = self.n_samples if elapsed < self.latency_target / 2 else max(100, self.n_samples // 4)
+        rng = np.random.default_rng([self.random_state, len(x)])
+        intervals = self._intervals(fit, x, y, grid, rng, n_samples)
+
+        origin_date = counts.index[0]
+        last_day = len(x) - 1
+        to_date = lambda day: (origin_date + pd.Timedelta(days=day)).date() if np.isfinite(day) else None
+
+        result = {
+            'meme': meme,
+            'model': fit['model'],
+            'fit_mode': mode,
+            'r_squared': fit['r_squared'],
+            'nfev': fit['nfev'],
+            'as_of': counts.index[-1].date(),
+            'status': 'rising' if point['peak_day'] > last_day else 'past_peak',
+            'peak_date': to_date(point['peak_day']),
+            'peak_height': point['peak_height'],
+            'decline_date': to_date(point['decline_day']),
+            'days_to_decline': point['decline_day'] - last_day if np.isfinite(point['decline_day']) else np.nan,
+            'end_date': to_date(point['end_day']),
+            'remaining_days': point['end_day'] - last_day if np.isfinite(point['end_day']) else np.nan,
+        }
+        for name, key in [('peak_day', 'peak_date'), ('peak_height', 'peak_height'),
+                          ('decline_day', 'decline_date'), ('end_day', 'end_date')]:
+            low, high = intervals[name] if intervals else (np.nan, np.nan)
+            if name == 'peak_height':
+                result[f'{key}_low'], result[f'{key}_high'] = low, high
+            else:
+                result[f'{key}_low'], result[f'{key}_high'] = to_date(low), to_date(high)
+
+        result['latency_ms'] = (time.perf_counter() - start_time) * 1000
+        result['within_target'] = result['latency_ms'] <= self.latency_target * 1000
+        return result
+
+
+def is_live(daily_metrics, as_of, max_idle_days=14):
+    """최근 max_idle_days 안에 게시물이 있으면 진행 중인 밈으로 본다"""
+    return (as_of - daily_metrics['date'].max()).days <= max_idle_days
+
+
+def _forecast_worker(item):
+    """프로세스 풀에서 실행되는 밈 묶음 예측 (갱신된 상태를 함께 반환)"""
+    settings, states, chunk = item
+    forecaster = LifecycleForecaster(state_path=None, **settings)
+    forecaster.state = states
+    results = [forecaster.forecast(meme, daily_metrics) for meme, daily_metrics in chunk]
+    return results, {meme: forecaster.state[meme] for meme, _ in chunk if meme in forecaster.state}
+
+
+def forecast_all(forecaster, daily_by_meme, workers=1):
+    """여러 밈을 한 번에 예측하고 상태 저장
+
+    Args:
+        forecaster: LifecycleForecaster
+        daily_by_meme: {밈: daily_metrics}
+        workers: 프로세스 수 (1이면 현재 프로세스에서 순차 실행)
+
+    Returns:
+        예측 결과 DataFrame
+    """
+    start_time = time.time()
+    items = list(daily_by_meme.items())
+    if workers == 1 or len(items) <= 1:
+        results = [forecaster.forecast(meme, daily_metrics) for meme, daily_metrics in items]
+    else:
+        settings = {
+            'models': forecaster.models, 'n_samples': forecaster.n_samples, 'interval': forecaster.interval,
+            'horizon_days': forecaster.horizon_days, 'latency_target': forecaster.latency_target,
+            'reselect_days': forecaster.reselect_days, 'random_state': forecaster.random_state
+        }
+        n_chunks = min(len(items), (workers or os.cpu_count()) * 4)
+        chunks = [items[i::n_chunks] for i in range(n_chunks)]
+        jobs = [(settings, {meme: forecaster.state[meme] for meme, _ in chunk if meme in forecaster.state}, chunk)
+                for chunk in chunks]
+        results = []
+        with ProcessPoolExecutor(max_workers=workers, mp_context=kernels.pool_context()) as executor:
+            for chunk_results, states in executor.map(_forecast_worker, jobs):
+                results.extend(chunk_results)
+                forecaster.state.update(states)
+
+    forecaster.save_state()
+    results = pd.DataFrame([result for result in results if result])
+    if len(results):
+        print(f"예측 완료: 밈 {len(results)}개, {time.time() - start_time:.2f}초 "
+              f"(웜 스타트 {int((results['fit_mode'] == 'warm').sum())}개, "
+              f"목표 시간 충족 {int(results['within_target'].sum())}개, "
+              f"중앙 처리 시간 {results['latency_ms'].median():.1f}ms)")
+    return results
+
+
+def main():
+    """메인 실행 함수"""
+    from src.analyzers.batch_analyzer import (
+        find_latest_processed_files, load_processed_corpus, build_daily_metrics_grouped
+    )
+
+    parser = argparse.ArgumentParser(description='밈 피크/잔여 수명 예측')
+    parser.add_argument('--memes', nargs='+', help='예측할 밈 이름 목록 (미지정 시 진행 중인 전체 밈)')
+    parser.add_argument('--max-idle-days', type=int, default=14, help='진행 중으로 볼 최대 무활동 일수')
+    parser.add_argument('--workers', type=int, default=1, help='프로세스 수')
+    parser.add_argument('--samples', type=int, default=500, help='예측 구간 표본 수')
+    parser.add_argument('--latency-ms', type=float, default=50, help='밈당 목표 처리 시간 (ms)')
+
+    args = parser.parse_args()
+
+    files = find_latest_processed_files(args.memes)
+    if not files:
+        print("전처리된 데이터 파일을 찾을 수 없습니다.")
+        return
+
+    daily = build_daily_metrics_grouped(load_processed_corpus(files))
+    as_of = daily['date'].max()
+    daily_by_meme = {meme: group.drop(columns='meme').reset_index(drop=True)
+                     for meme, group in daily.groupby('meme', observed=True)}
+    if not args.memes:
+        daily_by_meme = {meme: group for meme, group in daily_by_meme.items()
+                         if is_live(group, as_of, args.max_idle_days)}
+    print(f"예측 대상: {len(daily_by_meme)}개 밈 (기준일 {as_of.date()})")
+
+    forecaster = LifecycleForecaster(n_samples=args.samples, latency_target=args.latency_ms / 1000)
+    results = forecast_all(forecaster, daily_by_meme, workers=args.workers)
+    if len(results) == 0:
+        print("예측 가능한 밈이 없습니다.")
+        return
+
+    for _, row in results.iterrows():
+        print(f"  {row['meme']}: {row['status']}, peak {row['peak_date']} "
+              f"[{row['peak_date_low']} ~ {row['peak_date_high']}], decline {row['decline_date']}")
+
+    os.makedirs(REPORTS_DIR, exist_ok=True)
+    output_path = os.path.join(REPORTS_DIR, 'lifecycle_forecasts.csv')
+    results.to_csv(output_path, index=False)
+    print(f"\n예측 결과 저장: {output_path}")
+
+# 실행 코드
+if __name__ == "__main__":
+    main()
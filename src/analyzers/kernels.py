@@ -0,0 +1,317 @@
+"""
+시계열 수치 커널 (여러 밈 시계열을 2차원 배열로 한 번에 처리)
+
+각 행이 하나의 시계열이며, numba가 설치되어 있으면 JIT 컴파일된 구현을,
+없으면 NumPy 구현을 사용한다. 결과는 pandas의 rolling/pct_change/cumsum과 같다.
+"""
+
+import importlib.util
+import multiprocessing
+
+import numpy as np
+
+# numba 자체는 numba 백엔드를 처음 쓸 때 import (kernels_numba)
+HAS_NUMBA = importlib.util.find_spec('numba') is not None
+
+# change_points가 정확한 분할을 계산하는 최대 길이 (더 길면 블록 경계에서 분할 후 다듬음)
+MAX_PELT_POINTS = 5000
+
+
+def pool_context():
+    """프로세스 풀 시작 방식
+
+    numba의 병렬 스레드 풀은 fork 이후 안전하지 않으므로(종료 시 멈춤),
+    numba가 있으면 forkserver로 워커를 만든다. 없으면 플랫폼 기본값을 쓴다.
+    """
+    if HAS_NUMBA and 'forkserver' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('forkserver')
+    return None
+
+
+def _as_2d(values):
+    values = np.asarray(values, dtype=np.float64)
+    if values.ndim == 1:
+        return values[np.newaxis, :], True
+    return values, False
+
+
+def _resolve_backend(backend):
+    if backend is None:
+        return 'numba' if HAS_NUMBA else 'numpy'
+    if backend == 'numba' and not HAS_NUMBA:
+        raise ImportError("numba가 설치되어 있지 않습니다.")
+    if backend not in ('numba', 'numpy'):
+        raise ValueError(f"알 수 없는 backend: {backend}")
+    return backend
+
+
+def _numba():
+    """numba 구현 모듈 (처음 호출 시 import)"""
+    from src.analyzers import kernels_numba
+    return kernels_numba
+
+
+# ---------------------------------------------------------------------------
+# NumPy 구현
+# ---------------------------------------------------------------------------
+
+def _window_sums(values, window):
+    """행별 후행 window 합과 유효값 개수 (NaN 제외)"""
+    valid = ~np.isnan(values)
+    zeroed = np.where(valid, values, 0.0)
+    n_rows, n_cols = values.shape
+    sums = np.zeros((n_rows, n_cols + 1))
+    counts = np.zeros((n_rows, n_cols + 1))
+    np.cumsum(zeroed, axis=1, out=sums[:, 1:])
+    np.cumsum(valid, axis=1, out=counts[:, 1:])
+    lagged = np.maximum(np.arange(1, n_cols + 1) - window, 0)
+    return sums[:, 1:] - sums[:, lagged], counts[:, 1:] - counts[:, lagged]
+
+
+def _rolling_mean_numpy(values, window, min_periods):
+    sums, counts = _window_sums(values, window)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        result = sums / counts
+    result[counts < min_periods] = np.nan
+    return result
+
+
+def _pct_change_numpy(values):
+    result = np.full(values.shape, np.nan)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        result[:, 1:] = values[:, 1:] / values[:, :-1] - 1.0
+    return result
+
+
+def _cumsum_numpy(values):
+    result = np.nancumsum(values, axis=1)
+    result[np.isnan(values)] = np.nan
+    return result
+
+
+def _burst_scores_numpy(values, window, min_periods):
+    sums, counts = _window_sums(values, window)
+    squares, _ = _window_sums(values ** 2, window)
+    # t 시점의 직전 구간 [t-window, t-1] 통계 = t-1 시점의 후행 window 통계
+    prev_sums = np.zeros_like(sums)
+    prev_squares = np.zeros_like(squares)
+    prev_counts = np.zeros_like(counts)
+    prev_sums[:, 1:] = sums[:, :-1]
+    prev_squares[:, 1:] = squares[:, :-1]
+    prev_counts[:, 1:] = counts[:, :-1]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = prev_sums / prev_counts
+        var = np.maximum(prev_squares / prev_counts - mean ** 2, 0.0)
+        result = (values - mean) / np.sqrt(var + 1.0)
+    result[(prev_counts < min_periods) | (prev_counts == 0)] = np.nan
+    return result
+
+
+def _segment_costs_numpy(values, starts, ends):
+    prefix = np.zeros((values.shape[0], values.shape[1] + 1))
+    prefix_sq = np.zeros_like(prefix)
+    np.cumsum(values, axis=1, out=prefix[:, 1:])
+    np.cumsum(values ** 2, axis=1, out=prefix_sq[:, 1:])
+    length = (ends - starts).astype(np.float64)
+    seg_sum = prefix[:, ends] - prefix[:, starts]
+    seg_sq = prefix_sq[:, ends] - prefix_sq[:, starts]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        cost = seg_sq - seg_sum ** 2 / length
+    cost[:, length <= 0] = 0.0
+    return np.maximum(cost, 0.0)
+
+
+def _pelt_numpy(prefix, prefix_sq, positions, penalty, min_size):
+    n = len(positions) - 1
+    best = np.full(n + 1, np.inf)
+    best[0] = -penalty
+    last = np.zeros(n + 1, dtype=np.int64)
+    candidates = np.array([0], dtype=np.int64)
+    for t in range(min_size, n + 1):
+        length = positions[t] - positions[candidates]
+        seg_sum = prefix[t] - prefix[candidates]
+        cost = np.maximum(prefix_sq[t] - prefix_sq[candidates] - seg_sum ** 2 / length, 0.0)
+        total = best[candidates] + cost
+        i = np.argmin(total)
+        best[t] = total[i] + penalty
+        last[t] = candidates[i]
+        # 가지치기: 이후 어떤 t에서도 최적이 될 수 없는 후보 제거
+        candidates = candidates[total <= best[t]]
+        new = t - min_size + 1
+        if new <= n - min_size and np.isfinite(best[new]):
+            candidates = np.append(candidates, new)
+    return last
+
+
+def _dtw_numpy(a, b, window, cutoff):
+    n, m = len(a), len(b)
+    previous = np.full(m + 1, np.inf)
+    previous[0] = 0.0
+    for i in range(1, n + 1):
+        current = np.full(m + 1, np.inf)
+        for j in range(max(1, i - window), min(m, i + window) + 1):
+            cost = (a[i - 1] - b[j - 1]) ** 2
+            current[j] = cost + min(previous[j - 1], previous[j], current[j - 1])
+        if current.min() > cutoff:
+            return np.inf
+        previous = current
+    return previous[m]
+
+
+# ---------------------------------------------------------------------------
+# 공개 API
+# ---------------------------------------------------------------------------
+
+def rolling_mean(values, window=7, min_periods=1, backend=None):
+    """행별 후행 이동 평균 (Series.rolling(window, min_periods).mean()과 동일)"""
+    values, squeeze = _as_2d(values)
+    if _resolve_backend(backend) == 'numba':
+        result = _numba().rolling_mean(values, window, min_periods)
+    else:
+        result = _rolling_mean_numpy(values, window, min_periods)
+    return result[0] if squeeze else result
+
+
+def pct_change(values, backend=None):
+    """행별 증감률 (Series.pct_change()와 동일, 첫 값은 NaN)"""
+    values, squeeze = _as_2d(values)
+    if _resolve_backend(backend) == 'numba':
+        result = _numba().pct_change(values)
+    else:
+        result = _pct_change_numpy(values)
+    return result[0] if squeeze else result
+
+
+def cumsum(values, backend=None):
+    """행별 누적 합 (Series.cumsum()과 동일, NaN 위치는 NaN 유지)"""
+    values, squeeze = _as_2d(values)
+    if _resolve_backend(backend) == 'numba':
+        result = _numba().cumsum(values)
+    else:
+        result = _cumsum_numpy(values)
+    return result[0] if squeeze else result
+
+
+def burst_scores(values, window=7, min_periods=3, backend=None):
+    """행별 버스트 점수
+
+    각 시점 값을 직전 window 구간(현재 값 제외)의 평균/분산과 비교한
+    z 점수. 카운트 데이터에서 분산이 0인 구간이 많으므로 분산에 1을 더해 안정화한다.
+    """
+    values, squeeze = _as_2d(values)
+    if _resolve_backend(backend) == 'numba':
+        result = _numba().burst_scores(values, window, min_periods)
+    else:
+        result = _burst_scores_numpy(values, window, min_periods)
+    return result[0] if squeeze else result
+
+
+def segment_costs(values, starts, ends, backend=None):
+    """행별 구간 [start, end) 의 평균 변화 비용 (구간 내 제곱 편차 합)
+
+    변화점 탐지(PELT 등)에서 후보 구간 비용을 한 번에 계산할 때 사용한다.
+
+    Returns:
+        (행 개수, 구간 개수) 배열
+    """
+    values, squeeze = _as_2d(values)
+    starts = np.asarray(starts, dtype=np.int64)
+    ends = np.asarray(ends, dtype=np.int64)
+    if _resolve_backend(backend) == 'numba':
+        result = _numba().segment_costs(values, starts, ends)
+    else:
+        result = _segment_costs_numpy(values, starts, ends)
+    return result[0] if squeeze else result
+
+
+def _segment_sse(prefix, prefix_sq, starts, ends):
+    """누적 합으로 계산한 구간 [start, end) 제곱 편차 합"""
+    seg_sum = prefix[ends] - prefix[starts]
+    return np.maximum(prefix_sq[ends] - prefix_sq[starts] - seg_sum ** 2 / (ends - starts), 0.0)
+
+
+def _refine_change_points(prefix, prefix_sq, points, n, min_size, radius):
+    """블록 경계에서 찾은 변화점을 원래 해상도의 ±radius 안에서 두 인접 구간 비용이 최소인 위치로 옮김
+
+    옮길 자리가 없는(최소 길이를 지킬 수 없는) 변화점은 이웃 구간에 합친다.
+    """
+    refined = []
+    left = 0
+    for point, right in zip(points, list(points[1:]) + [n]):
+        lo = max(point - radius, left + min_size)
+        hi = min(point + radius, right - min_size)
+        if lo > hi:
+            continue
+        candidates = np.arange(lo, hi + 1)
+        cost = (_segment_sse(prefix, prefix_sq, left, candidates)
+                + _segment_sse(prefix, prefix_sq, candidates, right))
+        left = int(candidates[np.argmin(cost)])
+        refined.append(left)
+    return refined
+
+
+def change_points(values, penalty, min_size=7, max_points=MAX_PELT_POINTS, backend=None):
+    """PELT 변화점 탐지 (구간 평균 변화, 제곱 편차 비용)
+
+    길이가 max_points 이하이면 같은 비용/패널티의 최적 분할(Optimal Partitioning)과 같은 결과를 낸다.
+    PELT 가지치기는 변화점이 길이에 비례해 늘어날 때만 선형이고, 변화가 거의 없는 긴 시계열에서는
+    제곱 시간이 된다. 그래서 더 긴 시계열은 max_points개 블록 경계만 후보로 한 최적 분할(구간 비용은
+    원래 값의 누적 합으로 정확히 계산)을 구한 뒤 각 변화점을 원래 해상도에서 ±1블록 안으로 다듬는다.
+    전체 작업량은 O(n + max_points²)로 제한된다.
+
+    Args:
+        values: 1차원 시계열 (NaN 없음)
+        penalty: 변화점 하나당 패널티
+        min_size: 구간 최소 길이
+        max_points: 정확한 분할을 계산할 최대 길이 (None이면 제한 없음)
+
+    Returns:
+        각 구간의 시작 인덱스 배열 (첫 구간의 0 제외, 오름차순)
+    """
+    values = np.asarray(values, dtype=np.float64)
+    n = len(values)
+    if n < 2 * min_size:
+        return np.array([], dtype=np.int64)
+    prefix = np.concatenate([[0.0], np.cumsum(values)])
+    prefix_sq = np.concatenate([[0.0], np.cumsum(values ** 2)])
+
+    coarse = max_points is not None and n > max_points
+    if coarse:
+        positions = np.arange(max_points + 1, dtype=np.int64) * n // max_points
+        block = n // max_points
+        block_min_size = -(-min_size // block)
+    else:
+        positions = np.arange(n + 1, dtype=np.int64)
+        block_min_size = min_size
+
+    pelt = _numba().pelt if _resolve_backend(backend) == 'numba' else _pelt_numpy
+    last = pelt(prefix[positions], prefix_sq[positions], positions, float(penalty), int(block_min_size))
+
+    points = []
+    t = last[len(positions) - 1]
+    while t > 0:
+        points.append(int(positions[t]))
+        t = last[t]
+    points = points[::-1]
+    if coarse:
+        points = _refine_change_points(prefix, prefix_sq, points, n, min_size, radius=-(-n // max_points))
+    return np.array(points, dtype=np.int64)
+
+
+def dtw_distance(a, b, window=None, cutoff=np.inf, backend=None):
+    """Sakoe-Chiba 밴드 DTW 거리 (정렬 경로의 제곱 차이 합)
+
+    누적 비용이 한 행 전체에서 cutoff를 넘으면 계산을 중단하고 inf를 돌려준다
+    (최근접 탐색에서 현재 최선값을 cutoff로 넘겨 조기 종료).
+
+    Args:
+        a, b: 1차원 시계열
+        window: 밴드 폭 (None이면 제한 없음)
+        cutoff: 조기 종료 기준
+    """
+    a = np.asarray(a, dtype=np.float64)
+    b = np.asarray(b, dtype=np.float64)
+    window = max(len(a), len(b)) if window is None else max(int(window), abs(len(a) - len(b)))
+    if _resolve_backend(backend) == 'numba':
+        return float(_numba().dtw(a, b, window, float(cutoff)))
+    return float(_dtw_numpy(a, b, window, float(cutoff)))
@@ -0,0 +1,175 @@
+"""
+시계열 수치 커널의 numba 구현
+
+kernels.py의 공개 함수가 numba 백엔드를 처음 쓸 때 import한다.
+numba import와 JIT 캐시 로딩 비용을 numba 경로를 쓰지 않는 실행에서는 내지 않기 위해 분리했다.
+"""
+
+import numpy as np
+from numba import njit, prange
+
+
+@njit(parallel=True, cache=True)
+def rolling_mean(values, window, min_periods):
+    n_rows, n_cols = values.shape
+    result = np.empty((n_rows, n_cols))
+    for i in prange(n_rows):
+        total = 0.0
+        count = 0
+        for t in range(n_cols):
+            x = values[i, t]
+            if not np.isnan(x):
+                total += x
+                count += 1
+            if t >= window:
+                old = values[i, t - window]
+                if not np.isnan(old):
+                    total -= old
+                    count -= 1
+            result[i, t] = total / count if count >= min_periods and count > 0 else np.nan
+    return result
+
+
+@njit(parallel=True, cache=True)
+def pct_change(values):
+    n_rows, n_cols = values.shape
+    result = np.empty((n_rows, n_cols))
+    for i in prange(n_rows):
+        result[i, 0] = np.nan
+        for t in range(1, n_cols):
+            prev = values[i, t - 1]
+            x = values[i, t]
+            if prev == 0.0:
+                if x == 0.0 or np.isnan(x):
+                    result[i, t] = np.nan
+                else:
+                    result[i, t] = np.inf if x > 0 else -np.inf
+            else:
+                result[i, t] = x / prev - 1.0
+    return result
+
+
+@njit(parallel=True, cache=True)
+def cumsum(values):
+    n_rows, n_cols = values.shape
+    result = np.empty((n_rows, n_cols))
+    for i in prange(n_rows):
+        total = 0.0
+        for t in range(n_cols):
+            x = values[i, t]
+            if np.isnan(x):
+                result[i, t] = np.nan
+            else:
+                total += x
+                result[i, t] = total
+    return result
+
+
+@njit(parallel=True, cache=True)
+def burst_scores(values, window, min_periods):
+    n_rows, n_cols = values.shape
+    result = np.empty((n_rows, n_cols))
+    for i in prange(n_rows):
+        total = 0.0
+        total_sq = 0.0
+        count = 0
+        for t in range(n_cols):
+            # 직전 window 통계 [t-window, t-1]
+            if count >= min_periods and count > 0:
+                mean = total / count
+                var = max(total_sq / count - mean * mean, 0.0)
+                result[i, t] = (values[i, t] - mean) / np.sqrt(var + 1.0)
+            else:
+                result[i, t] = np.nan
+            x = values[i, t]
+            if not np.isnan(x):
+                total += x
+                total_sq += x * x
+                count += 1
+            # 다음 시점의 직전 구간은 [t-window+1, t]
+            if t - window >= 0:
+                old = values[i, t - window]
+                if not np.isnan(old):
+                    total -= old
+                    total_sq -= old * old
+                    count -= 1
+    return result
+
+
+@njit(parallel=True, cache=True)
+def segment_costs(values, starts, ends):
+    n_rows, n_cols = values.shape
+    n_segments = starts.shape[0]
+    result = np.empty((n_rows, n_segments))
+    for i in prange(n_rows):
+        prefix = np.zeros(n_cols + 1)
+        prefix_sq = np.zeros(n_cols + 1)
+        for t in range(n_cols):
+            prefix[t + 1] = prefix[t] + values[i, t]
+            prefix_sq[t + 1] = prefix_sq[t] + values[i, t] * values[i, t]
+        for j in range(n_segments):
+            length = ends[j] - starts[j]
+            if length <= 0:
+                result[i, j] = 0.0
+                continue
+            seg_sum = prefix[ends[j]] - prefix[starts[j]]
+            seg_sq = prefix_sq[ends[j]] - prefix_sq[starts[j]]
+            result[i, j] = max(seg_sq - seg_sum * seg_sum / length, 0.0)
+    return result
+
+
+@njit(cache=True)
+def pelt(prefix, prefix_sq, positions, penalty, min_size):
+    n = positions.shape[0] - 1
+    best = np.full(n + 1, np.inf)
+    best[0] = -penalty
+    last = np.zeros(n + 1, dtype=np.int64)
+    candidates = np.empty(n + 1, dtype=np.int64)
+    totals = np.empty(n + 1)
+    candidates[0] = 0
+    n_candidates = 1
+    for t in range(min_size, n + 1):
+        min_total = np.inf
+        argmin = 0
+        for j in range(n_candidates):
+            s = candidates[j]
+            seg_sum = prefix[t] - prefix[s]
+            cost = max(prefix_sq[t] - prefix_sq[s] - seg_sum * seg_sum / (positions[t] - positions[s]), 0.0)
+            totals[j] = best[s] + cost
+            if totals[j] < min_total:
+                min_total = totals[j]
+                argmin = s
+        best[t] = min_total + penalty
+        last[t] = argmin
+        kept = 0
+        for j in range(n_candidates):
+            if totals[j] <= best[t]:
+                candidates[kept] = candidates[j]
+                kept += 1
+        n_candidates = kept
+        new = t - min_size + 1
+        if new <= n - min_size and np.isfinite(best[new]):
+            candidates[n_candidates] = new
+            n_candidates += 1
+    return last
+
+
+@njit(cache=True)
+def dtw(a, b, window, cutoff):
+    n, m = a.shape[0], b.shape[0]
+    previous = np.full(m + 1, np.inf)
+    current = np.full(m + 1, np.inf)
+    previous[0] = 0.0
+    for i in range(1, n + 1):
+        current[:] = np.inf
+        row_min = np.inf
+        for j in range(max(1, i - window), min(m, i + window) + 1):
+            diff = a[i - 1] - b[j - 1]
+            best = min(previous[j - 1], previous[j], current[j - 1])
+            current[j] = diff * diff + best
+            if current[j] < row_min:
+                row_min = current[j]
+        if row_min > cutoff:
+            return np.inf
+        previous, current = current, previous
+    return previous[m]
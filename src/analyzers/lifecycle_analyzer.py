@@ -1,9 +1,5 @@
 import pandas as pd
 import numpy as np
-from scipy import stats
-from scipy.optimize import curve_fit
-from sklearn.preprocessing import StandardScaler
-from sklearn.cluster import KMeans
 import warnings
 import os
 import sys
@@ -14,39 +10,231 @@ warnings.filterwarnings('ignore')
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-from config.config import PROCESSED_DATA_DIR, RESULTS_DIR
+from config.config import PROCESSED_DATA_DIR, RAW_DATA_DIR, RESULTS_DIR
+from src.analyzers.curve_models import MODELS, fit_models
+from src.analyzers.phase_segmentation import PhaseSegmenter
+from src.analyzers.shape_clustering import load_shape_model
+
+# 곡선 피팅에 사용하는 구간 시작일
+CURVE_FIT_START = '2024-01-01'
+
+DAILY_METRIC_COLUMNS = ['date', 'post_count', 'avg_score', 'total_score',
+                        'avg_comments', 'total_comments', 'total_engagement']
+
+def build_daily_metrics(df):
+    """게시물 DataFrame을 일별 지표로 집계"""
+    # 일별 집계
+    daily_metrics = df.groupby('date').agg({
+        'id': 'count',
+        'score': ['mean', 'sum'],
+        'num_comments': ['mean', 'sum'],
+        'engagement_score': 'sum'
+    }).reset_index()
+    
+    # 컬럼명 정리
+    daily_metrics.columns = DAILY_METRIC_COLUMNS
+    
+    return add_daily_derived_columns(daily_metrics)
+
+def add_daily_derived_columns(daily_metrics):
+    """일별 집계 표(DAILY_METRIC_COLUMNS)에 누적/이동 평균/성장률 컬럼 추가"""
+    # 누적 지표 계산
+    daily_metrics['cumulative_posts'] = daily_metrics['post_count'].cumsum()
+    daily_metrics['days_since_start'] = (daily_metrics['date'] - daily_metrics['date'].min()).dt.days
+    
+    # 이동 평균 (7일)
+    daily_metrics['ma7_posts'] = daily_metrics['post_count'].rolling(window=7, min_periods=1).mean()
+    daily_metrics['ma7_engagement'] = daily_metrics['total_engagement'].rolling(window=7, min_periods=1).mean()
+    
+    # 성장률 계산
+    daily_metrics['growth_rate'] = daily_metrics['ma7_posts'].pct_change()
+    
+    return daily_metrics
+
+# 메트릭 계산에 필요한 공유 중간값과 메트릭 등록부
+INTERMEDIATE_REGISTRY = {}
+METRIC_REGISTRY = []
+
+def register_intermediate(name):
+    """공유 중간값 계산 함수 등록 (MetricContext에서 최초 요청 시 한 번만 계산)"""
+    def decorator(func):
+        INTERMEDIATE_REGISTRY[name] = func
+        return func
+    return decorator
+
+def register_metric(*requires):
+    """메트릭 계산 함수 등록
+
+    함수는 (context, metrics)를 받아 {메트릭명: 값} 딕셔너리를 반환한다.
+    requires에는 사용하는 공유 중간값 이름을 선언한다. 새 메트릭은 원본
+    DataFrame을 다시 훑지 않고 context.get(...)으로 중간값을 재사용해야 한다.
+    """
+    def decorator(func):
+        unknown = [name for name in requires if name not in INTERMEDIATE_REGISTRY]
+        if unknown:
+            raise ValueError(f"등록되지 않은 중간값: {unknown}")
+        METRIC_REGISTRY.append((func, requires))
+        return func
+    return decorator
+
+class MetricContext:
+    """메트릭 간 공유되는 중간값 캐시"""
+    
+    def __init__(self, df, daily_metrics):
+        self.df = df
+        self.daily_metrics = daily_metrics
+        self._cache = {}
+    
+    def get(self, name):
+        if name not in self._cache:
+            self._cache[name] = INTERMEDIATE_REGISTRY[name](self)
+        return self._cache[name]
+
+@register_intermediate('daily_dates')
+def _daily_dates(context):
+    """날짜순으로 정렬된 일별 날짜 배열 (daily_metrics는 groupby로 이미 정렬됨)"""
+    return context.daily_metrics['date'].to_numpy()
+
+@register_intermediate('daily_counts')
+def _daily_counts(context):
+    return context.daily_metrics['post_count'].to_numpy()
+
+@register_intermediate('date_bounds')
+def _date_bounds(context):
+    daily_dates = context.get('daily_dates')
+    return pd.Timestamp(daily_dates[0]), pd.Timestamp(daily_dates[-1])
+
+@register_intermediate('peak_index')
+def _peak_index(context):
+    return int(np.argmax(context.get('daily_counts')))
+
+@register_intermediate('engagement')
+def _engagement(context):
+    return context.df['engagement_score'].to_numpy()
+
+@register_metric('date_bounds')
+def _basic_metrics(context, metrics):
+    """1. 기본 통계"""
+    df = context.df
+    first_date, last_date = context.get('date_bounds')
+    total_posts = len(df)
+    unique_authors = df['author'].nunique()
+    return {
+        'total_posts': total_posts,
+        'unique_authors': unique_authors,
+        'date_range': f"{first_date} to {last_date}",
+        'duration_days': (last_date - first_date).days
+    }
+
+@register_metric('engagement')
+def _engagement_metrics(context, metrics):
+    """2. 참여도 지표"""
+    return {
+        'avg_score': context.df['score'].mean(),
+        'avg_comments': context.df['num_comments'].mean(),
+        'total_engagement': context.get('engagement').sum()
+    }
+
+@register_metric()
+def _spread_metrics(context, metrics):
+    """3. 확산 지표"""
+    return {
+        'posts_per_author': metrics['total_posts'] / metrics['unique_authors'],
+        'subreddit_count': context.df['subreddit'].nunique()
+    }
+
+@register_metric('daily_dates', 'daily_counts', 'date_bounds', 'peak_index')
+def _temporal_metrics(context, metrics):
+    """4. 시간적 패턴 / 5. 생명주기 단계별 분포"""
+    peak_index = context.get('peak_index')
+    peak_date = pd.Timestamp(context.get('daily_dates')[peak_index])
+    first_date, _ = context.get('date_bounds')
+    result = {
+        'peak_date': peak_date,
+        'days_to_peak': (peak_date - first_date).days
+    }
+    
+    if result['days_to_peak'] > 0:
+        # 피크 이전/이후 게시물 수는 일별 카운트 합으로 계산 (원본 재탐색 없음)
+        daily_counts = context.get('daily_counts')
+        growth_posts = int(daily_counts[:peak_index].sum())
+        decline_posts = int(daily_counts[peak_index:].sum())
+        result['growth_phase_posts'] = growth_posts
+        result['decline_phase_posts'] = decline_posts
+        result['growth_decline_ratio'] = growth_posts / max(decline_posts, 1)
+    
+    return result
+
+@register_metric('daily_counts')
+def _persistence_metrics(context, metrics):
+    """6. 지속성 지표 (활동일 비율)"""
+    daily_counts = context.get('daily_counts')
+    return {'active_days_ratio': np.count_nonzero(daily_counts > 0) / len(daily_counts)}
+
+@register_metric('engagement')
+def _virality_metrics(context, metrics):
+    """7. 바이럴리티 지표 (상위 10% 게시물이 차지하는 engagement 비율)"""
+    engagement = context.get('engagement')
+    top_10_pct = int(len(engagement) * 0.1)
+    if top_10_pct > 0:
+        # 전체 정렬 없이 상위 k개만 분리
+        top_posts_engagement = np.partition(engagement, len(engagement) - top_10_pct)[-top_10_pct:].sum()
+    else:
+        top_posts_engagement = 0
+    return {'viral_concentration': top_posts_engagement / engagement.sum()}
+
+def diffusion_metrics(df):
+    """밈별 확산 네트워크 지표 {밈: {지표: 값}} (meme 컬럼이 없으면 키는 '')
+
+    네트워크 구성(서브레딧 그래프, PageRank)은 게시물 전체를 다시 훑으므로 등록 메트릭에 넣지 않고,
+    필요한 경로(일괄 분석, --diffusion 보고서)에서 코퍼스당 한 번 계산해 calculate_lifecycle_metrics에 넘긴다.
+    """
+    from src.analyzers.diffusion_network import DiffusionNetwork
+
+    summary = DiffusionNetwork(df).meme_summary().drop(columns='diffusion_subreddits')
+    return {record.pop('meme'): record for record in summary.to_dict('records')}
+
+def curve_fit_data(daily_metrics):
+    """곡선 피팅 대상 구간과 (x, y)
+
+    Returns:
+        (피팅 구간 daily_metrics, x: 구간 시작일로부터의 일수, y: 일별 게시물 수)
+    """
+    # 최근 데이터만 사용
+    recent_data = daily_metrics[daily_metrics['date'] >= CURVE_FIT_START]
+    x = (recent_data['date'] - recent_data['date'].min()).dt.days.values
+    y = recent_data['post_count'].values
+    return recent_data, x, y
+
+def duration_lifecycle_type(duration_days):
+    """형태 군집 모델이 없을 때 쓰는 기간 기준 분류"""
+    if duration_days < 30:
+        return "Flash Meme"
+    elif duration_days < 90:
+        return "Short-lived Meme"
+    elif duration_days < 365:
+        return "Standard Meme"
+    return "Long-lived Meme"
 
 class LifecycleAnalyzer:
-    def __init__(self):
-        """밈 수명 주기 분석기 초기화"""
+    def __init__(self, start_date=None, end_date=None):
+        """밈 수명 주기 분석기 초기화
+
+        Args:
+            start_date, end_date: 단계 분할 기간 (None이면 전체 이력)
+        """
         self.results_dir = RESULTS_DIR
+        self.segmenter = PhaseSegmenter(start_date=start_date, end_date=end_date)
+        self.shape_model = None
         
-    def identify_lifecycle_phases(self, df):
-        """밈의 생명주기 단계 식별"""
+    def identify_lifecycle_phases(self, df, cube=None):
+        """밈의 생명주기 단계 식별 (롤업 큐브가 있으면 원본 대신 큐브의 일별 표 사용)"""
         print("\n=== Lifecycle Phase Analysis ===")
         
-        # 일별 집계
-        daily_metrics = df.groupby('date').agg({
-            'id': 'count',
-            'score': ['mean', 'sum'],
-            'num_comments': ['mean', 'sum'],
-            'engagement_score': 'sum'
-        }).reset_index()
-        
-        # 컬럼명 정리
-        daily_metrics.columns = ['date', 'post_count', 'avg_score', 'total_score', 
-                                'avg_comments', 'total_comments', 'total_engagement']
-        
-        # 누적 지표 계산
-        daily_metrics['cumulative_posts'] = daily_metrics['post_count'].cumsum()
-        daily_metrics['days_since_start'] = (daily_metrics['date'] - daily_metrics['date'].min()).dt.days
-        
-        # 이동 평균 (7일)
-        daily_metrics['ma7_posts'] = daily_metrics['post_count'].rolling(window=7, min_periods=1).mean()
-        daily_metrics['ma7_engagement'] = daily_metrics['total_engagement'].rolling(window=7, min_periods=1).mean()
-        
-        # 성장률 계산
-        daily_metrics['growth_rate'] = daily_metrics['ma7_posts'].pct_change()
+        if cube is not None:
+            daily_metrics = add_daily_derived_columns(cube.daily_frame())
+        else:
+            daily_metrics = build_daily_metrics(df)
         
         # 단계 식별
         phases = self._identify_phases(daily_metrics)
@@ -54,154 +242,105 @@ class LifecycleAnalyzer:
         return daily_metrics, phases
     
     def _identify_phases(self, daily_metrics):
-        """성장률 기반 단계 식별"""
-        # 최근 2년 데이터만 사용
-        recent_data = daily_metrics[daily_metrics['date'] >= '2023-01-01'].copy()
+        """변화점 기반 단계 식별 (Emergence/Growth/Peak/Decline/Resurgence)"""
+        phases = self.segmenter.segment_daily_metrics(daily_metrics)
         
-        if len(recent_data) < 30:
-            print("Not enough recent data for phase identification")
+        if not phases:
+            print("Not enough data for phase identification")
             return None
         
-        # 정규화된 지표
-        recent_data['normalized_posts'] = recent_data['ma7_posts'] / recent_data['ma7_posts'].max()
-        
-        # 단계 정의 (간단한 규칙 기반)
-        phases = []
-        
-        # 피크 찾기
-        peak_idx = recent_data['normalized_posts'].idxmax()
-        peak_date = recent_data.loc[peak_idx, 'date']
-        
-        # 피크 전후로 단계 구분
-        growth_phase = recent_data[recent_data['date'] < peak_date]
-        decline_phase = recent_data[recent_data['date'] >= peak_date]
-        
-        if len(growth_phase) > 0:
-            phases.append({
-                'phase': 'Growth',
-                'start_date': growth_phase['date'].min(),
-                'end_date': growth_phase['date'].max(),
-                'duration_days': len(growth_phase),
-                'avg_daily_posts': growth_phase['post_count'].mean(),
-                'total_posts': growth_phase['post_count'].sum()
-            })
-        
-        if len(decline_phase) > 0:
-            phases.append({
-                'phase': 'Decline',
-                'start_date': decline_phase['date'].min(),
-                'end_date': decline_phase['date'].max(),
-                'duration_days': len(decline_phase),
-                'avg_daily_posts': decline_phase['post_count'].mean(),
-                'total_posts': decline_phase['post_count'].sum()
-            })
-        
+        print(f"Identified {len(phases)} phases: {' → '.join(phase['phase'] for phase in phases)}")
         return phases
     
-    def fit_lifecycle_curve(self, daily_metrics):
-        """수명 주기 곡선 피팅"""
+    def fit_lifecycle_curve(self, daily_metrics, models=None, criterion='bic'):
+        """수명 주기 곡선 피팅
+
+        여러 곡선 모델(curve_models.MODELS)을 차례로 피팅하고 AIC/BIC로 최적 모델을 고른다.
+
+        Args:
+            models: 피팅할 모델 이름 목록 (None이면 전체)
+            criterion: 모델 선택 기준 ('aic' 또는 'bic')
+        """
         print("\n=== Lifecycle Curve Fitting ===")
         
-        # 최근 데이터만 사용
-        recent_data = daily_metrics[daily_metrics['date'] >= '2024-01-01'].copy()
+        recent_data, x, y = curve_fit_data(daily_metrics)
         
         if len(recent_data) < 10:
             print("Not enough data for curve fitting")
             return None
         
-        # x: 시작일로부터의 일수
-        x = (recent_data['date'] - recent_data['date'].min()).dt.days.values
-        y = recent_data['post_count'].values
+        best, candidates = fit_models(x, y, models=models, criterion=criterion)
         
-        # 가우시안 함수로 피팅 시도
-        try:
-            def gaussian(x, a, b, c):
-                return a * np.exp(-(x - b)**2 / (2 * c**2))
-            
-            # 초기 추정값
-            a_init = y.max()
-            b_init = x[np.argmax(y)]
-            c_init = len(x) / 4
-            
-            popt, pcov = curve_fit(gaussian, x, y, p0=[a_init, b_init, c_init], maxfev=5000)
-            
-            # 피팅 결과
-            y_fit = gaussian(x, *popt)
-            
-            # R-squared 계산
-            residuals = y - y_fit
-            ss_res = np.sum(residuals**2)
-            ss_tot = np.sum((y - np.mean(y))**2)
-            r_squared = 1 - (ss_res / ss_tot)
-            
-            print(f"Gaussian fit R-squared: {r_squared:.3f}")
-            print(f"Peak day: {int(popt[1])}")
-            print(f"Spread (days): {int(popt[2])}")
-            
-            return {
-                'model': 'gaussian',
-                'parameters': popt,
-                'r_squared': r_squared,
-                'peak_day': int(popt[1]),
-                'spread_days': int(popt[2])
-            }
-            
-        except Exception as e:
-            print(f"Curve fitting failed: {e}")
+        for candidate in candidates:
+            if 'error' in candidate:
+                print(f"  {candidate['model']:<20} failed: {candidate['error']}")
+            else:
+                print(f"  {candidate['model']:<20} R²={candidate['r_squared']:.3f} "
+                      f"AIC={candidate['aic']:.1f} BIC={candidate['bic']:.1f} nfev={candidate['nfev']}")
+        
+        if best is None:
+            print("Curve fitting failed: 모든 모델 피팅 실패")
             return None
+        
+        print(f"Best model ({criterion.upper()}): {best['model']}")
+        print(f"R-squared: {best['r_squared']:.3f}")
+        print(f"Peak day: {best['peak_day']:.0f}")
+        print(f"Spread (days): {best['spread_days']:.0f}")
+        
+        return {
+            'model': best['model'],
+            'parameters': best['parameters'],
+            'covariance': best['covariance'],
+            'r_squared': best['r_squared'],
+            'peak_day': best['peak_day'],
+            'spread_days': best['spread_days'],
+            'aic': best['aic'],
+            'bic': best['bic'],
+            'nfev': best['nfev'],
+            'criterion': criterion,
+            'candidates': [
+                {key: c[key] for key in ('model', 'r_squared', 'aic', 'bic', 'nfev') if key in c}
+                for c in candidates if 'error' not in c
+            ]
+        }
+    
+    def classify_lifecycle_shape(self, daily_metrics):
+        """저장된 곡선 형태 군집 모델로 분류 (모델이 없거나 곡선을 만들 수 없으면 None)"""
+        if self.shape_model is None:
+            self.shape_model = load_shape_model()
+            if self.shape_model is None:
+                return None
+        return self.shape_model.classify(daily_metrics)
     
-    def calculate_lifecycle_metrics(self, df, daily_metrics):
-        """수명 주기 관련 메트릭 계산"""
+    def calculate_lifecycle_metrics(self, df, daily_metrics, diffusion=None):
+        """수명 주기 관련 메트릭 계산
+
+        Args:
+            daily_metrics: identify_lifecycle_phases(df)의 결과
+            diffusion: diffusion_metrics()의 이 밈 항목 (있으면 메트릭에 합침)
+        """
         print("\n=== Lifecycle Metrics ===")
         
+        # 등록된 메트릭을 순서대로 계산 (공유 중간값은 MetricContext가 한 번만 계산)
+        context = MetricContext(df, daily_metrics)
         metrics = {}
-        
-        # 1. 기본 통계
-        metrics['total_posts'] = len(df)
-        metrics['unique_authors'] = df['author'].nunique()
-        metrics['date_range'] = f"{df['date'].min()} to {df['date'].max()}"
-        metrics['duration_days'] = (df['date'].max() - df['date'].min()).days
-        
-        # 2. 참여도 지표
-        metrics['avg_score'] = df['score'].mean()
-        metrics['avg_comments'] = df['num_comments'].mean()
-        metrics['total_engagement'] = df['engagement_score'].sum()
-        
-        # 3. 확산 지표
-        metrics['posts_per_author'] = metrics['total_posts'] / metrics['unique_authors']
-        metrics['subreddit_count'] = df['subreddit'].nunique()
-        
-        # 4. 시간적 패턴
-        # 피크 시점 찾기
-        peak_date_idx = daily_metrics['post_count'].idxmax()
-        peak_date = daily_metrics.loc[peak_date_idx, 'date']
-        metrics['peak_date'] = peak_date
-        metrics['days_to_peak'] = (peak_date - df['date'].min()).days
-        
-        # 5. 생명주기 단계별 분포
-        if metrics['days_to_peak'] > 0:
-            growth_phase = df[df['date'] < peak_date]
-            decline_phase = df[df['date'] >= peak_date]
-            
-            metrics['growth_phase_posts'] = len(growth_phase)
-            metrics['decline_phase_posts'] = len(decline_phase)
-            metrics['growth_decline_ratio'] = metrics['growth_phase_posts'] / max(metrics['decline_phase_posts'], 1)
-        
-        # 6. 지속성 지표
-        # 활동일 비율
-        active_days = daily_metrics[daily_metrics['post_count'] > 0]
-        metrics['active_days_ratio'] = len(active_days) / len(daily_metrics)
-        
-        # 7. 바이럴리티 지표
-        # 상위 10% 게시물이 차지하는 engagement 비율
-        top_10_pct = int(len(df) * 0.1)
-        top_posts_engagement = df.nlargest(top_10_pct, 'engagement_score')['engagement_score'].sum()
-        metrics['viral_concentration'] = top_posts_engagement / df['engagement_score'].sum()
+        for func, _ in METRIC_REGISTRY:
+            metrics.update(func(context, metrics))
+        if diffusion:
+            metrics.update(diffusion)
         
         return metrics
     
-    def generate_report(self, meme_name, df, daily_metrics, phases, curve_fit, metrics):
-        """분석 보고서 생성"""
+    def generate_report(self, meme_name, df, daily_metrics, phases, curve_fit, metrics, intervals=None):
+        """분석 보고서 생성 (intervals: LifecycleBootstrap.confidence_intervals 결과, 있으면 신뢰 구간 표기)"""
+        intervals = intervals or {}
+        
+        def ci(name, fmt):
+            if name not in intervals or not np.isfinite(intervals[name]['low']):
+                return ""
+            low, high = intervals[name]['low'], intervals[name]['high']
+            return f" ({intervals[name]['n']}-resample CI {low:{fmt}} ~ {high:{fmt}})"
+        
         reports_dir = os.path.join(self.results_dir, 'reports')
         os.makedirs(reports_dir, exist_ok=True)
         
@@ -220,20 +359,28 @@ class LifecycleAnalyzer:
             f.write(f"Date Range: {metrics['date_range']}\n")
             f.write(f"Duration: {metrics['duration_days']} days\n")
             f.write(f"Peak Date: {metrics['peak_date']}\n")
-            f.write(f"Days to Peak: {metrics['days_to_peak']}\n\n")
+            f.write(f"Days to Peak: {metrics['days_to_peak']}{ci('days_to_peak', '.0f')}\n\n")
             
             f.write(f"2. ENGAGEMENT METRICS\n")
             f.write(f"{'-'*30}\n")
-            f.write(f"Average Score: {metrics['avg_score']:.1f}\n")
-            f.write(f"Average Comments: {metrics['avg_comments']:.1f}\n")
+            f.write(f"Average Score: {metrics['avg_score']:.1f}{ci('avg_score', '.1f')}\n")
+            f.write(f"Average Comments: {metrics['avg_comments']:.1f}{ci('avg_comments', '.1f')}\n")
             f.write(f"Total Engagement: {metrics['total_engagement']:,}\n")
-            f.write(f"Viral Concentration: {metrics['viral_concentration']:.2%}\n\n")
+            f.write(f"Viral Concentration: {metrics['viral_concentration']:.2%}{ci('viral_concentration', '.2%')}\n\n")
             
             f.write(f"3. SPREAD METRICS\n")
             f.write(f"{'-'*30}\n")
             f.write(f"Posts per Author: {metrics['posts_per_author']:.2f}\n")
             f.write(f"Subreddit Count: {metrics['subreddit_count']}\n")
-            f.write(f"Active Days Ratio: {metrics['active_days_ratio']:.2%}\n\n")
+            f.write(f"Active Days Ratio: {metrics['active_days_ratio']:.2%}\n")
+            if 'independent_introductions' in metrics:
+                f.write(f"First Subreddit: r/{metrics['first_subreddit']}\n")
+                f.write(f"Independent Introductions: {metrics['independent_introductions']}\n")
+                f.write(f"Cascade Depth: max {metrics['max_cascade_depth']}, mean {metrics['mean_cascade_depth']:.2f}\n")
+                f.write(f"Largest Cascade Share: {metrics['largest_cascade_share']:.2%}\n")
+                f.write(f"Bridge Author Share: {metrics['bridge_author_share']:.2%}\n")
+                f.write(f"Hub Subreddit: r/{metrics['hub_subreddit']} (PageRank {metrics['hub_pagerank']:.3f})\n")
+            f.write("\n")
             
             if phases:
                 f.write(f"4. LIFECYCLE PHASES\n")
@@ -249,24 +396,28 @@ class LifecycleAnalyzer:
                 f.write(f"\n5. CURVE FITTING RESULTS\n")
                 f.write(f"{'-'*30}\n")
                 f.write(f"Model: {curve_fit['model']}\n")
-                f.write(f"R-squared: {curve_fit['r_squared']:.3f}\n")
-                f.write(f"Peak Day: {curve_fit['peak_day']}\n")
-                f.write(f"Spread: {curve_fit['spread_days']} days\n")
+                f.write(f"R-squared: {curve_fit['r_squared']:.3f}{ci('r_squared', '.3f')}\n")
+                f.write(f"Peak Day: {curve_fit['peak_day']:.0f}{ci('peak_day', '.0f')}\n")
+                f.write(f"Spread: {curve_fit['spread_days']:.0f} days{ci('spread_days', '.0f')}\n")
+                if intervals:
+                    f.write(f"Parameters:\n")
+                    for name, value in zip(MODELS[curve_fit['model']].param_names, curve_fit['parameters']):
+                        f.write(f"  - {name}: {value:.4g}{ci(f'param_{name}', '.4g')}\n")
+                if curve_fit.get('candidates'):
+                    f.write(f"\nModel Comparison ({curve_fit['criterion'].upper()}):\n")
+                    for candidate in sorted(curve_fit['candidates'], key=lambda c: c[curve_fit['criterion']]):
+                        f.write(f"  - {candidate['model']}: R²={candidate['r_squared']:.3f}, "
+                                f"AIC={candidate['aic']:.1f}, BIC={candidate['bic']:.1f}\n")
             
             f.write(f"\n6. LIFECYCLE CLASSIFICATION\n")
             f.write(f"{'-'*30}\n")
             
-            # 수명 주기 분류
-            if metrics['duration_days'] < 30:
-                lifecycle_type = "Flash Meme"
-            elif metrics['duration_days'] < 90:
-                lifecycle_type = "Short-lived Meme"
-            elif metrics['duration_days'] < 365:
-                lifecycle_type = "Standard Meme"
+            # 수명 주기 분류 (학습된 곡선 형태 군집, 모델이 없으면 기간 기준)
+            shape = self.classify_lifecycle_shape(daily_metrics)
+            if shape:
+                f.write(f"Lifecycle Type: {shape['name']} (cluster {shape['cluster']}, DTW distance {shape['distance']:.3f})\n")
             else:
-                lifecycle_type = "Long-lived Meme"
-            
-            f.write(f"Lifecycle Type: {lifecycle_type}\n")
+                f.write(f"Lifecycle Type: {duration_lifecycle_type(metrics['duration_days'])} (duration rule)\n")
             
             # 확산 패턴 분류
             if metrics.get('growth_decline_ratio', 0) > 2:
@@ -277,6 +428,19 @@ class LifecycleAnalyzer:
                 spread_pattern = "Viral Spike"
             
             f.write(f"Spread Pattern: {spread_pattern}\n")
+            if 'growth_decline_ratio' in metrics:
+                f.write(f"Growth/Decline Ratio: {metrics['growth_decline_ratio']:.2f}{ci('growth_decline_ratio', '.2f')}\n")
+            
+            if 'post_sentiment' in daily_metrics.columns:
+                f.write(f"\n7. SENTIMENT\n")
+                f.write(f"{'-'*30}\n")
+                f.write(f"Average Post Sentiment: {daily_metrics['post_sentiment'].mean():.3f}\n")
+                if 'comment_sentiment' in daily_metrics.columns:
+                    f.write(f"Average Comment Sentiment: {daily_metrics['comment_sentiment'].mean():.3f}\n")
+                for phase in phases or []:
+                    in_phase = daily_metrics['date'].between(phase['start_date'], phase['end_date'])
+                    f.write(f"{phase['phase']} Phase Post Sentiment: "
+                            f"{daily_metrics.loc[in_phase, 'post_sentiment'].mean():.3f}\n")
             
         print(f"\nReport saved: {report_path}")
         return report_path
@@ -323,9 +487,23 @@ def main():
     parser = argparse.ArgumentParser(description='밈 수명 주기 분석')
     parser.add_argument('--meme', type=str, help='분석할 밈 이름')
     parser.add_argument('--file', type=str, help='분석할 특정 파일명')
+    parser.add_argument('--sentiment', action='store_true', help='일별 감성 지표 포함')
+    parser.add_argument('--comments-file', type=str, help='감성 분석에 사용할 댓글 CSV 파일명 (data/raw 기준)')
+    parser.add_argument('--start-date', type=str, help='단계 분할 시작일 (YYYY-MM-DD, 미지정 시 전체 이력)')
+    parser.add_argument('--end-date', type=str, help='단계 분할 종료일 (YYYY-MM-DD)')
+    parser.add_argument('--all', action='store_true', help='전처리된 모든 밈 일괄 분석')
+    parser.add_argument('--workers', type=int, default=None, help='일괄 분석/부트스트랩 곡선 재피팅 프로세스 수')
+    parser.add_argument('--bootstrap', type=int, default=0, help='부트스트랩 재표본 수 (0이면 신뢰 구간 생략)')
+    parser.add_argument('--diffusion', action='store_true', help='보고서에 확산 네트워크 지표 포함')
     
     args = parser.parse_args()
     
+    # 일괄 분석 모드
+    if args.all:
+        from src.analyzers.batch_analyzer import run_batch_analysis
+        run_batch_analysis(workers=args.workers, start_date=args.start_date, end_date=args.end_date)
+        return
+    
     # 처리할 파일 찾기
     if args.file:
         # 특정 파일 지정
@@ -357,22 +535,55 @@ def main():
         df['created_utc'] = pd.to_datetime(df['created_utc'])
         df['date'] = pd.to_datetime(df['date'])
         
+        # 전처리 시 저장된 롤업 큐브 (없으면 만들어 저장)
+        from src.preprocessors.rollup_cube import load_rollup
+        cube = load_rollup(filepath, df, meme_name)
+        
         # 분석 실행
-        analyzer = LifecycleAnalyzer()
+        analyzer = LifecycleAnalyzer(start_date=args.start_date, end_date=args.end_date)
         
         print(f"\n=== {meme_name.replace('_', ' ').title()} 밈 수명 주기 분석 ===")
         
         # 1. 생명주기 단계 식별
-        daily_metrics, phases = analyzer.identify_lifecycle_phases(df)
+        daily_metrics, phases = analyzer.identify_lifecycle_phases(df, cube)
+        
+        # 감성 지표 (선택)
+        if args.sentiment:
+            from src.analyzers.sentiment_analyzer import SentimentAnalyzer, add_sentiment_to_daily_metrics
+            comments_df = None
+            if args.comments_file:
+                comments_df = pd.read_csv(os.path.join(RAW_DATA_DIR, args.comments_file))
+            daily_sentiment = SentimentAnalyzer().analyze(df, comments_df)
+            daily_metrics = add_sentiment_to_daily_metrics(daily_metrics, daily_sentiment)
         
         # 2. 곡선 피팅
         curve_fit = analyzer.fit_lifecycle_curve(daily_metrics)
         
         # 3. 메트릭 계산
-        metrics = analyzer.calculate_lifecycle_metrics(df, daily_metrics)
+        diffusion = next(iter(diffusion_metrics(df).values())) if args.diffusion else None
+        metrics = analyzer.calculate_lifecycle_metrics(df, daily_metrics, diffusion)
+        
+        # 부트스트랩 신뢰 구간 (선택)
+        intervals = None
+        if args.bootstrap > 0:
+            from src.analyzers.bootstrap import LifecycleBootstrap
+            bootstrap = LifecycleBootstrap(n_resamples=args.bootstrap, workers=args.workers)
+            intervals = bootstrap.confidence_intervals(df, daily_metrics, metrics, curve_fit)
         
         # 4. 보고서 생성
-        report_path = analyzer.generate_report(meme_name, df, daily_metrics, phases, curve_fit, metrics)
+        report_path = analyzer.generate_report(meme_name, df, daily_metrics, phases, curve_fit, metrics, intervals)
+        
+        # 5. 비슷한 곡선의 밈 검색 후 색인에 추가
+        from src.analyzers.curve_index import load_or_create_index
+        index = load_or_create_index()
+        neighbours = index.query_daily_metrics(daily_metrics, k=5, exclude=[meme_name])
+        if neighbours:
+            print(f"\n=== Similar Memes (first {neighbours[0]['horizon']} days) ===")
+            for neighbour in neighbours:
+                print(f"  {neighbour['meme']}: distance {neighbour['distance']:.3f}, "
+                      f"peak at day {neighbour['days_to_peak']}")
+        index.add_daily_metrics(meme_name, daily_metrics)
+        index.save()
         
         print(f"\n✅ '{meme_name}' 밈 분석 완료!")
         print(f"보고서: {report_path}")
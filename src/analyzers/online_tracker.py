@@ -0,0 +1,326 @@
+"""
+밈별 온라인 수명 주기 추적기
+
+전체 이력을 다시 집계하지 않고, 새 게시물 묶음(또는 일별 카운터)이 들어올 때마다
+일별 카운터, 7일 이동 창, 누적 합, 성장률을 상수 시간에 갱신한다.
+daily_metrics()는 build_daily_metrics(df)와 같은 형태의 DataFrame을 돌려준다.
+마지막 날짜는 아직 게시물이 더 들어올 수 있으므로 그날 반영한 게시물 id를 기억해 두고,
+다시 수집된 파일에서 그날의 새 게시물만 더한다.
+"""
+
+from collections import deque
+import argparse
+import glob
+import json
+import math
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from config.config import PROCESSED_DATA_DIR, TRACKER_DIR
+from src.analyzers.lifecycle_analyzer import DAILY_METRIC_COLUMNS
+
+# build_daily_metrics 결과의 전체 컬럼 순서
+TRACKER_COLUMNS = DAILY_METRIC_COLUMNS + ['cumulative_posts', 'days_since_start',
+                                          'ma7_posts', 'ma7_engagement', 'growth_rate']
+
+
+class LifecycleTracker:
+    def __init__(self, meme_name, window=7):
+        """밈 하나의 상태 저장형 추적기
+
+        daily_metrics와 마찬가지로 게시물이 있는 날짜만 행이 되며,
+        이동 평균은 최근 window개 행 기준이다.
+
+        Args:
+            meme_name: 밈 이름
+            window: 이동 평균 창 크기 (행 수)
+        """
+        self.meme_name = meme_name
+        self.window = window
+        # 일별 행: [date, post_count, total_score, total_comments, total_engagement,
+        #           cumulative_posts, ma7_posts, ma7_engagement, growth_rate]
+        self.rows = []
+        self.window_posts = deque(maxlen=window)
+        self.window_engagement = deque(maxlen=window)
+        self.window_post_sum = 0.0
+        self.window_engagement_sum = 0.0
+        self.cumulative_posts = 0
+        # 마지막 날짜에 반영한 게시물 id (늦게 들어온 같은 날 게시물을 중복 없이 더하기 위함)
+        self.last_day_ids = set()
+
+    @property
+    def start_date(self):
+        return self.rows[0][0] if self.rows else None
+
+    @property
+    def last_date(self):
+        return self.rows[-1][0] if self.rows else None
+
+    # ------------------------------------------------------------------
+    # 갱신
+    # ------------------------------------------------------------------
+
+    def _push_window(self, post_count, engagement):
+        """이동 창에 새 행 추가 (창이 가득 차면 가장 오래된 값이 빠짐)"""
+        if len(self.window_posts) == self.window:
+            self.window_post_sum -= self.window_posts[0]
+            self.window_engagement_sum -= self.window_engagement[0]
+        self.window_posts.append(post_count)
+        self.window_engagement.append(engagement)
+        self.window_post_sum += post_count
+        self.window_engagement_sum += engagement
+
+    def _replace_window_last(self, post_count, engagement):
+        """같은 날 데이터가 추가로 들어온 경우 창의 마지막 값 교체"""
+        self.window_post_sum += post_count - self.window_posts[-1]
+        self.window_engagement_sum += engagement - self.window_engagement[-1]
+        self.window_posts[-1] = post_count
+        self.window_engagement[-1] = engagement
+
+    def _growth_rate(self, ma7_posts):
+        """직전 행 이동 평균 대비 증감률 (pct_change와 동일)"""
+        if len(self.rows) < 2:
+            return np.nan
+        previous = self.rows[-2][6]
+        if previous == 0:
+            return np.nan if ma7_posts == 0 else np.inf
+        return ma7_posts / previous - 1.0
+
+    def _refresh_last_row(self):
+        row = self.rows[-1]
+        row[5] = self.cumulative_posts
+        row[6] = self.window_post_sum / len(self.window_posts)
+        row[7] = self.window_engagement_sum / len(self.window_engagement)
+        row[8] = self._growth_rate(row[6])
+
+    def update_day(self, date, post_count, total_score=0, total_comments=0, total_engagement=0):
+        """하루치 카운터 반영 (상수 시간)
+
+        마지막 날짜와 같으면 그날 값에 더하고, 이후 날짜면 새 행을 추가한다.
+        이전 날짜의 데이터는 이동 창 전체를 다시 계산해야 하므로 받지 않는다.
+        """
+        date = pd.Timestamp(date).normalize()
+        if post_count <= 0:
+            return
+
+        if self.rows and date < self.last_date:
+            raise ValueError(f"{date.date()}는 마지막 반영 날짜({self.last_date.date()})보다 이전입니다.")
+
+        self.cumulative_posts += post_count
+        if self.rows and date == self.last_date:
+            row = self.rows[-1]
+            row[1] += post_count
+            row[2] += total_score
+            row[3] += total_comments
+            row[4] += total_engagement
+            self._replace_window_last(row[1], row[4])
+        else:
+            self.rows.append([date, post_count, total_score, total_comments, total_engagement,
+                              0, 0.0, 0.0, np.nan])
+            self._push_window(post_count, total_engagement)
+        self._refresh_last_row()
+
+    def update(self, posts):
+        """새 게시물 묶음 반영 (묶음 크기에만 비례, 기존 이력 재집계 없음)
+
+        id 컬럼이 있으면 마지막 날짜에 이미 반영한 게시물은 건너뛰므로,
+        같은 날짜가 포함된 재수집 파일을 넘겨도 그날의 새 게시물만 더해진다.
+
+        Args:
+            posts: date, score, num_comments, engagement_score (선택: id) 컬럼이 있는 게시물 DataFrame
+        """
+        if len(posts) == 0:
+            return self
+        dates = pd.to_datetime(posts['date']).dt.normalize()
+        has_ids = 'id' in posts.columns
+        if has_ids:
+            ids = posts['id'].astype(str)
+            if self.rows:
+                new = ~((dates == self.last_date) & ids.isin(self.last_day_ids))
+                posts, dates, ids = posts[new], dates[new], ids[new]
+            if len(posts) == 0:
+                return self
+        previous_last_date = self.last_date
+
+        daily = posts.groupby(dates).agg(
+            post_count=('score', 'size'),
+            total_score=('score', 'sum'),
+            total_comments=('num_comments', 'sum'),
+            total_engagement=('engagement_score', 'sum')
+        ).sort_index()
+        for date, row in zip(daily.index, daily.itertuples(index=False)):
+            self.update_day(date, int(row.post_count), row.total_score,
+                            row.total_comments, row.total_engagement)
+
+        if has_ids:
+            if self.last_date != previous_last_date:
+                self.last_day_ids = set()
+            self.last_day_ids.update(ids[dates == self.last_date])
+        return self
+
+    @classmethod
+    def from_posts(cls, meme_name, df, window=7):
+        """전체 게시물 이력으로 추적기 초기화"""
+        return cls(meme_name, window=window).update(df)
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def latest(self):
+        """가장 최근 날짜의 지표 딕셔너리 (daily_metrics()의 마지막 행과 같음, 상수 시간)"""
+        if not self.rows:
+            return None
+        date, posts, scores, comments, engagement, cumulative, ma7_posts, ma7_engagement, growth = self.rows[-1]
+        return {
+            'date': date,
+            'post_count': posts,
+            'avg_score': scores / posts,
+            'total_score': scores,
+            'avg_comments': comments / posts,
+            'total_comments': comments,
+            'total_engagement': engagement,
+            'cumulative_posts': cumulative,
+            'days_since_start': (date - self.start_date).days,
+            'ma7_posts': ma7_posts,
+            'ma7_engagement': ma7_engagement,
+            'growth_rate': growth
+        }
+
+    def daily_metrics(self):
+        """build_daily_metrics(df)와 같은 형태의 일별 지표 DataFrame"""
+        if not self.rows:
+            return pd.DataFrame(columns=TRACKER_COLUMNS)
+
+        dates, posts, scores, comments, engagement, cumulative, ma7_posts, ma7_engagement, growth = \
+            map(list, zip(*self.rows))
+        posts = np.asarray(posts, dtype=np.int64)
+        daily_metrics = pd.DataFrame({
+            'date': pd.to_datetime(dates),
+            'post_count': posts,
+            'avg_score': np.asarray(scores, dtype=np.float64) / posts,
+            'total_score': scores,
+            'avg_comments': np.asarray(comments, dtype=np.float64) / posts,
+            'total_comments': comments,
+            'total_engagement': engagement,
+            'cumulative_posts': np.asarray(cumulative, dtype=np.int64),
+        })
+        daily_metrics['days_since_start'] = (daily_metrics['date'] - daily_metrics['date'].min()).dt.days
+        daily_metrics['ma7_posts'] = ma7_posts
+        daily_metrics['ma7_engagement'] = ma7_engagement
+        daily_metrics['growth_rate'] = growth
+        return daily_metrics[TRACKER_COLUMNS]
+
+    # ------------------------------------------------------------------
+    # 저장/로드
+    # ------------------------------------------------------------------
+
+    def to_dict(self):
+        def to_json_number(value):
+            if isinstance(value, (int, np.integer)):
+                return int(value)
+            value = float(value)
+            return None if math.isnan(value) else value
+
+        return {
+            'meme': self.meme_name,
+            'window': self.window,
+            'rows': [[row[0].strftime('%Y-%m-%d')] + [to_json_number(v) for v in row[1:]] for row in self.rows],
+            'last_day_ids': sorted(self.last_day_ids)
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        tracker = cls(data['meme'], window=data['window'])
+        for row in data['rows']:
+            values = [np.nan if v is None else v for v in row[1:]]
+            values[0] = int(values[0])
+            values[4] = int(values[4])
+            tracker.rows.append([pd.Timestamp(row[0])] + values)
+        # 이동 창과 누적 합은 마지막 window개 행에서 복원
+        for row in tracker.rows[-tracker.window:]:
+            tracker._push_window(row[1], row[4])
+        tracker.cumulative_posts = tracker.rows[-1][5] if tracker.rows else 0
+        tracker.last_day_ids = set(data.get('last_day_ids', []))
+        return tracker
+
+    def save(self, filepath=None):
+        """추적기 상태를 JSON 파일로 저장"""
+        filepath = filepath or tracker_path(self.meme_name)
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f)
+        return filepath
+
+    @classmethod
+    def load(cls, filepath):
+        """저장된 추적기 상태 로드"""
+        with open(filepath, 'r', encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
+
+
+def tracker_path(meme_name):
+    """밈별 추적기 상태 파일 경로"""
+    return os.path.join(TRACKER_DIR, f"{meme_name.replace(' ', '_').lower()}_tracker.json")
+
+
+def load_or_create_tracker(meme_name):
+    """저장된 추적기가 있으면 로드, 없으면 새로 생성"""
+    filepath = tracker_path(meme_name)
+    if os.path.exists(filepath):
+        return LifecycleTracker.load(filepath)
+    return LifecycleTracker(meme_name)
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description='밈 수명 주기 온라인 추적')
+    parser.add_argument('--meme', type=str, required=True, help='추적할 밈 이름')
+    parser.add_argument('--file', type=str, help='반영할 게시물 CSV 파일명 (data/processed 기준, 미지정 시 최신 파일)')
+    parser.add_argument('--reset', action='store_true', help='저장된 상태를 무시하고 새로 시작')
+
+    args = parser.parse_args()
+
+    tracker = LifecycleTracker(args.meme) if args.reset else load_or_create_tracker(args.meme)
+
+    if args.file:
+        filepath = os.path.join(PROCESSED_DATA_DIR, args.file)
+    else:
+        pattern = f"processed_reddit_{args.meme.replace(' ', '_').lower()}_*.csv"
+        files = glob.glob(os.path.join(PROCESSED_DATA_DIR, pattern))
+        if not files:
+            print(f"'{args.meme}' 밈의 전처리된 데이터 파일을 찾을 수 없습니다.")
+            return
+        filepath = max(files, key=os.path.getctime)
+
+    posts = pd.read_csv(filepath, usecols=['id', 'date', 'score', 'num_comments', 'engagement_score'])
+    posts['date'] = pd.to_datetime(posts['date'])
+
+    # 마지막 반영 날짜부터 반영 (마지막 날짜의 이미 반영한 게시물은 id로 건너뜀)
+    if tracker.last_date is not None:
+        stale = posts['date'] < tracker.last_date
+        if stale.any():
+            print(f"마지막 반영 날짜 이전 게시물 {int(stale.sum()):,}개는 반영하지 않습니다.")
+        posts = posts[~stale]
+
+    previous_total = tracker.cumulative_posts
+    tracker.update(posts)
+    saved_path = tracker.save()
+
+    print(f"반영한 게시물: {tracker.cumulative_posts - previous_total:,}개")
+    print(f"추적 기간: {tracker.start_date} ~ {tracker.last_date}")
+    latest = tracker.latest()
+    if latest:
+        print("\n=== Latest Day ===")
+        for key, value in latest.items():
+            print(f"{key}: {value}")
+    print(f"\n상태 저장: {saved_path}")
+
+# 실행 코드
+if __name__ == "__main__":
+    main()
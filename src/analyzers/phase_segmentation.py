@@ -0,0 +1,245 @@
+"""
+변화점 기반 밈 수명 주기 단계 분할
+
+게시물 수 시계열(일별 또는 시간별)을 분산 안정화(Anscombe) 척도로 바꾼 뒤 PELT로
+평균이 바뀌는 지점을 찾고, 인접 구간의 수준 변화로 Emergence/Growth/Peak/Decline/Resurgence를 붙인다.
+"""
+
+import argparse
+import glob
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from config.config import PROCESSED_DATA_DIR
+from src.analyzers import kernels
+
+# 시간 단위별 구간 최소 길이 (일별 1주, 시간별 하루)
+DEFAULT_MIN_SIZE = {'D': 7, 'h': 24}
+# 상대 수준(전체 범위 대비)이 이 값 미만인 초기 구간은 Emergence
+EMERGENCE_LEVEL = 0.25
+# 상대 수준이 이 값 이상인 국소 최대 구간은 Peak (전역 최대는 항상 Peak)
+PEAK_LEVEL = 0.5
+# 인접 구간 상대 수준 차이가 이 값 미만이면 방향 전환으로 보지 않음
+MIN_CHANGE = 0.1
+
+
+def anscombe(counts):
+    """포아송 카운트의 분산 안정화 변환 (잡음 표준편차가 약 1이 됨)"""
+    return 2 * np.sqrt(np.asarray(counts, dtype=np.float64) + 3 / 8)
+
+
+def estimate_noise(values):
+    """1차 차분의 MAD로 추정한 잡음 표준편차 (변화점에 강건)"""
+    diffs = np.diff(values)
+    if len(diffs) == 0:
+        return 0.0
+    return float(np.median(np.abs(diffs - np.median(diffs))) / 0.6745 / np.sqrt(2))
+
+
+def find_turning_points(relative, min_change=MIN_CHANGE):
+    """지그재그 방식의 국소 최대/최소 구간 인덱스
+
+    직전 극값에서 min_change 이상 반대로 움직였을 때만 방향 전환으로 인정한다.
+    """
+    peaks, troughs = [], []
+    direction = None
+    high = low = 0
+    for i in range(1, len(relative)):
+        if direction == 'up':
+            if relative[i] > relative[high]:
+                high = i
+            elif relative[high] - relative[i] >= min_change:
+                peaks.append(high)
+                direction, low = 'down', i
+        elif direction == 'down':
+            if relative[i] < relative[low]:
+                low = i
+            elif relative[i] - relative[low] >= min_change:
+                troughs.append(low)
+                direction, high = 'up', i
+        else:
+            if relative[i] > relative[high]:
+                high = i
+            if relative[i] < relative[low]:
+                low = i
+            if relative[high] - relative[low] >= min_change:
+                if high > low:
+                    direction = 'up'
+                else:
+                    peaks.append(high)
+                    direction, low = 'down', i
+    if direction == 'up':
+        peaks.append(high)
+    return peaks, troughs
+
+
+def label_segments(levels, emergence_level=EMERGENCE_LEVEL, peak_level=PEAK_LEVEL, min_change=MIN_CHANGE):
+    """구간 수준 목록을 단계 이름으로 분류
+
+    - 첫 상승 전의 낮은 구간: Emergence
+    - 국소 최대 중 충분히 높은 구간(전역 최대 포함): Peak
+    - 국소 최대 이후 다음 최소까지: Decline
+    - 최소 이후 다음 최대까지: 첫 번째 상승이면 Growth, 그 이후면 Resurgence
+    """
+    levels = np.asarray(levels, dtype=np.float64)
+    low, high = levels.min(), levels.max()
+    relative = (levels - low) / (high - low) if high > low else np.zeros_like(levels)
+    peaks, troughs = find_turning_points(relative, min_change)
+    global_peak = int(np.argmax(levels))
+
+    labels = []
+    falling = False
+    seen_peak = False
+    for i in range(len(levels)):
+        if i == global_peak or (i in peaks and relative[i] >= peak_level):
+            labels.append('Peak')
+        elif falling:
+            labels.append('Decline')
+        elif seen_peak:
+            labels.append('Resurgence')
+        elif relative[i] < emergence_level and all(label == 'Emergence' for label in labels):
+            labels.append('Emergence')
+        else:
+            labels.append('Growth')
+
+        # 다음 구간의 방향 (국소 최대 이후는 하락, 국소 최소 이후는 상승)
+        if i in peaks or i == global_peak:
+            falling = seen_peak = True
+        elif i in troughs:
+            falling = False
+    return labels
+
+
+class PhaseSegmenter:
+    def __init__(self, start_date=None, end_date=None, freq='D', penalty=None,
+                 penalty_scale=3.0, min_size=None, min_periods=30, backend=None):
+        """변화점 기반 단계 분할기 초기화
+
+        Args:
+            start_date, end_date: 분석 기간 (None이면 전체 이력)
+            freq: 'D'(일별) 또는 'h'(시간별)
+            penalty: 변화점 패널티 (None이면 잡음 수준과 길이로 자동 설정)
+            penalty_scale: 자동 패널티 배율 (클수록 단계 수가 줄어듦)
+            min_size: 구간 최소 길이 (None이면 일별 7, 시간별 24)
+            min_periods: 분할에 필요한 최소 시점 수
+            backend: kernels 백엔드 ('numba', 'numpy', None이면 자동)
+        """
+        self.start_date = pd.Timestamp(start_date) if start_date else None
+        self.end_date = pd.Timestamp(end_date) if end_date else None
+        self.freq = freq
+        self.penalty = penalty
+        self.penalty_scale = penalty_scale
+        self.min_size = min_size or DEFAULT_MIN_SIZE.get(freq, 7)
+        self.min_periods = min_periods
+        self.backend = backend
+
+    def _clip(self, series):
+        if self.start_date is not None:
+            series = series[series.index >= self.start_date]
+        if self.end_date is not None:
+            series = series[series.index <= self.end_date]
+        return series
+
+    def _penalty(self, values):
+        if self.penalty is not None:
+            return self.penalty
+        # 변환 후 포아송 잡음은 1, 과분산이면 그보다 큼
+        sigma = max(estimate_noise(values), 1.0)
+        return self.penalty_scale * 2 * sigma ** 2 * np.log(len(values))
+
+    def segment_series(self, counts):
+        """게시물 수 시계열을 단계 목록으로 분할
+
+        Args:
+            counts: 시각 인덱스의 게시물 수 Series (비어 있는 시점은 0으로 채움)
+
+        Returns:
+            단계 딕셔너리 리스트, 데이터가 부족하면 None
+        """
+        counts = self._clip(counts.sort_index())
+        if len(counts) == 0:
+            return None
+        counts = counts.asfreq(self.freq, fill_value=0)
+        if len(counts) < self.min_periods:
+            return None
+
+        values = anscombe(counts.to_numpy())
+        starts = kernels.change_points(values, self._penalty(values), self.min_size, backend=self.backend)
+        bounds = np.concatenate([[0], starts, [len(values)]])
+
+        levels = [values[start:end].mean() for start, end in zip(bounds[:-1], bounds[1:])]
+        labels = label_segments(levels)
+
+        # 같은 단계가 연속되면 하나로 합침
+        merged = []
+        for label, start, end in zip(labels, bounds[:-1], bounds[1:]):
+            if merged and merged[-1][0] == label:
+                merged[-1][2] = end
+            else:
+                merged.append([label, start, end])
+
+        step_days = pd.Timedelta(1, unit=self.freq) / pd.Timedelta(days=1)
+        phases = []
+        for label, start, end in merged:
+            segment = counts.iloc[start:end]
+            duration_days = len(segment) * step_days
+            phases.append({
+                'phase': label,
+                'start_date': segment.index[0],
+                'end_date': segment.index[-1],
+                'duration_days': int(round(duration_days)) if self.freq == 'D' else round(duration_days, 2),
+                'avg_daily_posts': segment.sum() / duration_days,
+                'total_posts': int(segment.sum())
+            })
+        return phases
+
+    def segment_daily_metrics(self, daily_metrics):
+        """build_daily_metrics 결과로 일별 단계 분할"""
+        counts = daily_metrics.set_index('date')['post_count']
+        return self.segment_series(counts)
+
+    def segment_posts(self, df, time_column='created_utc'):
+        """게시물 DataFrame으로 단계 분할 (freq 단위로 집계)"""
+        timestamps = pd.to_datetime(df[time_column]).dt.floor(self.freq)
+        return self.segment_series(timestamps.value_counts())
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description='변화점 기반 밈 수명 주기 단계 분할')
+    parser.add_argument('--meme', type=str, required=True, help='분석할 밈 이름')
+    parser.add_argument('--start-date', type=str, help='분석 시작일 (YYYY-MM-DD, 미지정 시 전체 이력)')
+    parser.add_argument('--end-date', type=str, help='분석 종료일 (YYYY-MM-DD)')
+    parser.add_argument('--freq', choices=['D', 'h'], default='D', help='시간 단위 (일별/시간별)')
+    parser.add_argument('--penalty-scale', type=float, default=3.0, help='변화점 패널티 배율')
+
+    args = parser.parse_args()
+
+    pattern = f"processed_reddit_{args.meme.replace(' ', '_').lower()}_*.csv"
+    files = glob.glob(os.path.join(PROCESSED_DATA_DIR, pattern))
+    if not files:
+        print(f"'{args.meme}' 밈의 전처리된 데이터 파일을 찾을 수 없습니다.")
+        return
+
+    df = pd.read_csv(max(files, key=os.path.getctime), usecols=['created_utc'])
+    segmenter = PhaseSegmenter(args.start_date, args.end_date, freq=args.freq,
+                               penalty_scale=args.penalty_scale)
+    phases = segmenter.segment_posts(df)
+    if not phases:
+        print("Not enough data for phase identification")
+        return
+
+    print(f"\n=== {args.meme} Lifecycle Phases ({args.freq}) ===")
+    for phase in phases:
+        print(f"{phase['phase']:<11} {phase['start_date']} ~ {phase['end_date']} "
+              f"({phase['duration_days']} days, {phase['total_posts']:,} posts, "
+              f"{phase['avg_daily_posts']:.1f}/day)")
+
+# 실행 코드
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+import pandas as pd
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+import os
+import sys
+import argparse
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from config.config import PROCESSED_DATA_DIR, RAW_DATA_DIR, REPORTS_DIR
+from src.database import TextCache
+
+# VADER compound 점수 기준 긍정/부정 경계
+POSITIVE_THRESHOLD = 0.05
+NEGATIVE_THRESHOLD = -0.05
+
+_vader = None
+
+
+def _get_vader():
+    """프로세스별 VADER 분석기 (최초 호출 시 한 번만 생성)"""
+    global _vader
+    if _vader is None:
+        import nltk
+        from nltk.sentiment.vader import SentimentIntensityAnalyzer
+        try:
+            nltk.data.find('sentiment/vader_lexicon.zip')
+        except LookupError:
+            raise RuntimeError("VADER 사전이 없습니다. python -m nltk.downloader vader_lexicon 을 실행하세요.")
+        _vader = SentimentIntensityAnalyzer()
+    return _vader
+
+
+def score_batch(texts):
+    """텍스트 배치의 compound 감성 점수 (-1 ~ 1)"""
+    vader = _get_vader()
+    return [vader.polarity_scores(text)['compound'] for text in texts]
+
+
+class SentimentAnalyzer:
+    def __init__(self, batch_size=10000, workers=None, use_cache=True):
+        """감성 분석기 초기화
+
+        Args:
+            batch_size: 프로세스에 넘기는 배치 크기
+            workers: 프로세스 수 (None 또는 1이면 단일 프로세스)
+            use_cache: 텍스트 해시 기반 점수 캐시 사용 여부
+        """
+        self.batch_size = batch_size
+        self.workers = workers
+        self.cache = TextCache('sentiment_vader') if use_cache else None
+
+    def score_texts(self, texts):
+        """텍스트 배열의 감성 점수 (중복 텍스트와 캐시된 텍스트는 재계산하지 않음)"""
+        texts = pd.Series(texts).fillna('').astype(str)
+        unique_texts = pd.unique(texts.values)
+        hashes = [TextCache.hash_text(text) for text in unique_texts]
+
+        cached = self.cache.get_many(hashes) if self.cache else {}
+        missing = [(text_hash, text) for text_hash, text in zip(hashes, unique_texts)
+                   if text_hash not in cached and text]
+        print(f"감성 점수: 고유 텍스트 {len(unique_texts):,}개 중 계산 대상 {len(missing):,}개")
+
+        batches = [missing[start:start + self.batch_size] for start in range(0, len(missing), self.batch_size)]
+        if self.workers and self.workers > 1 and len(batches) > 1:
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                batch_scores = list(executor.map(score_batch, [[text for _, text in batch] for batch in batches]))
+        else:
+            batch_scores = [score_batch([text for _, text in batch]) for batch in batches]
+
+        for batch, scores in zip(batches, batch_scores):
+            new_values = {text_hash: score for (text_hash, _), score in zip(batch, scores)}
+            if self.cache:
+                self.cache.set_many(new_values)
+            cached.update(new_values)
+
+        # 빈 텍스트는 점수 없음
+        by_text = {text: cached.get(text_hash, np.nan) for text_hash, text in zip(hashes, unique_texts)}
+        return texts.map(by_text).to_numpy(dtype=np.float64)
+
+    def score_posts(self, df):
+        """게시물 감성 점수 (title_clean + selftext_clean)"""
+        print("\n=== Post Sentiment Scoring ===")
+        texts = (df['title_clean'].fillna('') + ' ' + df['selftext_clean'].fillna('')).str.strip()
+        scored = df[['id', 'date']].copy()
+        scored['sentiment'] = self.score_texts(texts)
+        return scored
+
+    def score_comments(self, comments_df):
+        """댓글 감성 점수 (body)"""
+        print("\n=== Comment Sentiment Scoring ===")
+        scored = comments_df[['id', 'post_id']].copy()
+        scored['date'] = pd.to_datetime(comments_df['created_utc']).dt.normalize()
+        scored['sentiment'] = self.score_texts(comments_df['body'])
+        return scored
+
+    def daily_sentiment(self, scored, prefix):
+        """일별 감성 집계
+
+        Returns:
+            date, {prefix}_sentiment, {prefix}_positive_ratio, {prefix}_negative_ratio,
+            {prefix}_scored_count 컬럼의 DataFrame
+        """
+        scored = scored.dropna(subset=['sentiment'])
+        daily = scored.assign(
+            positive=scored['sentiment'] > POSITIVE_THRESHOLD,
+            negative=scored['sentiment'] < NEGATIVE_THRESHOLD
+        ).groupby('date').agg(
+            sentiment=('sentiment', 'mean'),
+            positive_ratio=('positive', 'mean'),
+            negative_ratio=('negative', 'mean'),
+            scored_count=('sentiment', 'size')
+        )
+        daily.columns = [f'{prefix}_{column}' for column in daily.columns]
+        return daily.reset_index()
+
+    def analyze(self, df, comments_df=None):
+        """게시물(및 댓글)의 일별 감성 시계열 생성"""
+        scored_posts = self.score_posts(df)
+        daily = self.daily_sentiment(scored_posts, 'post')
+
+        if comments_df is not None and len(comments_df) > 0:
+            scored_comments = self.score_comments(comments_df)
+            daily = daily.merge(self.daily_sentiment(scored_comments, 'comment'), on='date', how='outer')
+
+        daily['date'] = pd.to_datetime(daily['date'])
+        return daily.sort_values('date').reset_index(drop=True)
+
+
+def add_sentiment_to_daily_metrics(daily_metrics, daily_sentiment, window=7):
+    """LifecycleAnalyzer의 daily_metrics에 감성 컬럼과 7일 이동 평균 추가"""
+    merged = daily_metrics.merge(daily_sentiment, on='date', how='left')
+    for column in ['post_sentiment', 'comment_sentiment']:
+        if column in merged.columns:
+            merged[f'ma{window}_{column}'] = merged[column].rolling(window=window, min_periods=1).mean()
+    return merged
+
+
+def main():
+    """메인 실행 함수"""
+    from src.analyzers.lifecycle_analyzer import find_latest_processed_file, extract_meme_name_from_processed_filename
+
+    parser = argparse.ArgumentParser(description='밈 게시물/댓글 감성 분석')
+    parser.add_argument('--meme', type=str, help='분석할 밈 이름')
+    parser.add_argument('--file', type=str, help='분석할 특정 파일명')
+    parser.add_argument('--comments-file', type=str, help='댓글 CSV 파일명 (data/raw 기준)')
+    parser.add_argument('--workers', type=int, default=None, help='감성 점수 계산 프로세스 수')
+
+    args = parser.parse_args()
+
+    if args.file:
+        filepath = os.path.join(PROCESSED_DATA_DIR, args.file)
+        if not os.path.exists(filepath):
+            print(f"파일을 찾을 수 없습니다: {args.file}")
+            return
+    else:
+        filepath = find_latest_processed_file(args.meme)
+        if not filepath:
+            print("전처리된 데이터 파일을 찾을 수 없습니다.")
+            return
+    meme_name = extract_meme_name_from_processed_filename(os.path.basename(filepath))
+
+    print(f"분석할 파일: {os.path.basename(filepath)}")
+
+    try:
+        df = pd.read_csv(filepath)
+        df['date'] = pd.to_datetime(df['date'])
+
+        comments_df = None
+        if args.comments_file:
+            comments_df = pd.read_csv(os.path.join(RAW_DATA_DIR, args.comments_file))
+
+        analyzer = SentimentAnalyzer(workers=args.workers)
+        daily = analyzer.analyze(df, comments_df)
+
+        os.makedirs(REPORTS_DIR, exist_ok=True)
+        output_path = os.path.join(REPORTS_DIR, f'{meme_name}_daily_sentiment.csv')
+        daily.to_csv(output_path, index=False)
+        print(f"\n일별 감성 저장: {output_path}")
+
+    except Exception as e:
+        print(f"❌ 분석 중 오류 발생: {e}")
+        import traceback
+        traceback.print_exc()
+
+# 실행 코드
+if __name__ == "__main__":
+    main()
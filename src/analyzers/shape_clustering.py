@@ -0,0 +1,351 @@
+"""
+밈 수명 주기 곡선 형태 군집화
+
+밈별 일별 게시물 수를 활동 구간으로 잘라 고정 길이로 리샘플링하고 최대값으로
+정규화한 곡선을 DTW 거리로 군집화한다. MiniBatchKMeans(유클리드)로 초기 메도이드를
+잡은 뒤, LB_Keogh 하한으로 가지치기한 DTW 최근접 할당과 메도이드 갱신을 반복한다.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from config.config import MODELS_DIR, REPORTS_DIR
+from src.analyzers import kernels
+
+DEFAULT_MODEL_PATH = os.path.join(MODELS_DIR, 'lifecycle_shape_clusters.json')
+# 정규화 곡선 길이와 DTW 밴드 폭 (곡선 길이 대비)
+CURVE_LENGTH = 64
+WINDOW_RATIO = 0.1
+# 활동 구간: 누적 게시물 비율 기준 양 끝을 잘라냄
+ACTIVE_QUANTILES = (0.01, 0.99)
+
+
+def normalize_curve(counts, length=CURVE_LENGTH, smooth=7):
+    """일별 게시물 수를 형태 비교용 곡선으로 변환
+
+    누적 게시물의 1%~99% 구간만 남기고, 이동 평균으로 평활한 뒤 length개 점으로
+    리샘플링하여 최대값을 1로 맞춘다.
+
+    Args:
+        counts: 날짜 인덱스의 일별 게시물 수 Series (빠진 날짜는 0으로 채움)
+
+    Returns:
+        (length,) 배열, 활동 구간이 너무 짧으면 None
+    """
+    counts = counts.sort_index().asfreq('D', fill_value=0).to_numpy(dtype=np.float64)
+    if counts.sum() <= 0:
+        return None
+    cumulative = np.cumsum(counts) / counts.sum()
+    start = int(np.searchsorted(cumulative, ACTIVE_QUANTILES[0]))
+    end = int(np.searchsorted(cumulative, ACTIVE_QUANTILES[1])) + 1
+    active = counts[start:end]
+    if len(active) < 2:
+        return None
+
+    smoothed = pd.Series(active).rolling(window=smooth, min_periods=1, center=True).mean().to_numpy()
+    resampled = np.interp(np.linspace(0, len(smoothed) - 1, length), np.arange(len(smoothed)), smoothed)
+    return resampled / resampled.max() if resampled.max() > 0 else None
+
+
+def curves_from_daily(daily):
+    """build_daily_metrics_grouped 결과에서 밈별 정규화 곡선 {밈: 곡선}"""
+    curves = {}
+    for meme, group in daily.groupby('meme', observed=True):
+        curve = normalize_curve(group.set_index('date')['post_count'])
+        if curve is not None:
+            curves[meme] = curve
+    return curves
+
+
+def envelope(curves, window):
+    """LB_Keogh용 상/하한 포락선 (각 시점 ±window 구간의 최대/최소)"""
+    curves = np.atleast_2d(curves)
+    length = curves.shape[1]
+    upper = np.empty_like(curves)
+    lower = np.empty_like(curves)
+    for t in range(length):
+        lo, hi = max(0, t - window), min(length, t + window + 1)
+        upper[:, t] = curves[:, lo:hi].max(axis=1)
+        lower[:, t] = curves[:, lo:hi].min(axis=1)
+    return upper, lower
+
+
+def lb_keogh(curves, upper, lower):
+    """LB_Keogh 하한 행렬 (곡선 수, 포락선 수)
+
+    각 곡선이 포락선 밖으로 벗어난 만큼의 제곱합이며, 같은 밴드 폭의 DTW 거리보다 크지 않다.
+    """
+    above = np.maximum(curves[:, np.newaxis, :] - upper[np.newaxis, :, :], 0.0)
+    below = np.maximum(lower[np.newaxis, :, :] - curves[:, np.newaxis, :], 0.0)
+    return (above ** 2 + below ** 2).sum(axis=2)
+
+
+def describe_shape(curve):
+    """메도이드 곡선 형태를 사람이 읽을 수 있는 이름으로 요약"""
+    from scipy.signal import find_peaks
+
+    peaks, _ = find_peaks(np.r_[0.0, curve, 0.0], prominence=0.3)
+    peak_position = int(np.argmax(curve)) / (len(curve) - 1)
+    width = float(np.mean(curve >= 0.5))
+
+    if len(peaks) >= 2:
+        return "Multi-wave"
+    if width >= 0.5:
+        return "Sustained"
+    if width < 0.15:
+        return "Viral Spike" if peak_position < 0.5 else "Late Spike"
+    if peak_position < 0.35:
+        return "Front-loaded"
+    if peak_position > 0.65:
+        return "Slow Burn"
+    return "Bell-shaped"
+
+
+class ShapeClusterModel:
+    def __init__(self, n_clusters=6, window_ratio=WINDOW_RATIO, max_iter=20,
+                 medoid_sample=64, random_state=42):
+        """DTW 기반 곡선 형태 군집 모델
+
+        Args:
+            n_clusters: 군집 수 (곡선 수보다 많으면 곡선 수로 줄임)
+            window_ratio: DTW Sakoe-Chiba 밴드 폭 (곡선 길이 대비)
+            max_iter: 할당/메도이드 갱신 최대 반복 횟수
+            medoid_sample: 메도이드 갱신 시 비교할 후보/구성원 표본 수
+        """
+        self.n_clusters = n_clusters
+        self.window_ratio = window_ratio
+        self.max_iter = max_iter
+        self.medoid_sample = medoid_sample
+        self.random_state = random_state
+        self.medoids = None
+        self.names = None
+        self.stats = {}
+
+    @property
+    def window(self):
+        length = self.medoids.shape[1] if self.medoids is not None else CURVE_LENGTH
+        return max(1, int(round(length * self.window_ratio)))
+
+    # ------------------------------------------------------------------
+    # 할당
+    # ------------------------------------------------------------------
+
+    def _nearest(self, curves, medoids):
+        """LB_Keogh 가지치기를 적용한 DTW 최근접 메도이드 (라벨, 거리)"""
+        window = self.window
+        upper, lower = envelope(medoids, window)
+        bounds = lb_keogh(curves, upper, lower)
+
+        labels = np.zeros(len(curves), dtype=np.int64)
+        distances = np.full(len(curves), np.inf)
+        computed = 0
+        for i, curve in enumerate(curves):
+            # 하한이 작은 메도이드부터 확인하고, 하한이 현재 최선보다 크면 중단
+            for j in np.argsort(bounds[i]):
+                if bounds[i, j] >= distances[i]:
+                    break
+                distance = kernels.dtw_distance(curve, medoids[j], window, cutoff=distances[i])
+                computed += 1
+                if distance < distances[i]:
+                    labels[i], distances[i] = j, distance
+
+        self.stats['dtw_computed'] = self.stats.get('dtw_computed', 0) + computed
+        self.stats['dtw_pruned'] = self.stats.get('dtw_pruned', 0) + bounds.size - computed
+        return labels, distances
+
+    def _update_medoid(self, members, current, rng):
+        """구성원 표본과의 DTW 합이 최소인 곡선을 새 메도이드로 선택"""
+        if len(members) <= self.medoid_sample:
+            candidates = members
+            references = members
+        else:
+            # 평균 곡선에 가까운 후보와 무작위 구성원 표본만 비교
+            mean_curve = members.mean(axis=0)
+            order = np.argsort(((members - mean_curve) ** 2).sum(axis=1))
+            candidates = members[order[:self.medoid_sample]]
+            references = members[rng.choice(len(members), self.medoid_sample, replace=False)]
+        candidates = np.vstack([current, candidates])
+
+        window = self.window
+        best, best_cost = current, np.inf
+        for candidate in candidates:
+            cost = 0.0
+            for reference in references:
+                cost += kernels.dtw_distance(candidate, reference, window, cutoff=best_cost - cost)
+                if cost >= best_cost:
+                    break
+            if cost < best_cost:
+                best, best_cost = candidate, cost
+        return best
+
+    # ------------------------------------------------------------------
+    # 학습/예측
+    # ------------------------------------------------------------------
+
+    def fit(self, curves):
+        """곡선 배열 (곡선 수, 길이)로 군집 학습 후 라벨 반환"""
+        from sklearn.cluster import MiniBatchKMeans
+
+        curves = np.asarray(curves, dtype=np.float64)
+        n_clusters = min(self.n_clusters, len(curves))
+        rng = np.random.default_rng(self.random_state)
+        self.stats = {}
+        start_time = time.time()
+
+        # 1. MiniBatchKMeans 중심에 가장 가까운 실제 곡선으로 초기 메도이드 설정
+        kmeans = MiniBatchKMeans(n_clusters=n_clusters, random_state=self.random_state,
+                                 batch_size=min(1024, len(curves)), n_init=3)
+        kmeans.fit(curves)
+        nearest = [int(np.argmin(((curves - center) ** 2).sum(axis=1))) for center in kmeans.cluster_centers_]
+        self.medoids = curves[np.unique(nearest)]
+
+        # 2. DTW 할당과 메도이드 갱신 반복
+        labels = None
+        for iteration in range(self.max_iter):
+            new_labels, _ = self._nearest(curves, self.medoids)
+            if labels is not None and np.array_equal(labels, new_labels):
+                break
+            labels = new_labels
+            self.medoids = np.vstack([
+                self._update_medoid(curves[labels == k], medoid, rng) if np.any(labels == k) else medoid
+                for k, medoid in enumerate(self.medoids)
+            ])
+
+        # 마지막 갱신 후의 메도이드 기준으로 다시 할당 (반복 한도에 걸려 끝나도 predict와 일치)
+        labels, distances = self._nearest(curves, self.medoids)
+        self.names = self._name_clusters()
+        self.stats.update({
+            'iterations': iteration + 1,
+            'inertia': float(distances.sum()),
+            'fit_seconds': round(time.time() - start_time, 3)
+        })
+        return labels
+
+    def _name_clusters(self):
+        names = [describe_shape(medoid) for medoid in self.medoids]
+        # 같은 이름이 여러 군집에 붙으면 번호를 덧붙여 구분
+        for name in set(names):
+            indices = [i for i, n in enumerate(names) if n == name]
+            if len(indices) > 1:
+                for rank, i in enumerate(indices, start=1):
+                    names[i] = f"{name} {rank}"
+        return names
+
+    def predict(self, curves):
+        """곡선 배열의 (군집 번호, DTW 거리)"""
+        if self.medoids is None:
+            raise ValueError("학습되지 않은 모델입니다.")
+        return self._nearest(np.atleast_2d(np.asarray(curves, dtype=np.float64)), self.medoids)
+
+    def classify(self, daily_metrics):
+        """밈 하나의 daily_metrics로 군집 분류 결과 딕셔너리 (곡선 생성 실패 시 None)"""
+        curve = normalize_curve(daily_metrics.set_index('date')['post_count'], length=self.medoids.shape[1])
+        if curve is None:
+            return None
+        labels, distances = self.predict(curve)
+        return {'cluster': int(labels[0]), 'name': self.names[labels[0]], 'distance': float(distances[0])}
+
+    # ------------------------------------------------------------------
+    # 저장/로드
+    # ------------------------------------------------------------------
+
+    def save(self, filepath=DEFAULT_MODEL_PATH):
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump({
+                'n_clusters': self.n_clusters,
+                'window_ratio': self.window_ratio,
+                'max_iter': self.max_iter,
+                'medoid_sample': self.medoid_sample,
+                'random_state': self.random_state,
+                'medoids': self.medoids.tolist(),
+                'names': self.names,
+                'stats': self.stats
+            }, f, ensure_ascii=False)
+        print(f"군집 모델 저장: {filepath}")
+        return filepath
+
+    @classmethod
+    def load(cls, filepath=DEFAULT_MODEL_PATH):
+        with open(filepath, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        model = cls(data['n_clusters'], data['window_ratio'], data['max_iter'],
+                    data['medoid_sample'], data['random_state'])
+        model.medoids = np.asarray(data['medoids'])
+        model.names = data['names']
+        model.stats = data.get('stats', {})
+        return model
+
+
+def load_shape_model(filepath=DEFAULT_MODEL_PATH):
+    """저장된 군집 모델 로드 (없으면 None)"""
+    if not os.path.exists(filepath):
+        return None
+    return ShapeClusterModel.load(filepath)
+
+
+def cluster_daily_metrics(daily, n_clusters=6, model_path=DEFAULT_MODEL_PATH):
+    """여러 밈의 일별 지표로 형태 군집 학습, 저장 후 밈별 할당 테이블 반환"""
+    curves = curves_from_daily(daily)
+    if len(curves) < 2:
+        print("군집화할 밈 곡선이 부족합니다.")
+        return None
+
+    memes = list(curves)
+    matrix = np.vstack([curves[meme] for meme in memes])
+    model = ShapeClusterModel(n_clusters=n_clusters)
+    model.fit(matrix)
+    # 저장된 모델로 새 밈을 분류할 때와 같은 기준의 라벨/거리
+    labels, distances = model.predict(matrix)
+    model.save(model_path)
+
+    print(f"\n=== Lifecycle Shape Clusters ({len(model.medoids)}) ===")
+    print(f"DTW 계산 {model.stats['dtw_computed']:,}회, 하한으로 생략 {model.stats['dtw_pruned']:,}회, "
+          f"{model.stats['fit_seconds']}초")
+    for k, name in enumerate(model.names):
+        print(f"  {k}: {name} ({int(np.sum(labels == k))} memes)")
+
+    return pd.DataFrame({
+        'meme': memes,
+        'shape_cluster': labels,
+        'shape_cluster_name': [model.names[label] for label in labels],
+        'shape_distance': distances
+    })
+
+
+def main():
+    """메인 실행 함수"""
+    from src.analyzers.batch_analyzer import (
+        find_latest_processed_files, load_processed_corpus, build_daily_metrics_grouped
+    )
+
+    parser = argparse.ArgumentParser(description='밈 수명 주기 곡선 형태 군집화')
+    parser.add_argument('--memes', nargs='+', help='군집화할 밈 이름 목록 (미지정 시 전체)')
+    parser.add_argument('--clusters', type=int, default=6, help='군집 수')
+
+    args = parser.parse_args()
+
+    files = find_latest_processed_files(args.memes)
+    if len(files) < 2:
+        print("군집화하려면 전처리된 밈이 2개 이상 필요합니다.")
+        return
+
+    daily = build_daily_metrics_grouped(load_processed_corpus(files))
+    assignments = cluster_daily_metrics(daily, n_clusters=args.clusters)
+    if assignments is not None:
+        os.makedirs(REPORTS_DIR, exist_ok=True)
+        output_path = os.path.join(REPORTS_DIR, 'lifecycle_shape_clusters.csv')
+        assignments.to_csv(output_path, index=False)
+        print(f"\n군집 할당 저장: {output_path}")
+
+# 실행 코드
+if __name__ == "__main__":
+    main()
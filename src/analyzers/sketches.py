@@ -0,0 +1,457 @@
+import pandas as pd
+import numpy as np
+import base64
+import json
+import os
+import sys
+import glob
+import argparse
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from config.config import PROCESSED_DATA_DIR
+
+SKETCH_VERSION = 1
+
+
+def hash_values(values):
+    """값 배열을 64비트 해시로 변환 (프로세스/실행 간 동일한 결과)"""
+    series = pd.Series(values).astype(str)
+    return pd.util.hash_pandas_object(series, index=False).to_numpy(dtype=np.uint64)
+
+
+def _bit_length(values):
+    """uint64 배열의 비트 길이 (0은 0)"""
+    hi = (values >> np.uint64(32)).astype(np.float64)
+    lo = (values & np.uint64(0xFFFFFFFF)).astype(np.float64)
+    with np.errstate(divide='ignore'):
+        hi_len = np.where(hi > 0, np.floor(np.log2(np.maximum(hi, 1))) + 1 + 32, 0)
+        lo_len = np.where(lo > 0, np.floor(np.log2(np.maximum(lo, 1))) + 1, 0)
+    return np.where(hi > 0, hi_len, lo_len).astype(np.int64)
+
+
+class HyperLogLog:
+    """고유값 개수 근사 (작성자, 서브레딧 등)"""
+
+    def __init__(self, p=14):
+        self.p = p
+        self.m = 1 << p
+        self.registers = np.zeros(self.m, dtype=np.uint8)
+
+    def add(self, values):
+        """값 배열 추가"""
+        if len(values) == 0:
+            return self
+        self.add_hashes(hash_values(values))
+        return self
+
+    def add_hashes(self, hashes):
+        """64비트 해시 배열 추가"""
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        idx = (hashes >> np.uint64(64 - self.p)).astype(np.int64)
+        rest = hashes & np.uint64((1 << (64 - self.p)) - 1)
+        rho = (64 - self.p) - _bit_length(rest) + 1
+        np.maximum.at(self.registers, idx, rho.astype(np.uint8))
+        return self
+
+    def count(self):
+        """고유값 개수 추정"""
+        alpha = 0.7213 / (1 + 1.079 / self.m)
+        estimate = alpha * self.m ** 2 / np.sum(np.exp2(-self.registers.astype(np.float64)))
+        zeros = np.count_nonzero(self.registers == 0)
+        # 작은 범위 보정 (linear counting)
+        if estimate <= 2.5 * self.m and zeros > 0:
+            estimate = self.m * np.log(self.m / zeros)
+        return int(round(estimate))
+
+    def merge(self, other):
+        """다른 스케치와 병합"""
+        if other.p != self.p:
+            raise ValueError(f"HyperLogLog 정밀도 불일치: {self.p} != {other.p}")
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def to_dict(self):
+        return {
+            'p': self.p,
+            'registers': base64.b64encode(self.registers.tobytes()).decode('ascii')
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        sketch = cls(p=data['p'])
+        sketch.registers = np.frombuffer(base64.b64decode(data['registers']), dtype=np.uint8).copy()
+        return sketch
+
+
+class TDigest:
+    """분위수 근사 (score, num_comments 분포)"""
+
+    def __init__(self, compression=100):
+        self.compression = compression
+        self.means = np.zeros(0)
+        self.weights = np.zeros(0)
+        self.count = 0
+        self.total = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+
+    def add(self, values):
+        """값 배열 추가"""
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return self
+        self.count += len(values)
+        self.total += float(values.sum())
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+        self._compress(np.concatenate([self.means, values]),
+                       np.concatenate([self.weights, np.ones(len(values))]))
+        return self
+
+    def _compress(self, means, weights):
+        """k1 스케일 함수 기준으로 centroid 병합"""
+        order = np.argsort(means, kind='mergesort')
+        means = means[order]
+        weights = weights[order]
+        cum_weights = np.cumsum(weights)
+        q = (cum_weights - weights / 2) / cum_weights[-1]
+        k = self.compression / (2 * np.pi) * np.arcsin(2 * q - 1)
+        buckets = np.floor(k - k[0]).astype(np.int64)
+        starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+        merged_weights = np.add.reduceat(weights, starts)
+        self.means = np.add.reduceat(means * weights, starts) / merged_weights
+        self.weights = merged_weights
+
+    def quantile(self, q):
+        """q 분위수 추정 (q는 스칼라 또는 배열)"""
+        if self.count == 0:
+            return np.nan
+        cum_weights = np.cumsum(self.weights)
+        centers = (cum_weights - self.weights / 2) / cum_weights[-1]
+        xp = np.r_[0.0, centers, 1.0]
+        fp = np.r_[self.min, self.means, self.max]
+        return np.interp(q, xp, fp)
+
+    def mean(self):
+        return self.total / self.count if self.count else np.nan
+
+    def upper_sum(self, fraction):
+        """상위 fraction 비율 값들의 합 추정"""
+        if self.count == 0 or fraction <= 0:
+            return 0.0
+        # 원본과 동일하게 상위 개수는 내림 처리
+        top_weight = float(int(self.count * fraction))
+        remaining = top_weight
+        total = 0.0
+        for mean, weight in zip(self.means[::-1], self.weights[::-1]):
+            if remaining <= 0:
+                break
+            take = min(weight, remaining)
+            total += mean * take
+            remaining -= take
+        return total
+
+    def merge(self, other):
+        """다른 스케치와 병합"""
+        if other.count == 0:
+            return self
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._compress(np.concatenate([self.means, other.means]),
+                       np.concatenate([self.weights, other.weights]))
+        return self
+
+    def to_dict(self):
+        return {
+            'compression': self.compression,
+            'means': self.means.tolist(),
+            'weights': self.weights.tolist(),
+            'count': self.count,
+            'total': self.total,
+            'min': self.min if self.count else None,
+            'max': self.max if self.count else None
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        sketch = cls(compression=data['compression'])
+        sketch.means = np.asarray(data['means'], dtype=np.float64)
+        sketch.weights = np.asarray(data['weights'], dtype=np.float64)
+        sketch.count = data['count']
+        sketch.total = data['total']
+        if sketch.count:
+            sketch.min = data['min']
+            sketch.max = data['max']
+        return sketch
+
+
+class SpaceSaving:
+    """가중치 기반 상위 항목(heavy hitter) 추적"""
+
+    def __init__(self, capacity=100):
+        self.capacity = capacity
+        self.counts = pd.Series(dtype=np.float64)
+        self.errors = pd.Series(dtype=np.float64)
+
+    def add(self, keys, weights=None):
+        """키 배열과 가중치 추가 (배치 단위로 먼저 집계)"""
+        if len(keys) == 0:
+            return self
+        if weights is None:
+            weights = np.ones(len(keys))
+        batch = pd.Series(np.asarray(weights, dtype=np.float64), index=pd.Index(keys).astype(str))
+        batch = batch.groupby(level=0).sum()
+        other = SpaceSaving(self.capacity)
+        other.counts = batch
+        other.errors = pd.Series(0.0, index=batch.index)
+        # 배치 전체를 정확한 요약으로 보고 병합
+        other._truncate()
+        return self.merge(other)
+
+    def _min_count(self):
+        if len(self.counts) < self.capacity:
+            return 0.0
+        return float(self.counts.min())
+
+    def _truncate(self):
+        # 잘려나간 항목의 값은 남은 최소값 이하이므로 병합 시 최소값으로 대체됨
+        if len(self.counts) > self.capacity:
+            self.counts = self.counts.nlargest(self.capacity)
+            self.errors = self.errors.reindex(self.counts.index)
+
+    def merge(self, other):
+        """다른 스케치와 병합 (Agarwal et al. 병합 규칙)"""
+        self_min = self._min_count()
+        other_min = other._min_count()
+        index = self.counts.index.union(other.counts.index)
+        counts = (self.counts.reindex(index).fillna(self_min)
+                  + other.counts.reindex(index).fillna(other_min))
+        errors = (self.errors.reindex(index).fillna(self_min)
+                  + other.errors.reindex(index).fillna(other_min))
+        self.counts = counts.nlargest(self.capacity)
+        self.errors = errors.reindex(self.counts.index)
+        return self
+
+    def top(self, n=10):
+        """상위 n개 항목 (key, 추정값, 오차 한계)"""
+        top = self.counts.nlargest(n)
+        return [(key, float(value), float(self.errors[key])) for key, value in top.items()]
+
+    def to_dict(self):
+        return {
+            'capacity': self.capacity,
+            'keys': self.counts.index.tolist(),
+            'counts': self.counts.tolist(),
+            'errors': self.errors.tolist()
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        sketch = cls(capacity=data['capacity'])
+        index = pd.Index(data['keys'], dtype=object)
+        sketch.counts = pd.Series(data['counts'], index=index, dtype=np.float64)
+        sketch.errors = pd.Series(data['errors'], index=index, dtype=np.float64)
+        return sketch
+
+
+class MemeSketch:
+    """밈 하나(또는 여러 밈/기간)의 병합 가능한 요약 스케치 묶음"""
+
+    def __init__(self, hll_precision=14, compression=100, top_capacity=100):
+        self.total_posts = 0
+        self.first_post = None
+        self.last_post = None
+        self.authors = HyperLogLog(hll_precision)
+        self.subreddits = HyperLogLog(hll_precision)
+        self.score = TDigest(compression)
+        self.comments = TDigest(compression)
+        self.engagement = TDigest(compression)
+        self.top_posts = SpaceSaving(top_capacity)
+        self.top_subreddits = SpaceSaving(top_capacity)
+
+    def update(self, df):
+        """전처리된 게시물 DataFrame으로 스케치 갱신"""
+        if len(df) == 0:
+            return self
+        created = pd.to_datetime(df['created_utc'])
+        first, last = created.min(), created.max()
+        self.first_post = first if self.first_post is None else min(self.first_post, first)
+        self.last_post = last if self.last_post is None else max(self.last_post, last)
+        self.total_posts += len(df)
+
+        self.authors.add(df['author'].values)
+        self.subreddits.add(df['subreddit'].values)
+        self.score.add(df['score'].values)
+        self.comments.add(df['num_comments'].values)
+        self.engagement.add(df['engagement_score'].values)
+        self.top_posts.add(df['id'].values, df['engagement_score'].values)
+        self.top_subreddits.add(df['subreddit'].values)
+        return self
+
+    def merge(self, other):
+        """다른 MemeSketch와 병합"""
+        self.total_posts += other.total_posts
+        if other.first_post is not None:
+            self.first_post = other.first_post if self.first_post is None else min(self.first_post, other.first_post)
+            self.last_post = other.last_post if self.last_post is None else max(self.last_post, other.last_post)
+        self.authors.merge(other.authors)
+        self.subreddits.merge(other.subreddits)
+        self.score.merge(other.score)
+        self.comments.merge(other.comments)
+        self.engagement.merge(other.engagement)
+        self.top_posts.merge(other.top_posts)
+        self.top_subreddits.merge(other.top_subreddits)
+        return self
+
+    def summary(self, quantiles=(0.5, 0.9, 0.99)):
+        """요약 통계 (save_processed_data의 요약과 같은 키 + 분위수)"""
+        total_engagement = self.engagement.total
+        summary = {
+            'total_posts': self.total_posts,
+            'date_range': f"{self.first_post} ~ {self.last_post}",
+            'unique_authors': self.authors.count(),
+            'unique_subreddits': self.subreddits.count(),
+            'avg_score': self.score.mean(),
+            'avg_comments': self.comments.mean(),
+            'total_engagement': total_engagement
+        }
+        for q in quantiles:
+            summary[f'score_p{int(q * 100)}'] = float(self.score.quantile(q))
+            summary[f'comments_p{int(q * 100)}'] = float(self.comments.quantile(q))
+        if total_engagement:
+            summary['viral_concentration'] = float(self.engagement.upper_sum(0.1) / total_engagement)
+        else:
+            summary['viral_concentration'] = np.nan
+        summary['top_posts'] = [key for key, _, _ in self.top_posts.top(10)]
+        summary['top_subreddits'] = [key for key, _, _ in self.top_subreddits.top(10)]
+        return summary
+
+    def to_dict(self):
+        return {
+            'version': SKETCH_VERSION,
+            'total_posts': self.total_posts,
+            'first_post': str(self.first_post) if self.first_post is not None else None,
+            'last_post': str(self.last_post) if self.last_post is not None else None,
+            'authors': self.authors.to_dict(),
+            'subreddits': self.subreddits.to_dict(),
+            'score': self.score.to_dict(),
+            'comments': self.comments.to_dict(),
+            'engagement': self.engagement.to_dict(),
+            'top_posts': self.top_posts.to_dict(),
+            'top_subreddits': self.top_subreddits.to_dict()
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        if data.get('version') != SKETCH_VERSION:
+            raise ValueError(f"지원하지 않는 스케치 버전: {data.get('version')}")
+        sketch = cls()
+        sketch.total_posts = data['total_posts']
+        sketch.first_post = pd.Timestamp(data['first_post']) if data['first_post'] else None
+        sketch.last_post = pd.Timestamp(data['last_post']) if data['last_post'] else None
+        sketch.authors = HyperLogLog.from_dict(data['authors'])
+        sketch.subreddits = HyperLogLog.from_dict(data['subreddits'])
+        sketch.score = TDigest.from_dict(data['score'])
+        sketch.comments = TDigest.from_dict(data['comments'])
+        sketch.engagement = TDigest.from_dict(data['engagement'])
+        sketch.top_posts = SpaceSaving.from_dict(data['top_posts'])
+        sketch.top_subreddits = SpaceSaving.from_dict(data['top_subreddits'])
+        return sketch
+
+
+def build_sketches(df):
+    """전체 스케치와 월별 스케치 생성"""
+    total = MemeSketch().update(df)
+    months = pd.to_datetime(df['created_utc']).dt.strftime('%Y-%m')
+    monthly = {}
+    for month, month_df in df.groupby(months.values):
+        monthly[month] = MemeSketch().update(month_df)
+    return total, monthly
+
+
+def save_sketches(meme_name, total, monthly, filepath):
+    """스케치를 JSON 파일로 저장"""
+    data = {
+        'meme': meme_name,
+        'total': total.to_dict(),
+        'monthly': {month: sketch.to_dict() for month, sketch in monthly.items()}
+    }
+    with open(filepath, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+    print(f"스케치 저장: {filepath}")
+    return filepath
+
+
+def load_sketches(filepath):
+    """저장된 스케치 JSON 로드"""
+    with open(filepath, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    total = MemeSketch.from_dict(data['total'])
+    monthly = {month: MemeSketch.from_dict(sketch) for month, sketch in data['monthly'].items()}
+    return data['meme'], total, monthly
+
+
+def find_sketch_files(meme_name=None):
+    """밈별 가장 최근 스케치 파일 찾기"""
+    pattern = "processed_reddit_*_sketch.json"
+    if meme_name:
+        pattern = f"processed_reddit_{meme_name.replace(' ', '_').lower()}_*_sketch.json"
+
+    latest = {}
+    for filepath in glob.glob(os.path.join(PROCESSED_DATA_DIR, pattern)):
+        with open(filepath, 'r', encoding='utf-8') as f:
+            meme = json.load(f)['meme']
+        if meme not in latest or os.path.getctime(filepath) > os.path.getctime(latest[meme]):
+            latest[meme] = filepath
+    return latest
+
+
+def rollup_sketches(filepaths, months=None):
+    """저장된 스케치들을 원본 데이터 없이 병합
+
+    Args:
+        filepaths: 스케치 JSON 파일 경로 리스트
+        months: 포함할 월 목록 ('YYYY-MM'), None이면 전체 기간
+
+    Returns:
+        병합된 MemeSketch
+    """
+    rollup = MemeSketch()
+    for filepath in filepaths:
+        _, total, monthly = load_sketches(filepath)
+        if months is None:
+            rollup.merge(total)
+        else:
+            for month in months:
+                if month in monthly:
+                    rollup.merge(monthly[month])
+    return rollup
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description='저장된 스케치 기반 밈 요약 롤업')
+    parser.add_argument('--meme', type=str, help='롤업할 밈 이름 (미지정 시 전체 밈)')
+    parser.add_argument('--months', nargs='+', help='롤업할 월 목록 (예: 2025-01 2025-02)')
+
+    args = parser.parse_args()
+
+    sketch_files = find_sketch_files(args.meme)
+    if not sketch_files:
+        print("스케치 파일을 찾을 수 없습니다.")
+        return
+
+    print(f"롤업 대상 밈: {', '.join(sorted(sketch_files))}")
+    rollup = rollup_sketches(list(sketch_files.values()), args.months)
+
+    print("\n=== Sketch Rollup Summary ===")
+    for key, value in rollup.summary().items():
+        print(f"{key}: {value}")
+
+# 실행 코드
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,276 @@
+import pandas as pd
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+import os
+import sys
+import argparse
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from config.config import PROCESSED_DATA_DIR, REPORTS_DIR
+from src.database import TextCache
+from src.analyzers.lifecycle_analyzer import (
+    LifecycleAnalyzer, find_latest_processed_file, extract_meme_name_from_processed_filename
+)
+
+TOKEN_PATTERN = r"[\w']+"
+
+
+def _get_stop_words():
+    """불용어 목록 (nltk 코퍼스가 없으면 scikit-learn 목록 사용)"""
+    try:
+        from nltk.corpus import stopwords
+        return frozenset(stopwords.words('english'))
+    except LookupError:
+        from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS
+        return frozenset(ENGLISH_STOP_WORDS)
+
+
+def tokenize_batch(texts, ngram_range=(1, 2)):
+    """텍스트 배치를 n-gram 리스트로 변환 (프로세스 풀에서 호출 가능)"""
+    from nltk.tokenize import RegexpTokenizer
+    from nltk.util import everygrams
+
+    tokenizer = RegexpTokenizer(TOKEN_PATTERN)
+    stop_words = _get_stop_words()
+    min_n, max_n = ngram_range
+
+    results = []
+    for text in texts:
+        tokens = [token for token in tokenizer.tokenize(text.lower()) if len(token) > 1]
+        grams = []
+        for gram in everygrams(tokens, min_len=min_n, max_len=max_n):
+            # 불용어로만 이루어진 n-gram 제외
+            if all(token in stop_words for token in gram):
+                continue
+            grams.append(' '.join(gram))
+        results.append(grams)
+    return results
+
+
+class TermTrendAnalyzer:
+    def __init__(self, ngram_range=(1, 2), batch_size=5000, workers=None, use_cache=True):
+        """n-gram 추세 분석기 초기화
+
+        Args:
+            ngram_range: (최소 n, 최대 n)
+            batch_size: 토큰화 배치 크기
+            workers: 토큰화 프로세스 수 (None 또는 1이면 단일 프로세스)
+            use_cache: 텍스트 해시 기반 토큰 캐시 사용 여부
+        """
+        self.ngram_range = tuple(ngram_range)
+        self.batch_size = batch_size
+        self.workers = workers
+        self.cache = TextCache(f'ngrams_{ngram_range[0]}_{ngram_range[1]}') if use_cache else None
+
+    def tokenize(self, texts):
+        """텍스트 배열 토큰화 (중복 텍스트와 캐시된 텍스트는 건너뜀)"""
+        texts = pd.Series(texts).fillna('').astype(str)
+        unique_texts = pd.unique(texts.values)
+        hashes = [TextCache.hash_text(text) for text in unique_texts]
+
+        cached = self.cache.get_many(hashes) if self.cache else {}
+        missing = [(text_hash, text) for text_hash, text in zip(hashes, unique_texts) if text_hash not in cached]
+        print(f"토큰화: 고유 텍스트 {len(unique_texts):,}개 중 캐시 적중 {len(unique_texts) - len(missing):,}개")
+
+        batches = [missing[start:start + self.batch_size] for start in range(0, len(missing), self.batch_size)]
+        if self.workers and self.workers > 1 and len(batches) > 1:
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                outputs = executor.map(tokenize_batch, [[text for _, text in batch] for batch in batches],
+                                       [self.ngram_range] * len(batches))
+                batch_results = list(outputs)
+        else:
+            batch_results = [tokenize_batch([text for _, text in batch], self.ngram_range) for batch in batches]
+
+        for batch, grams_list in zip(batches, batch_results):
+            new_values = {text_hash: grams for (text_hash, _), grams in zip(batch, grams_list)}
+            if self.cache:
+                self.cache.set_many(new_values)
+            cached.update(new_values)
+
+        by_text = {text: cached[text_hash] for text_hash, text in zip(hashes, unique_texts)}
+        return [by_text[text] for text in texts.values]
+
+    def build_count_matrix(self, df, text_column='title_clean'):
+        """일 x n-gram 희소 카운트 행렬 생성
+
+        Returns:
+            (csr_matrix, 날짜 인덱스, n-gram 어휘, 일별 게시물 수)
+        """
+        from scipy import sparse
+
+        print(f"\n=== Building Day x N-gram Matrix ({text_column}) ===")
+        dates = pd.to_datetime(df['date']).dt.normalize()
+        days = pd.date_range(dates.min(), dates.max(), freq='D')
+        day_codes = ((dates - days[0]).dt.days).to_numpy()
+
+        grams_per_doc = self.tokenize(df[text_column].values)
+        lengths = np.fromiter((len(grams) for grams in grams_per_doc), dtype=np.int64, count=len(grams_per_doc))
+        flat_grams = np.fromiter(chain.from_iterable(grams_per_doc), dtype=object, count=int(lengths.sum()))
+
+        gram_codes, vocabulary = pd.factorize(flat_grams)
+        rows = np.repeat(day_codes, lengths)
+        # 같은 (일, n-gram) 항목은 csr 변환 시 합산됨
+        matrix = sparse.csr_matrix(
+            (np.ones(len(gram_codes), dtype=np.int32), (rows, gram_codes)),
+            shape=(len(days), len(vocabulary))
+        )
+        doc_counts = np.bincount(day_codes, minlength=len(days))
+
+        print(f"행렬 크기: {matrix.shape[0]:,}일 x {matrix.shape[1]:,}개 n-gram (비영 {matrix.nnz:,}개)")
+        return matrix, days, pd.Index(vocabulary), doc_counts
+
+    def detect_emerging_terms(self, matrix, days, vocabulary, doc_counts, window=7, as_of=None,
+                              min_count=5, top_n=30):
+        """빈도 증가가 가속 중인 n-gram 탐지
+
+        최근 세 구간(window일씩)의 게시물 대비 출현율 r1, r2, r3을 비교하여
+        r3 > r2 > r1 이고 증가폭이 커지는 n-gram을 찾는다.
+        """
+        end = len(days) if as_of is None else int(days.searchsorted(pd.Timestamp(as_of), side='right'))
+        start = end - 3 * window
+        if start < 0:
+            print("Not enough days for emerging term detection")
+            return pd.DataFrame()
+
+        bounds = [(start + i * window, start + (i + 1) * window) for i in range(3)]
+        counts = [np.asarray(matrix[a:b].sum(axis=0)).ravel() for a, b in bounds]
+        docs = [max(int(doc_counts[a:b].sum()), 1) for a, b in bounds]
+
+        # 출현율 (라플라스 평활)
+        rates = [(count + 0.5) / (doc + 1.0) for count, doc in zip(counts, docs)]
+        growth_recent = rates[2] / rates[1]
+        growth_previous = rates[1] / rates[0]
+        acceleration = rates[2] - 2 * rates[1] + rates[0]
+
+        # 직전 구간 기준 기대값 대비 포아송 z 점수
+        expected = (counts[1] + 0.5) * docs[2] / docs[1]
+        z_score = (counts[2] - expected) / np.sqrt(expected)
+
+        mask = ((counts[2] >= min_count) & (rates[2] > rates[1]) & (acceleration > 0)
+                & (growth_recent > growth_previous))
+        candidates = np.flatnonzero(mask)
+        if len(candidates) == 0:
+            return pd.DataFrame()
+
+        emerging = pd.DataFrame({
+            'ngram': vocabulary[candidates],
+            'recent_count': counts[2][candidates],
+            'previous_count': counts[1][candidates],
+            'earlier_count': counts[0][candidates],
+            'growth_recent': growth_recent[candidates],
+            'growth_previous': growth_previous[candidates],
+            'acceleration': acceleration[candidates],
+            'z_score': z_score[candidates]
+        })
+        emerging['as_of'] = days[end - 1]
+        return emerging.sort_values('z_score', ascending=False).head(top_n).reset_index(drop=True)
+
+    def terms_by_phase(self, matrix, days, vocabulary, phases, min_count=5, top_n=10):
+        """단계별로 전체 대비 비중이 높은 n-gram (단계를 이끈 표현 변형)"""
+        if not phases:
+            return pd.DataFrame()
+
+        totals = np.asarray(matrix.sum(axis=0)).ravel()
+        total_sum = max(totals.sum(), 1)
+
+        rows = []
+        for phase in phases:
+            a = int(days.searchsorted(pd.Timestamp(phase['start_date']), side='left'))
+            b = int(days.searchsorted(pd.Timestamp(phase['end_date']), side='right'))
+            phase_counts = np.asarray(matrix[a:b].sum(axis=0)).ravel()
+            phase_sum = max(phase_counts.sum(), 1)
+            lift = ((phase_counts + 0.5) / phase_sum) / ((totals + 0.5) / total_sum)
+            lift[phase_counts < min_count] = 0
+            for idx in np.argsort(-lift)[:top_n]:
+                if lift[idx] <= 0:
+                    break
+                rows.append({
+                    'phase': phase['phase'],
+                    'ngram': vocabulary[idx],
+                    'phase_count': int(phase_counts[idx]),
+                    'total_count': int(totals[idx]),
+                    'lift': lift[idx]
+                })
+        return pd.DataFrame(rows)
+
+    def term_series(self, matrix, days, vocabulary, ngrams):
+        """지정한 n-gram들의 일별 카운트 시계열"""
+        columns = [vocabulary.get_loc(ngram) for ngram in ngrams if ngram in vocabulary]
+        found = [ngram for ngram in ngrams if ngram in vocabulary]
+        return pd.DataFrame(matrix[:, columns].toarray(), index=days, columns=found)
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description='밈 제목 n-gram 추세 분석')
+    parser.add_argument('--meme', type=str, help='분석할 밈 이름')
+    parser.add_argument('--file', type=str, help='분석할 특정 파일명')
+    parser.add_argument('--column', type=str, default='title_clean', choices=['title_clean', 'selftext_clean'],
+                        help='분석할 텍스트 컬럼')
+    parser.add_argument('--ngram-max', type=int, default=2, help='최대 n-gram 길이')
+    parser.add_argument('--window', type=int, default=7, help='가속 판단 구간 길이 (일)')
+    parser.add_argument('--workers', type=int, default=None, help='토큰화 프로세스 수')
+    parser.add_argument('--phase-top', type=int, default=10, help='수명 주기 단계별 상위 n-gram 수')
+
+    args = parser.parse_args()
+
+    if args.file:
+        filepath = os.path.join(PROCESSED_DATA_DIR, args.file)
+        if not os.path.exists(filepath):
+            print(f"파일을 찾을 수 없습니다: {args.file}")
+            return
+    else:
+        filepath = find_latest_processed_file(args.meme)
+        if not filepath:
+            print("전처리된 데이터 파일을 찾을 수 없습니다.")
+            return
+    meme_name = extract_meme_name_from_processed_filename(os.path.basename(filepath))
+
+    print(f"분석할 파일: {os.path.basename(filepath)}")
+
+    try:
+        df = pd.read_csv(filepath)
+        df['date'] = pd.to_datetime(df['date'])
+
+        analyzer = TermTrendAnalyzer(ngram_range=(1, args.ngram_max), workers=args.workers)
+        matrix, days, vocabulary, doc_counts = analyzer.build_count_matrix(df, args.column)
+        emerging = analyzer.detect_emerging_terms(matrix, days, vocabulary, doc_counts, window=args.window)
+
+        os.makedirs(REPORTS_DIR, exist_ok=True)
+        if emerging.empty:
+            print("가속 중인 n-gram이 없습니다.")
+        else:
+            print("\n=== Emerging Terms ===")
+            print(emerging[['ngram', 'recent_count', 'previous_count', 'growth_recent', 'z_score']].to_string(index=False))
+
+            output_path = os.path.join(REPORTS_DIR, f'{meme_name}_emerging_terms.csv')
+            emerging.to_csv(output_path, index=False)
+            print(f"\n결과 저장: {output_path}")
+
+        # 수명 주기 단계별로 두드러진 n-gram (롤업 큐브가 있으면 큐브로 단계 식별)
+        from src.preprocessors.rollup_cube import load_rollup
+        _, phases = LifecycleAnalyzer().identify_lifecycle_phases(df, load_rollup(filepath))
+        phase_terms = analyzer.terms_by_phase(matrix, days, vocabulary, phases, top_n=args.phase_top)
+
+        if phase_terms.empty:
+            print("단계별로 두드러진 n-gram이 없습니다.")
+            return
+
+        print("\n=== Terms by Lifecycle Phase ===")
+        for phase, group in phase_terms.groupby('phase', sort=False):
+            print(f"{phase}: {', '.join(group['ngram'])}")
+
+        output_path = os.path.join(REPORTS_DIR, f'{meme_name}_phase_terms.csv')
+        phase_terms.to_csv(output_path, index=False)
+        print(f"\n결과 저장: {output_path}")
+
+    except Exception as e:
+        print(f"❌ 분석 중 오류 발생: {e}")
+        import traceback
+        traceback.print_exc()
+
+# 실행 코드
+if __name__ == "__main__":
+    main()
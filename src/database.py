@@ -0,0 +1,87 @@
+import os
+import sys
+import json
+import sqlite3
+from contextlib import contextmanager
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.config import CACHE_DIR
+from src.utils import generate_file_hash
+
+DEFAULT_CACHE_PATH = os.path.join(CACHE_DIR, 'text_cache.sqlite')
+
+
+class TextCache:
+    """텍스트 해시 기반 영구 캐시 (토큰화, 감성 점수 등 재계산 방지)"""
+
+    def __init__(self, namespace, db_path=DEFAULT_CACHE_PATH):
+        """
+        Args:
+            namespace: 캐시 구분 이름 (예: 'ngrams_1_2', 'sentiment_vader')
+            db_path: SQLite 파일 경로
+        """
+        self.namespace = namespace
+        self.db_path = db_path
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS text_cache ("
+                "namespace TEXT NOT NULL, text_hash TEXT NOT NULL, value TEXT NOT NULL, "
+                "PRIMARY KEY (namespace, text_hash))"
+            )
+
+    @contextmanager
+    def _connect(self):
+        """트랜잭션(커밋/롤백)이 끝나면 연결까지 닫는 SQLite 연결
+
+        sqlite3 연결의 with 문은 커밋/롤백만 하고 연결을 닫지 않으므로 직접 닫는다.
+        """
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def hash_text(text):
+        """텍스트 해시값"""
+        return generate_file_hash(text)
+
+    def get_many(self, text_hashes, chunk_size=900):
+        """해시 목록에 해당하는 캐시 값 조회 (없는 해시는 결과에서 제외)"""
+        results = {}
+        text_hashes = list(text_hashes)
+        with self._connect() as conn:
+            # SQLite 변수 개수 제한 때문에 나눠서 조회
+            for start in range(0, len(text_hashes), chunk_size):
+                chunk = text_hashes[start:start + chunk_size]
+                placeholders = ','.join('?' * len(chunk))
+                rows = conn.execute(
+                    f"SELECT text_hash, value FROM text_cache "
+                    f"WHERE namespace = ? AND text_hash IN ({placeholders})",
+                    [self.namespace] + chunk
+                )
+                for text_hash, value in rows:
+                    results[text_hash] = json.loads(value)
+        return results
+
+    def set_many(self, values):
+        """{해시: 값} 딕셔너리 저장"""
+        if not values:
+            return
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO text_cache (namespace, text_hash, value) VALUES (?, ?, ?)",
+                [(self.namespace, text_hash, json.dumps(value, ensure_ascii=False))
+                 for text_hash, value in values.items()]
+            )
+
+    def size(self):
+        """네임스페이스의 캐시 항목 수"""
+        with self._connect() as conn:
+            return conn.execute(
+                "SELECT COUNT(*) FROM text_cache WHERE namespace = ?", (self.namespace,)
+            ).fetchone()[0]
@@ -0,0 +1,301 @@
+"""
+단계 의존성 그래프(DAG) 기반 파이프라인 실행기
+
+각 단계는 입력/출력 이름을 선언하고, 실행기는 출력 이름으로 단계 사이의 의존성을 만든다.
+- 의존성이 모두 끝난 단계는 바로 워커 풀에 제출되므로 서로 독립인 단계(예: 시각화와 분석)는 동시에 실행된다.
+- I/O 단계(수집)는 스레드 풀, CPU 단계(전처리/시각화/분석)는 프로세스 풀에서 실행한다.
+- 단계가 쓰는 자원(예: 수집 플랫폼)별 동시 실행 수를 제한할 수 있다 (API 요청 제한).
+- 단계가 실패하면 그 단계에 의존하는 단계만 건너뛰고, 다른 분기는 계속 실행한다.
+  워커 프로세스가 죽으면(메모리 부족, 세그폴트 등) 프로세스 풀을 새로 만들고, 원인을 알 수 없으므로
+  중단된 단계는 전용 프로세스에서 한 번만 다시 실행한다.
+- 실행이 끝나면 단계별 타임라인과 임계 경로(전체 시간을 결정한 단계 사슬)를 출력한다.
+
+단계 함수는 프로세스 풀에서 실행될 수 있도록 모듈 최상위 함수여야 하고, 입력과 출력은 pickle 가능해야 한다.
+"""
+
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+import os
+import sys
+import time
+import traceback
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.analyzers import kernels
+
+STAGE_KINDS = ['io', 'cpu']
+
+
+class Stage:
+    def __init__(self, name, func, inputs=(), outputs=(), params=None, kind='cpu', required=True, resources=()):
+        """파이프라인 단계
+
+        Args:
+            name: 단계 이름 (파이프라인 안에서 고유)
+            func: 실행할 모듈 최상위 함수, func(**params, **입력)으로 호출
+            inputs: 입력 이름 리스트 (함수 인자 이름과 같음) 또는 {함수 인자 이름: 입력 이름},
+                이 이름을 출력하는 단계에 의존
+            outputs: 출력 이름 (하나면 반환값, 여러 개면 반환 dict의 키)
+            params: 입력 외의 고정 인자
+            kind: 'io'(스레드 풀) 또는 'cpu'(프로세스 풀)
+            required: False면 실패해도 파이프라인 실패로 보지 않음 (경고만 출력)
+            resources: 동시 실행 수를 제한할 자원 이름 (Pipeline의 resource_limits 참고)
+        """
+        if kind not in STAGE_KINDS:
+            raise ValueError(f"알 수 없는 단계 종류: {kind} ({', '.join(STAGE_KINDS)})")
+        self.name = name
+        self.func = func
+        self.inputs = dict(inputs) if isinstance(inputs, dict) else {name: name for name in inputs}
+        self.outputs = tuple(outputs)
+        self.params = dict(params or {})
+        self.kind = kind
+        self.required = required
+        self.resources = tuple(resources)
+
+
+def _run_stage(func, kwargs):
+    """워커에서 단계 함수 실행 (시작/종료 시각은 프로세스 사이에서도 비교되도록 벽시계 기준)"""
+    start = time.time()
+    try:
+        return func(**kwargs), None, start, time.time()
+    except Exception as e:
+        return None, f"{type(e).__name__}: {e}\n{traceback.format_exc()}", start, time.time()
+
+
+def _stage_kwargs(stage, artifacts):
+    """단계 함수 인자 (고정 인자 + 입력)"""
+    return dict(stage.params, **{param: artifacts[name] for param, name in stage.inputs.items()})
+
+
+def _is_empty(result):
+    """기존 단계 함수의 실패 반환값 (None, False, 빈 리스트/문자열)"""
+    if result is None or result is False:
+        return True
+    return isinstance(result, (list, tuple, dict, str)) and len(result) == 0
+
+
+class Pipeline:
+    def __init__(self, stages, workers=None, io_workers=4, resource_limits=None):
+        """DAG 파이프라인
+
+        Args:
+            stages: Stage 리스트
+            workers: CPU 단계 프로세스 수 (기본 CPU 코어 수)
+            io_workers: I/O 단계 스레드 수
+            resource_limits: {자원 이름: 동시 실행 수} (없는 자원은 제한 없음)
+        """
+        self.stages = {}
+        for stage in stages:
+            if stage.name in self.stages:
+                raise ValueError(f"단계 이름이 중복되었습니다: {stage.name}")
+            self.stages[stage.name] = stage
+        self.workers = workers or os.cpu_count() or 1
+        self.io_workers = io_workers
+        self.resource_limits = dict(resource_limits or {})
+
+        self.producers = {}
+        for stage in stages:
+            for output in stage.outputs:
+                if output in self.producers:
+                    raise ValueError(f"출력 '{output}'을 만드는 단계가 둘 이상입니다: "
+                                     f"{self.producers[output]}, {stage.name}")
+                self.producers[output] = stage.name
+        self.dependencies = {
+            stage.name: {self.producers[name] for name in stage.inputs.values() if name in self.producers}
+            for stage in stages
+        }
+        self._check_cycles()
+
+    def _check_cycles(self):
+        """의존성 순환 검사 (위상 정렬)"""
+        remaining = {name: set(deps) for name, deps in self.dependencies.items()}
+        while remaining:
+            ready = [name for name, deps in remaining.items() if not deps]
+            if not ready:
+                raise ValueError(f"단계 의존성에 순환이 있습니다: {', '.join(sorted(remaining))}")
+            for name in ready:
+                del remaining[name]
+            for deps in remaining.values():
+                deps.difference_update(ready)
+
+    def run(self, artifacts=None):
+        """파이프라인 실행
+
+        Args:
+            artifacts: 미리 주어진 입력 {이름: 값} (어떤 단계도 만들지 않는 입력)
+
+        Returns:
+            {'artifacts', 'records': {단계: {'status', 'start', 'end', 'error'}}, 'start', 'end'}
+            status는 'done', 'failed', 'skipped' 중 하나
+        """
+        artifacts = dict(artifacts or {})
+        for stage in self.stages.values():
+            missing = [name for name in stage.inputs.values() if name not in self.producers and name not in artifacts]
+            if missing:
+                raise ValueError(f"'{stage.name}' 단계의 입력을 만드는 단계가 없습니다: {', '.join(missing)}")
+
+        records = {name: {'status': 'pending', 'start': None, 'end': None, 'error': None} for name in self.stages}
+        running = {}
+        # 제출된 작업별 (실행한 풀, 제출 시각): 워커가 죽은 단계는 워커가 보고한 시작 시각이 없음
+        submitted = {}
+        # 워커 비정상 종료 후 단독으로 다시 실행 중인 단계의 전용 풀
+        isolated = {}
+        pipeline_start = time.time()
+        pools = {'io': ThreadPoolExecutor(max_workers=self.io_workers), 'cpu': self._cpu_pool()}
+        try:
+            while True:
+                self._schedule(records, artifacts, running, pools)
+                for future, name in running.items():
+                    submitted.setdefault(future, (pools[self.stages[name].kind], time.time()))
+                if not running:
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    pool, submit_time = submitted.pop(future)
+                    try:
+                        outcome = future.result()
+                    except BrokenProcessPool:
+                        # 같은 풀에서 실행 중이던 단계도 모두 중단되므로 풀은 한 번만 새로 만든다
+                        if pool is pools['cpu']:
+                            pool.shutdown(wait=False)
+                            pools['cpu'] = self._cpu_pool()
+                        if name not in isolated:
+                            print(f"⚠️  [{name}] 워커 프로세스가 비정상 종료되어 단독으로 다시 실행합니다")
+                            isolated[name] = ProcessPoolExecutor(max_workers=1, mp_context=kernels.pool_context())
+                            retry = isolated[name].submit(_run_stage, self.stages[name].func,
+                                                          _stage_kwargs(self.stages[name], artifacts))
+                            running[retry] = name
+                            submitted[retry] = (isolated[name], time.time())
+                            continue
+                        outcome = (None, 'BrokenProcessPool: 워커 프로세스가 비정상 종료되었습니다',
+                                   submit_time, time.time())
+                    except Exception as e:
+                        # 인자/결과 pickle 실패 등 단계 함수 밖에서 난 오류
+                        outcome = (None, f"{type(e).__name__}: {e}", submit_time, time.time())
+                    self._finish(name, outcome, records, artifacts)
+        finally:
+            pools['io'].shutdown()
+            pools['cpu'].shutdown()
+            for pool in isolated.values():
+                pool.shutdown()
+
+        return {'artifacts': artifacts, 'records': records, 'start': pipeline_start, 'end': time.time()}
+
+    def _cpu_pool(self):
+        return ProcessPoolExecutor(max_workers=self.workers, mp_context=kernels.pool_context())
+
+    def _schedule(self, records, artifacts, running, pools):
+        """의존성이 끝난 단계 제출, 실패한 단계의 후속 단계는 건너뜀 (더 바뀌지 않을 때까지 반복)
+
+        자원 제한에 걸린 단계는 대기 상태로 두었다가 같은 자원을 쓰는 단계가 끝나면 제출한다.
+        """
+        in_use = {}
+        for name in running.values():
+            for resource in self.stages[name].resources:
+                in_use[resource] = in_use.get(resource, 0) + 1
+        changed = True
+        while changed:
+            changed = False
+            for name, stage in self.stages.items():
+                if records[name]['status'] != 'pending':
+                    continue
+                statuses = [records[dep]['status'] for dep in self.dependencies[name]]
+                blocked = [dep for dep in self.dependencies[name] if records[dep]['status'] in ('failed', 'skipped')]
+                if blocked:
+                    records[name].update(status='skipped', error=f"선행 단계 실패: {', '.join(sorted(blocked))}")
+                    print(f"⏭️  [{name}] 건너뜀 ({records[name]['error']})")
+                    changed = True
+                elif all(status == 'done' for status in statuses):
+                    if any(in_use.get(resource, 0) >= self.resource_limits.get(resource, float('inf'))
+                           for resource in stage.resources):
+                        continue
+                    for resource in stage.resources:
+                        in_use[resource] = in_use.get(resource, 0) + 1
+                    kwargs = _stage_kwargs(stage, artifacts)
+                    try:
+                        future = pools[stage.kind].submit(_run_stage, stage.func, kwargs)
+                    except BrokenProcessPool:
+                        # 결과를 처리하기 전에 다른 단계가 워커를 죽임 (그 단계들은 run에서 처리)
+                        pools['cpu'].shutdown(wait=False)
+                        pools['cpu'] = self._cpu_pool()
+                        future = pools['cpu'].submit(_run_stage, stage.func, kwargs)
+                    running[future] = name
+                    records[name]['status'] = 'running'
+                    changed = True
+
+    def _finish(self, name, outcome, records, artifacts):
+        """완료된 단계의 결과 기록과 출력 저장"""
+        stage = self.stages[name]
+        result, error, start, end = outcome
+        if error is None and stage.outputs and _is_empty(result):
+            error = '출력 없이 종료'
+        if error is None and len(stage.outputs) > 1:
+            missing = [key for key in stage.outputs if key not in result]
+            if missing:
+                error = f"출력 누락: {', '.join(missing)}"
+
+        records[name].update(start=start, end=end, error=error, status='failed' if error else 'done')
+        if error:
+            print(f"✗ [{name}] 실패 ({end - start:.2f}초): {error.splitlines()[0]}")
+            return
+        if len(stage.outputs) == 1:
+            artifacts[stage.outputs[0]] = result
+        else:
+            artifacts.update({key: result[key] for key in stage.outputs})
+        print(f"✓ [{name}] 완료 ({end - start:.2f}초)")
+
+    def failed_required(self, run):
+        """실패했거나 선행 실패로 건너뛴 필수 단계 이름"""
+        return [name for name, record in run['records'].items()
+                if record['status'] in ('failed', 'skipped') and self.stages[name].required]
+
+    def critical_path(self, run):
+        """실제 실행 기준 임계 경로
+
+        가장 늦게 끝난 단계에서 시작해, 그 단계가 시작되기 전에 가장 늦게 끝난 단계(선행 단계이거나
+        워커/자원 대기를 풀어 준 단계)를 따라 거슬러 올라간 사슬. 경로 밖 단계를 줄여도 전체 시간은 줄지 않는다.
+        """
+        finished = {name: record for name, record in run['records'].items() if record['end'] is not None}
+        if not finished:
+            return []
+        path = [max(finished, key=lambda name: finished[name]['end'])]
+        while True:
+            start = finished[path[-1]]['start']
+            # 선행 단계는 항상 후보, 그 밖의 단계는 이 단계 시작 전에 끝났을 때만 후보
+            candidates = [name for name, record in finished.items()
+                          if name not in path and (name in self.dependencies[path[-1]] or record['end'] <= start)]
+            if not candidates:
+                break
+            path.append(max(candidates, key=lambda name: finished[name]['end']))
+        return path[::-1]
+
+    def print_timeline(self, run, width=40):
+        """단계별 시작/종료 시각 막대와 임계 경로 출력"""
+        origin = run['start']
+        total = max(run['end'] - origin, 1e-9)
+        path = self.critical_path(run)
+        label_width = max(len(name) for name in self.stages) + 2
+
+        print(f"\n=== 단계 타임라인 (전체 {total:.2f}초, CPU 프로세스 {self.workers}개) ===")
+        print(f"{'stage':<{label_width}} {'start':>7} {'end':>7} {'sec':>7}  {'status':<8}")
+        ordered = sorted(self.stages, key=lambda name: (run['records'][name]['start'] is None,
+                                                        run['records'][name]['start'] or 0))
+        for name in ordered:
+            record = run['records'][name]
+            marker = '*' if name in path else ' '
+            if record['start'] is None:
+                print(f"{marker}{name:<{label_width - 1}} {'-':>7} {'-':>7} {'-':>7}  {record['status']:<8}")
+                continue
+            start, end = record['start'] - origin, record['end'] - origin
+            left = int(round(start / total * width))
+            length = max(1, int(round((end - start) / total * width)))
+            bar = ' ' * left + '█' * length
+            print(f"{marker}{name:<{label_width - 1}} {start:>7.2f} {end:>7.2f} {end - start:>7.2f}  "
+                  f"{record['status']:<8} |{bar:<{width}}|")
+
+        if path:
+            records = run['records']
+            path_seconds = sum(records[name]['end'] - records[name]['start'] for name in path)
+            print(f"임계 경로(*): {' → '.join(path)} ({path_seconds:.2f}초, 전체의 {path_seconds / total:.0%})")
@@ -10,6 +10,8 @@ import argparse
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from config.config import RAW_DATA_DIR, PROCESSED_DATA_DIR
+from src.analyzers.sketches import build_sketches, save_sketches
+from src.preprocessors.rollup_cube import RollupCube, rollup_path
 
 class DataPreprocessor:
     def __init__(self):
@@ -122,6 +124,15 @@ class DataPreprocessor:
             for key, value in summary.items():
                 f.write(f"{key}: {value}\n")
         
+        # 병합 가능한 스케치 저장 (밈/기간 간 롤업용)
+        total_sketch, monthly_sketches = build_sketches(df)
+        meme_name = extract_meme_name_from_filename(output_filename.replace('processed_', ''))
+        sketch_path = output_path.replace('.csv', '_sketch.json')
+        save_sketches(meme_name, total_sketch, monthly_sketches, sketch_path)
+        
+        # 시간/일/주/월 롤업 큐브 저장 (분석기와 시각화가 원본 대신 사용)
+        RollupCube.from_posts(meme_name, df).save(rollup_path(output_path))
+        
         return df
 
 def find_latest_reddit_file(meme_name=None):
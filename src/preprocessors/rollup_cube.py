@@ -0,0 +1,268 @@
+"""
+밈별 다중 시간 단위 롤업 큐브
+
+전처리 시점에 게시물을 시간(hour)/일(day)/주(week)/월(month) 단위로 한 번 집계해
+게시물 수와 score/댓글 수/engagement 합계를 저장한다. 평균은 합계/게시물 수로 계산하며,
+시간대(hour_of_day)와 요일(day_of_week) 분포는 시간 단위 표에서 다시 묶어 만든다.
+분석기와 시각화는 원본 게시물을 다시 groupby하지 않고 이 큐브를 읽는다.
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from config.config import PROCESSED_DATA_DIR
+
+GRANULARITIES = ['hour', 'day', 'week', 'month']
+# 원본 컬럼 -> 큐브 합계 컬럼
+MEASURES = {'score': 'total_score', 'num_comments': 'total_comments', 'engagement_score': 'total_engagement'}
+SUM_COLUMNS = ['post_count'] + list(MEASURES.values())
+
+
+def period_start(timestamps, granularity):
+    """시각을 단위 구간의 시작 시각으로 내림 (주는 월요일 시작)"""
+    timestamps = pd.to_datetime(timestamps)
+    if granularity == 'hour':
+        return timestamps.dt.floor('h')
+    if granularity == 'day':
+        return timestamps.dt.floor('D')
+    if granularity == 'week':
+        return timestamps.dt.to_period('W').dt.start_time
+    if granularity == 'month':
+        return timestamps.dt.to_period('M').dt.start_time
+    raise ValueError(f"지원하지 않는 단위: {granularity}")
+
+
+def _aggregate(df):
+    """게시물을 단위별 합계 표로 집계 (원본은 시간 단위로 한 번만 훑고, 나머지는 시간 표를 다시 묶음)"""
+    hourly = df.groupby(period_start(df['created_utc'], 'hour')).agg(
+        post_count=('score', 'size'), **{column: (source, 'sum') for source, column in MEASURES.items()})
+    hourly.index.name = 'period'
+
+    tables = {'hour': hourly}
+    hours = hourly.index.to_series()
+    for granularity in GRANULARITIES[1:]:
+        periods = period_start(hours, granularity)
+        table = hourly.groupby(periods.values).sum()
+        table.index.name = 'period'
+        tables[granularity] = table
+    return tables
+
+
+def _with_means(table):
+    """합계 표에 평균 컬럼을 붙인 DataFrame (period 컬럼 포함)"""
+    table = table.reset_index()
+    table['avg_score'] = table['total_score'] / table['post_count']
+    table['avg_comments'] = table['total_comments'] / table['post_count']
+    table['avg_engagement'] = table['total_engagement'] / table['post_count']
+    return table
+
+
+class RollupCube:
+    def __init__(self, meme_name, tables=None, last_post=None, post_ids=None):
+        """롤업 큐브
+
+        Args:
+            meme_name: 밈 이름
+            tables: {단위: period 인덱스의 합계 DataFrame}
+            last_post: 큐브에 반영된 가장 늦은 게시 시각
+            post_ids: 큐브에 반영된 게시물 id (None이고 tables가 있으면 id 없이 저장된 이전 형식)
+        """
+        self.meme_name = meme_name
+        self.tables = tables or {}
+        self.last_post = pd.Timestamp(last_post) if last_post is not None else None
+        if post_ids is not None:
+            self.post_ids = set(post_ids)
+        else:
+            self.post_ids = None if self.tables else set()
+
+    @classmethod
+    def from_posts(cls, meme_name, df):
+        """게시물 DataFrame으로 큐브 생성"""
+        return cls(meme_name).update(df)
+
+    @property
+    def total_posts(self):
+        return int(self.tables['day']['post_count'].sum()) if self.tables else 0
+
+    def update(self, df):
+        """새 게시물 반영 (이미 반영된 id의 게시물은 무시)
+
+        새 게시물만 집계한 뒤 기존 표와 구간별로 더하므로 비용은 새 게시물 수에 비례한다.
+        늦게 수집된 과거 게시물도 해당 구간에 합산된다. id 목록이 없는 이전 형식의 큐브는
+        반영된 가장 늦은 시각 이하의 게시물을 무시한다.
+        """
+        timestamps = pd.to_datetime(df['created_utc'])
+        if self.post_ids is None:
+            fresh = timestamps > self.last_post
+        else:
+            ids = df['id'].astype(str)
+            fresh = ~ids.isin(self.post_ids) & ~ids.duplicated()
+        df = df[fresh]
+        timestamps = timestamps[fresh]
+        if len(df) == 0:
+            return self
+
+        new_tables = _aggregate(df.assign(created_utc=timestamps))
+        for granularity, table in new_tables.items():
+            if granularity in self.tables:
+                # 겹치는 구간(보통 마지막 구간)만 합산되고 나머지는 이어 붙음
+                table = pd.concat([self.tables[granularity], table]).groupby(level=0).sum()
+            self.tables[granularity] = table
+        if self.post_ids is not None:
+            self.post_ids.update(df['id'].astype(str))
+        self.last_post = timestamps.max() if self.last_post is None else max(self.last_post, timestamps.max())
+        return self
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def table(self, granularity, start=None, end=None):
+        """단위별 게시물 수/합계/평균 표 (period 컬럼 포함, 게시물이 있는 구간만)"""
+        table = self.tables[granularity]
+        if start is not None:
+            table = table[table.index >= pd.Timestamp(start)]
+        if end is not None:
+            table = table[table.index <= pd.Timestamp(end)]
+        return _with_means(table)
+
+    def series(self, granularity, column='post_count'):
+        """단위별 지표 하나의 Series (period 인덱스)"""
+        return self.table(granularity).set_index('period')[column]
+
+    def by_hour_of_day(self):
+        """시간대(0~23)별 합계/평균 표"""
+        hourly = self.tables['hour']
+        return _with_means(hourly.groupby(hourly.index.hour).sum().rename_axis('hour'))
+
+    def by_day_of_week(self):
+        """요일(0=월요일)별 합계/평균 표"""
+        hourly = self.tables['hour']
+        return _with_means(hourly.groupby(hourly.index.dayofweek).sum().rename_axis('day_of_week'))
+
+    def daily_frame(self):
+        """build_daily_metrics의 집계 단계와 같은 컬럼의 일별 표 (파생 컬럼 제외)"""
+        table = self.table('day').rename(columns={'period': 'date'})
+        return table[['date', 'post_count', 'avg_score', 'total_score',
+                      'avg_comments', 'total_comments', 'total_engagement']]
+
+    # ------------------------------------------------------------------
+    # 저장/로드
+    # ------------------------------------------------------------------
+
+    def save(self, filepath):
+        arrays = {}
+        for granularity, table in self.tables.items():
+            arrays[f'{granularity}_period'] = table.index.to_numpy()
+            for column in SUM_COLUMNS:
+                arrays[f'{granularity}_{column}'] = table[column].to_numpy()
+        if self.post_ids is not None:
+            arrays['post_ids'] = np.array(sorted(self.post_ids), dtype=str)
+        metadata = {
+            'meme': self.meme_name,
+            'last_post': self.last_post.isoformat() if self.last_post is not None else None,
+            'granularities': list(self.tables)
+        }
+        np.savez_compressed(filepath, metadata=json.dumps(metadata, ensure_ascii=False), **arrays)
+        print(f"롤업 큐브 저장: {filepath}")
+        return filepath
+
+    @classmethod
+    def load(cls, filepath, granularities=None):
+        """저장된 큐브 로드
+
+        Args:
+            granularities: 불러올 단위 목록 (None이면 전체, 일부만 불러온 큐브는 조회 전용이라 id 목록도 읽지 않음)
+        """
+        with np.load(filepath) as data:
+            metadata = json.loads(str(data['metadata']))
+            tables = {}
+            for granularity in granularities or metadata['granularities']:
+                index = pd.DatetimeIndex(data[f'{granularity}_period'], name='period')
+                tables[granularity] = pd.DataFrame(
+                    {column: data[f'{granularity}_{column}'] for column in SUM_COLUMNS}, index=index)
+            post_ids = None
+            if granularities is None and 'post_ids' in data.files:
+                post_ids = data['post_ids'].tolist()
+        return cls(metadata['meme'], tables, metadata['last_post'], post_ids)
+
+
+def rollup_path(processed_path):
+    """전처리 CSV 경로에 대응하는 큐브 파일 경로"""
+    return processed_path.replace('.csv', '_rollup.npz')
+
+
+def find_rollup_files(processed_dir=PROCESSED_DATA_DIR, meme_names=None):
+    """밈별 가장 최근 큐브 파일 {밈 이름: 경로} (파일은 열지 않고 이름만 사용)"""
+    from src.preprocessors.data_preprocessor import extract_meme_name_from_filename
+
+    latest = {}
+    for filepath in glob.glob(os.path.join(processed_dir, 'processed_reddit_*_rollup.npz')):
+        filename = os.path.basename(filepath).replace('processed_', '').replace('_rollup.npz', '.csv')
+        meme = extract_meme_name_from_filename(filename)
+        if meme not in latest or os.path.getctime(filepath) > os.path.getctime(latest[meme]):
+            latest[meme] = filepath
+
+    if meme_names:
+        wanted = {name.replace(' ', '_').lower() for name in meme_names}
+        latest = {meme: path for meme, path in latest.items() if meme in wanted}
+    return latest
+
+
+def load_rollup(processed_path, df=None, meme_name=None):
+    """전처리 파일의 큐브 로드 (없고 df가 주어지면 새로 만들어 저장)
+
+    조회용이므로 저장된 큐브는 게시물 id 목록 없이 불러온다 (갱신하려면 RollupCube.load 사용).
+    """
+    filepath = rollup_path(processed_path)
+    if os.path.exists(filepath):
+        return RollupCube.load(filepath, GRANULARITIES)
+    if df is None:
+        return None
+    cube = RollupCube.from_posts(meme_name, df)
+    cube.save(filepath)
+    return cube
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description='밈 롤업 큐브 생성/갱신/조회')
+    parser.add_argument('--meme', type=str, required=True, help='밈 이름')
+    parser.add_argument('--append', type=str, help='큐브에 추가할 새 게시물 CSV (data/processed 기준)')
+    parser.add_argument('--granularity', choices=GRANULARITIES, default='month', help='출력할 단위')
+
+    args = parser.parse_args()
+
+    pattern = f"processed_reddit_{args.meme.replace(' ', '_').lower()}_*.csv"
+    files = glob.glob(os.path.join(PROCESSED_DATA_DIR, pattern))
+    if not files:
+        print(f"'{args.meme}' 밈의 전처리된 데이터 파일을 찾을 수 없습니다.")
+        return
+
+    processed_path = max(files, key=os.path.getctime)
+    filepath = rollup_path(processed_path)
+    if os.path.exists(filepath):
+        cube = RollupCube.load(filepath)
+    else:
+        cube = RollupCube.from_posts(args.meme, pd.read_csv(processed_path))
+
+    if args.append:
+        before = cube.total_posts
+        cube.update(pd.read_csv(os.path.join(PROCESSED_DATA_DIR, args.append)))
+        print(f"새 게시물 {cube.total_posts - before:,}개 반영")
+    cube.save(filepath)
+
+    print(f"\n=== {args.meme} Rollup ({args.granularity}) ===")
+    print(cube.table(args.granularity).to_string(index=False))
+
+# 실행 코드
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,319 @@
+"""
+여러 밈 비교 시각화
+
+롤업 큐브의 일별 게시물 수를 (meme, date, post_count) long-format 표 하나로 모은 뒤,
+한 번의 벡터 연산으로 (밈 x 일수) 배열을 만들어 비교 그림 세 가지를 그린다.
+- small_multiples: 밈별 정규화 곡선을 격자로 정렬 (축 하나 + LineCollection 하나)
+- normalized_overlay: 첫 게시물 기준 일수 / 피크 대비 비율로 맞춘 곡선 겹쳐 그리기
+- activity_heatmap: 달력 날짜 기준 밈별 일별 활동 히트맵
+
+밈 수와 관계없이 비교 하나당 그림 하나, 축 하나로 그리므로 밈별 그림/축 생성 비용이 없다.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+import matplotlib.dates as mdates
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from config.config import FIGURES_DIR, PROCESSED_DATA_DIR, RENDER_PROFILES, DEFAULT_RENDER_PROFILE
+from src.analyzers import kernels
+from src.preprocessors.rollup_cube import RollupCube, find_rollup_files
+from src.visualizers.figure_cache import FigureCache, fingerprint
+from src.visualizers.meme_visualizer import PALETTE, STYLE, apply_style, profile_settings, save_figure
+
+COMPARISON_DPI = 150
+# 작은 격자 한 칸 크기 (인치)
+CELL_SIZE = (1.8, 1.1)
+MAX_COLUMNS = 10
+# 히트맵 y축에 밈 이름을 모두 쓰는 최대 밈 수
+MAX_HEATMAP_LABELS = 80
+
+COMPARISON_TYPES = {
+    'small_multiples': "비교 격자 저장",
+    'normalized_overlay': "정규화 곡선 비교 저장",
+    'activity_heatmap': "일별 활동 히트맵 저장"
+}
+
+
+def load_daily_long(rollup_files):
+    """큐브들의 일별 게시물 수를 long-format DataFrame (meme, date, post_count)으로 로드"""
+    frames = []
+    for meme, filepath in rollup_files.items():
+        table = RollupCube.load(filepath, ['day']).tables['day']
+        frames.append(pd.DataFrame({'meme': meme, 'date': table.index, 'post_count': table['post_count'].to_numpy()}))
+    long = pd.concat(frames, ignore_index=True)
+    long['meme'] = long['meme'].astype('category')
+    return long
+
+
+def build_comparison(long, max_days=365, smooth=7):
+    """long-format 일별 표를 비교용 배열로 변환 (밈별 반복 없이 한 번에 계산)
+
+    Args:
+        long: (meme, date, post_count) DataFrame (meme은 category)
+        max_days: 정규화 곡선에 쓸 첫 게시물 이후 최대 일수
+        smooth: 이동 평균 창 크기
+
+    Returns:
+        {'memes', 'titles', 'normalized', 'peaks', 'totals', 'calendar', 'start_date'}
+        normalized/calendar는 첫 게시물 순으로 정렬된 (밈 수, 일수) 배열
+    """
+    codes = long['meme'].cat.codes.to_numpy()
+    memes = np.asarray(long['meme'].cat.categories)
+    dates = pd.to_datetime(long['date']).dt.floor('D')
+    counts = long['post_count'].to_numpy(dtype=np.float64)
+    n_memes = len(memes)
+
+    # 밈별 첫/마지막 게시일과 총 게시물 수
+    day_number = ((dates - dates.min()).dt.days).to_numpy()
+    first_day = np.full(n_memes, np.iinfo(np.int64).max)
+    last_day = np.zeros(n_memes, dtype=np.int64)
+    np.minimum.at(first_day, codes, day_number)
+    np.maximum.at(last_day, codes, day_number)
+    totals = np.bincount(codes, weights=counts, minlength=n_memes)
+
+    # 첫 게시물 기준 일수 배열 (게시물 없는 날은 0, 마지막 게시일 이후는 NaN)
+    age = day_number - first_day[codes]
+    length = int(min(age.max() + 1, max_days))
+    by_age = np.zeros((n_memes, length))
+    within = age < length
+    by_age[codes[within], age[within]] = counts[within]
+    by_age[np.arange(length) > (last_day - first_day)[:, np.newaxis]] = np.nan
+    smoothed = kernels.rolling_mean(by_age, window=smooth, min_periods=1)
+    smoothed[np.isnan(by_age)] = np.nan
+    peaks = np.nanmax(smoothed, axis=1)
+    normalized = smoothed / np.where(peaks > 0, peaks, 1.0)[:, np.newaxis]
+
+    # 달력 날짜 기준 배열 (각 밈의 최대 일별 게시물 수 대비 비율)
+    calendar = np.zeros((n_memes, int(day_number.max()) + 1))
+    calendar[codes, day_number] = counts
+    calendar /= np.maximum(calendar.max(axis=1), 1.0)[:, np.newaxis]
+
+    order = np.lexsort((memes, first_day))
+    return {
+        'memes': memes[order].tolist(),
+        'titles': [meme.replace('_', ' ').title() for meme in memes[order]],
+        'normalized': normalized[order],
+        'peaks': peaks[order],
+        'totals': totals[order],
+        'calendar': calendar[order],
+        'start_date': dates.min()
+    }
+
+
+# ----------------------------------------------------------------------
+# 그리기 함수
+# ----------------------------------------------------------------------
+
+def _grid_shape(n_memes, columns=None):
+    columns = columns or min(MAX_COLUMNS, max(1, int(np.ceil(np.sqrt(n_memes * 1.5)))))
+    return int(np.ceil(n_memes / columns)), columns
+
+
+def draw_small_multiples(fig, data):
+    """밈별 정규화 곡선 격자 (칸마다 같은 x/y 범위)"""
+    ax = fig.add_subplot(111)
+    curves = data['normalized']
+    rows, columns = data['grid']
+    x = np.linspace(0.05, 0.95, curves.shape[1])
+
+    segments, baselines = [], []
+    for i, curve in enumerate(curves):
+        row, column = divmod(i, columns)
+        bottom = rows - 1 - row + 0.12
+        valid = ~np.isnan(curve)
+        segments.append(np.column_stack([column + x[valid], bottom + curve[valid] * 0.62]))
+        baselines.append([(column + 0.05, bottom), (column + 0.95, bottom)])
+        ax.text(column + 0.5, bottom + 0.7, data['titles'][i], ha='center', va='bottom', fontsize=7,
+                fontweight='bold', clip_on=True)
+        ax.text(column + 0.95, bottom + 0.62, f"{data['peaks'][i]:,.0f}/day", ha='right', va='top',
+                fontsize=5, color='gray')
+
+    ax.add_collection(LineCollection(baselines, colors='lightgray', linewidths=0.5))
+    ax.add_collection(LineCollection(segments, colors='steelblue', linewidths=0.8))
+    ax.set_xlim(0, columns)
+    ax.set_ylim(0, rows)
+    ax.set_axis_off()
+    ax.set_title(f"Meme Lifecycles (first {data['max_days']} days, 7-day MA, share of peak) - "
+                 f"{len(curves)} memes", fontsize=12, fontweight='bold')
+
+
+def draw_normalized_overlay(fig, data):
+    """첫 게시물 기준 일수 / 피크 대비 비율로 정렬한 곡선과 중앙값/사분위 범위"""
+    ax = fig.add_subplot(111)
+    curves = data['normalized']
+    days = np.arange(curves.shape[1])
+
+    segments = [np.column_stack([days[~np.isnan(curve)], curve[~np.isnan(curve)]]) for curve in curves]
+    alpha = float(np.clip(8 / max(len(curves), 1), 0.05, 0.6))
+    ax.add_collection(LineCollection(segments, colors='steelblue', linewidths=0.8, alpha=alpha))
+
+    # 관측된 밈이 충분한 일수만 백분위 계산 (모두 NaN인 열은 계산하지 않음)
+    observed = (~np.isnan(curves)).sum(axis=0) >= max(3, len(curves) // 10)
+    quantiles = np.full((3, curves.shape[1]), np.nan)
+    if observed.any():
+        quantiles[:, observed] = np.nanpercentile(curves[:, observed], [25, 50, 75], axis=0)
+    low, median, high = quantiles
+    ax.fill_between(days, low, high, color='orange', alpha=0.3, label='Interquartile Range')
+    ax.plot(days, median, color='red', linewidth=2.5, label='Median')
+
+    ax.set_xlim(0, curves.shape[1] - 1)
+    ax.set_ylim(0, 1.05)
+    ax.set_title(f"Normalized Lifecycle Curves ({len(curves)} memes)", fontsize=14, fontweight='bold')
+    ax.set_xlabel('Days Since First Post')
+    ax.set_ylabel('Share of Peak (7-day MA)')
+    ax.legend(loc='upper right')
+    ax.grid(True, alpha=0.3)
+
+
+def draw_activity_heatmap(fig, data):
+    """달력 날짜 x 밈 일별 활동 (밈별 최대 일 대비 비율, 첫 게시물 순 정렬)"""
+    ax = fig.add_subplot(111)
+    calendar = data['calendar']
+    start = mdates.date2num(data['start_date'])
+    image = ax.imshow(calendar, aspect='auto', interpolation='nearest', cmap='magma',
+                      extent=[start, start + calendar.shape[1], len(calendar), 0])
+    ax.xaxis_date()
+    if len(calendar) <= MAX_HEATMAP_LABELS:
+        ax.set_yticks(np.arange(len(calendar)) + 0.5)
+        ax.set_yticklabels(data['titles'], fontsize=7)
+    else:
+        ax.set_ylabel(f'{len(calendar)} memes (ordered by first post)')
+    ax.grid(False)
+    ax.set_title('Daily Activity Across Memes', fontsize=14, fontweight='bold')
+    fig.colorbar(image, ax=ax, label='Share of Peak Day')
+
+
+def figure_size(kind, data):
+    if kind == 'small_multiples':
+        rows, columns = data['grid']
+        return (CELL_SIZE[0] * columns, CELL_SIZE[1] * rows + 0.6)
+    if kind == 'activity_heatmap':
+        return (16, min(4 + 0.15 * len(data['calendar']), 40))
+    return (14, 8)
+
+
+DRAWERS = {
+    'small_multiples': draw_small_multiples,
+    'normalized_overlay': draw_normalized_overlay,
+    'activity_heatmap': draw_activity_heatmap
+}
+
+
+def render_comparison(kind, data, filepath, settings):
+    """비교 그림 하나를 Agg 캔버스에 그려 저장
+
+    Returns:
+        저장된 파일 크기 (바이트)
+    """
+    fig = Figure(figsize=figure_size(kind, data))
+    FigureCanvasAgg(fig)
+    DRAWERS[kind](fig, data)
+    fig.tight_layout()
+    return save_figure(fig, filepath, settings)
+
+
+class ComparisonVisualizer:
+    def __init__(self, use_cache=True, profile=DEFAULT_RENDER_PROFILE, dpi=COMPARISON_DPI):
+        """여러 밈 비교 시각화
+
+        Args:
+            use_cache: 데이터와 스타일이 같은 그림은 다시 렌더링하지 않음
+            profile: 렌더 프로파일
+            dpi: 저장 해상도 상한 (큰 격자 그림이라 프로파일 해상도보다 낮게 제한)
+        """
+        self.figures_dir = FIGURES_DIR
+        os.makedirs(self.figures_dir, exist_ok=True)
+        self.cache = FigureCache() if use_cache else None
+        self.settings = profile_settings(profile, max_dpi=dpi)
+        apply_style()
+
+    def prepare_all(self, long, max_days=365, smooth=7, columns=None):
+        """비교 그림별 데이터 (집계는 한 번만 계산해 공유)"""
+        comparison = build_comparison(long, max_days, smooth)
+        shared = {'titles': comparison['titles'], 'max_days': comparison['normalized'].shape[1]}
+        return {
+            'small_multiples': dict(shared, normalized=comparison['normalized'], peaks=comparison['peaks'],
+                                    grid=_grid_shape(len(comparison['memes']), columns)),
+            'normalized_overlay': dict(shared, normalized=comparison['normalized']),
+            'activity_heatmap': dict(shared, calendar=comparison['calendar'],
+                                     start_date=comparison['start_date'])
+        }
+
+    def render_all(self, long, name='all', kinds=None, max_days=365, smooth=7, columns=None):
+        """비교 그림 렌더링
+
+        Returns:
+            {그림 종류: 파일 경로}
+        """
+        start_time = time.time()
+        prepared = self.prepare_all(long, max_days, smooth, columns)
+        print(f"비교 집계: 밈 {long['meme'].nunique()}개, {time.time() - start_time:.2f}초")
+
+        paths = {}
+        for kind in kinds or list(DRAWERS):
+            data = prepared[kind]
+            filepath = os.path.join(self.figures_dir, f"comparison_{name}_{kind}.{self.settings['format']}")
+            paths[kind] = filepath
+            if self.cache is not None:
+                style = dict(self.settings, figsize=figure_size(kind, data), style=STYLE, palette=PALETTE)
+                figure_fingerprint = fingerprint(kind, data, style)
+                if self.cache.lookup(filepath, figure_fingerprint):
+                    print(f"{COMPARISON_TYPES[kind]} (변경 없음, 기존 파일 사용): {filepath}")
+                    continue
+
+            render_start = time.time()
+            size = render_comparison(kind, data, filepath, self.settings)
+            seconds = time.time() - render_start
+            print(f"{COMPARISON_TYPES[kind]}: {filepath} ({seconds:.2f}초, {size / 1024:.0f}KB)")
+            if self.cache is not None:
+                self.cache.record(filepath, figure_fingerprint, seconds)
+
+        if self.cache is not None:
+            self.cache.save()
+        print(f"비교 그림 완료: {time.time() - start_time:.2f}초")
+        return paths
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description='여러 밈 비교 시각화')
+    parser.add_argument('--memes', nargs='+', help='비교할 밈 이름 목록 (미지정 시 롤업 큐브가 있는 전체 밈)')
+    parser.add_argument('--name', type=str, default='all', help='출력 파일 이름 (comparison_<name>_<종류>.<형식>)')
+    parser.add_argument('--kinds', nargs='+', choices=list(DRAWERS), help='그릴 비교 그림 (미지정 시 전체)')
+    parser.add_argument('--max-days', type=int, default=365, help='정규화 곡선에 쓸 첫 게시물 이후 최대 일수')
+    parser.add_argument('--smooth', type=int, default=7, help='이동 평균 창 크기')
+    parser.add_argument('--columns', type=int, help='격자 열 수 (미지정 시 밈 수에 맞춤)')
+    parser.add_argument('--no-cache', action='store_true', help='그림 캐시를 무시하고 다시 렌더링')
+    parser.add_argument('--profile', choices=list(RENDER_PROFILES), default=DEFAULT_RENDER_PROFILE,
+                        help='렌더 프로파일 (draft, web, publication, publication-svg, publication-pdf)')
+
+    args = parser.parse_args()
+
+    rollup_files = find_rollup_files(PROCESSED_DATA_DIR, args.memes)
+    if not rollup_files:
+        print("롤업 큐브가 있는 밈을 찾을 수 없습니다. 먼저 데이터 전처리를 실행하세요.")
+        return
+
+    try:
+        long = load_daily_long(rollup_files)
+        ComparisonVisualizer(use_cache=not args.no_cache, profile=args.profile).render_all(
+            long, args.name, args.kinds, args.max_days, args.smooth, args.columns)
+        print(f"결과는 {FIGURES_DIR}에 저장되었습니다.")
+    except Exception as e:
+        print(f"❌ 비교 시각화 중 오류 발생: {e}")
+        import traceback
+        traceback.print_exc()
+
+# 실행 코드
+if __name__ == "__main__":
+    main()
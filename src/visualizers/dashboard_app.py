@@ -0,0 +1,360 @@
+"""
+인터랙티브 밈 대시보드 (Dash)
+
+원본 게시물은 읽지 않고 전처리/일괄 분석 단계에서 저장한 작은 집계만 사용한다.
+- 롤업 큐브(_rollup.npz): 일/주/월 게시물 수, 시간대/요일 분포
+- 스케치(_sketch.json): 상위 서브레딧
+- 일괄 분석 결과(lifecycle_batch_results.csv): 수명 주기 지표와 피팅된 곡선 파라미터
+
+밈 목록은 파일 이름만으로 만들고 밈별 집계는 선택될 때 처음 로드한다.
+로드한 집계와 콜백 결과(그림)는 크기 제한이 있는 LRU 캐시에 보관한다.
+그림은 plotly figure 딕셔너리로 만들므로 데이터 계층은 dash/plotly 없이도 동작한다.
+"""
+
+from functools import lru_cache
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from config.config import PROCESSED_DATA_DIR, REPORTS_DIR
+from src.analyzers.curve_models import MODELS
+from src.analyzers.lifecycle_analyzer import curve_fit_data
+from src.analyzers.sketches import SpaceSaving
+from src.preprocessors.rollup_cube import GRANULARITIES, RollupCube, find_rollup_files
+from src.visualizers.downsample import downsample_series
+
+DEFAULT_RESULTS_PATH = os.path.join(REPORTS_DIR, 'lifecycle_batch_results.csv')
+GRANULARITY_LABELS = {'day': 'Daily', 'week': 'Weekly', 'month': 'Monthly'}
+DAY_NAMES = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
+TOP_SUBREDDITS = 15
+# 콜백 응답 목표 시간 (넘으면 경고 출력)
+SLOW_CALLBACK_MS = 100
+
+# (일괄 분석 결과 컬럼, 표시 이름, 형식)
+SUMMARY_FIELDS = [
+    ('total_posts', 'Total Posts', '{:,.0f}'),
+    ('unique_authors', 'Unique Authors', '{:,.0f}'),
+    ('duration_days', 'Duration (days)', '{:,.0f}'),
+    ('peak_date', 'Peak Date', '{}'),
+    ('lifecycle_type', 'Lifecycle Type', '{}'),
+    ('phase_sequence', 'Phases', '{}'),
+    ('curve_model', 'Curve Model', '{}'),
+    ('r_squared', 'R²', '{:.3f}'),
+    ('viral_concentration', 'Viral Concentration', '{:.1%}'),
+    ('hub_subreddit', 'Hub Subreddit', 'r/{}'),
+]
+
+
+def load_batch_results(results_path=DEFAULT_RESULTS_PATH):
+    """일괄 분석 결과 테이블 (밈 인덱스, 없으면 빈 DataFrame)"""
+    if not os.path.exists(results_path):
+        return pd.DataFrame()
+    results = pd.read_csv(results_path)
+    return results.drop_duplicates('meme', keep='last').set_index('meme')
+
+
+def load_top_subreddits(sketch_path, n=TOP_SUBREDDITS):
+    """스케치 파일의 전체 기간 상위 서브레딧 [(이름, 게시물 수)] (월별 스케치는 복원하지 않음)"""
+    if not os.path.exists(sketch_path):
+        return []
+    with open(sketch_path, 'r', encoding='utf-8') as f:
+        top = SpaceSaving.from_dict(json.load(f)['total']['top_subreddits'])
+    return [(key, count) for key, count, _ in top.top(n)]
+
+
+def fitted_curve(daily_frame, row):
+    """일괄 분석에서 피팅한 곡선을 날짜 인덱스 Series로 복원 (곡선이 없으면 None)"""
+    if row is None or not isinstance(row.get('curve_parameters'), str) or row.get('curve_model') not in MODELS:
+        return None
+    recent_data, x, _ = curve_fit_data(daily_frame)
+    if len(recent_data) == 0:
+        return None
+    days = np.arange(int(x.max()) + 1, dtype=np.float64)
+    dates = recent_data['date'].min() + pd.to_timedelta(days, unit='D')
+    values = MODELS[row['curve_model']].func(days, *json.loads(row['curve_parameters']))
+    return pd.Series(values, index=dates)
+
+
+def _dates(series):
+    return series.index.strftime('%Y-%m-%d').tolist()
+
+
+def _layout(title, **kwargs):
+    layout = {
+        'title': {'text': title},
+        'margin': {'l': 60, 'r': 20, 't': 50, 'b': 40},
+        'plot_bgcolor': 'white',
+        'hovermode': 'x unified',
+    }
+    layout.update(kwargs)
+    return layout
+
+
+def activity_figure(title, aggregates, granularity, max_points):
+    """게시물 수 추이 (일 단위는 7일 이동평균과 피팅 곡선 포함)"""
+    series = downsample_series(aggregates['series'][granularity], max_points)
+    traces = [{
+        'type': 'scatter', 'mode': 'lines', 'name': 'Posts',
+        'x': _dates(series), 'y': series.tolist(),
+        'line': {'color': 'steelblue', 'width': 1}
+    }]
+    if granularity == 'day':
+        ma = downsample_series(aggregates['ma7'], max_points)
+        traces.append({
+            'type': 'scatter', 'mode': 'lines', 'name': '7-day MA',
+            'x': _dates(ma), 'y': ma.tolist(),
+            'line': {'color': 'red', 'width': 2}
+        })
+        curve = aggregates['curve']
+        if curve is not None:
+            curve = downsample_series(curve, max_points)
+            traces.append({
+                'type': 'scatter', 'mode': 'lines', 'name': f"Fitted ({aggregates['curve_model']})",
+                'x': _dates(curve), 'y': curve.tolist(),
+                'line': {'color': 'black', 'width': 2, 'dash': 'dash'}
+            })
+    return {
+        'data': traces,
+        'layout': _layout(f"{title} - {GRANULARITY_LABELS[granularity]} Posts",
+                          xaxis={'type': 'date'}, yaxis={'title': {'text': 'Number of Posts'}})
+    }
+
+
+def timing_figure(aggregates):
+    """시간대별/요일별 게시물 수"""
+    hourly = aggregates['hour_of_day']
+    weekly = aggregates['day_of_week']
+    return {
+        'data': [
+            {'type': 'bar', 'name': 'By Hour', 'x': hourly['hour'].tolist(),
+             'y': hourly['post_count'].tolist(), 'marker': {'color': 'green'}},
+            {'type': 'bar', 'name': 'By Weekday', 'x': [DAY_NAMES[day] for day in weekly['day_of_week']],
+             'y': weekly['post_count'].tolist(), 'marker': {'color': 'orange'},
+             'xaxis': 'x2', 'yaxis': 'y2'}
+        ],
+        'layout': _layout('Posting Time', showlegend=False, hovermode='closest',
+                          xaxis={'domain': [0, 0.62], 'title': {'text': 'Hour (24h)'}},
+                          xaxis2={'domain': [0.7, 1], 'anchor': 'y2'},
+                          yaxis={'title': {'text': 'Number of Posts'}},
+                          yaxis2={'anchor': 'x2'})
+    }
+
+
+def subreddit_figure(aggregates):
+    """상위 서브레딧 (스케치 기준 근사 게시물 수)"""
+    top = aggregates['top_subreddits'][::-1]
+    return {
+        'data': [{'type': 'bar', 'orientation': 'h', 'name': 'Posts',
+                  'x': [count for _, count in top], 'y': [f'r/{name}' for name, _ in top],
+                  'marker': {'color': 'purple'}}],
+        'layout': _layout(f'Top {TOP_SUBREDDITS} Subreddits' if top else 'Top Subreddits (스케치 없음)',
+                          hovermode='closest', margin={'l': 140, 'r': 20, 't': 50, 'b': 40})
+    }
+
+
+def summary_markdown(title, aggregates):
+    """일괄 분석 지표 요약 (결과가 없으면 큐브 게시물 수만)"""
+    row = aggregates['summary']
+    lines = [f"### {title}"]
+    if row is None:
+        lines.append(f"**Total Posts**: {aggregates['total_posts']:,} (일괄 분석 결과 없음)")
+        return '\n\n'.join(lines)
+    items = []
+    for column, label, fmt in SUMMARY_FIELDS:
+        value = row.get(column)
+        if value is None or (isinstance(value, float) and np.isnan(value)):
+            continue
+        items.append(f"**{label}**: {fmt.format(value)}")
+    lines.append(' · '.join(items))
+    return '\n\n'.join(lines)
+
+
+class DashboardData:
+    def __init__(self, processed_dir=PROCESSED_DATA_DIR, results_path=DEFAULT_RESULTS_PATH,
+                 meme_cache_size=64, figure_cache_size=256, max_points=1500):
+        """대시보드 데이터 계층
+
+        Args:
+            processed_dir: 롤업 큐브/스케치가 있는 디렉토리
+            results_path: 일괄 분석 결과 CSV
+            meme_cache_size: 메모리에 유지할 밈 집계 수 (LRU)
+            figure_cache_size: 메모리에 유지할 (밈, 단위)별 그림 묶음 수 (LRU)
+            max_points: 선 그래프 하나의 최대 점 수 (넘으면 LTTB로 축약)
+        """
+        self.rollup_files = find_rollup_files(processed_dir)
+        self.results = load_batch_results(results_path)
+        self.memes = sorted(self.rollup_files)
+        self.max_points = max_points
+        self.callback_seconds = []
+
+        # 밈별 집계와 그림은 처음 요청될 때 만들어 LRU로 보관
+        self.meme_aggregates = lru_cache(maxsize=meme_cache_size)(self._load_aggregates)
+        self.figures = lru_cache(maxsize=figure_cache_size)(self._build_figures)
+
+    def _load_aggregates(self, meme):
+        """밈 하나의 큐브/스케치/일괄 분석 결과 로드"""
+        rollup_file = self.rollup_files[meme]
+        # 조회만 하므로 게시물 id 목록은 읽지 않음
+        cube = RollupCube.load(rollup_file, GRANULARITIES)
+        row = self.results.loc[meme].to_dict() if meme in self.results.index else None
+        daily = cube.series('day')
+        return {
+            'series': {granularity: cube.series(granularity) for granularity in GRANULARITY_LABELS},
+            'ma7': daily.rolling(window=7, min_periods=1).mean(),
+            'hour_of_day': cube.by_hour_of_day(),
+            'day_of_week': cube.by_day_of_week(),
+            'top_subreddits': load_top_subreddits(rollup_file.replace('_rollup.npz', '_sketch.json')),
+            'curve': fitted_curve(cube.daily_frame(), row),
+            'curve_model': row.get('curve_model') if row else None,
+            'summary': row,
+            'total_posts': cube.total_posts
+        }
+
+    def _build_figures(self, meme, granularity):
+        """밈/단위별 그림 묶음 (캐시된 결과는 수정하지 않음)"""
+        aggregates = self.meme_aggregates(meme)
+        title = meme.replace('_', ' ').title()
+        return {
+            'activity': activity_figure(title, aggregates, granularity, self.max_points),
+            'timing': timing_figure(aggregates),
+            'subreddits': subreddit_figure(aggregates),
+            'summary': summary_markdown(title, aggregates)
+        }
+
+    def timed_figures(self, meme, granularity):
+        """콜백용 그림 묶음 조회 (소요 시간 기록, 목표 시간 초과 시 경고)"""
+        start_time = time.perf_counter()
+        figures = self.figures(meme, granularity)
+        elapsed = time.perf_counter() - start_time
+        self.callback_seconds.append(elapsed)
+        if elapsed * 1000 > SLOW_CALLBACK_MS:
+            print(f"⚠️ 느린 콜백: {meme} ({granularity}) {elapsed * 1000:.0f}ms")
+        return figures
+
+    def overview_figure(self):
+        """전체 밈 개요 (일괄 분석 결과의 기간 vs 게시물 수, 점을 누르면 밈 선택)"""
+        results = self.results[self.results.index.isin(self.memes)] if len(self.results) else self.results
+        if len(results) == 0:
+            return {'data': [], 'layout': _layout('All Memes (일괄 분석 결과 없음)')}
+        types = results['lifecycle_type'].fillna('Unknown') if 'lifecycle_type' in results else \
+            pd.Series('Unknown', index=results.index)
+        traces = []
+        for lifecycle_type, group in results.groupby(types):
+            traces.append({
+                'type': 'scattergl' if len(group) > 500 else 'scatter', 'mode': 'markers',
+                'name': lifecycle_type,
+                'x': group['duration_days'].tolist(), 'y': group['total_posts'].tolist(),
+                'text': group.index.tolist(), 'customdata': group.index.tolist(),
+                'hovertemplate': '%{text}<br>%{x} days, %{y:,} posts<extra></extra>'
+            })
+        return {
+            'data': traces,
+            'layout': _layout(f'All Memes ({len(results)})', hovermode='closest',
+                              xaxis={'title': {'text': 'Duration (days)'}},
+                              yaxis={'title': {'text': 'Total Posts'}, 'type': 'log'})
+        }
+
+    def cache_report(self):
+        """캐시 적중 현황 출력"""
+        for name, cached in (('밈 집계', self.meme_aggregates), ('그림', self.figures)):
+            info = cached.cache_info()
+            print(f"{name} 캐시: 적중 {info.hits}, 실패 {info.misses}, 보관 {info.currsize}/{info.maxsize}")
+
+
+def create_app(data):
+    """Dash 앱 생성"""
+    from dash import Dash, Input, Output, dcc, html
+
+    app = Dash(__name__, title='Meme Lifecycle Dashboard')
+    app.layout = html.Div([
+        html.H2('Meme Lifecycle Dashboard'),
+        html.Div([
+            dcc.Dropdown(id='meme', clearable=False, style={'width': '360px'},
+                         options=[{'label': meme.replace('_', ' ').title(), 'value': meme} for meme in data.memes],
+                         value=data.memes[0] if data.memes else None),
+            dcc.RadioItems(id='granularity', inline=True, value='day',
+                           options=[{'label': label, 'value': granularity}
+                                    for granularity, label in GRANULARITY_LABELS.items()])
+        ], style={'display': 'flex', 'gap': '24px', 'alignItems': 'center'}),
+        dcc.Graph(id='overview', figure=data.overview_figure(), style={'height': '320px'}),
+        dcc.Markdown(id='summary'),
+        dcc.Graph(id='activity'),
+        html.Div([
+            dcc.Graph(id='timing', style={'flex': '2'}),
+            dcc.Graph(id='subreddits', style={'flex': '1'})
+        ], style={'display': 'flex'})
+    ], style={'fontFamily': 'sans-serif', 'margin': '16px'})
+
+    @app.callback(Output('meme', 'value'), Input('overview', 'clickData'), prevent_initial_call=True)
+    def select_from_overview(click_data):
+        return click_data['points'][0]['customdata']
+
+    @app.callback(
+        [Output('activity', 'figure'), Output('timing', 'figure'),
+         Output('subreddits', 'figure'), Output('summary', 'children')],
+        [Input('meme', 'value'), Input('granularity', 'value')]
+    )
+    def update_meme(meme, granularity):
+        if meme is None:
+            empty = {'data': [], 'layout': _layout('')}
+            return empty, empty, empty, '롤업 큐브가 있는 밈이 없습니다.'
+        figures = data.timed_figures(meme, granularity)
+        return figures['activity'], figures['timing'], figures['subreddits'], figures['summary']
+
+    return app
+
+
+def benchmark(data):
+    """서버 없이 전체 밈의 콜백 응답 시간 측정 (처음 로드 / 캐시 적중)"""
+    cold, warm = [], []
+    for meme in data.memes:
+        for granularity in GRANULARITY_LABELS:
+            start_time = time.perf_counter()
+            data.figures(meme, granularity)
+            cold.append(time.perf_counter() - start_time)
+            start_time = time.perf_counter()
+            data.figures(meme, granularity)
+            warm.append(time.perf_counter() - start_time)
+
+    print(f"\n=== Dashboard Callback Benchmark ({len(data.memes)} memes) ===")
+    for label, seconds in (('처음 로드', cold), ('캐시 적중', warm)):
+        ms = np.asarray(seconds) * 1000
+        print(f"{label}: p50 {np.percentile(ms, 50):.2f}ms, p95 {np.percentile(ms, 95):.2f}ms, 최대 {ms.max():.2f}ms")
+    data.cache_report()
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description='인터랙티브 밈 대시보드')
+    parser.add_argument('--host', type=str, default='127.0.0.1', help='서버 주소')
+    parser.add_argument('--port', type=int, default=8050, help='서버 포트')
+    parser.add_argument('--results', type=str, default=DEFAULT_RESULTS_PATH, help='일괄 분석 결과 CSV')
+    parser.add_argument('--meme-cache', type=int, default=64, help='메모리에 유지할 밈 집계 수')
+    parser.add_argument('--max-points', type=int, default=1500, help='선 그래프 최대 점 수')
+    parser.add_argument('--benchmark', action='store_true', help='서버를 띄우지 않고 콜백 응답 시간만 측정')
+    parser.add_argument('--debug', action='store_true', help='Dash 디버그 모드')
+
+    args = parser.parse_args()
+
+    data = DashboardData(results_path=args.results, meme_cache_size=args.meme_cache, max_points=args.max_points)
+    print(f"밈 {len(data.memes)}개 (일괄 분석 결과 {len(data.results)}개)")
+    if not data.memes:
+        print("롤업 큐브가 있는 밈이 없습니다. 먼저 데이터 전처리를 실행하세요.")
+        return
+
+    if args.benchmark:
+        benchmark(data)
+        return
+
+    create_app(data).run(host=args.host, port=args.port, debug=args.debug)
+
+# 실행 코드
+if __name__ == "__main__":
+    main()
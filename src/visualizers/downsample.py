@@ -0,0 +1,81 @@
+"""
+큰 시계열/산점도의 그리기용 축약
+
+- 선 그래프: LTTB(Largest-Triangle-Three-Buckets)로 모양(극값)을 유지하며 점 수를 줄인다.
+- 산점도: 점 대신 로그 구간 2차원 히스토그램(밀도)으로 바꿔 그리기 비용을 데이터 크기와 무관하게 만든다.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def lttb(x, y, n_out):
+    """LTTB로 고른 점의 인덱스
+
+    첫 점과 마지막 점은 항상 포함하고, 나머지 n_out - 2개 구간에서 직전 선택점과
+    다음 구간 평균점이 이루는 삼각형 넓이가 가장 큰 점을 하나씩 고른다.
+
+    Args:
+        x, y: 같은 길이의 1차원 배열 (x는 오름차순)
+        n_out: 남길 점 수
+
+    Returns:
+        오름차순 인덱스 배열 (n_out 이상이면 전체 인덱스)
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    # 가운데 점들을 n_out - 2개 구간으로 나눈 경계
+    edges = (np.arange(n_out - 1) * ((n - 2) / (n_out - 2))).astype(np.int64) + 1
+    edges[-1] = n - 1
+
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    previous = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            next_x = x[end:edges[i + 2]].mean()
+            next_y = y[end:edges[i + 2]].mean()
+        else:
+            next_x, next_y = x[-1], y[-1]
+        area = np.abs((x[previous] - next_x) * (y[start:end] - y[previous])
+                      - (x[previous] - x[start:end]) * (next_y - y[previous]))
+        previous = start + int(np.argmax(area))
+        selected[i + 1] = previous
+    return selected
+
+
+def downsample_series(series, n_out):
+    """시각 인덱스 Series를 LTTB로 n_out개 점으로 축약 (짧으면 그대로)"""
+    if len(series) <= n_out:
+        return series
+    index = series.index
+    if isinstance(index, pd.DatetimeIndex):
+        x = index.asi8
+    elif isinstance(index, pd.PeriodIndex):
+        x = index.asi8
+    else:
+        x = np.arange(len(series))
+    return series.iloc[lttb(x, series.to_numpy(dtype=np.float64), n_out)]
+
+
+def log_density(x, y, bins=60):
+    """양수 값 쌍의 로그 구간 2차원 히스토그램 (로그 축 산점도 대체용)
+
+    Returns:
+        (counts, x_edges, y_edges), 양수 쌍이 없으면 None
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    positive = (x > 0) & (y > 0)
+    if not positive.any():
+        return None
+    x, y = x[positive], y[positive]
+    x_edges = np.logspace(np.log10(x.min()), np.log10(x.max()) + 1e-9, bins + 1)
+    y_edges = np.logspace(np.log10(y.min()), np.log10(y.max()) + 1e-9, bins + 1)
+    counts, _, _ = np.histogram2d(x, y, bins=[x_edges, y_edges])
+    return counts, x_edges, y_edges
@@ -0,0 +1,122 @@
+"""
+그림 지문(fingerprint) 캐시
+
+그림이 그리는 집계 데이터와 스타일 파라미터로 지문을 계산해 매니페스트에 기록한다.
+같은 파일 경로에 같은 지문의 그림이 이미 있으면 다시 렌더링하지 않고 기존 파일을 쓴다.
+"""
+
+import hashlib
+import json
+import os
+import sys
+import time
+
+import matplotlib
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from config.config import FIGURES_DIR
+
+DEFAULT_MANIFEST_PATH = os.path.join(FIGURES_DIR, 'figure_manifest.json')
+# 그리기 코드가 바뀌어 기존 그림을 모두 무효화해야 할 때 올림
+CACHE_VERSION = 1
+
+
+def _update_hash(digest, value):
+    """값을 타입 태그와 함께 해시에 누적 (dict는 키 순서와 무관)"""
+    if isinstance(value, dict):
+        digest.update(b'dict')
+        for key in sorted(value, key=str):
+            _update_hash(digest, str(key))
+            _update_hash(digest, value[key])
+    elif isinstance(value, (list, tuple)):
+        digest.update(f'seq{len(value)}'.encode())
+        for item in value:
+            _update_hash(digest, item)
+    elif isinstance(value, (pd.Series, pd.DataFrame)):
+        digest.update(type(value).__name__.encode())
+        columns = value.columns if isinstance(value, pd.DataFrame) else [value.name]
+        digest.update(repr(list(columns)).encode())
+        digest.update(repr(list(value.dtypes) if isinstance(value, pd.DataFrame) else value.dtype).encode())
+        digest.update(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+    elif isinstance(value, np.ndarray):
+        digest.update(f'ndarray{value.dtype}{value.shape}'.encode())
+        digest.update(np.ascontiguousarray(value).tobytes())
+    else:
+        digest.update(f'{type(value).__name__}:{value!r}'.encode())
+
+
+def fingerprint(kind, data, style):
+    """그림 종류, 집계 데이터, 스타일 파라미터의 지문 (16진수 문자열)"""
+    digest = hashlib.blake2b(digest_size=16)
+    _update_hash(digest, {
+        'kind': kind,
+        'data': data,
+        'style': style,
+        'cache_version': CACHE_VERSION,
+        'matplotlib': matplotlib.__version__
+    })
+    return digest.hexdigest()
+
+
+class FigureCache:
+    def __init__(self, manifest_path=DEFAULT_MANIFEST_PATH):
+        """지문 매니페스트 기반 그림 캐시
+
+        매니페스트는 {파일명: {'fingerprint', 'rendered_at', 'render_seconds'}} 형식의 JSON이다.
+        """
+        self.manifest_path = manifest_path
+        self.manifest = {}
+        if os.path.exists(manifest_path):
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                self.manifest = json.load(f)
+        self.recorded = {}
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, filepath, figure_fingerprint):
+        """같은 지문의 그림 파일이 있으면 True (적중/실패 횟수 기록)"""
+        entry = self.manifest.get(os.path.basename(filepath))
+        hit = entry is not None and entry['fingerprint'] == figure_fingerprint and os.path.exists(filepath)
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return hit
+
+    def record(self, filepath, figure_fingerprint, render_seconds=None):
+        self.recorded[os.path.basename(filepath)] = {
+            'fingerprint': figure_fingerprint,
+            'rendered_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'render_seconds': round(render_seconds, 3) if render_seconds is not None else None
+        }
+        self.manifest.update(self.recorded)
+
+    def save(self):
+        """이번에 기록한 항목만 디스크의 최신 매니페스트에 합쳐 저장
+
+        여러 밈의 파이프라인이 동시에 렌더링해도 서로의 기록을 덮어쓰지 않도록 저장 직전에 다시 읽고,
+        임시 파일에 쓴 뒤 교체한다.
+        """
+        os.makedirs(os.path.dirname(self.manifest_path), exist_ok=True)
+        if os.path.exists(self.manifest_path):
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                self.manifest = json.load(f)
+        self.manifest.update(self.recorded)
+        temp_path = f'{self.manifest_path}.{os.getpid()}.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.manifest, f, ensure_ascii=False, indent=2, sort_keys=True)
+        os.replace(temp_path, self.manifest_path)
+        return self.manifest_path
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def report(self):
+        """캐시 적중률 출력"""
+        total = self.hits + self.misses
+        print(f"그림 캐시: 적중 {self.hits}/{total} ({self.hit_rate:.0%}), 렌더링 {self.misses}개")
@@ -0,0 +1,317 @@
+"""
+밈 수명 주기 애니메이션 (GIF/MP4)
+
+일별 게시물 수, 누적 게시물 수, 상위 서브레딧 누적 게시물 수가 하루씩 늘어나는 애니메이션을 만든다.
+- 블리팅: 축/눈금/제목/전체 곡선 윤곽 같은 정적 요소는 한 번만 그려 배경으로 저장하고,
+  프레임마다 배경을 복원한 뒤 바뀌는 요소(곡선, 커서, 막대, 날짜)만 다시 그린다.
+- 병렬 청크: 프레임을 연속 구간으로 나눠 프로세스마다 자기 Figure와 배경을 만들어 렌더링한다.
+- 인코딩: GIF는 Pillow, MP4는 로컬 ffmpeg(청크별 세그먼트를 만든 뒤 재인코딩 없이 이어 붙임)를 사용한다.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+import matplotlib.dates as mdates
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from PIL import Image
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from config.config import FIGURES_DIR, PROCESSED_DATA_DIR
+from src.analyzers import kernels
+from src.preprocessors.rollup_cube import RollupCube, load_rollup
+from src.visualizers.meme_visualizer import (
+    apply_style, find_latest_processed_file, extract_meme_name_from_processed_filename
+)
+
+FIGSIZE = (12, 7)
+ANIMATION_DPI = 80
+MAX_FRAMES = 300
+TOP_SUBREDDITS = 8
+GIF_TRANSPARENT = 255
+FORMATS = ['gif', 'mp4']
+
+
+def prepare_animation(df, meme_name, cube=None, top_n=TOP_SUBREDDITS, step=None, max_frames=MAX_FRAMES):
+    """애니메이션에 필요한 일별 배열
+
+    Args:
+        df: 전처리된 게시물 DataFrame (created_utc, subreddit 컬럼만 사용)
+        cube: 롤업 큐브 (None이면 df로 생성)
+        top_n: 막대로 보여줄 상위 서브레딧 수 (전체 기간 기준)
+        step: 프레임 간격 (일, None이면 max_frames에 맞춤)
+        max_frames: step이 None일 때 최대 프레임 수
+
+    Returns:
+        {'title', 'dates', 'daily', 'ma7', 'cumulative', 'subreddits', 'subreddit_cumulative', 'frame_days'}
+    """
+    cube = cube or RollupCube.from_posts(meme_name, df)
+    daily_posts = cube.series('day')
+    dates = pd.date_range(daily_posts.index.min(), daily_posts.index.max(), freq='D')
+    daily = daily_posts.reindex(dates, fill_value=0).to_numpy(dtype=np.float64)
+
+    # 상위 서브레딧의 일별 누적 게시물 수 (일 x 서브레딧)
+    subreddits = df['subreddit'].value_counts().head(top_n).index.tolist()
+    codes = pd.Index(subreddits).get_indexer(df['subreddit'])
+    day_index = (pd.to_datetime(df['created_utc']).dt.floor('D') - dates[0]).dt.days.to_numpy()
+    known = codes >= 0
+    counts = np.bincount(day_index[known] * len(subreddits) + codes[known],
+                         minlength=len(dates) * len(subreddits)).reshape(len(dates), len(subreddits))
+
+    step = step or max(1, int(np.ceil(len(dates) / max_frames)))
+    frame_days = np.arange(len(dates) - 1, -1, -step)[::-1]
+    return {
+        'title': meme_name.replace('_', ' ').title(),
+        'dates': mdates.date2num(dates.to_pydatetime()),
+        'daily': daily,
+        'ma7': kernels.rolling_mean(daily, window=7, min_periods=1),
+        'cumulative': np.cumsum(daily),
+        'subreddits': subreddits,
+        'subreddit_cumulative': np.cumsum(counts, axis=0),
+        'frame_days': frame_days
+    }
+
+
+class FrameRenderer:
+    def __init__(self, data, figsize=FIGSIZE, dpi=ANIMATION_DPI):
+        """블리팅 프레임 렌더러
+
+        정적 요소를 그린 캔버스를 배경으로 저장하고, animated=True인 요소만 프레임마다 다시 그린다.
+        """
+        self.data = data
+        self.fig = Figure(figsize=figsize, dpi=dpi)
+        self.canvas = FigureCanvasAgg(self.fig)
+        grid = self.fig.add_gridspec(2, 3)
+        self.ax_daily = self.fig.add_subplot(grid[0, :2])
+        self.ax_cumulative = self.fig.add_subplot(grid[1, :2], sharex=self.ax_daily)
+        self.ax_subreddits = self.fig.add_subplot(grid[:, 2])
+
+        self._draw_static()
+        self._create_animated()
+        self.fig.tight_layout()
+        self.canvas.draw()
+        self.background = self.canvas.copy_from_bbox(self.fig.bbox)
+
+    def _draw_static(self):
+        """배경: 축 범위/제목/라벨과 전체 곡선 윤곽 (한 번만 그림)"""
+        data = self.data
+        dates = data['dates']
+        self.fig.suptitle(f"{data['title']} Meme Lifecycle", fontsize=16, fontweight='bold')
+
+        self.ax_daily.plot(dates, data['daily'], color='lightgray', linewidth=0.8)
+        self.ax_daily.set_xlim(dates[0], dates[-1])
+        self.ax_daily.set_ylim(0, max(data['daily'].max(), 1) * 1.1)
+        self.ax_daily.set_ylabel('Daily Posts')
+        self.ax_daily.xaxis_date()
+
+        self.ax_cumulative.plot(dates, data['cumulative'], color='lightgray', linewidth=1.5)
+        self.ax_cumulative.set_ylim(0, max(data['cumulative'][-1], 1) * 1.05)
+        self.ax_cumulative.set_ylabel('Cumulative Posts')
+
+        final = data['subreddit_cumulative'][-1] if len(data['subreddits']) else np.zeros(0)
+        positions = np.arange(len(data['subreddits']))[::-1]
+        self.ax_subreddits.set_yticks(positions)
+        self.ax_subreddits.set_yticklabels([f'r/{name}' for name in data['subreddits']])
+        self.ax_subreddits.set_ylim(-0.6, len(data['subreddits']) - 0.4)
+        self.ax_subreddits.set_xlim(0, max(final.max() if len(final) else 0, 1) * 1.1)
+        self.ax_subreddits.set_xlabel('Cumulative Posts')
+        self.ax_subreddits.set_title(f"Top {len(data['subreddits'])} Subreddits")
+        self.bar_positions = positions
+
+    def _create_animated(self):
+        """프레임마다 바뀌는 요소 (animated=True면 배경 그리기에서 제외됨)"""
+        self.daily_line, = self.ax_daily.plot([], [], color='steelblue', linewidth=1, animated=True)
+        self.ma_line, = self.ax_daily.plot([], [], color='red', linewidth=2, animated=True)
+        self.cumulative_line, = self.ax_cumulative.plot([], [], color='green', linewidth=2, animated=True)
+        self.cursors = [ax.axvline(self.data['dates'][0], color='black', linewidth=0.8, alpha=0.6, animated=True)
+                        for ax in (self.ax_daily, self.ax_cumulative)]
+        self.date_text = self.ax_daily.text(0.01, 0.95, '', transform=self.ax_daily.transAxes, fontsize=12,
+                                            va='top', fontweight='bold', animated=True)
+        self.total_text = self.ax_cumulative.text(0.01, 0.95, '', transform=self.ax_cumulative.transAxes,
+                                                  fontsize=11, va='top', animated=True)
+        self.bars = self.ax_subreddits.barh(self.bar_positions, np.zeros(len(self.bar_positions)),
+                                           color='purple', animated=True).patches
+        self.artists = [self.daily_line, self.ma_line, self.cumulative_line, *self.cursors,
+                        self.date_text, self.total_text, *self.bars]
+
+    def render(self, day):
+        """day번째 날까지의 프레임 (RGB uint8 배열)"""
+        data = self.data
+        dates = data['dates'][:day + 1]
+        self.canvas.restore_region(self.background)
+
+        self.daily_line.set_data(dates, data['daily'][:day + 1])
+        self.ma_line.set_data(dates, data['ma7'][:day + 1])
+        self.cumulative_line.set_data(dates, data['cumulative'][:day + 1])
+        for cursor in self.cursors:
+            cursor.set_xdata([dates[-1], dates[-1]])
+        self.date_text.set_text(mdates.num2date(dates[-1]).strftime('%Y-%m-%d'))
+        self.total_text.set_text(f"{data['cumulative'][day]:,.0f} posts")
+        if len(self.bars):
+            for bar, width in zip(self.bars, data['subreddit_cumulative'][day]):
+                bar.set_width(width)
+
+        for artist in self.artists:
+            artist.axes.draw_artist(artist)
+        return np.asarray(self.canvas.buffer_rgba())[:, :, :3].copy()
+
+
+def _gif_frames(renderer, days, last_day):
+    """GIF 프레임 (공통 팔레트 + 이전 프레임과 같은 픽셀은 투명)
+
+    팔레트는 마지막 프레임에서 만들어 모든 청크가 같은 팔레트를 쓰고, 마지막 인덱스는 투명색으로 남겨 둔다.
+    청크 첫 프레임은 전체를 담으므로 청크를 이어 붙여도 화면이 어긋나지 않는다.
+    """
+    palette = Image.fromarray(renderer.render(last_day)).quantize(
+        colors=GIF_TRANSPARENT, method=Image.Quantize.FASTOCTREE)
+    frames = []
+    previous = None
+    for day in days:
+        indices = np.asarray(Image.fromarray(renderer.render(day)).quantize(palette=palette, dither=Image.Dither.NONE))
+        masked = indices.copy()
+        if previous is not None:
+            masked[indices == previous] = GIF_TRANSPARENT
+        previous = indices
+        frame = Image.fromarray(masked, 'P')
+        frame.putpalette(palette.getpalette())
+        frames.append(frame)
+    return frames
+
+
+def _ffmpeg_command(filepath, size, fps):
+    width, height = size
+    return ['ffmpeg', '-y', '-loglevel', 'error', '-f', 'rawvideo', '-pix_fmt', 'rgb24',
+            '-s', f'{width}x{height}', '-r', str(fps), '-i', '-',
+            '-c:v', 'libx264', '-pix_fmt', 'yuv420p', '-vf', 'pad=ceil(iw/2)*2:ceil(ih/2)*2', filepath]
+
+
+def _render_chunk(job):
+    """프로세스 풀에서 실행되는 프레임 구간 렌더링
+
+    GIF는 팔레트 이미지 목록을, MP4는 ffmpeg로 인코딩한 세그먼트 경로를 돌려준다.
+    """
+    data, days, fmt, segment_path, fps, dpi = job
+    start_time = time.time()
+    renderer = FrameRenderer(data, dpi=dpi)
+    if fmt == 'gif':
+        frames = _gif_frames(renderer, days, data['frame_days'][-1])
+        return frames, len(days), time.time() - start_time
+
+    first = renderer.render(days[0])
+    command = _ffmpeg_command(segment_path, (first.shape[1], first.shape[0]), fps)
+    with subprocess.Popen(command, stdin=subprocess.PIPE) as encoder:
+        encoder.stdin.write(first.tobytes())
+        for day in days[1:]:
+            encoder.stdin.write(renderer.render(day).tobytes())
+        encoder.stdin.close()
+    if encoder.returncode != 0:
+        raise RuntimeError(f"ffmpeg 인코딩 실패: {segment_path}")
+    return segment_path, len(days), time.time() - start_time
+
+
+def export_animation(data, filepath, fps=20, workers=None, dpi=ANIMATION_DPI):
+    """애니메이션 파일 저장 (형식은 확장자로 결정)
+
+    Args:
+        data: prepare_animation 결과
+        filepath: .gif 또는 .mp4 경로
+        fps: 초당 프레임 수
+        workers: 렌더링 프로세스 수 (1이면 순차 실행)
+    """
+    fmt = os.path.splitext(filepath)[1].lstrip('.').lower()
+    if fmt not in FORMATS:
+        raise ValueError(f"지원하지 않는 형식: {fmt} (gif 또는 mp4)")
+    if fmt == 'mp4' and shutil.which('ffmpeg') is None:
+        raise RuntimeError("MP4 저장에는 ffmpeg가 필요합니다. GIF로 저장하거나 ffmpeg를 설치하세요.")
+
+    start_time = time.time()
+    frame_days = data['frame_days']
+    n_chunks = max(1, min(workers or os.cpu_count() or 1, len(frame_days)))
+    chunks = [days for days in np.array_split(frame_days, n_chunks) if len(days)]
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        jobs = [(data, days, fmt, os.path.join(tmpdir, f'segment_{i:03d}.mp4'), fps, dpi)
+                for i, days in enumerate(chunks)]
+        if len(jobs) == 1:
+            results = [_render_chunk(jobs[0])]
+        else:
+            with ProcessPoolExecutor(max_workers=len(jobs), mp_context=kernels.pool_context(),
+                                     initializer=apply_style) as executor:
+                results = list(executor.map(_render_chunk, jobs))
+        render_seconds = time.time() - start_time
+
+        if fmt == 'gif':
+            frames = [frame for chunk_frames, _, _ in results for frame in chunk_frames]
+            frames[0].save(filepath, save_all=True, append_images=frames[1:], duration=int(1000 / fps),
+                           loop=0, transparency=GIF_TRANSPARENT, disposal=1, optimize=False)
+        else:
+            list_path = os.path.join(tmpdir, 'segments.txt')
+            with open(list_path, 'w', encoding='utf-8') as f:
+                f.writelines(f"file '{segment_path}'\n" for segment_path, _, _ in results)
+            subprocess.run(['ffmpeg', '-y', '-loglevel', 'error', '-f', 'concat', '-safe', '0',
+                            '-i', list_path, '-c', 'copy', filepath], check=True)
+
+    n_frames = sum(count for _, count, _ in results)
+    elapsed = time.time() - start_time
+    print(f"애니메이션 저장: {filepath}")
+    print(f"프레임 {n_frames}개, 청크 {len(chunks)}개: 렌더링 {render_seconds:.2f}초, "
+          f"전체 {elapsed:.2f}초 ({n_frames / max(elapsed, 1e-9):.0f} fps), "
+          f"{os.path.getsize(filepath) / 1024 / 1024:.1f}MB")
+    return filepath
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description='밈 수명 주기 애니메이션 생성')
+    parser.add_argument('--meme', type=str, help='애니메이션을 만들 밈 이름')
+    parser.add_argument('--file', type=str, help='특정 전처리 파일명')
+    parser.add_argument('--format', choices=FORMATS, default='gif', help='출력 형식')
+    parser.add_argument('--fps', type=int, default=20, help='초당 프레임 수')
+    parser.add_argument('--step', type=int, help='프레임 간격 (일, 미지정 시 --max-frames에 맞춤)')
+    parser.add_argument('--max-frames', type=int, default=MAX_FRAMES, help='최대 프레임 수')
+    parser.add_argument('--top-n', type=int, default=TOP_SUBREDDITS, help='상위 서브레딧 수')
+    parser.add_argument('--dpi', type=int, default=ANIMATION_DPI, help='프레임 해상도')
+    parser.add_argument('--workers', type=int, default=None, help='렌더링 프로세스 수 (1이면 순차 실행)')
+
+    args = parser.parse_args()
+
+    if args.file:
+        filepath = os.path.join(PROCESSED_DATA_DIR, args.file)
+        if not os.path.exists(filepath):
+            print(f"파일을 찾을 수 없습니다: {args.file}")
+            return
+    else:
+        filepath = find_latest_processed_file(args.meme)
+        if not filepath:
+            print(f"'{args.meme}' 밈의 전처리된 데이터 파일을 찾을 수 없습니다." if args.meme
+                  else "전처리된 데이터 파일을 찾을 수 없습니다.")
+            return
+    meme_name = extract_meme_name_from_processed_filename(os.path.basename(filepath))
+    print(f"애니메이션 대상: {os.path.basename(filepath)}")
+
+    try:
+        apply_style()
+        df = pd.read_csv(filepath, usecols=['created_utc', 'subreddit', 'score', 'num_comments', 'engagement_score'])
+        df['created_utc'] = pd.to_datetime(df['created_utc'])
+        data = prepare_animation(df, meme_name, load_rollup(filepath, df, meme_name),
+                                 args.top_n, args.step, args.max_frames)
+        os.makedirs(FIGURES_DIR, exist_ok=True)
+        output_path = os.path.join(FIGURES_DIR, f'reddit_{meme_name}_lifecycle_animation.{args.format}')
+        export_animation(data, output_path, args.fps, args.workers, args.dpi)
+    except Exception as e:
+        print(f"❌ 애니메이션 생성 중 오류 발생: {e}")
+        import traceback
+        traceback.print_exc()
+
+# 실행 코드
+if __name__ == "__main__":
+    main()
@@ -1,272 +1,515 @@
-import matplotlib.pyplot as plt
-import seaborn as sns
+import matplotlib
+import matplotlib.style
+import io
+from matplotlib.colors import LogNorm
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 import pandas as pd
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 import os
 import sys
 import glob
+import time
 import argparse
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-from config.config import PROCESSED_DATA_DIR, FIGURES_DIR
+from config.config import PROCESSED_DATA_DIR, FIGURES_DIR, RENDER_PROFILES, DEFAULT_RENDER_PROFILE, set_global_font
+from src.analyzers import kernels
+from src.preprocessors.rollup_cube import RollupCube, load_rollup
+from src.visualizers.figure_cache import FigureCache, fingerprint
+from src.visualizers.downsample import downsample_series, log_density
+
+STYLE = 'seaborn-v0_8-darkgrid'
+PALETTE = 'husl'
+
+# 그림 종류별 (파일명 접미사, 저장 메시지)
+PLOT_TYPES = {
+    'lifecycle_curve': ('lifecycle_curve', "생명주기 곡선 저장"),
+    'engagement_analysis': ('engagement_analysis', "참여도 분석 저장"),
+    'subreddit_distribution': ('subreddit_distribution', "서브레딧 분포 저장"),
+    'lifecycle_phases': ('lifecycle_phases', "생명주기 단계 분석 저장"),
+    'dashboard': ('dashboard', "대시보드 저장")
+}
+
+
+def apply_style():
+    """그림 스타일과 한글 글꼴 설정 (메인 프로세스와 렌더링 워커 모두에서 호출)"""
+    import seaborn as sns
+
+    matplotlib.style.use(STYLE)
+    sns.set_palette(PALETTE)
+    set_global_font()
+
+
+def _histogram(values, bins=50):
+    """결측치를 뺀 값의 히스토그램 (Series.hist와 같은 구간)"""
+    counts, edges = np.histogram(values.dropna(), bins=bins)
+    return counts, edges
+
+
+def _draw_histogram(ax, histogram, **kwargs):
+    """미리 계산한 히스토그램을 Series.hist와 같은 모양으로 그림"""
+    counts, edges = histogram
+    ax.hist(edges[:-1], bins=edges, weights=counts, **kwargs)
+    ax.grid(True)
+
+
+# ----------------------------------------------------------------------
+# 그리기 함수: (Figure, 준비된 데이터)만 받아 pyplot 상태 없이 그림
+# ----------------------------------------------------------------------
+
+def draw_lifecycle_curve(fig, data):
+    ax1, ax2 = fig.subplots(2, 1)
+    daily_posts = data['daily_posts']
+    daily_posts_ma = data['daily_posts_ma']
+    
+    # 상단: 일별 게시물 수
+    ax1.plot(daily_posts.index, daily_posts.values, alpha=0.3, label='Daily Posts')
+    ax1.plot(daily_posts_ma.index, daily_posts_ma.values, linewidth=2, label='7-day Moving Average')
+    ax1.set_title(f'{data["title"]} Meme Life Cycle - {data["platform"]}', fontsize=16, fontweight='bold')
+    ax1.set_xlabel('Date')
+    ax1.set_ylabel('number of posts')
+    ax1.legend()
+    ax1.grid(True, alpha=0.3)
+    
+    # 하단: 누적 게시물 수
+    cumulative_posts = data['cumulative_posts']
+    ax2.plot(cumulative_posts.index, cumulative_posts.values, linewidth=2, color='green')
+    ax2.fill_between(cumulative_posts.index, cumulative_posts.values, alpha=0.3, color='green')
+    ax2.set_title('Cumulative Posts', fontsize=14)
+    ax2.set_xlabel('Date')
+    ax2.set_ylabel('Cumulative Posts')
+    ax2.grid(True, alpha=0.3)
+
+
+def draw_engagement_analysis(fig, data):
+    axes = fig.subplots(2, 2)
+    fig.suptitle(f'{data["title"]} Engagement Analysis - {data["platform"]}', fontsize=16, fontweight='bold')
+    
+    # 1. Score 분포
+    ax1 = axes[0, 0]
+    _draw_histogram(ax1, data['score_histogram'], alpha=0.7, color='blue', edgecolor='black')
+    ax1.set_title('Score Distribution')
+    ax1.set_xlabel('Score')
+    ax1.set_ylabel('Frequency')
+    ax1.set_yscale('log')
+    
+    # 2. 댓글 수 분포
+    ax2 = axes[0, 1]
+    _draw_histogram(ax2, data['comments_histogram'], alpha=0.7, color='green', edgecolor='black')
+    ax2.set_title('Comments Distribution')
+    ax2.set_xlabel('Number of Comments')
+    ax2.set_ylabel('Frequency')
+    ax2.set_yscale('log')
+    
+    # 3. 시간대별 평균 Score
+    ax3 = axes[1, 0]
+    data['hourly_score'].plot(kind='bar', ax=ax3, color='orange')
+    ax3.set_title('Average Score by Hour')
+    ax3.set_xlabel('Hour (24h)')
+    ax3.set_ylabel('Average Score')
+    ax3.set_xticklabels(ax3.get_xticklabels(), rotation=0)
+    
+    # 4. 요일별 게시물 수
+    ax4 = axes[1, 1]
+    days_english = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
+    ax4.bar(range(7), data['day_counts'].values, color='purple')
+    ax4.set_xticks(range(7))
+    ax4.set_xticklabels(days_english)
+    ax4.set_title('Posts by Day of Week')
+    ax4.set_xlabel('Day of Week')
+    ax4.set_ylabel('Number of Posts')
+
+
+def draw_subreddit_distribution(fig, data):
+    ax = fig.subplots()
+    top_subreddits = data['top_subreddits']
+    
+    # 막대 그래프
+    bars = ax.bar(range(len(top_subreddits)), top_subreddits.values)
+    ax.set_xticks(range(len(top_subreddits)), top_subreddits.index, rotation=45, ha='right')
+    
+    # 색상 그라데이션
+    colors = matplotlib.colormaps['viridis'](np.linspace(0, 1, len(bars)))
+    for bar, color in zip(bars, colors):
+        bar.set_color(color)
+    
+    ax.set_title(f'{data["title"]} - Top 10 Subreddit Distribution', fontsize=14, fontweight='bold')
+    ax.set_xlabel('Subreddit')
+    ax.set_ylabel('Number of Posts')
+    ax.grid(True, alpha=0.3, axis='y')
+
+
+def draw_lifecycle_phases(fig, data):
+    ax = fig.subplots()
+    recent_data = data['monthly']
+    
+    # 정규화
+    normalized_posts = recent_data['post_count'] / recent_data['post_count'].max()
+    normalized_score = recent_data['avg_score'] / recent_data['avg_score'].max()
+    
+    # 플롯
+    x = range(len(recent_data))
+    ax.plot(x, normalized_posts, 'o-', label='Post Count (Normalized)', linewidth=2, markersize=8)
+    ax.plot(x, normalized_score, 's-', label='Average Score (Normalized)', linewidth=2, markersize=8)
+    
+    # 배경색으로 단계 표시
+    if len(x) > 0:
+        # 초기 단계
+        ax.axvspan(0, len(x)//3, alpha=0.1, color='green', label='Growth Phase')
+        # 정점 단계
+        ax.axvspan(len(x)//3, 2*len(x)//3, alpha=0.1, color='yellow', label='Maturity Phase')
+        # 쇠퇴 단계
+        ax.axvspan(2*len(x)//3, len(x), alpha=0.1, color='red', label='Decline Phase')
+    
+    ax.set_xticks(x[::3])
+    ax.set_xticklabels([str(idx) for idx in recent_data.index[::3]], rotation=45)
+    ax.set_title(f'{data["title"]} Meme Lifecycle Phases (Last 2 Years)', fontsize=14, fontweight='bold')
+    ax.set_xlabel('Year-Month')
+    ax.set_ylabel('Normalized Value')
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+
+
+def draw_dashboard(fig, data):
+    # 제목
+    fig.suptitle(f'{data["title"]} Meme Analysis Dashboard - {data["platform"]}', fontsize=20, fontweight='bold')
+    grid = fig.add_gridspec(4, 3)
+    
+    # 통계 요약 (텍스트)
+    ax_text = fig.add_subplot(grid[0, :])
+    ax_text.axis('off')
+    ax_text.text(0.5, 0.5, data['summary_text'], ha='center', va='center', fontsize=14,
+                bbox=dict(boxstyle="round,pad=0.5", facecolor='lightgray', alpha=0.5))
+    
+    # 그래프들
+    # 1. 월별 추이
+    ax1 = fig.add_subplot(grid[1, :2])
+    data['monthly_posts'].plot(kind='line', ax=ax1, color='blue', linewidth=2)
+    ax1.set_title('Monthly Post Trends')
+    ax1.set_xlabel('Month')
+    ax1.set_ylabel('Number of Posts')
+    ax1.grid(True, alpha=0.3)
+    
+    # 2. Score vs Comments 산점도
+    ax2 = fig.add_subplot(grid[1, 2])
+    if 'density' in data:
+        # 점이 많으면 로그 구간 밀도로 표시
+        if data['density'] is not None:
+            counts, x_edges, y_edges = data['density']
+            mesh = ax2.pcolormesh(x_edges, y_edges, np.ma.masked_equal(counts.T, 0), norm=LogNorm(), cmap='viridis',
+                                  rasterized=True)
+            fig.colorbar(mesh, ax=ax2, label='Posts')
+    else:
+        ax2.scatter(data['score'], data['num_comments'], alpha=0.5, s=20, rasterized=True)
+    ax2.set_xlabel('Score')
+    ax2.set_ylabel('Comments')
+    ax2.set_title('Score vs Comments')
+    ax2.set_xscale('log')
+    ax2.set_yscale('log')
+    ax2.grid(True, alpha=0.3)
+    
+    # 3. 시간대별 분포
+    ax3 = fig.add_subplot(grid[2, :])
+    data['hourly_posts'].plot(kind='bar', ax=ax3, color='green')
+    ax3.set_title('Posts by Hour')
+    ax3.set_xlabel('Hour (24h)')
+    ax3.set_ylabel('Number of Posts')
+    
+    # 4. 상위 서브레딧
+    ax4 = fig.add_subplot(grid[3, :])
+    data['top_subreddits'].plot(kind='barh', ax=ax4, color='purple')
+    ax4.set_title('Top 15 Subreddits')
+    ax4.set_xlabel('Number of Posts')
+
+
+# 그림 종류별 (크기, 그리기 함수)
+DRAWERS = {
+    'lifecycle_curve': ((12, 10), draw_lifecycle_curve),
+    'engagement_analysis': ((14, 10), draw_engagement_analysis),
+    'subreddit_distribution': ((10, 6), draw_subreddit_distribution),
+    'lifecycle_phases': ((12, 6), draw_lifecycle_phases),
+    'dashboard': ((16, 12), draw_dashboard)
+}
+
+
+def profile_settings(profile=DEFAULT_RENDER_PROFILE, max_dpi=None):
+    """렌더 프로파일 설정 (max_dpi로 해상도 상한 지정)"""
+    if profile not in RENDER_PROFILES:
+        raise ValueError(f"알 수 없는 렌더 프로파일: {profile} ({', '.join(RENDER_PROFILES)})")
+    settings = dict(RENDER_PROFILES[profile], profile=profile)
+    if max_dpi is not None:
+        settings['dpi'] = min(settings['dpi'], max_dpi)
+    return settings
+
+
+def save_figure(fig, filepath, settings):
+    """프로파일 설정에 맞춰 그림 저장 (web은 팔레트 PNG로 압축)
+
+    Returns:
+        저장된 파일 크기 (바이트)
+    """
+    savefig_kwargs = {'format': settings['format'], 'dpi': settings['dpi'], 'bbox_inches': settings['bbox_inches']}
+    if not settings.get('colors'):
+        fig.savefig(filepath, **savefig_kwargs)
+        return os.path.getsize(filepath)
+
+    from PIL import Image
+
+    buffer = io.BytesIO()
+    fig.savefig(buffer, **savefig_kwargs)
+    buffer.seek(0)
+    with Image.open(buffer) as image:
+        image.convert('RGB').quantize(colors=settings['colors'], method=Image.Quantize.FASTOCTREE).save(
+            filepath, format='PNG', optimize=True)
+    return os.path.getsize(filepath)
+
+
+def figure_style(kind, profile=DEFAULT_RENDER_PROFILE):
+    """그림 지문에 들어가는 스타일 파라미터 (프로파일이 바뀌면 다시 렌더링)"""
+    return dict(profile_settings(profile), figsize=DRAWERS[kind][0], style=STYLE, palette=PALETTE)
+
+
+def render_figure(kind, data, filepath, profile=DEFAULT_RENDER_PROFILE):
+    """준비된 데이터로 Agg 캔버스에 그림을 그려 저장 (pyplot 전역 상태 미사용)
+
+    Returns:
+        저장된 파일 크기 (바이트)
+    """
+    figsize, draw = DRAWERS[kind]
+    fig = Figure(figsize=figsize)
+    FigureCanvasAgg(fig)
+    draw(fig, data)
+    # 기존 출력과 같게 서브레딧 분포 그림만 tight_layout 없이 저장
+    if kind != 'subreddit_distribution':
+        fig.tight_layout()
+    return save_figure(fig, filepath, profile_settings(profile))
+
+
+def _render_worker(job):
+    """프로세스 풀에서 실행되는 그림 하나 렌더링"""
+    kind, data, filepath, profile = job
+    start_time = time.time()
+    size = render_figure(kind, data, filepath, profile)
+    return kind, filepath, time.time() - start_time, size
+
 
 class MemeVisualizer:
-    def __init__(self):
-        """시각화 클래스 초기화"""
+    def __init__(self, use_cache=True, max_line_points=2000, max_scatter_points=20000,
+                 profile=DEFAULT_RENDER_PROFILE):
+        """시각화 클래스 초기화
+
+        Args:
+            use_cache: 집계 데이터와 스타일이 같은 그림은 다시 렌더링하지 않음
+            max_line_points: 선 그래프 점 수 상한 (넘으면 LTTB로 축약)
+            max_scatter_points: 산점도 점 수 상한 (넘으면 2차원 밀도로 표시)
+            profile: 렌더 프로파일 (draft, web, publication, publication-svg, publication-pdf)
+        """
         self.figures_dir = FIGURES_DIR
         os.makedirs(self.figures_dir, exist_ok=True)
+        self.cache = FigureCache() if use_cache else None
+        self.max_line_points = max_line_points
+        self.max_scatter_points = max_scatter_points
+        self.profile = profile
+        self.extension = profile_settings(profile)['format']
         
         # 스타일 설정
-        plt.style.use('seaborn-v0_8-darkgrid')
-        sns.set_palette("husl")
-        
-    def plot_lifecycle_curve(self, df, meme_name, platform='reddit'):
-        """밈 생명주기 곡선 시각화"""
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 10))
-        
-        # 일별 게시물 수
-        daily_posts = df.groupby('date').size()
-        
-        # 7일 이동평균
-        daily_posts_ma = daily_posts.rolling(window=7, min_periods=1).mean()
-        
-        # 상단: 일별 게시물 수
-        ax1.plot(daily_posts.index, daily_posts.values, alpha=0.3, label='Daily Posts')
-        ax1.plot(daily_posts_ma.index, daily_posts_ma.values, linewidth=2, label='7-day Moving Average')
-        ax1.set_title(f'{meme_name.replace("_", " ").title()} Meme Life Cycle - {platform.upper()}', fontsize=16, fontweight='bold')
-        ax1.set_xlabel('Date')
-        ax1.set_ylabel('number of posts')
-        ax1.legend()
-        ax1.grid(True, alpha=0.3)
-        
-        # 하단: 누적 게시물 수
-        cumulative_posts = daily_posts.cumsum()
-        ax2.plot(cumulative_posts.index, cumulative_posts.values, linewidth=2, color='green')
-        ax2.fill_between(cumulative_posts.index, cumulative_posts.values, alpha=0.3, color='green')
-        ax2.set_title('Cumulative Posts', fontsize=14)
-        ax2.set_xlabel('Date')
-        ax2.set_ylabel('Cumulative Posts')
-        ax2.grid(True, alpha=0.3)
-        
-        plt.tight_layout()
-        
-        # 저장
-        filename = f'{platform}_{meme_name}_lifecycle_curve.png'
-        filepath = os.path.join(self.figures_dir, filename)
-        plt.savefig(filepath, dpi=300, bbox_inches='tight')
-        plt.close()
-        
-        print(f"생명주기 곡선 저장: {filepath}")
-        
-    def plot_engagement_analysis(self, df, meme_name, platform='reddit'):
-        """참여도 분석 시각화"""
-        fig, axes = plt.subplots(2, 2, figsize=(14, 10))
-        fig.suptitle(f'{meme_name.replace("_", " ").title()} Engagement Analysis - {platform.upper()}', fontsize=16, fontweight='bold')
-        
-        # 1. Score 분포
-        ax1 = axes[0, 0]
-        df['score'].hist(bins=50, ax=ax1, alpha=0.7, color='blue', edgecolor='black')
-        ax1.set_title('Score Distribution')
-        ax1.set_xlabel('Score')
-        ax1.set_ylabel('Frequency')
-        ax1.set_yscale('log')
-        
-        # 2. 댓글 수 분포
-        ax2 = axes[0, 1]
-        df['num_comments'].hist(bins=50, ax=ax2, alpha=0.7, color='green', edgecolor='black')
-        ax2.set_title('Comments Distribution')
-        ax2.set_xlabel('Number of Comments')
-        ax2.set_ylabel('Frequency')
-        ax2.set_yscale('log')
-        
-        # 3. 시간대별 평균 Score
-        ax3 = axes[1, 0]
-        hourly_score = df.groupby('hour')['score'].mean()
-        hourly_score.plot(kind='bar', ax=ax3, color='orange')
-        ax3.set_title('Average Score by Hour')
-        ax3.set_xlabel('Hour (24h)')
-        ax3.set_ylabel('Average Score')
-        ax3.set_xticklabels(ax3.get_xticklabels(), rotation=0)
-        
-        # 4. 요일별 게시물 수
-        ax4 = axes[1, 1]
-        days_english = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
-        day_counts = df['day_of_week'].value_counts().sort_index()
-        ax4.bar(range(7), day_counts.values, color='purple')
-        ax4.set_xticks(range(7))
-        ax4.set_xticklabels(days_english)
-        ax4.set_title('Posts by Day of Week')
-        ax4.set_xlabel('Day of Week')
-        ax4.set_ylabel('Number of Posts')
-        
-        plt.tight_layout()
+        apply_style()
+    
+    def _filepath(self, kind, meme_name, platform):
+        return os.path.join(self.figures_dir, f'{platform}_{meme_name}_{PLOT_TYPES[kind][0]}.{self.extension}')
+    
+    def _render(self, kind, data, meme_name, platform):
+        return self.render_jobs([(kind, data, self._filepath(kind, meme_name, platform))], workers=1)[0]
+    
+    # ------------------------------------------------------------------
+    # 데이터 준비: 원본/큐브에서 그림에 필요한 작은 집계만 추림
+    # ------------------------------------------------------------------
+    
+    def prepare_lifecycle_curve(self, df, meme_name, platform='reddit', cube=None):
+        cube = cube or RollupCube.from_posts(meme_name, df)
+        daily_posts = cube.series('day')
+        
+        # 이동평균/누적합은 전체 데이터로 계산한 뒤 그릴 점만 축약
+        return {
+            'title': meme_name.replace("_", " ").title(),
+            'platform': platform.upper(),
+            'daily_posts': downsample_series(daily_posts, self.max_line_points),
+            'daily_posts_ma': downsample_series(daily_posts.rolling(window=7, min_periods=1).mean(), self.max_line_points),
+            'cumulative_posts': downsample_series(daily_posts.cumsum(), self.max_line_points)
+        }
+    
+    def prepare_engagement_analysis(self, df, meme_name, platform='reddit', cube=None):
+        cube = cube or RollupCube.from_posts(meme_name, df)
+        return {
+            'title': meme_name.replace("_", " ").title(),
+            'platform': platform.upper(),
+            'score_histogram': _histogram(df['score']),
+            'comments_histogram': _histogram(df['num_comments']),
+            'hourly_score': cube.by_hour_of_day().set_index('hour')['avg_score'],
+            'day_counts': cube.by_day_of_week().set_index('day_of_week')['post_count'].reindex(range(7), fill_value=0)
+        }
+    
+    def prepare_subreddit_distribution(self, df, meme_name, platform='reddit', cube=None):
+        return {
+            'title': meme_name.replace("_", " ").title(),
+            # 상위 10개 서브레딧
+            'top_subreddits': df['subreddit'].value_counts().head(10)
+        }
+    
+    def prepare_lifecycle_phases(self, df, meme_name, platform='reddit', cube=None):
+        cube = cube or RollupCube.from_posts(meme_name, df)
+        
+        # 월별 집계 (최근 2년 데이터만 사용)
+        recent_data = cube.table('month', start='2023-01-01')
+        if len(recent_data) == 0:
+            return None
+        return {
+            'title': meme_name.replace("_", " ").title(),
+            'monthly': recent_data.set_index(recent_data['period'].dt.to_period('M'))
+        }
+    
+    def prepare_dashboard(self, df, meme_name, platform='reddit', cube=None):
+        cube = cube or RollupCube.from_posts(meme_name, df)
         
-        # 저장
-        filename = f'{platform}_{meme_name}_engagement_analysis.png'
-        filepath = os.path.join(self.figures_dir, filename)
-        plt.savefig(filepath, dpi=300, bbox_inches='tight')
-        plt.close()
+        # 시간 범위
+        date_range = f"{df['created_utc'].min().strftime('%Y-%m-%d')} ~ {df['created_utc'].max().strftime('%Y-%m-%d')}"
+        summary_text = f"""
+        Total Posts: {len(df):,}
+        Total Authors: {df['author'].nunique():,}
+        Average Score: {df['score'].mean():.1f}
+        Average Comments: {df['num_comments'].mean():.1f}
+        Data Period: {date_range}
+        """
+        monthly_posts = cube.series('month')
+        monthly_posts.index = monthly_posts.index.to_period('M')
+        data = {
+            'title': meme_name.replace("_", " ").title(),
+            'platform': platform.upper(),
+            'summary_text': summary_text,
+            'monthly_posts': monthly_posts,
+            'hourly_posts': cube.by_hour_of_day().set_index('hour')['post_count'],
+            'top_subreddits': df['subreddit'].value_counts().head(15)
+        }
+        if len(df) > self.max_scatter_points:
+            data['density'] = log_density(df['score'], df['num_comments'])
+        else:
+            data['score'] = df['score'].to_numpy()
+            data['num_comments'] = df['num_comments'].to_numpy()
+        return data
+    
+    def prepare_all(self, df, meme_name, platform='reddit', cube=None):
+        """모든 그림의 렌더링 작업 [(종류, 데이터, 저장 경로)] (데이터가 부족한 그림은 제외)"""
+        cube = cube or RollupCube.from_posts(meme_name, df)
+        jobs = []
+        for kind in PLOT_TYPES:
+            data = getattr(self, f'prepare_{kind}')(df, meme_name, platform, cube)
+            if data is None:
+                print(f"데이터가 충분하지 않아 {kind} 그림을 건너뜁니다.")
+                continue
+            jobs.append((kind, data, self._filepath(kind, meme_name, platform)))
+        return jobs
+    
+    # ------------------------------------------------------------------
+    # 개별 그림
+    # ------------------------------------------------------------------
+    
+    def plot_lifecycle_curve(self, df, meme_name, platform='reddit', cube=None):
+        """밈 생명주기 곡선 시각화 (cube: 롤업 큐브, 없으면 df로 생성)"""
+        data = self.prepare_lifecycle_curve(df, meme_name, platform, cube)
+        return self._render('lifecycle_curve', data, meme_name, platform)
         
-        print(f"참여도 분석 저장: {filepath}")
+    def plot_engagement_analysis(self, df, meme_name, platform='reddit', cube=None):
+        """참여도 분석 시각화 (분포는 df, 시간대/요일 집계는 롤업 큐브 사용)"""
+        data = self.prepare_engagement_analysis(df, meme_name, platform, cube)
+        return self._render('engagement_analysis', data, meme_name, platform)
         
     def plot_subreddit_distribution(self, df, meme_name):
         """서브레딧별 분포 시각화"""
-        plt.figure(figsize=(10, 6))
-        
-        # 상위 10개 서브레딧
-        top_subreddits = df['subreddit'].value_counts().head(10)
-        
-        # 막대 그래프
-        bars = plt.bar(range(len(top_subreddits)), top_subreddits.values)
-        plt.xticks(range(len(top_subreddits)), top_subreddits.index, rotation=45, ha='right')
-        
-        # 색상 그라데이션
-        colors = plt.cm.viridis(np.linspace(0, 1, len(bars)))
-        for bar, color in zip(bars, colors):
-            bar.set_color(color)
-        
-        plt.title(f'{meme_name.replace("_", " ").title()} - Top 10 Subreddit Distribution', fontsize=14, fontweight='bold')
-        plt.xlabel('Subreddit')
-        plt.ylabel('Number of Posts')
-        plt.grid(True, alpha=0.3, axis='y')
-        
-        # 저장
-        filename = f'reddit_{meme_name}_subreddit_distribution.png'
-        filepath = os.path.join(self.figures_dir, filename)
-        plt.savefig(filepath, dpi=300, bbox_inches='tight')
-        plt.close()
-        
-        print(f"서브레딧 분포 저장: {filepath}")
+        data = self.prepare_subreddit_distribution(df, meme_name)
+        return self._render('subreddit_distribution', data, meme_name, 'reddit')
         
-    def plot_lifecycle_phases(self, df, meme_name, platform='reddit'):
+    def plot_lifecycle_phases(self, df, meme_name, platform='reddit', cube=None):
         """밈 생명주기 단계 분석"""
-        # 월별 집계
-        df['year_month'] = df['created_utc'].dt.to_period('M')
-        monthly_stats = df.groupby('year_month').agg({
-            'id': 'count',
-            'score': 'mean',
-            'num_comments': 'mean'
-        }).rename(columns={'id': 'post_count'})
-        
-        # 최근 2년 데이터만 사용
-        recent_data = monthly_stats[monthly_stats.index >= '2023-01']
-        
-        if len(recent_data) > 0:
-            fig, ax = plt.subplots(figsize=(12, 6))
-            
-            # 정규화
-            normalized_posts = recent_data['post_count'] / recent_data['post_count'].max()
-            normalized_score = recent_data['score'] / recent_data['score'].max()
-            
-            # 플롯
-            x = range(len(recent_data))
-            ax.plot(x, normalized_posts, 'o-', label='Post Count (Normalized)', linewidth=2, markersize=8)
-            ax.plot(x, normalized_score, 's-', label='Average Score (Normalized)', linewidth=2, markersize=8)
-            
-            # 배경색으로 단계 표시
-            if len(x) > 0:
-                # 초기 단계
-                ax.axvspan(0, len(x)//3, alpha=0.1, color='green', label='Growth Phase')
-                # 정점 단계
-                ax.axvspan(len(x)//3, 2*len(x)//3, alpha=0.1, color='yellow', label='Maturity Phase')
-                # 쇠퇴 단계
-                ax.axvspan(2*len(x)//3, len(x), alpha=0.1, color='red', label='Decline Phase')
-            
-            ax.set_xticks(x[::3])
-            ax.set_xticklabels([str(idx) for idx in recent_data.index[::3]], rotation=45)
-            ax.set_title(f'{meme_name.replace("_", " ").title()} Meme Lifecycle Phases (Last 2 Years)', fontsize=14, fontweight='bold')
-            ax.set_xlabel('Year-Month')
-            ax.set_ylabel('Normalized Value')
-            ax.legend()
-            ax.grid(True, alpha=0.3)
-            
-            plt.tight_layout()
-            
-            # 저장
-            filename = f'{platform}_{meme_name}_lifecycle_phases.png'
-            filepath = os.path.join(self.figures_dir, filename)
-            plt.savefig(filepath, dpi=300, bbox_inches='tight')
-            plt.close()
-            
-            print(f"생명주기 단계 분석 저장: {filepath}")
-        else:
+        data = self.prepare_lifecycle_phases(df, meme_name, platform, cube)
+        if data is None:
             print("최근 데이터가 충분하지 않아 생명주기 단계 분석을 건너뜁니다.")
+            return None
+        return self._render('lifecycle_phases', data, meme_name, platform)
     
-    def create_summary_dashboard(self, df, meme_name, platform='reddit'):
+    def create_summary_dashboard(self, df, meme_name, platform='reddit', cube=None):
         """종합 대시보드 생성"""
-        # 기본 통계
-        total_posts = len(df)
-        total_authors = df['author'].nunique()
-        avg_score = df['score'].mean()
-        avg_comments = df['num_comments'].mean()
-        
-        # 시간 범위
-        date_range = f"{df['created_utc'].min().strftime('%Y-%m-%d')} ~ {df['created_utc'].max().strftime('%Y-%m-%d')}"
-        
-        # 대시보드 생성
-        fig = plt.figure(figsize=(16, 12))
-        
-        # 제목
-        fig.suptitle(f'{meme_name.replace("_", " ").title()} Meme Analysis Dashboard - {platform.upper()}', fontsize=20, fontweight='bold')
-        
-        # 통계 요약 (텍스트)
-        ax_text = plt.subplot2grid((4, 3), (0, 0), colspan=3)
-        ax_text.axis('off')
-        summary_text = f"""
-        Total Posts: {total_posts:,}
-        Total Authors: {total_authors:,}
-        Average Score: {avg_score:.1f}
-        Average Comments: {avg_comments:.1f}
-        Data Period: {date_range}
+        data = self.prepare_dashboard(df, meme_name, platform, cube)
+        return self._render('dashboard', data, meme_name, platform)
+    
+    # ------------------------------------------------------------------
+    # 병렬 렌더링
+    # ------------------------------------------------------------------
+    
+    def render_jobs(self, jobs, workers=None):
+        """렌더링 작업을 프로세스 풀에 분배 (workers=1이면 현재 프로세스에서 순차 실행)
+
+        캐시를 쓰면 지문이 매니페스트와 같은 그림은 건너뛰고 기존 파일 경로를 돌려준다.
+
+        Returns:
+            저장된 파일 경로 리스트
         """
-        ax_text.text(0.5, 0.5, summary_text, ha='center', va='center', fontsize=14,
-                    bbox=dict(boxstyle="round,pad=0.5", facecolor='lightgray', alpha=0.5))
-        
-        # 그래프들
-        # 1. 월별 추이
-        ax1 = plt.subplot2grid((4, 3), (1, 0), colspan=2)
-        monthly_posts = df.groupby(df['created_utc'].dt.to_period('M')).size()
-        monthly_posts.plot(kind='line', ax=ax1, color='blue', linewidth=2)
-        ax1.set_title('Monthly Post Trends')
-        ax1.set_xlabel('Month')
-        ax1.set_ylabel('Number of Posts')
-        ax1.grid(True, alpha=0.3)
-        
-        # 2. Score vs Comments 산점도
-        ax2 = plt.subplot2grid((4, 3), (1, 2))
-        ax2.scatter(df['score'], df['num_comments'], alpha=0.5, s=20)
-        ax2.set_xlabel('Score')
-        ax2.set_ylabel('Comments')
-        ax2.set_title('Score vs Comments')
-        ax2.set_xscale('log')
-        ax2.set_yscale('log')
-        ax2.grid(True, alpha=0.3)
-        
-        # 3. 시간대별 분포
-        ax3 = plt.subplot2grid((4, 3), (2, 0), colspan=3)
-        df.groupby('hour').size().plot(kind='bar', ax=ax3, color='green')
-        ax3.set_title('Posts by Hour')
-        ax3.set_xlabel('Hour (24h)')
-        ax3.set_ylabel('Number of Posts')
-        
-        # 4. 상위 서브레딧
-        ax4 = plt.subplot2grid((4, 3), (3, 0), colspan=3)
-        top_subs = df['subreddit'].value_counts().head(15)
-        top_subs.plot(kind='barh', ax=ax4, color='purple')
-        ax4.set_title('Top 15 Subreddits')
-        ax4.set_xlabel('Number of Posts')
-        
-        plt.tight_layout()
-        
-        # 저장
-        filename = f'{platform}_{meme_name}_dashboard.png'
-        filepath = os.path.join(self.figures_dir, filename)
-        plt.savefig(filepath, dpi=300, bbox_inches='tight')
-        plt.close()
-        
-        print(f"대시보드 저장: {filepath}")
+        start_time = time.time()
+        
+        # 지문이 같은 그림은 기존 파일 재사용
+        fingerprints = {}
+        pending = []
+        for kind, data, filepath in jobs:
+            if self.cache is not None:
+                fingerprints[filepath] = fingerprint(kind, data, figure_style(kind, self.profile))
+                if self.cache.lookup(filepath, fingerprints[filepath]):
+                    print(f"{PLOT_TYPES[kind][1]} (변경 없음, 기존 파일 사용): {filepath}")
+                    continue
+            pending.append((kind, data, filepath, self.profile))
+        
+        if workers == 1 or len(pending) <= 1:
+            results = [_render_worker(job) for job in pending]
+        else:
+            workers = min(workers or os.cpu_count() or 1, len(pending))
+            with ProcessPoolExecutor(max_workers=workers, mp_context=kernels.pool_context(),
+                                     initializer=apply_style) as executor:
+                results = list(executor.map(_render_worker, pending))
+        
+        for kind, filepath, seconds, size in results:
+            print(f"{PLOT_TYPES[kind][1]}: {filepath} ({seconds:.2f}초, {size / 1024:.0f}KB)")
+            if self.cache is not None:
+                self.cache.record(filepath, fingerprints[filepath], seconds)
+        
+        if self.cache is not None:
+            self.cache.save()
+        if len(jobs) > 1:
+            total_size = sum(size for _, _, _, size in results)
+            print(f"그림 {len(results)}개 렌더링 ({self.profile}): {time.time() - start_time:.2f}초, "
+                  f"{total_size / 1024 / 1024:.1f}MB")
+            if self.cache is not None:
+                self.cache.report()
+        return [filepath for _, _, filepath in jobs]
+    
+    def render_all(self, df, meme_name, platform='reddit', cube=None, workers=None):
+        """밈 하나의 모든 그림을 병렬 렌더링"""
+        return self.render_jobs(self.prepare_all(df, meme_name, platform, cube), workers)
+    
+    def render_memes(self, files, workers=None):
+        """여러 밈의 모든 그림을 하나의 프로세스 풀에서 렌더링
+
+        Args:
+            files: {밈 이름: 전처리 파일 경로}
+        """
+        jobs = []
+        for meme_name, filepath in files.items():
+            df = pd.read_csv(filepath)
+            df['created_utc'] = pd.to_datetime(df['created_utc'])
+            df['date'] = pd.to_datetime(df['date'])
+            jobs.extend(self.prepare_all(df, meme_name, cube=load_rollup(filepath, df, meme_name)))
+        return self.render_jobs(jobs, workers)
 
 def find_latest_processed_file(meme_name=None):
     """가장 최근 전처리된 파일 찾기"""
@@ -310,9 +553,27 @@ def main():
     parser = argparse.ArgumentParser(description='밈 시각화 생성')
     parser.add_argument('--meme', type=str, help='시각화할 밈 이름')
     parser.add_argument('--file', type=str, help='시각화할 특정 파일명')
+    parser.add_argument('--all', action='store_true', help='전처리된 모든 밈 시각화')
+    parser.add_argument('--workers', type=int, default=None, help='렌더링 프로세스 수 (1이면 순차 실행)')
+    parser.add_argument('--no-cache', action='store_true', help='그림 캐시를 무시하고 모두 다시 렌더링')
+    parser.add_argument('--max-line-points', type=int, default=2000, help='선 그래프 점 수 상한 (넘으면 LTTB 축약)')
+    parser.add_argument('--max-scatter-points', type=int, default=20000, help='산점도 점 수 상한 (넘으면 밀도 표시)')
+    parser.add_argument('--profile', choices=list(RENDER_PROFILES), default=DEFAULT_RENDER_PROFILE,
+                        help='렌더 프로파일 (draft: 빠른 검토, web: 압축 PNG, publication: 300dpi PNG/SVG/PDF)')
     
     args = parser.parse_args()
     
+    # 모든 밈 일괄 렌더링 (밈과 그림 모두 하나의 프로세스 풀에 분배)
+    if args.all:
+        from src.analyzers.batch_analyzer import find_latest_processed_files
+        files = find_latest_processed_files()
+        if not files:
+            print("전처리된 데이터 파일을 찾을 수 없습니다.")
+            return
+        MemeVisualizer(not args.no_cache, args.max_line_points, args.max_scatter_points, args.profile).render_memes(files, workers=args.workers)
+        print(f"결과는 {FIGURES_DIR}에 저장되었습니다.")
+        return
+    
     # 처리할 파일 찾기
     if args.file:
         # 특정 파일 지정
@@ -344,15 +605,14 @@ def main():
         df['created_utc'] = pd.to_datetime(df['created_utc'])
         df['date'] = pd.to_datetime(df['date'])
         
+        # 전처리 시 저장된 롤업 큐브 (없으면 만들어 저장)
+        cube = load_rollup(filepath, df, meme_name)
+        
         # 시각화 생성
-        visualizer = MemeVisualizer()
+        visualizer = MemeVisualizer(not args.no_cache, args.max_line_points, args.max_scatter_points, args.profile)
         
         print(f"\n=== {meme_name.replace('_', ' ').title()} 밈 시각화 생성 ===")
-        visualizer.plot_lifecycle_curve(df, meme_name)
-        visualizer.plot_engagement_analysis(df, meme_name)
-        visualizer.plot_subreddit_distribution(df, meme_name)
-        visualizer.plot_lifecycle_phases(df, meme_name)
-        visualizer.create_summary_dashboard(df, meme_name)
+        visualizer.render_all(df, meme_name, cube=cube, workers=args.workers)
         
         print(f"\n✅ '{meme_name}' 밈의 모든 시각화 완료!")
         print(f"결과는 {FIGURES_DIR}에 저장되었습니다.")
@@ -0,0 +1,36 @@
+"""테스트 공용 게시물 데이터 생성 도우미"""
+
+import numpy as np
+import pandas as pd
+
+START = pd.Timestamp('2024-01-01')
+SUBREDDITS = ['memes', 'kpop', 'videos', 'funny']
+
+
+def make_posts(n_posts=2000, n_days=120, seed=0, peak_day=None, width=12.0, n_authors=300,
+               subreddits=SUBREDDITS, score_mean=30, comments_mean=6, id_prefix='p'):
+    """전처리된 게시물 형태의 DataFrame (작성 시각 순서가 섞여 있음)
+
+    Args:
+        n_days: 게시 기간 (2024-01-01부터)
+        peak_day: None이면 기간 전체에 고르게, 지정하면 이 날을 중심으로 한 번 유행
+        width: 유행 곡선의 표준편차 (일)
+        id_prefix: 게시물 id 앞에 붙일 문자열 (여러 밈을 합칠 때 id가 겹치지 않도록)
+    """
+    rng = np.random.default_rng(seed)
+    if peak_day is None:
+        seconds = rng.integers(0, n_days * 86400, n_posts)
+    else:
+        seconds = (rng.normal(peak_day, width, n_posts) * 86400).clip(0, n_days * 86400 - 1).astype(np.int64)
+    created = START + pd.to_timedelta(seconds, unit='s')
+    df = pd.DataFrame({
+        'id': [f'{id_prefix}{i}' for i in range(n_posts)],
+        'created_utc': created,
+        'date': created.normalize(),
+        'score': rng.poisson(score_mean, n_posts),
+        'num_comments': rng.poisson(comments_mean, n_posts),
+        'author': rng.integers(0, n_authors, n_posts).astype(str),
+        'subreddit': rng.choice(subreddits, n_posts),
+    })
+    df['engagement_score'] = df['score'] + df['num_comments'] * 2
+    return df
@@ -0,0 +1,66 @@
+import contextlib
+import io
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from conftest import make_posts
+from src.analyzers import batch_analyzer
+from src.analyzers.batch_analyzer import BatchLifecycleAnalyzer, build_daily_metrics_grouped
+from src.analyzers.lifecycle_analyzer import LifecycleAnalyzer, build_daily_metrics, diffusion_metrics
+from src.analyzers.shape_clustering import cluster_daily_metrics
+
+
+def make_corpus(n_memes=4, seed=0):
+    """load_processed_corpus 형태의 여러 밈 코퍼스 (밈마다 유행 시점과 길이가 다름)"""
+    rng = np.random.default_rng(seed)
+    frames = [
+        make_posts(int(rng.integers(800, 2000)), n_days=200, seed=seed * n_memes + i, peak_day=16 * (i + 1),
+                   width=8 * np.sqrt(2 + i), n_authors=400, id_prefix=f'm{i}_').assign(meme=f'meme{i}')
+        for i in range(n_memes)
+    ]
+    corpus = pd.concat(frames, ignore_index=True)
+    corpus['meme'] = corpus['meme'].astype('category')
+    return corpus
+
+
+def test_grouped_daily_metrics_match_per_meme():
+    corpus = make_corpus()
+    daily = build_daily_metrics_grouped(corpus)
+    for meme, group in corpus.groupby('meme', observed=True):
+        expected = build_daily_metrics(group.drop(columns='meme'))
+        actual = daily[daily['meme'] == meme].drop(columns='meme').reset_index(drop=True)
+        pd.testing.assert_frame_equal(actual[expected.columns], expected, check_dtype=False)
+
+
+def test_batch_results_match_single_meme_analysis(monkeypatch, tmp_path):
+    model_path = str(tmp_path / 'shape_clusters.npz')
+    monkeypatch.setattr(batch_analyzer, 'cluster_daily_metrics',
+                        lambda daily, n_clusters: cluster_daily_metrics(daily, n_clusters, model_path=model_path))
+    corpus = make_corpus()
+    with contextlib.redirect_stdout(io.StringIO()):
+        results, _ = BatchLifecycleAnalyzer(workers=2, n_clusters=2).analyze(corpus)
+
+    assert list(results['meme']) == list(corpus['meme'].cat.categories)
+    assert results['shape_cluster'].notna().all()
+    assert os.path.exists(model_path)
+
+    analyzer = LifecycleAnalyzer()
+    diffusion = diffusion_metrics(corpus)
+    for row in results.itertuples():
+        df = corpus[corpus['meme'] == row.meme].drop(columns='meme').reset_index(drop=True)
+        with contextlib.redirect_stdout(io.StringIO()):
+            daily_metrics = build_daily_metrics(df)
+            metrics = analyzer.calculate_lifecycle_metrics(df, daily_metrics)
+            curve = analyzer.fit_lifecycle_curve(daily_metrics)
+        assert row.total_posts == metrics['total_posts']
+        assert row.days_to_peak == metrics['days_to_peak']
+        assert row.viral_concentration == pytest.approx(metrics['viral_concentration'])
+        assert row.independent_introductions == diffusion[row.meme]['independent_introductions']
+        assert row.curve_model == curve['model']
+        assert row.peak_day == pytest.approx(curve['peak_day'])
@@ -0,0 +1,38 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from conftest import make_posts
+from src.analyzers.bootstrap import LifecycleBootstrap
+from src.analyzers.lifecycle_analyzer import LifecycleAnalyzer
+
+
+def test_intervals_contain_point_estimates():
+    df = make_posts(3000, peak_day=40, n_authors=500)
+    analyzer = LifecycleAnalyzer()
+    daily_metrics, _ = analyzer.identify_lifecycle_phases(df)
+    curve_fit = analyzer.fit_lifecycle_curve(daily_metrics, models=['gaussian', 'lognormal'])
+    metrics = analyzer.calculate_lifecycle_metrics(df, daily_metrics)
+
+    # 보고서에서만 반올림하므로 곡선 지표는 재표본 값과 같은 실수
+    assert isinstance(curve_fit['peak_day'], float)
+    assert isinstance(curve_fit['spread_days'], float)
+
+    intervals = LifecycleBootstrap(n_resamples=100, workers=1).confidence_intervals(
+        df, daily_metrics, metrics, curve_fit)
+    assert {'r_squared', 'peak_day', 'spread_days', 'avg_score'} <= set(intervals)
+    for name, ci in intervals.items():
+        assert ci['n'] > 0, name
+        assert ci['low'] <= ci['estimate'] <= ci['high'], name
+    assert intervals['r_squared']['high'] == curve_fit['r_squared']
+
+
+def test_bias_corrected_interval_matches_percentile_when_centred():
+    bootstrap = LifecycleBootstrap(confidence=0.9)
+    values = np.random.default_rng(0).normal(0, 1, 20001)
+    ci = bootstrap.interval(values, float(np.median(values)))
+    np.testing.assert_allclose([ci['low'], ci['high']], np.quantile(values, [0.05, 0.95]), atol=1e-3)
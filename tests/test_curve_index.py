@@ -0,0 +1,78 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.analyzers.curve_index import CurveIndex, FULL, embed
+
+
+def make_counts(seed, n_days=200):
+    """활동 시작 후 감쇠하는 일별 게시물 수"""
+    rng = np.random.default_rng(seed)
+    peak = rng.integers(5, 60)
+    days = np.arange(n_days)
+    curve = 50 * np.exp(-((days - peak) / rng.uniform(5, 40)) ** 2)
+    return pd.Series(rng.poisson(curve + 0.5), index=pd.date_range('2024-01-01', periods=n_days, freq='D'))
+
+
+def neighbours(index, query, horizon):
+    return [(row['meme'], pytest.approx(row['distance'])) for row in index.query(query, k=5, horizon=horizon)]
+
+
+def test_readd_replaces_without_full_rebuild(tmp_path):
+    index = CurveIndex(rebuild_ratio=0.5)
+    for i in range(40):
+        index.add(f'meme{i}', make_counts(i))
+
+    rebuilds = []
+    original_rebuild = index._rebuild
+    index._rebuild = lambda horizon: rebuilds.append(horizon) or original_rebuild(horizon)
+    for i in range(3):
+        index.add(f'meme{i}', make_counts(100 + i))
+    index.remove('meme5')
+    assert rebuilds == []
+
+    expected = CurveIndex()
+    for i in range(40):
+        if i != 5:
+            expected.add(f'meme{i}', make_counts(100 + i if i < 3 else i))
+    assert len(index) == len(expected) == 39
+
+    for horizon in (30, FULL):
+        for seed in range(3):
+            query = make_counts(200 + seed)
+            assert neighbours(index, query, horizon) == neighbours(expected, query, horizon)
+
+    filepath = index.save(str(tmp_path / 'curve_index.npz'))
+    loaded = CurveIndex.load(filepath)
+    query = make_counts(300)
+    assert neighbours(loaded, query, FULL) == neighbours(expected, query, FULL)
+    assert 'meme5' not in loaded.names[FULL]
+
+
+def test_adds_are_buffered_until_the_tree_is_rebuilt():
+    index = CurveIndex(horizons=(30,), rebuild_ratio=0.5)
+    rebuilds = []
+    original_rebuild = index._rebuild
+    index._rebuild = lambda horizon: rebuilds.append(horizon) or original_rebuild(horizon)
+
+    for i in range(200):
+        before, n_rebuilds = index.vectors[FULL], len(rebuilds)
+        index.add(f'meme{i}', make_counts(i))
+        # 재구성 사이에는 트리 행렬을 다시 쌓지 않음
+        if len(rebuilds) == n_rebuilds:
+            assert index.vectors[FULL] is before
+    # 버퍼 허용량이 트리 크기에 비례하므로 재구성 횟수는 로그 수준
+    assert rebuilds.count(FULL) <= 12
+    assert len(index.vectors[FULL]) + len(index.buffers[FULL]) == len(index.names[FULL]) == 200
+
+    vectors = np.vstack([embed(make_counts(i), FULL) for i in range(200)])
+    for seed in range(300, 305):
+        query = embed(make_counts(seed), FULL)
+        distances = np.sqrt(((vectors - query) ** 2).sum(axis=1))
+        expected = [(f'meme{row}', pytest.approx(distances[row])) for row in np.argsort(distances)[:5]]
+        assert index.query_vector(query, FULL, k=5) == expected
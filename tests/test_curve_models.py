@@ -0,0 +1,80 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.analyzers.curve_models import MODELS, fit_model, fit_models, information_criteria
+
+X = np.arange(120, dtype=np.float64)
+# 모델별 실제 파라미터 (피크가 관측 구간 안에 있음)
+TRUE_PARAMS = {
+    'gaussian': [80.0, 40.0, 9.0],
+    'lognormal': [60.0, np.log(31.0), 0.4],
+    'gamma': [70.0, 6.0, 5.0],
+    'bass': [3000.0, 0.002, 0.15],
+    'sir': [90.0, 50.0, 8.0],
+    'gaussian_mixture_2': [80.0, 30.0, 6.0, 45.0, 85.0, 10.0],
+    'gaussian_mixture_3': [80.0, 20.0, 5.0, 50.0, 55.0, 6.0, 30.0, 95.0, 8.0],
+}
+
+
+def numerical_jacobian(func, x, params, step=1e-6):
+    params = np.asarray(params, dtype=np.float64)
+    columns = []
+    for i in range(len(params)):
+        h = step * max(abs(params[i]), 1.0)
+        upper, lower = params.copy(), params.copy()
+        upper[i] += h
+        lower[i] -= h
+        columns.append((func(x, *upper) - func(x, *lower)) / (2 * h))
+    return np.column_stack(columns)
+
+
+@pytest.mark.parametrize('name', list(MODELS))
+def test_analytic_jacobian_matches_finite_differences(name):
+    model = MODELS[name]
+    params = TRUE_PARAMS[name]
+    expected = numerical_jacobian(model.func, X, params)
+    actual = model.jac(X, *params)
+    assert actual.shape == (len(X), model.n_params)
+    np.testing.assert_allclose(actual, expected, rtol=1e-4, atol=1e-6 * np.abs(expected).max())
+
+
+@pytest.mark.parametrize('name', ['gaussian', 'lognormal', 'gamma', 'bass', 'sir'])
+def test_fit_recovers_parameters_and_peak(name):
+    model = MODELS[name]
+    y = model.func(X, *TRUE_PARAMS[name])
+    fit = fit_model(name, X, y)
+    assert 'error' not in fit
+    assert fit['r_squared'] > 0.999
+    np.testing.assert_allclose(fit['parameters'], TRUE_PARAMS[name], rtol=1e-3)
+    # 피크 시점은 곡선의 최댓값 위치
+    fine = np.linspace(0, X[-1], 12001)
+    assert fit['peak_day'] == pytest.approx(fine[np.argmax(model.func(fine, *fit['parameters']))], abs=0.05)
+
+
+def test_selection_prefers_mixture_for_two_waves_and_respects_criterion():
+    rng = np.random.default_rng(0)
+    y = rng.poisson(MODELS['gaussian_mixture_2'].func(X, *TRUE_PARAMS['gaussian_mixture_2'])).astype(np.float64)
+    best, candidates = fit_models(X, y, models=['gaussian', 'sir', 'gaussian_mixture_2'])
+    assert best['model'] == 'gaussian_mixture_2'
+    assert {c['model'] for c in candidates} == {'gaussian', 'sir', 'gaussian_mixture_2'}
+
+    for criterion in ('aic', 'bic'):
+        best, candidates = fit_models(X, y, criterion=criterion)
+        assert best[criterion] == min(c[criterion] for c in candidates if 'error' not in c)
+
+
+def test_models_with_too_few_points_are_skipped():
+    x = np.arange(5, dtype=np.float64)
+    _, candidates = fit_models(x, np.array([1.0, 3, 5, 3, 1]))
+    assert {c['model'] for c in candidates} == {'gaussian', 'lognormal', 'gamma', 'bass', 'sir'}
+
+
+def test_bic_penalizes_parameters_more_than_aic():
+    aic_small, bic_small = information_criteria(100.0, 120, 3)
+    aic_large, bic_large = information_criteria(100.0, 120, 6)
+    assert bic_large - bic_small > aic_large - aic_small > 0
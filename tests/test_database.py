@@ -0,0 +1,41 @@
+import os
+import sqlite3
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src import database
+from src.database import TextCache
+
+
+def test_text_cache_roundtrip(tmp_path):
+    cache = TextCache('test', db_path=str(tmp_path / 'cache.sqlite'))
+    values = {TextCache.hash_text(f'text {i}'): {'score': i} for i in range(1000)}
+    cache.set_many(values)
+    assert cache.get_many(values) == values
+    assert cache.size() == 1000
+    assert TextCache('other', db_path=str(tmp_path / 'cache.sqlite')).size() == 0
+
+
+def test_text_cache_closes_connections(tmp_path, monkeypatch):
+    opened = []
+    original_connect = sqlite3.connect
+
+    class TrackedConnection(sqlite3.Connection):
+        def close(self):
+            self.closed = True
+            super().close()
+
+    def connect(*args, **kwargs):
+        conn = original_connect(*args, factory=TrackedConnection, **kwargs)
+        conn.closed = False
+        opened.append(conn)
+        return conn
+
+    monkeypatch.setattr(database.sqlite3, 'connect', connect)
+    cache = TextCache('test', db_path=str(tmp_path / 'cache.sqlite'))
+    cache.set_many({'a': 1})
+    cache.get_many(['a'])
+    cache.size()
+    assert len(opened) == 4
+    assert all(conn.closed for conn in opened)
@@ -0,0 +1,104 @@
+import contextlib
+import io
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.analyzers.curve_models import MODELS
+from src.analyzers.forecaster import LifecycleForecaster, curve_milestones, forecast_all
+
+START = pd.Timestamp('2024-03-01')
+
+
+def make_daily_metrics(n_days, peak=40.0, width=10.0, height=120.0, seed=0):
+    """가우시안 유행 곡선에서 뽑은 일별 게시물 수 (daily_metrics 형태)"""
+    rng = np.random.default_rng(seed)
+    x = np.arange(n_days, dtype=np.float64)
+    counts = rng.poisson(MODELS['gaussian'].func(x, height, peak, width) + 1)
+    return pd.DataFrame({'date': START + pd.to_timedelta(x, unit='D'), 'post_count': counts})
+
+
+def day_of(date):
+    return (pd.Timestamp(date) - START).days
+
+
+def test_curve_milestones_match_analytic_gaussian():
+    grid = np.arange(0, 400, 0.01)
+    parameters = np.array([[100.0, 50.0, 8.0], [30.0, 120.0, 20.0]])
+    milestones = curve_milestones('gaussian', parameters, grid)
+
+    # 가우시안이 피크의 r배가 되는 시점은 b + c * sqrt(-2 ln r)
+    np.testing.assert_allclose(milestones['peak_day'], parameters[:, 1], atol=0.01)
+    np.testing.assert_allclose(milestones['peak_height'], parameters[:, 0], rtol=1e-6)
+    np.testing.assert_allclose(milestones['decline_day'],
+                               parameters[:, 1] + parameters[:, 2] * np.sqrt(2 * np.log(2)), atol=0.02)
+    np.testing.assert_allclose(milestones['end_day'],
+                               parameters[:, 1] + parameters[:, 2] * np.sqrt(2 * np.log(20)), atol=0.02)
+
+
+def test_curve_milestones_missing_when_curve_does_not_decline():
+    grid = np.arange(0, 60, dtype=np.float64)
+    milestones = curve_milestones('gaussian', np.array([[100.0, 55.0, 10.0]]), grid)
+    assert milestones['peak_day'][0] == 55
+    assert np.isnan(milestones['decline_day'][0]) and np.isnan(milestones['end_day'][0])
+
+
+@pytest.mark.parametrize('n_days, status', [(90, 'past_peak'), (32, 'rising')])
+def test_forecast_interval_contains_true_peak(tmp_path, n_days, status):
+    forecaster = LifecycleForecaster(state_path=str(tmp_path / 'state.json'), latency_target=10)
+    result = forecaster.forecast('meme', make_daily_metrics(n_days))
+
+    assert result['status'] == status
+    assert result['fit_mode'] == 'full'
+    assert day_of(result['peak_date_low']) <= 40 <= day_of(result['peak_date_high'])
+    assert result['peak_height_low'] <= result['peak_height'] <= result['peak_height_high']
+    assert day_of(result['peak_date']) < day_of(result['decline_date']) < day_of(result['end_date'])
+    assert result['remaining_days'] == day_of(result['end_date']) - (n_days - 1)
+
+
+def test_forecast_warm_starts_from_saved_state(tmp_path):
+    state_path = str(tmp_path / 'models' / 'state.json')
+    forecaster = LifecycleForecaster(state_path=state_path, reselect_days=7)
+    first = forecaster.forecast('meme', make_daily_metrics(60))
+    forecaster.save_state()
+
+    # 새 프로세스처럼 저장된 상태만으로 다시 시작
+    restored = LifecycleForecaster(state_path=state_path, reselect_days=7)
+    assert restored.state == forecaster.state
+    second = restored.forecast('meme', make_daily_metrics(63))
+    assert second['fit_mode'] == 'warm'
+    assert second['model'] == first['model']
+    assert restored.state['meme']['selected_at'] == 60
+    assert restored.state['meme']['fitted_days'] == 63
+
+    # reselect_days만큼 데이터가 늘면 전체 모델 선택으로 돌아감
+    third = restored.forecast('meme', make_daily_metrics(67))
+    assert third['fit_mode'] == 'full'
+    assert restored.state['meme']['selected_at'] == 67
+
+
+def test_forecast_skips_short_series(tmp_path):
+    forecaster = LifecycleForecaster(state_path=str(tmp_path / 'state.json'))
+    assert forecaster.forecast('meme', make_daily_metrics(10)) is None
+    assert 'meme' not in forecaster.state
+
+
+def test_forecast_all_parallel_matches_sequential(tmp_path):
+    daily_by_meme = {f'meme{i}': make_daily_metrics(50 + 10 * i, peak=30 + 5 * i, seed=i) for i in range(4)}
+    daily_by_meme['short'] = make_daily_metrics(10)
+    results = {}
+    for workers in (1, 2):
+        state_path = str(tmp_path / f'state_{workers}.json')
+        forecaster = LifecycleForecaster(state_path=state_path, latency_target=10)
+        with contextlib.redirect_stdout(io.StringIO()):
+            results[workers] = forecast_all(forecaster, daily_by_meme, workers=workers)
+        assert set(LifecycleForecaster(state_path=state_path).state) == set(daily_by_meme) - {'short'}
+
+    columns = [c for c in results[1].columns if c not in ('latency_ms', 'within_target')]
+    pd.testing.assert_frame_equal(results[1][columns], results[2][columns])
+    assert list(results[1]['meme']) == [f'meme{i}' for i in range(4)]
@@ -0,0 +1,176 @@
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.analyzers import kernels
+
+BACKENDS = ['numpy'] + (['numba'] if kernels.HAS_NUMBA else [])
+
+
+def make_series(n_rows=20, n_cols=120, seed=0, with_nan=False):
+    """포아송 카운트 형태의 테스트 시계열 (0 포함)"""
+    rng = np.random.default_rng(seed)
+    values = rng.poisson(rng.uniform(0.2, 30, size=(n_rows, 1)), size=(n_rows, n_cols)).astype(np.float64)
+    values[:, 10:15] = 0.0
+    if with_nan:
+        values[rng.random(values.shape) < 0.05] = np.nan
+    return values
+
+
+def reference_burst_scores(row, window, min_periods):
+    """burst_scores의 정의를 pandas로 그대로 계산한 기준값"""
+    series = pd.Series(row)
+    previous = series.shift(1).rolling(window=window, min_periods=min_periods)
+    mean = previous.mean()
+    var = previous.var(ddof=0).clip(lower=0)
+    return ((series - mean) / np.sqrt(var + 1.0)).to_numpy()
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+@pytest.mark.parametrize('with_nan', [False, True])
+@pytest.mark.parametrize('window,min_periods', [(7, 1), (3, 3), (14, 5)])
+def test_rolling_mean_matches_pandas(backend, with_nan, window, min_periods):
+    values = make_series(with_nan=with_nan)
+    result = kernels.rolling_mean(values, window, min_periods, backend=backend)
+    expected = pd.DataFrame(values.T).rolling(window=window, min_periods=min_periods).mean().to_numpy().T
+    np.testing.assert_allclose(result, expected, rtol=1e-9, atol=1e-9)
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+def test_pct_change_matches_pandas(backend):
+    values = make_series()
+    result = kernels.pct_change(values, backend=backend)
+    expected = pd.DataFrame(values.T).pct_change().to_numpy().T
+    np.testing.assert_allclose(result, expected, rtol=1e-12)
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+@pytest.mark.parametrize('with_nan', [False, True])
+def test_cumsum_matches_pandas(backend, with_nan):
+    values = make_series(with_nan=with_nan)
+    result = kernels.cumsum(values, backend=backend)
+    expected = pd.DataFrame(values.T).cumsum().to_numpy().T
+    np.testing.assert_allclose(result, expected, rtol=1e-12)
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+@pytest.mark.parametrize('with_nan', [False, True])
+def test_burst_scores_match_reference(backend, with_nan):
+    values = make_series(with_nan=with_nan)
+    result = kernels.burst_scores(values, window=7, min_periods=3, backend=backend)
+    expected = np.vstack([reference_burst_scores(row, 7, 3) for row in values])
+    np.testing.assert_allclose(result, expected, rtol=1e-7, atol=1e-7)
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+def test_segment_costs_match_direct_computation(backend):
+    values = make_series(n_rows=5, n_cols=60)
+    starts = np.array([0, 5, 10, 30, 59, 20])
+    ends = np.array([60, 20, 15, 45, 60, 20])
+    result = kernels.segment_costs(values, starts, ends, backend=backend)
+    for i, row in enumerate(values):
+        for j, (start, end) in enumerate(zip(starts, ends)):
+            segment = row[start:end]
+            expected = ((segment - segment.mean()) ** 2).sum() if len(segment) else 0.0
+            assert result[i, j] == pytest.approx(expected, rel=1e-7, abs=1e-6)
+
+
+def optimal_partitioning(values, penalty, min_size):
+    """가지치기 없는 최적 분할 (change_points 기준값)"""
+    n = len(values)
+    best = np.full(n + 1, np.inf)
+    best[0] = -penalty
+    last = np.zeros(n + 1, dtype=int)
+    for t in range(min_size, n + 1):
+        for s in range(0, t - min_size + 1):
+            segment = values[s:t]
+            total = best[s] + ((segment - segment.mean()) ** 2).sum() + penalty
+            if total < best[t] - 1e-9:
+                best[t], last[t] = total, s
+    points = []
+    t = last[n]
+    while t > 0:
+        points.append(t)
+        t = last[t]
+    return points[::-1]
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+@pytest.mark.parametrize('seed', range(5))
+def test_change_points_match_optimal_partitioning(backend, seed):
+    rng = np.random.default_rng(seed)
+    values = np.concatenate([rng.normal(level, 1.0, rng.integers(5, 30)) for level in rng.normal(0, 3, 5)])
+    expected = optimal_partitioning(values, penalty=5.0, min_size=4)
+    assert list(kernels.change_points(values, penalty=5.0, min_size=4, backend=backend)) == expected
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+def test_bounded_change_points_match_exact_on_long_steps(backend):
+    rng = np.random.default_rng(0)
+    lengths = rng.integers(300, 900, 10)
+    levels = np.cumsum(rng.choice([-6.0, 6.0], len(lengths)))
+    values = np.concatenate([rng.normal(level, 1.0, length) for level, length in zip(levels, lengths)])
+    exact = kernels.change_points(values, penalty=50.0, min_size=24, max_points=None, backend=backend)
+    bounded = kernels.change_points(values, penalty=50.0, min_size=24, max_points=500, backend=backend)
+    assert list(bounded) == list(exact) == list(np.cumsum(lengths)[:-1])
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+def test_change_points_scale_on_long_flat_series(backend):
+    # 변화점이 없는 8년치 시간 단위 시계열: 정확한 PELT는 가지치기가 안 되어 제곱 시간이 걸림
+    values = np.random.default_rng(0).normal(10.0, 1.0, 8 * 365 * 24)
+    penalty = 2.0 * np.log(len(values))
+    kernels.change_points(values[:1000], penalty, min_size=24, backend=backend)  # JIT 컴파일 제외
+    start = time.perf_counter()
+    points = kernels.change_points(values, penalty, min_size=24, backend=backend)
+    assert time.perf_counter() - start < 5.0
+    assert len(points) == 0
+
+
+def reference_dtw(a, b, window):
+    """전체 누적 비용 행렬로 계산한 밴드 DTW"""
+    cost = np.full((len(a) + 1, len(b) + 1), np.inf)
+    cost[0, 0] = 0.0
+    for i in range(1, len(a) + 1):
+        for j in range(max(1, i - window), min(len(b), i + window) + 1):
+            cost[i, j] = (a[i - 1] - b[j - 1]) ** 2 + min(cost[i - 1, j - 1], cost[i - 1, j], cost[i, j - 1])
+    return cost[-1, -1]
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+@pytest.mark.parametrize('window', [1, 5, 40])
+def test_dtw_distance_matches_reference(backend, window):
+    rng = np.random.default_rng(window)
+    a, b = rng.normal(size=40), rng.normal(size=40)
+    expected = reference_dtw(a, b, window)
+    assert kernels.dtw_distance(a, b, window, backend=backend) == pytest.approx(expected)
+    # cutoff보다 크면 조기 종료, 크지 않으면 정확한 값
+    assert kernels.dtw_distance(a, b, window, cutoff=expected * 0.5, backend=backend) == np.inf
+    assert kernels.dtw_distance(a, b, window, cutoff=expected, backend=backend) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+def test_one_dimensional_input(backend):
+    row = make_series(n_rows=1)[0]
+    assert kernels.rolling_mean(row, backend=backend).shape == row.shape
+    np.testing.assert_allclose(kernels.cumsum(row, backend=backend), np.cumsum(row))
+
+
+@pytest.mark.skipif(not kernels.HAS_NUMBA, reason='numba 미설치')
+def test_numba_matches_numpy_on_large_batch():
+    values = make_series(n_rows=200, n_cols=1000, seed=1, with_nan=True)
+    for name in ['rolling_mean', 'pct_change', 'cumsum', 'burst_scores']:
+        fast = getattr(kernels, name)(values, backend='numba')
+        slow = getattr(kernels, name)(values, backend='numpy')
+        np.testing.assert_allclose(fast, slow, rtol=1e-7, atol=1e-7, err_msg=name)
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        kernels.rolling_mean(np.ones(3), backend='cuda')
@@ -0,0 +1,103 @@
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from conftest import make_posts
+from src.analyzers import lifecycle_analyzer
+from src.analyzers.lifecycle_analyzer import (
+    INTERMEDIATE_REGISTRY, LifecycleAnalyzer, build_daily_metrics, diffusion_metrics, register_metric
+)
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def legacy_lifecycle_metrics(df, daily_metrics):
+    """메트릭 등록부 도입 전 구현 (비교 기준)"""
+    metrics = {}
+    metrics['total_posts'] = len(df)
+    metrics['unique_authors'] = df['author'].nunique()
+    metrics['date_range'] = f"{df['date'].min()} to {df['date'].max()}"
+    metrics['duration_days'] = (df['date'].max() - df['date'].min()).days
+    metrics['avg_score'] = df['score'].mean()
+    metrics['avg_comments'] = df['num_comments'].mean()
+    metrics['total_engagement'] = df['engagement_score'].sum()
+    metrics['posts_per_author'] = metrics['total_posts'] / metrics['unique_authors']
+    metrics['subreddit_count'] = df['subreddit'].nunique()
+    peak_date = daily_metrics.loc[daily_metrics['post_count'].idxmax(), 'date']
+    metrics['peak_date'] = peak_date
+    metrics['days_to_peak'] = (peak_date - df['date'].min()).days
+    if metrics['days_to_peak'] > 0:
+        metrics['growth_phase_posts'] = len(df[df['date'] < peak_date])
+        metrics['decline_phase_posts'] = len(df[df['date'] >= peak_date])
+        metrics['growth_decline_ratio'] = metrics['growth_phase_posts'] / max(metrics['decline_phase_posts'], 1)
+    metrics['active_days_ratio'] = (daily_metrics['post_count'] > 0).sum() / len(daily_metrics)
+    top_posts = df.nlargest(int(len(df) * 0.1), 'engagement_score')
+    metrics['viral_concentration'] = top_posts['engagement_score'].sum() / df['engagement_score'].sum()
+    return metrics
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_registry_metrics_match_legacy_implementation(seed):
+    df = make_posts(1500, n_days=90, seed=seed)
+    daily_metrics = build_daily_metrics(df)
+    expected = legacy_lifecycle_metrics(df, daily_metrics)
+    actual = LifecycleAnalyzer().calculate_lifecycle_metrics(df, daily_metrics)
+
+    assert list(actual) == list(expected)
+    for key, value in expected.items():
+        if isinstance(value, float):
+            assert actual[key] == pytest.approx(value), key
+        else:
+            assert actual[key] == value, key
+
+
+def test_shared_intermediates_are_computed_once(monkeypatch):
+    calls = {}
+
+    def counted(name, func):
+        def wrapper(context):
+            calls[name] = calls.get(name, 0) + 1
+            return func(context)
+        return wrapper
+
+    for name, func in list(INTERMEDIATE_REGISTRY.items()):
+        monkeypatch.setitem(INTERMEDIATE_REGISTRY, name, counted(name, func))
+    df = make_posts(1500, n_days=90)
+    LifecycleAnalyzer().calculate_lifecycle_metrics(df, build_daily_metrics(df))
+    assert set(calls) == set(INTERMEDIATE_REGISTRY)
+    assert all(count == 1 for count in calls.values())
+
+
+def test_register_metric_rejects_unknown_intermediate(monkeypatch):
+    monkeypatch.setattr(lifecycle_analyzer, 'METRIC_REGISTRY', [])
+    with pytest.raises(ValueError):
+        register_metric('no_such_intermediate')(lambda context, metrics: {})
+    assert lifecycle_analyzer.METRIC_REGISTRY == []
+
+
+def test_diffusion_metrics_are_opt_in():
+    df = make_posts(1500, n_days=90)
+    analyzer = LifecycleAnalyzer()
+    daily_metrics = build_daily_metrics(df)
+
+    metrics = analyzer.calculate_lifecycle_metrics(df, daily_metrics)
+    assert 'hub_subreddit' not in metrics
+
+    diffusion = diffusion_metrics(df)
+    assert list(diffusion) == ['']
+    with_diffusion = analyzer.calculate_lifecycle_metrics(df, daily_metrics, diffusion[''])
+    assert with_diffusion == dict(metrics, **diffusion[''])
+    assert with_diffusion['first_subreddit'] == df.sort_values('created_utc')['subreddit'].iloc[0]
+
+
+def test_import_does_not_load_scipy():
+    code = ("import sys; import src.analyzers.lifecycle_analyzer, src.analyzers.term_trends; "
+            "print('scipy' in sys.modules)")
+    output = subprocess.run([sys.executable, '-c', code], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True)
+    assert output.stdout.strip() == 'False'
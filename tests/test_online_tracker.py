@@ -0,0 +1,52 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from conftest import make_posts
+from src.analyzers.lifecycle_analyzer import build_daily_metrics
+from src.analyzers.online_tracker import LifecycleTracker, TRACKER_COLUMNS
+
+
+def assert_matches_full(tracker, df):
+    expected = build_daily_metrics(df)[TRACKER_COLUMNS]
+    pd.testing.assert_frame_equal(tracker.daily_metrics(), expected, check_dtype=False)
+
+
+def test_incremental_matches_full_history():
+    df = make_posts(n_days=60)
+    order = df.sort_values('date')
+    tracker = LifecycleTracker('test')
+    for chunk in np.array_split(np.arange(len(order)), 7):
+        tracker.update(order.iloc[chunk])
+    assert_matches_full(tracker, df)
+
+
+def test_late_posts_for_last_day_are_added_once(tmp_path):
+    df = make_posts(n_days=60)
+    last_date = df['date'].max()
+    late = df[df['date'] == last_date].iloc[:5]
+    first = df.drop(late.index)
+
+    tracker = LifecycleTracker.from_posts('test', first)
+    filepath = tracker.save(str(tmp_path / 'tracker.json'))
+    tracker = LifecycleTracker.load(filepath)
+
+    # 재수집 파일: 이미 반영한 마지막 날 게시물 + 늦게 들어온 게시물
+    tracker.update(df[df['date'] == last_date])
+    tracker.update(df[df['date'] == last_date])
+    assert_matches_full(tracker, df)
+
+
+def test_latest_matches_last_row():
+    tracker = LifecycleTracker.from_posts('test', make_posts(n_days=60))
+    expected = tracker.daily_metrics().iloc[-1].to_dict()
+    latest = tracker.latest()
+    assert list(latest) == TRACKER_COLUMNS
+    assert latest['date'] == expected['date']
+    for key in TRACKER_COLUMNS[1:]:
+        assert latest[key] == pytest.approx(expected[key], nan_ok=True)
@@ -0,0 +1,136 @@
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.pipeline import Pipeline, Stage
+
+
+# 단계 함수는 프로세스 풀에서 pickle되도록 모듈 최상위에 둔다
+def produce(value):
+    return value
+
+
+def add_one(value):
+    return value + 1
+
+
+def wait_and_return(value, seconds=0.2):
+    time.sleep(seconds)
+    return value
+
+
+def fail():
+    raise RuntimeError('boom')
+
+
+def crash():
+    """워커 프로세스 강제 종료 (메모리 부족/세그폴트 대용)"""
+    os._exit(1)
+
+
+def unpicklable():
+    return lambda: None
+
+
+def test_worker_crash_fails_only_its_branch():
+    stages = [
+        Stage('good', produce, outputs=['a'], params={'value': 1}),
+        Stage('bad', crash, outputs=['b']),
+        Stage('g2', add_one, inputs={'value': 'a'}, outputs=['c']),
+        Stage('after_bad', add_one, inputs={'value': 'b'}, outputs=['d']),
+        Stage('pickle', unpicklable, outputs=['e']),
+        Stage('after_pickle', add_one, inputs={'value': 'e'}, outputs=['f']),
+    ]
+    pipeline = Pipeline(stages, workers=2)
+    run = pipeline.run()
+    records = run['records']
+
+    assert {name: record['status'] for name, record in records.items()} == {
+        'good': 'done', 'bad': 'failed', 'g2': 'done', 'after_bad': 'skipped',
+        'pickle': 'failed', 'after_pickle': 'skipped'
+    }
+    assert run['artifacts']['c'] == 2
+    assert records['bad']['error'].startswith('BrokenProcessPool')
+    assert records['bad']['start'] is not None and records['bad']['end'] >= records['bad']['start']
+    assert sorted(pipeline.failed_required(run)) == ['after_bad', 'after_pickle', 'bad', 'pickle']
+
+
+def test_stages_after_a_crash_run_on_a_new_pool():
+    # 워커 하나로 crash 뒤에 제출되는 단계도 새 풀에서 실행되어야 함
+    stages = [Stage('bad', crash, outputs=['b'])]
+    stages += [Stage(f'later{i}', produce, inputs=['value'], outputs=[f'x{i}']) for i in range(3)]
+    run = Pipeline(stages, workers=1).run({'value': 5})
+    assert run['records']['bad']['status'] == 'failed'
+    assert [run['artifacts'][f'x{i}'] for i in range(3)] == [5, 5, 5]
+
+
+def test_failure_skips_dependants_transitively_and_optional_failures_are_not_required():
+    stages = [
+        Stage('root', fail, outputs=['a']),
+        Stage('child', add_one, inputs={'value': 'a'}, outputs=['b']),
+        Stage('grandchild', add_one, inputs={'value': 'b'}, outputs=['c']),
+        Stage('optional', fail, outputs=['d'], required=False),
+        Stage('independent', produce, outputs=['e'], params={'value': 3}),
+    ]
+    pipeline = Pipeline(stages, workers=1)
+    run = pipeline.run()
+    statuses = {name: record['status'] for name, record in run['records'].items()}
+    assert statuses == {'root': 'failed', 'child': 'skipped', 'grandchild': 'skipped',
+                        'optional': 'failed', 'independent': 'done'}
+    assert run['records']['root']['error'].startswith('RuntimeError: boom')
+    assert run['records']['grandchild']['error'] == '선행 단계 실패: child'
+    assert sorted(pipeline.failed_required(run)) == ['child', 'grandchild', 'root']
+
+
+def test_resource_limits_throttle_stages_sharing_a_resource():
+    stages = [Stage(f'collect{i}', wait_and_return, outputs=[f'x{i}'], params={'value': i},
+                    kind='io', resources=['reddit']) for i in range(3)]
+    stages.append(Stage('other', wait_and_return, outputs=['y'], params={'value': 9}, kind='io'))
+    run = Pipeline(stages, io_workers=4, resource_limits={'reddit': 1}).run()
+    records = run['records']
+
+    # 같은 자원을 쓰는 단계는 하나씩, 자원이 없는 단계는 동시에 실행
+    intervals = sorted((records[f'collect{i}']['start'], records[f'collect{i}']['end']) for i in range(3))
+    assert all(later[0] >= earlier[1] for earlier, later in zip(intervals, intervals[1:]))
+    assert records['other']['start'] < intervals[0][1]
+    assert [run['artifacts'][f'x{i}'] for i in range(3)] == [0, 1, 2]
+
+
+def test_invalid_graphs_are_rejected():
+    with pytest.raises(ValueError):
+        Pipeline([Stage('a', add_one, inputs={'value': 'b'}, outputs=['a']),
+                  Stage('b', add_one, inputs={'value': 'a'}, outputs=['b'])])
+    with pytest.raises(ValueError):
+        Pipeline([Stage('a', produce, outputs=['x']), Stage('b', produce, outputs=['x'])])
+    with pytest.raises(ValueError):
+        Pipeline([Stage('a', add_one, inputs=['value'], outputs=['x'])]).run()
+
+
+def record(start, end, status='done'):
+    return {'status': status, 'start': start, 'end': end, 'error': None}
+
+
+def test_critical_path_follows_dependencies_and_worker_waits():
+    stages = [
+        Stage('a', produce, outputs=['a']),
+        Stage('b', add_one, inputs={'value': 'a'}, outputs=['b']),
+        Stage('c', add_one, inputs={'value': 'b'}, outputs=['c']),
+        Stage('short', produce, outputs=['s']),
+        Stage('queued', produce, outputs=['q']),
+    ]
+    pipeline = Pipeline(stages)
+    # queued는 의존성이 없지만 b가 워커를 비워 줄 때까지 기다렸다가 가장 늦게 끝남
+    run = {'start': 0.0, 'end': 10.0, 'records': {
+        'a': record(0.0, 2.0), 'short': record(0.0, 1.0), 'b': record(2.0, 5.0),
+        'c': record(5.0, 6.0), 'queued': record(5.0, 9.0)
+    }}
+    assert pipeline.critical_path(run) == ['a', 'b', 'queued']
+
+    run['records']['queued'] = record(None, None, 'skipped')
+    assert pipeline.critical_path(run) == ['a', 'b', 'c']
+    assert pipeline.critical_path({'start': 0.0, 'end': 0.0,
+                                   'records': {name: record(None, None, 'skipped') for name in pipeline.stages}}) == []
@@ -0,0 +1,59 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from conftest import make_posts
+from src.analyzers.lifecycle_analyzer import DAILY_METRIC_COLUMNS, build_daily_metrics
+from src.preprocessors.rollup_cube import GRANULARITIES, RollupCube, load_rollup, rollup_path
+
+
+def assert_same_cube(cube, expected):
+    for granularity in GRANULARITIES:
+        pd.testing.assert_frame_equal(cube.table(granularity), expected.table(granularity), check_dtype=False)
+    assert cube.total_posts == expected.total_posts
+    assert cube.last_post == expected.last_post
+
+
+def test_daily_frame_matches_build_daily_metrics():
+    df = make_posts(3000)
+    cube = RollupCube.from_posts('test', df)
+    pd.testing.assert_frame_equal(cube.daily_frame(), build_daily_metrics(df)[DAILY_METRIC_COLUMNS],
+                                  check_dtype=False)
+
+
+def test_incremental_updates_match_full_build():
+    df = make_posts(3000)
+    # 수집 묶음마다 이전 묶음보다 이른 게시물이 섞여 들어옴
+    cube = RollupCube('test')
+    for chunk in np.array_split(np.arange(len(df)), 5):
+        cube.update(df.iloc[chunk])
+    assert_same_cube(cube, RollupCube.from_posts('test', df))
+    assert cube.total_posts == len(df)
+
+
+def test_update_ignores_already_counted_posts(tmp_path):
+    df = make_posts(3000)
+    first, second = df.iloc[:2000], df.iloc[1500:]
+    cube = RollupCube.from_posts('test', first)
+    filepath = cube.save(str(tmp_path / 'cube_rollup.npz'))
+
+    loaded = RollupCube.load(filepath)
+    loaded.update(second)
+    loaded.update(pd.concat([df.iloc[:10], df.iloc[:10]]))
+    assert_same_cube(loaded, RollupCube.from_posts('test', df))
+
+
+def test_load_rollup_reads_tables_without_post_ids(tmp_path):
+    df = make_posts(3000)
+    processed_path = str(tmp_path / 'processed_reddit_test_20250101_120000.csv')
+    created = load_rollup(processed_path, df, 'test')
+    assert os.path.exists(rollup_path(processed_path))
+    assert len(created.post_ids) == len(df)
+
+    loaded = load_rollup(processed_path)
+    assert loaded.post_ids is None
+    assert_same_cube(loaded, created)
@@ -0,0 +1,108 @@
+import argparse
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import run_pipeline
+from run_pipeline import build_stages
+from src.pipeline import Pipeline
+
+
+# main에서 실제 단계 대신 실행할 단계 함수 (프로세스 풀에서 pickle되도록 모듈 최상위)
+def fake_preprocessing(meme_name, collected_platforms=None):
+    if meme_name == 'boom':
+        os._exit(1)
+    return f'processed_reddit_{meme_name}_20250101_120000.csv'
+
+
+def fake_visualization(processed_filename, meme_name, profile=None, workers=None):
+    return [] if meme_name == 'noviz' else [f'reddit_{meme_name}_lifecycle_curve.png']
+
+
+def fake_analysis(processed_filename, meme_name):
+    return f'{meme_name}_lifecycle_report.txt'
+
+
+def stop_before_run(*args, **kwargs):
+    raise RuntimeError('실행하지 않음')
+
+
+def make_args(**overrides):
+    args = dict(skip_collection=False, skip_visualization=False, skip_analysis=False,
+                platforms=['reddit'], profile='draft')
+    args.update(overrides)
+    return argparse.Namespace(**args)
+
+
+def test_build_stages_wires_one_meme():
+    stages, steps = build_stages('Chill Guy', make_args(), render_workers=2)
+    assert steps == {step: f'{step}:chill_guy' for step in run_pipeline.STEPS}
+    pipeline = Pipeline(stages)
+    assert pipeline.dependencies == {
+        'collection:chill_guy': set(),
+        'preprocessing:chill_guy': {'collection:chill_guy'},
+        'visualization:chill_guy': {'preprocessing:chill_guy'},
+        'analysis:chill_guy': {'preprocessing:chill_guy'},
+    }
+    collection, _, visualization, analysis = stages
+    assert (collection.kind, collection.resources) == ('io', ('reddit',))
+    assert visualization.params['workers'] == 2 and not visualization.required
+    assert analysis.required
+
+    stages, steps = build_stages('Chill Guy', make_args(skip_collection=True, skip_visualization=True))
+    assert list(steps) == ['preprocessing', 'analysis']
+    assert stages[0].inputs == {}
+
+
+def test_batch_run_reports_every_meme_when_a_worker_dies(monkeypatch, tmp_path, capsys):
+    monkeypatch.setattr(run_pipeline, 'run_preprocessing', fake_preprocessing)
+    monkeypatch.setattr(run_pipeline, 'run_visualization', fake_visualization)
+    monkeypatch.setattr(run_pipeline, 'run_analysis', fake_analysis)
+    monkeypatch.setattr(run_pipeline, 'validate_environment', lambda: True)
+    monkeypatch.setattr(run_pipeline, 'REPORTS_DIR', str(tmp_path))
+    monkeypatch.setattr(sys, 'argv', ['run_pipeline.py', '--memes', 'ok', 'boom', 'noviz',
+                                      '--skip-collection', '--workers', '2'])
+
+    assert run_pipeline.main() == 1
+    report_files = list(tmp_path.glob('pipeline_run_*.json'))
+    assert len(report_files) == 1
+    with open(report_files[0], 'r', encoding='utf-8') as f:
+        report = json.load(f)
+
+    memes = report['memes']
+    assert {name: meme['status'] for name, meme in memes.items()} == {
+        'ok': 'success', 'boom': 'failed', 'noviz': 'partial'
+    }
+    assert memes['ok']['report'] == 'ok_lifecycle_report.txt'
+    assert memes['ok']['figures'] == ['reddit_ok_lifecycle_curve.png']
+    assert memes['boom']['stages']['preprocessing']['error'].startswith('BrokenProcessPool')
+    assert memes['boom']['stages']['analysis'] == {'status': 'skipped', 'seconds': None,
+                                                   'error': '선행 단계 실패: preprocessing:boom'}
+    assert memes['noviz']['stages']['visualization']['error'] == '출력 없이 종료'
+    assert report['workers'] == 2
+    assert report['critical_path'] and all(':' in name for name in report['critical_path'])
+    assert '파이프라인 실패: boom' in capsys.readouterr().out
+
+
+@pytest.mark.parametrize('workers, memes, skip, expected', [
+    (8, ['a'], [], 4), (8, ['a', 'b'], [], 2), (8, ['a', 'b', 'c', 'd', 'e'], [], 1),
+    (8, ['a'], ['--skip-analysis'], 8), (1, ['a'], [], 1),
+])
+def test_render_workers_share_cpu_between_concurrent_stages(monkeypatch, workers, memes, skip, expected):
+    captured = {}
+
+    def fake_build_stages(meme_name, args, render_workers=None):
+        captured[meme_name] = render_workers
+        return [], {}
+
+    monkeypatch.setattr(run_pipeline, 'build_stages', fake_build_stages)
+    monkeypatch.setattr(run_pipeline, 'validate_environment', lambda: True)
+    # 단계 구성까지만 확인하고 실행 전에 중단
+    monkeypatch.setattr(run_pipeline, 'Pipeline', stop_before_run)
+    monkeypatch.setattr(sys, 'argv', ['run_pipeline.py', '--memes', *memes, '--workers', str(workers), *skip])
+    assert run_pipeline.main() == 1
+    assert captured == {meme: expected for meme in memes}
@@ -0,0 +1,63 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.analyzers import sentiment_analyzer
+from src.analyzers.sentiment_analyzer import SentimentAnalyzer
+from src.database import TextCache
+
+TEXTS = [
+    'this meme is absolutely hilarious', 'worst template ever, so boring', 'posted it again',
+    'I love this so much!!', 'this meme is absolutely hilarious', '', None, 'not funny at all',
+    'great edit but the original was better', 'I love this so much!!', 'meh',
+]
+
+
+@pytest.fixture
+def vader():
+    try:
+        return sentiment_analyzer._get_vader()
+    except (ImportError, RuntimeError) as e:
+        pytest.skip(str(e))
+
+
+def make_analyzer(tmp_path, **kwargs):
+    """임시 캐시 파일을 쓰는 감성 분석기"""
+    analyzer = SentimentAnalyzer(use_cache=False, **kwargs)
+    analyzer.cache = TextCache('sentiment_vader', db_path=str(tmp_path / 'cache.db'))
+    return analyzer
+
+
+@pytest.mark.parametrize('batch_size, workers', [(3, None), (2, 2)])
+def test_batched_scores_match_unbatched_vader(vader, batch_size, workers):
+    expected = [vader.polarity_scores(text)['compound'] if text else np.nan for text in TEXTS]
+    scores = SentimentAnalyzer(batch_size=batch_size, workers=workers, use_cache=False).score_texts(TEXTS)
+    # 빈 텍스트는 점수 없이 NaN
+    np.testing.assert_array_equal(scores, expected)
+
+
+def test_repeated_texts_are_scored_once_and_then_read_from_cache(vader, tmp_path, monkeypatch):
+    scored = []
+
+    def recording_score_batch(texts):
+        scored.extend(texts)
+        return [vader.polarity_scores(text)['compound'] for text in texts]
+
+    monkeypatch.setattr(sentiment_analyzer, 'score_batch', recording_score_batch)
+    analyzer = make_analyzer(tmp_path, batch_size=4)
+    first = analyzer.score_texts(TEXTS)
+    # 중복과 빈 텍스트는 계산하지 않음 (캐시 미스는 고유 텍스트 수만큼)
+    assert sorted(scored) == sorted({text for text in TEXTS if text})
+
+    scored.clear()
+    np.testing.assert_array_equal(make_analyzer(tmp_path).score_texts(TEXTS), first)
+    assert scored == []
+
+    # 새 텍스트만 계산하고 기존 텍스트는 캐시 적중
+    second = make_analyzer(tmp_path).score_texts(['meh', 'brand new caption', 'meh'])
+    assert scored == ['brand new caption']
+    assert second[0] == second[2] == first[TEXTS.index('meh')]
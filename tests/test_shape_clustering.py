@@ -0,0 +1,75 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.analyzers import kernels
+from src.analyzers.shape_clustering import (
+    ShapeClusterModel, cluster_daily_metrics, curves_from_daily, normalize_curve
+)
+
+
+def make_counts(seed, n_days=120):
+    """봉우리 위치/폭/개수가 제각각인 일별 게시물 수"""
+    rng = np.random.default_rng(seed)
+    days = np.arange(n_days)
+    curve = np.zeros(n_days)
+    for _ in range(rng.integers(1, 3)):
+        curve += rng.uniform(10, 60) * np.exp(-((days - rng.uniform(5, n_days - 5)) / rng.uniform(2, 30)) ** 2)
+    return pd.Series(rng.poisson(curve + 0.2), index=pd.date_range('2024-01-01', periods=n_days, freq='D'))
+
+
+def make_curves(n_curves=60):
+    return np.vstack([normalize_curve(make_counts(seed)) for seed in range(n_curves)])
+
+
+@pytest.mark.parametrize('max_iter', [1, 20])
+def test_fit_labels_match_predict(max_iter):
+    curves = make_curves()
+    model = ShapeClusterModel(n_clusters=4, max_iter=max_iter, medoid_sample=16)
+    labels = model.fit(curves)
+
+    # 반복 한도에 걸려 끝나도 학습 라벨은 최종 메도이드 기준 할당과 같아야 함
+    predicted, distances = model.predict(curves)
+    np.testing.assert_array_equal(labels, predicted)
+    assert model.stats['inertia'] == pytest.approx(distances.sum())
+    assert len(model.names) == len(model.medoids)
+
+
+def test_predict_matches_exhaustive_dtw(tmp_path):
+    curves = make_curves()
+    model = ShapeClusterModel(n_clusters=4, medoid_sample=16)
+    model.fit(curves[:40])
+    labels, distances = model.predict(curves[40:])
+
+    # LB_Keogh로 가지치기해도 모든 메도이드와 비교한 결과와 같음
+    exhaustive = np.array([[kernels.dtw_distance(curve, medoid, model.window) for medoid in model.medoids]
+                           for curve in curves[40:]])
+    np.testing.assert_array_equal(labels, exhaustive.argmin(axis=1))
+    np.testing.assert_allclose(distances, exhaustive.min(axis=1))
+    assert model.stats['dtw_pruned'] > 0
+
+    loaded = ShapeClusterModel.load(model.save(str(tmp_path / 'clusters.json')))
+    loaded_labels, loaded_distances = loaded.predict(curves[40:])
+    np.testing.assert_array_equal(loaded_labels, labels)
+    np.testing.assert_allclose(loaded_distances, distances)
+
+
+def test_cluster_daily_metrics_uses_saved_model_assignments(tmp_path):
+    daily = pd.concat([
+        make_counts(seed).rename('post_count').rename_axis('date').reset_index().assign(meme=f'meme{seed}')
+        for seed in range(30)
+    ])
+    model_path = str(tmp_path / 'clusters.json')
+    assignments = cluster_daily_metrics(daily, n_clusters=3, model_path=model_path)
+
+    model = ShapeClusterModel.load(model_path)
+    curves = curves_from_daily(daily)
+    labels, distances = model.predict(np.vstack([curves[meme] for meme in assignments['meme']]))
+    np.testing.assert_array_equal(assignments['shape_cluster'], labels)
+    np.testing.assert_allclose(assignments['shape_distance'], distances)
+    assert assignments['shape_cluster_name'].tolist() == [model.names[label] for label in labels]
@@ -0,0 +1,93 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from conftest import make_posts
+from src.analyzers.sketches import HyperLogLog, MemeSketch, SpaceSaving, TDigest
+
+
+@pytest.mark.parametrize('n_unique', [50, 5000, 200000])
+def test_hyperloglog_error_bound(n_unique):
+    hll = HyperLogLog(p=14)
+    values = np.arange(n_unique).astype(str)
+    hll.add(np.concatenate([values, values[:n_unique // 2]]))
+    # 표준 오차 1.04/sqrt(m)의 3배 이내
+    assert abs(hll.count() - n_unique) <= 3 * 1.04 / np.sqrt(hll.m) * n_unique + 1
+
+
+def test_hyperloglog_merge_equals_union():
+    values = np.arange(30000).astype(str)
+    left, right = HyperLogLog().add(values[:20000]), HyperLogLog().add(values[10000:])
+    union = HyperLogLog().add(values)
+    np.testing.assert_array_equal(left.merge(right).registers, union.registers)
+    restored = HyperLogLog.from_dict(union.to_dict())
+    assert restored.count() == union.count()
+    with pytest.raises(ValueError):
+        HyperLogLog(p=12).merge(union)
+
+
+def rank_error(values, digest, quantiles):
+    """추정 분위수의 실제 순위와 요청 분위수의 차이"""
+    ordered = np.sort(values)
+    estimates = digest.quantile(np.asarray(quantiles))
+    ranks = np.searchsorted(ordered, estimates, side='right') / len(ordered)
+    return np.abs(ranks - np.asarray(quantiles))
+
+
+def test_tdigest_quantile_rank_error_for_single_and_merged_digests():
+    rng = np.random.default_rng(0)
+    values = rng.lognormal(2, 1, 100000)
+    quantiles = [0.01, 0.1, 0.5, 0.9, 0.99]
+
+    digest = TDigest(compression=100).add(values)
+    assert rank_error(values, digest, quantiles).max() < 0.01
+    assert digest.mean() == pytest.approx(values.mean())
+
+    merged = TDigest(compression=100)
+    for chunk in np.array_split(values, 20):
+        merged.merge(TDigest(compression=100).add(chunk))
+    assert rank_error(values, merged, quantiles).max() < 0.01
+    assert len(merged.means) < 200
+
+    top = np.sort(values)[-10000:].sum()
+    assert merged.upper_sum(0.1) == pytest.approx(top, rel=0.02)
+
+
+def test_space_saving_bounds_hold_after_merges():
+    rng = np.random.default_rng(0)
+    keys = rng.zipf(1.5, 50000) % 5000
+    exact = pd.Series(keys).astype(str).value_counts()
+
+    sketch = SpaceSaving(capacity=50)
+    for chunk in np.array_split(keys, 10):
+        sketch.add(chunk)
+
+    for key, estimate, error in sketch.top(50):
+        # 추정값 - 오차 <= 실제 개수 <= 추정값
+        assert estimate - error <= exact.get(key, 0) <= estimate
+    # 전체의 1/capacity보다 많이 나온 항목은 모두 남아 있음
+    heavy = exact[exact > len(keys) / sketch.capacity].index
+    assert set(heavy) <= set(sketch.counts.index)
+    assert [key for key, _, _ in sketch.top(5)] == list(exact.index[:5])
+
+
+def test_meme_sketch_summary_close_to_exact_values():
+    n_posts = 20000
+    df = make_posts(n_posts, n_days=90, n_authors=8000, subreddits=['memes', 'kpop', 'videos'])
+
+    merged = MemeSketch()
+    for chunk in np.array_split(np.arange(n_posts), 4):
+        merged.merge(MemeSketch().update(df.iloc[chunk]))
+    summary = MemeSketch.from_dict(merged.to_dict()).summary()
+
+    assert summary['total_posts'] == n_posts
+    assert summary['unique_subreddits'] == 3
+    assert summary['unique_authors'] == pytest.approx(df['author'].nunique(), rel=0.03)
+    assert summary['avg_score'] == pytest.approx(df['score'].mean())
+    top = df['engagement_score'].nlargest(n_posts // 10).sum() / df['engagement_score'].sum()
+    assert summary['viral_concentration'] == pytest.approx(top, rel=0.02)
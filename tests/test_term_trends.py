@@ -0,0 +1,117 @@
+import os
+import sys
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.analyzers import term_trends
+from src.analyzers.term_trends import TermTrendAnalyzer, tokenize_batch
+from src.database import TextCache
+
+
+def make_titles(n_days=90, seed=0):
+    """급상승 후 감소하는 게시물 수, 전반부와 후반부의 표현 변형이 다른 제목"""
+    rng = np.random.default_rng(seed)
+    days = pd.date_range('2024-01-01', periods=n_days, freq='D')
+    counts = rng.poisson(2 + 40 * np.exp(-((np.arange(n_days) - 30) / 8) ** 2))
+    early = ['distracted boyfriend template', 'original distracted boyfriend', 'boyfriend looking back']
+    late = ['distracted boyfriend but cats', 'cats edition again', 'boyfriend cats remix']
+    rows = []
+    for day, (date, count) in enumerate(zip(days, counts)):
+        variants = early if day < 40 else late
+        for _ in range(count):
+            rows.append({'date': date, 'title_clean': variants[rng.integers(len(variants))]})
+    # 빈 제목과 중복 제목, 게시물이 없는 날짜 포함
+    rows.append({'date': days[0], 'title_clean': None})
+    df = pd.DataFrame(rows)
+    df = df[df['date'] != days[50]].reset_index(drop=True)
+    df['id'] = [f'p{i}' for i in range(len(df))]
+    df['created_utc'] = df['date'] + pd.Timedelta(hours=12)
+    df['score'] = rng.poisson(30, len(df))
+    df['num_comments'] = rng.poisson(6, len(df))
+    df['engagement_score'] = df['score'] + df['num_comments'] * 2
+    return df
+
+
+def test_count_matrix_matches_per_day_counter():
+    df = make_titles()
+    analyzer = TermTrendAnalyzer(use_cache=False)
+    matrix, days, vocabulary, doc_counts = analyzer.build_count_matrix(df)
+
+    assert len(days) == 90 and matrix.shape == (90, len(vocabulary))
+    np.testing.assert_array_equal(doc_counts, df.groupby('date').size().reindex(days, fill_value=0).to_numpy())
+    assert matrix[50].nnz == 0
+
+    dense = matrix.toarray()
+    for day in [0, 30, 60]:
+        texts = df.loc[df['date'] == days[day], 'title_clean'].fillna('').tolist()
+        expected = Counter(gram for grams in tokenize_batch(texts) for gram in grams)
+        actual = {vocabulary[j]: dense[day, j] for j in np.flatnonzero(dense[day])}
+        assert actual == dict(expected)
+
+
+def test_tokenize_drops_stop_word_ngrams_and_reuses_cache(tmp_path, monkeypatch):
+    grams = tokenize_batch(["it's the cats and the dogs"])[0]
+    assert 'cats' in grams and 'the cats' in grams
+    assert 'and the' not in grams and 'the' not in grams
+
+    analyzer = TermTrendAnalyzer(use_cache=False)
+    analyzer.cache = TextCache('ngrams_1_2', db_path=str(tmp_path / 'cache.db'))
+    texts = ['cats edition again', 'boyfriend cats remix', 'cats edition again']
+    first = analyzer.tokenize(texts)
+    assert first[0] == first[2]
+
+    # 두 번째 호출은 캐시에서만 읽음
+    monkeypatch.setattr(term_trends, 'tokenize_batch', None)
+    assert analyzer.tokenize(texts) == first
+
+
+def test_terms_by_phase_ranks_phase_specific_ngrams():
+    df = make_titles()
+    analyzer = TermTrendAnalyzer(use_cache=False)
+    matrix, days, vocabulary, _ = analyzer.build_count_matrix(df)
+    phases = [
+        {'phase': 'Growth', 'start_date': days[0], 'end_date': days[39]},
+        {'phase': 'Decline', 'start_date': days[40], 'end_date': days[-1]},
+    ]
+    terms = analyzer.terms_by_phase(matrix, days, vocabulary, phases, min_count=5, top_n=4)
+
+    growth = terms[terms['phase'] == 'Growth']
+    decline = terms[terms['phase'] == 'Decline']
+    assert len(growth) == 4 and len(decline) == 4
+    # 단계 안에서 lift 내림차순, 상위는 그 단계에만 나오는 표현 변형
+    assert growth['lift'].is_monotonic_decreasing and decline['lift'].is_monotonic_decreasing
+    assert (terms['phase_count'] == terms['total_count']).all() and (terms['lift'] > 1).all()
+    assert not growth['ngram'].str.contains('cats').any()
+    assert not decline['ngram'].isin(tokenize_batch(['original distracted boyfriend template'])[0]).any()
+
+    totals = np.asarray(matrix.sum(axis=0)).ravel()
+    assert (totals[vocabulary.get_indexer(terms['ngram'])] == terms['total_count']).all()
+
+    # min_count 미만인 n-gram은 순위에서 제외
+    rare = analyzer.terms_by_phase(matrix, days, vocabulary, phases, min_count=int(totals.max()) + 1)
+    assert rare.empty
+    assert analyzer.terms_by_phase(matrix, days, vocabulary, None).empty
+
+
+def test_main_writes_terms_by_lifecycle_phase(tmp_path, monkeypatch):
+    df = make_titles()
+    df.to_csv(tmp_path / 'processed_reddit_distracted_boyfriend_20250101_120000.csv', index=False)
+
+    class TmpCache(TextCache):
+        def __init__(self, namespace):
+            super().__init__(namespace, db_path=str(tmp_path / 'cache.db'))
+
+    monkeypatch.setattr(term_trends, 'PROCESSED_DATA_DIR', str(tmp_path))
+    monkeypatch.setattr(term_trends, 'REPORTS_DIR', str(tmp_path / 'reports'))
+    monkeypatch.setattr(term_trends, 'TextCache', TmpCache)
+    monkeypatch.setattr(sys, 'argv', ['term_trends.py', '--file',
+                                      'processed_reddit_distracted_boyfriend_20250101_120000.csv'])
+    term_trends.main()
+
+    terms = pd.read_csv(tmp_path / 'reports' / 'distracted_boyfriend_phase_terms.csv')
+    assert terms['phase'].nunique() > 1
+    assert {'phase', 'ngram', 'phase_count', 'total_count', 'lift'} <= set(terms.columns)
@@ -0,0 +1,271 @@
+import contextlib
+import io
+import json
+import os
+import subprocess
+import sys
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+from matplotlib.figure import Figure
+from PIL import Image, ImageSequence
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from conftest import make_posts
+from src.preprocessors.rollup_cube import RollupCube
+from src.visualizers.comparison_visualizer import draw_normalized_overlay
+from src.visualizers.dashboard_app import DashboardData
+from src.visualizers.downsample import downsample_series, lttb
+from src.visualizers.figure_cache import FigureCache, fingerprint
+from src.visualizers.lifecycle_animation import FrameRenderer, export_animation, prepare_animation
+from src.visualizers.meme_visualizer import MemeVisualizer, apply_style
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_normalized_overlay_skips_unobserved_days_without_warnings():
+    rng = np.random.default_rng(0)
+    curves = rng.random((20, 200))
+    for curve in curves:
+        curve[rng.integers(20, 150):] = np.nan
+
+    fig = Figure()
+    with warnings.catch_warnings():
+        warnings.simplefilter('error', RuntimeWarning)
+        draw_normalized_overlay(fig, {'normalized': curves})
+
+    median = fig.axes[0].lines[0].get_ydata()
+    assert np.isnan(median[150:]).all()
+    np.testing.assert_allclose(median[:20], np.median(curves[:, :20], axis=0))
+
+
+def test_process_pool_renders_same_images_as_sequential(tmp_path):
+    df = make_posts()
+    images = {}
+    for workers in (1, 2):
+        visualizer = MemeVisualizer(use_cache=False, profile='draft')
+        visualizer.figures_dir = str(tmp_path / f'workers_{workers}')
+        os.makedirs(visualizer.figures_dir)
+        with contextlib.redirect_stdout(io.StringIO()):
+            paths = visualizer.render_all(df, 'zz_test', workers=workers)
+        images[workers] = {os.path.basename(path): np.asarray(Image.open(path)) for path in paths}
+
+    assert len(images[1]) == 5
+    assert images[1].keys() == images[2].keys()
+    for name, image in images[1].items():
+        np.testing.assert_array_equal(image, images[2][name], err_msg=name)
+
+
+def test_fingerprint_depends_on_data_and_style_only():
+    series = pd.Series([1.0, 2.0, 3.0], index=pd.date_range('2024-01-01', periods=3), name='post_count')
+    data = {'title': 'Aespa', 'daily_posts': series}
+    base = fingerprint('lifecycle_curve', data, {'dpi': 100})
+
+    # dict 키 순서와 객체 동일성은 지문에 영향이 없음
+    assert fingerprint('lifecycle_curve', {'daily_posts': series.copy(), 'title': 'Aespa'}, {'dpi': 100}) == base
+    assert fingerprint('lifecycle_curve', {'title': 'Aespa', 'daily_posts': series * 2}, {'dpi': 100}) != base
+    assert fingerprint('lifecycle_curve', data, {'dpi': 200}) != base
+    assert fingerprint('dashboard', data, {'dpi': 100}) != base
+
+
+def test_figure_cache_hits_only_for_same_fingerprint_and_existing_file(tmp_path):
+    manifest_path = str(tmp_path / 'figures' / 'figure_manifest.json')
+    filepath = str(tmp_path / 'figure.png')
+    cache = FigureCache(manifest_path)
+    assert not cache.lookup(filepath, 'a')
+    cache.record(filepath, 'a', 0.5)
+    # 매니페스트에 있어도 파일이 없으면 실패
+    assert not cache.lookup(filepath, 'a')
+    open(filepath, 'wb').close()
+    assert cache.lookup(filepath, 'a')
+    assert not cache.lookup(filepath, 'b')
+    assert (cache.hits, cache.misses) == (1, 3)
+    cache.save()
+
+    # 다른 프로세스가 그사이 저장한 항목을 덮어쓰지 않음
+    other = FigureCache(manifest_path)
+    other.record(str(tmp_path / 'other.png'), 'c')
+    other.save()
+    cache.save()
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    assert {name: entry['fingerprint'] for name, entry in manifest.items()} == {'figure.png': 'a', 'other.png': 'c'}
+    assert FigureCache(manifest_path).lookup(filepath, 'a')
+
+
+def test_render_jobs_skips_unchanged_figures(tmp_path):
+    visualizer = MemeVisualizer(profile='draft')
+    visualizer.figures_dir = str(tmp_path)
+    visualizer.cache = FigureCache(str(tmp_path / 'figure_manifest.json'))
+    df = make_posts()
+    with contextlib.redirect_stdout(io.StringIO()):
+        paths = visualizer.render_all(df, 'zz_test', workers=1)
+    assert all(os.path.exists(path) for path in paths)
+    mtimes = {path: os.path.getmtime(path) for path in paths}
+
+    # 같은 데이터는 모두 적중, 매니페스트는 새 인스턴스에서도 유지
+    visualizer.cache = FigureCache(visualizer.cache.manifest_path)
+    with contextlib.redirect_stdout(io.StringIO()):
+        visualizer.render_all(df, 'zz_test', workers=1)
+    assert (visualizer.cache.hits, visualizer.cache.misses) == (len(paths), 0)
+    assert {path: os.path.getmtime(path) for path in paths} == mtimes
+
+    # 서브레딧만 바꾸면 서브레딧을 쓰는 그림만 다시 렌더링
+    changed = df.assign(subreddit=df['subreddit'].replace('funny', 'pics'))
+    visualizer.cache = FigureCache(visualizer.cache.manifest_path)
+    with contextlib.redirect_stdout(io.StringIO()):
+        visualizer.render_all(changed, 'zz_test', workers=1)
+    assert visualizer.cache.misses == 2
+    assert visualizer.cache.hits == len(paths) - 2
+
+
+@pytest.mark.parametrize('n, n_out', [(10000, 500), (1001, 3), (50, 49)])
+def test_lttb_keeps_endpoints_and_bucket_count(n, n_out):
+    rng = np.random.default_rng(0)
+    x = np.arange(n, dtype=np.float64)
+    index = lttb(x, rng.standard_normal(n).cumsum(), n_out)
+    assert len(index) == n_out
+    assert index[0] == 0 and index[-1] == n - 1
+    assert np.all(np.diff(index) > 0)
+
+
+def test_lttb_preserves_spikes_and_extrema():
+    rng = np.random.default_rng(0)
+    n = 20000
+    y = rng.random(n)
+    spikes = [1234, 8000, 15555]
+    y[spikes] = [50.0, -40.0, 80.0]
+    index = lttb(np.arange(n), y, 300)
+    assert set(spikes) <= set(index)
+
+    # 매끄러운 곡선의 최댓값/최솟값도 남음
+    x = np.linspace(0, 6 * np.pi, n)
+    smooth = np.sin(x) * np.exp(-x / 10)
+    index = lttb(x, smooth, 200)
+    assert smooth[index].max() == pytest.approx(smooth.max(), abs=1e-3)
+    assert smooth[index].min() == pytest.approx(smooth.min(), abs=1e-3)
+
+
+def test_downsample_series_uses_time_index():
+    series = pd.Series(np.arange(100.0), index=pd.date_range('2024-01-01', periods=100))
+    assert downsample_series(series, 200) is series
+    assert lttb(np.arange(10), np.arange(10), 2).tolist() == list(range(10))
+
+    long = pd.Series(np.random.default_rng(0).random(5000), index=pd.date_range('2020-01-01', periods=5000))
+    long.iloc[2500] = 30.0
+    reduced = downsample_series(long, 400)
+    assert len(reduced) == 400
+    assert reduced.index[0] == long.index[0] and reduced.index[-1] == long.index[-1]
+    assert reduced.idxmax() == long.index[2500]
+
+
+def make_dashboard_data(tmp_path, memes=('alpha', 'beta', 'gamma'), **kwargs):
+    """밈별 롤업 큐브를 임시 디렉토리에 저장하고 대시보드 데이터 계층 생성"""
+    for i, meme in enumerate(memes):
+        cube = RollupCube.from_posts(meme, make_posts(n_days=400, seed=i))
+        cube.save(str(tmp_path / f'processed_reddit_{meme}_20250101_120000_rollup.npz'))
+    return DashboardData(processed_dir=str(tmp_path), results_path=str(tmp_path / 'missing.csv'), **kwargs)
+
+
+def test_dashboard_data_caches_aggregates_and_figures(tmp_path, monkeypatch):
+    data = make_dashboard_data(tmp_path, max_points=100)
+    loaded = []
+    load = RollupCube.load.__func__
+
+    def recording_load(cls, *args):
+        cube = load(cls, *args)
+        loaded.append(cube)
+        return cube
+
+    monkeypatch.setattr(RollupCube, 'load', classmethod(recording_load))
+    assert data.memes == ['alpha', 'beta', 'gamma']
+
+    figures = data.figures('alpha', 'day')
+    assert data.figures('alpha', 'day') is figures
+    for granularity in ('week', 'month'):
+        data.figures('alpha', granularity)
+    # 단위가 달라도 밈 집계는 한 번만 로드
+    assert data.meme_aggregates.cache_info().misses == 1
+    # 대시보드는 조회만 하므로 게시물 id 목록은 읽지 않음
+    assert [cube.post_ids for cube in loaded] == [None]
+    assert data.figures.cache_info().hits == 1
+
+    activity = figures['activity']['data']
+    assert [trace['name'] for trace in activity] == ['Posts', '7-day MA']
+    assert all(len(trace['x']) == len(trace['y']) <= 100 for trace in activity)
+    assert '일괄 분석 결과 없음' in figures['summary']
+    assert data.overview_figure()['data'] == []
+
+
+def test_dashboard_data_evicts_least_recently_used(tmp_path):
+    data = make_dashboard_data(tmp_path, meme_cache_size=2, figure_cache_size=2)
+    for meme in ('alpha', 'beta', 'alpha', 'gamma'):
+        data.figures(meme, 'day')
+    assert data.figures.cache_info().currsize == 2
+    # gamma를 넣으면서 가장 오래 안 쓴 beta가 밀려나고 alpha는 남음
+    data.figures('alpha', 'day')
+    assert data.figures.cache_info().hits == 2
+    data.figures('beta', 'day')
+    assert data.figures.cache_info().misses == 4
+    # 집계 캐시는 그림 캐시 실패 때만 쓰이므로 beta 집계는 아직 남아 있음
+    assert data.meme_aggregates.cache_info()[:2] == (1, 3)
+
+    with contextlib.redirect_stdout(io.StringIO()) as output:
+        data.cache_report()
+    assert '보관 2/2' in output.getvalue()
+
+
+def test_dashboard_module_imports_without_dash():
+    code = ("import sys; import src.visualizers.dashboard_app; "
+            "print(any(name in sys.modules for name in ('dash', 'plotly')))")
+    output = subprocess.run([sys.executable, '-c', code], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True)
+    assert output.stdout.strip() == 'False'
+
+
+def test_prepare_animation_frames_and_cumulative_counts():
+    df = make_posts(n_days=200)
+    data = prepare_animation(df, 'zz_test', top_n=3, max_frames=50)
+    n_days = len(data['dates'])
+    assert data['frame_days'][-1] == n_days - 1
+    assert len(data['frame_days']) <= 50
+    assert np.all(np.diff(data['frame_days']) == int(np.ceil(n_days / 50)))
+    assert data['cumulative'][-1] == len(df)
+    expected = df['subreddit'].value_counts().head(3)
+    assert data['subreddits'] == expected.index.tolist()
+    np.testing.assert_array_equal(data['subreddit_cumulative'][-1], expected.to_numpy())
+
+
+def test_blitted_frames_match_fresh_renderer():
+    data = prepare_animation(make_posts(n_days=60), 'zz_test', step=10)
+    renderer = FrameRenderer(data, dpi=30)
+    frames = [renderer.render(day) for day in data['frame_days']]
+    # 이전 프레임의 흔적 없이 배경 + 해당 날짜 요소만 그려져야 함
+    for day, frame in zip(data['frame_days'][::2], frames[::2]):
+        np.testing.assert_array_equal(frame, FrameRenderer(data, dpi=30).render(day))
+    assert not np.array_equal(frames[0], frames[-1])
+
+
+def test_gif_export_chunks_match_sequential(tmp_path, monkeypatch):
+    # 워커는 apply_style로 초기화되므로 메인 프로세스도 CLI처럼 같은 스타일을 적용
+    apply_style()
+    data = prepare_animation(make_posts(n_days=60), 'zz_test', step=5)
+    decoded = {}
+    for workers in (1, 2):
+        filepath = str(tmp_path / f'animation_{workers}.gif')
+        with contextlib.redirect_stdout(io.StringIO()):
+            export_animation(data, filepath, fps=10, workers=workers, dpi=30)
+        with Image.open(filepath) as image:
+            decoded[workers] = [np.asarray(frame.convert('RGB')) for frame in ImageSequence.Iterator(image)]
+
+    assert len(decoded[1]) == len(data['frame_days'])
+    for first, second in zip(decoded[1], decoded[2]):
+        np.testing.assert_array_equal(first, second)
+
+    with pytest.raises(ValueError):
+        export_animation(data, str(tmp_path / 'animation.avi'))
+    monkeypatch.setattr('shutil.which', lambda name: None)
+    with pytest.raises(RuntimeError):
+        export_animation(data, str(tmp_path / 'animation.mp4'))